@@ -5,9 +5,10 @@ import os
 import json
 import time
 from datetime import datetime
-import requests
 from dotenv import load_dotenv
 
+from core import cliente_http
+
 # Carregar variáveis de ambiente
 load_dotenv()
 
@@ -157,7 +158,7 @@ Características do meu estilo de fala:
             "temperature": 0.8
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = cliente_http.post(url, headers=headers, json=data, timeout=30)
         response.raise_for_status()
 
         result = response.json()
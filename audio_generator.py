@@ -11,6 +11,10 @@ import requests
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
+from core import cliente_http
+from core.text_optimizer import get_optimizer
+from core.audio_cache import AudioCache, DEFAULT_MAX_BYTES
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,12 +30,16 @@ class AudioGenerator:
     Classe para gerar áudio a partir de texto usando a API da ElevenLabs.
     """
 
-    def __init__(self, voice_profile: Optional[str] = None):
+    def __init__(self, voice_profile: Optional[str] = None, usar_cache: bool = True,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = DEFAULT_MAX_BYTES):
         """
         Inicializa o gerador de áudio.
 
         Args:
             voice_profile: Nome do perfil de voz a ser usado (se None, usa o padrão)
+            usar_cache: Se True, reaproveita áudios já gerados para o mesmo texto e voz
+            cache_dir: Diretório do cache de áudio (se None, usa cache/audio)
+            cache_max_bytes: Tamanho máximo do cache de áudio em disco
         """
         # Carregar a chave da API
         self.api_key = self._load_api_key()
@@ -54,6 +62,11 @@ class AudioGenerator:
         self.voice_name = "Rapidinha Voice"
         self._load_voice_config(voice_profile)
 
+        # Cache de áudios gerados, indexado pelo conteúdo
+        self.cache = None
+        if usar_cache:
+            self.cache = AudioCache(cache_dir or os.path.join(os.getcwd(), "cache", "audio"), cache_max_bytes)
+
     def _load_api_key(self) -> Optional[str]:
         """
         Carrega a chave da API do ambiente ou do arquivo .env.
@@ -129,10 +142,6 @@ class AudioGenerator:
         Returns:
             Optional[str]: Caminho para o arquivo de áudio gerado, ou None se falhar
         """
-        if not self.api_key and not dry_run:
-            logger.error("API key da ElevenLabs não configurada. Não é possível gerar áudio.")
-            return None
-
         # Otimizar o texto se solicitado
         if optimize:
             original_text = text
@@ -153,6 +162,19 @@ class AudioGenerator:
 
             # Verificar se temos uma voz configurada
             voice_identifier = self.voice_id if self.voice_id else "Rachel"
+            model_id = self.voice_settings.get("model_id", "eleven_multilingual_v2")
+
+            # Reaproveitar o áudio se este texto já foi gerado com a mesma voz e configurações
+            cache_key = None
+            if self.cache:
+                cache_key = AudioCache.make_key(text, voice_identifier, model_id, self.voice_settings)
+                if self.cache.get(cache_key, output_path):
+                    logger.info(f"Áudio reaproveitado do cache: {output_path}")
+                    return output_path
+
+            if not self.api_key:
+                logger.error("API key da ElevenLabs não configurada. Não é possível gerar áudio.")
+                return None
 
             # Preparar a requisição para a API
             url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_identifier}"
@@ -165,19 +187,22 @@ class AudioGenerator:
 
             data = {
                 "text": text,
-                "model_id": self.voice_settings.get("model_id", "eleven_multilingual_v2"),
+                "model_id": model_id,
                 "voice_settings": self.voice_settings
             }
 
             # Fazer a requisição para a API
             logger.info(f"Gerando áudio para o texto: '{text[:50]}...'")
-            response = requests.post(url, json=data, headers=headers, timeout=60)
+            response = cliente_http.post(url, json=data, headers=headers, timeout=60)
             response.raise_for_status()
 
             # Salvar o áudio
             with open(output_path, 'wb') as f:
                 f.write(response.content)
 
+            if cache_key:
+                self.cache.put(cache_key, response.content)
+
             logger.info(f"Áudio gerado com sucesso: {output_path}")
             return output_path
 
@@ -205,56 +230,7 @@ class AudioGenerator:
         Returns:
             str: Texto otimizado
         """
-        if not text:
-            return text
-
-        # Substituir introdução para máxima energia
-        if text.lower().startswith("e aí cambada"):
-            text = "EAÍCAMBADA" + text[len("e aí cambada"):]
-        elif text.lower().startswith("fala cambada"):
-            text = "FALACAMBADA" + text[len("fala cambada"):]
-
-        # Remover pontuação excessiva que causa pausas
-        for char in [',', '.', '!', '?', '...', ';', ':']:
-            text = text.replace(char, '')
-
-        # Substituir termos para melhor pronúncia
-        replacements = {
-            "Bitcoin": "Bitcoim",
-            "Ethereum": "Etherium",
-            "Cardano": "Cardâno",
-            "Solana": "Solâna",
-            "Polkadot": "Polcadot",
-            "Binance": "Bináns",
-            "Coinbase": "Cóinbeis",
-            "NFT": "ÊnÊfeTê",
-            "DeFi": "DêFai",
-            "staking": "stêiking",
-            "blockchain": "blókcheim",
-            "wallet": "wólet",
-            "token": "tôken",
-            "altcoin": "ôltcoin",
-            "mining": "máining",
-            "miner": "máiner"
-        }
-
-        for original, replacement in replacements.items():
-            text = text.replace(original, replacement)
-
-        # Usar maiúsculas para ênfase em palavras-chave
-        emphasis_words = [
-            "bombando", "muito", "super", "mega", "alta", "subindo",
-            "disparou", "explodiu", "recorde", "máxima", "forte",
-            "incrível", "enorme", "gigante", "absurdo", "impressionante",
-            "surpreendente", "extraordinário", "fenomenal", "espetacular"
-        ]
-
-        for word in emphasis_words:
-            if word in text.lower():
-                text = text.replace(word, word.upper())
-                text = text.replace(word.capitalize(), word.upper())
-
-        return text
+        return get_optimizer("natural").optimize(text)
 
     def clone_voice(self, audio_files: List[str], voice_name: str = "Rapidinha Voice", dry_run: bool = False) -> Optional[str]:
         """
@@ -321,7 +297,7 @@ class AudioGenerator:
                 "description": "Voz clonada para o quadro Rapidinha no Cripto"
             }
 
-            response = requests.post(url, headers=headers, data=data, files=files)
+            response = cliente_http.post(url, headers=headers, data=data, files=files)
             response.raise_for_status()
 
             # Processar a resposta
@@ -594,7 +570,7 @@ def list_available_voices(api_key: str) -> List[dict]:
     try:
         url = "https://api.elevenlabs.io/v1/voices"
         headers = {"xi-api-key": api_key}
-        response = requests.get(url, headers=headers)
+        response = cliente_http.get(url, headers=headers)
         response.raise_for_status()
 
         voices_data = response.json()
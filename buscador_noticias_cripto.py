@@ -5,7 +5,6 @@ Buscador de notícias sobre criptomoedas em portais especializados.
 import os
 import re
 import sys
-import json
 import time
 import random
 import logging
@@ -14,11 +13,16 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
-from googletrans import Translator
+
+from core.cache_http import CacheHTTP
+from core.armazem_itens import ArmazemItens, filtrar_recentes
+from core.tradutor import Tradutor
+from core.coleta_concorrente import ColetorConcorrente
 
 # Importar o verificador de notícias
 try:
     from core.verificador_noticias import VerificadorNoticias
+    from core.verificador_incremental import VerificadorIncremental
     VERIFICADOR_DISPONIVEL = True
 except ImportError:
     VERIFICADOR_DISPONIVEL = False
@@ -178,7 +182,10 @@ class NoticiasCriptoScraper:
     """
     Classe para buscar notícias sobre criptomoedas em portais especializados.
     """
-    def __init__(self, user_agent: str = None, cache_dir: str = "cache", traduzir_automaticamente: bool = True):
+    def __init__(self, user_agent: str = None, cache_dir: str = "cache", traduzir_automaticamente: bool = True,
+                 max_concorrencia: int = 8, max_por_host: int = 2, prazo_coleta: float = 60.0,
+                 intervalo_por_host: Tuple[float, float] = (1.0, 3.0), usar_cache_http: bool = True,
+                 tradutor: Optional[Tradutor] = None):
         """
         Inicializa o scraper de notícias.
 
@@ -186,6 +193,13 @@ class NoticiasCriptoScraper:
             user_agent: User-Agent a ser usado nas requisições
             cache_dir: Diretório para armazenar o cache de notícias
             traduzir_automaticamente: Se True, traduz automaticamente notícias em outros idiomas
+            max_concorrencia: Número máximo de portais buscados ao mesmo tempo na coleta concorrente
+            max_por_host: Número máximo de requisições simultâneas a um mesmo host na coleta concorrente
+            prazo_coleta: Tempo máximo em segundos para a coleta concorrente de todos os portais
+            intervalo_por_host: Intervalo (mínimo, máximo) em segundos entre requisições ao mesmo host
+            usar_cache_http: Se True, usa requisições condicionais (ETag/Last-Modified) e não
+                reprocessa páginas que não mudaram
+            tradutor: Tradutor com memória de tradução (se None, cria um com a memória em cache_dir)
         """
         self.user_agent = user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         self.cache_dir = cache_dir
@@ -193,57 +207,25 @@ class NoticiasCriptoScraper:
         self.session.headers.update({"User-Agent": self.user_agent})
         self.traduzir_automaticamente = traduzir_automaticamente
 
-        # Inicializar o tradutor
-        self.translator = Translator()
-
-        # Criar diretório de cache se não existir
-        os.makedirs(self.cache_dir, exist_ok=True)
-
-    def _get_cache_path(self, portal_nome: str) -> str:
-        """
-        Retorna o caminho para o arquivo de cache de um portal.
-
-        Args:
-            portal_nome: Nome do portal
-
-        Returns:
-            str: Caminho para o arquivo de cache
-        """
-        return os.path.join(self.cache_dir, f"{portal_nome.lower().replace(' ', '_')}_cache.json")
+        # Parâmetros da coleta concorrente
+        self.max_concorrencia = max_concorrencia
+        self.max_por_host = max_por_host
+        self.prazo_coleta = prazo_coleta
+        self.intervalo_por_host = intervalo_por_host
 
-    def _load_cache(self, portal_nome: str) -> List[Dict[str, Any]]:
-        """
-        Carrega o cache de notícias de um portal.
-
-        Args:
-            portal_nome: Nome do portal
+        # Cache de respostas HTTP compartilhado com os outros buscadores
+        self.cache_http = CacheHTTP(os.path.join(cache_dir, "http")) if usar_cache_http else None
 
-        Returns:
-            List[Dict[str, Any]]: Lista de notícias em cache
-        """
-        cache_path = self._get_cache_path(portal_nome)
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Erro ao carregar cache para {portal_nome}: {e}")
-        return []
+        # Inicializar o tradutor (com memória de tradução persistente)
+        self.tradutor = None
+        if traduzir_automaticamente:
+            self.tradutor = tradutor or Tradutor(arquivo_memoria=os.path.join(cache_dir, "traducoes.db"))
 
-    def _save_cache(self, portal_nome: str, noticias: List[Dict[str, Any]]) -> None:
-        """
-        Salva o cache de notícias de um portal.
+        # Criar diretório de cache se não existir
+        os.makedirs(self.cache_dir, exist_ok=True)
 
-        Args:
-            portal_nome: Nome do portal
-            noticias: Lista de notícias a serem salvas
-        """
-        cache_path = self._get_cache_path(portal_nome)
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(noticias, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Erro ao salvar cache para {portal_nome}: {e}")
+        # Armazém local das notícias coletadas (compartilhado com os outros buscadores)
+        self.armazem = ArmazemItens(os.path.join(cache_dir, "itens.db"))
 
     def _parse_data(self, data_str: str, formato: str) -> Optional[datetime]:
         """
@@ -293,46 +275,24 @@ class NoticiasCriptoScraper:
         Returns:
             Dict[str, Any]: Notícia traduzida
         """
-        if not self.traduzir_automaticamente:
-            return noticia
+        return self._traduzir_noticias([noticia])[0]
+
+    def _traduzir_noticias(self, noticias: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Traduz uma lista de notícias para português em lote, se necessário.
 
-        # Se a notícia já está em português, não precisa traduzir
-        if noticia.get("idioma", "pt") == "pt":
-            return noticia
+        Títulos e resumos já traduzidos antes são reaproveitados da memória de tradução.
 
-        try:
-            # Traduzir título
-            titulo_traduzido = self.translator.translate(
-                noticia["titulo"], src=noticia.get("idioma", "en"), dest="pt"
-            ).text
-
-            # Traduzir resumo, se existir
-            resumo_traduzido = ""
-            if noticia.get("resumo"):
-                resumo_traduzido = self.translator.translate(
-                    noticia["resumo"], src=noticia.get("idioma", "en"), dest="pt"
-                ).text
-
-            # Criar cópia da notícia com os campos traduzidos
-            noticia_traduzida = noticia.copy()
-            noticia_traduzida["titulo_original"] = noticia["titulo"]
-            noticia_traduzida["titulo"] = titulo_traduzido
-
-            if resumo_traduzido:
-                noticia_traduzida["resumo_original"] = noticia["resumo"]
-                noticia_traduzida["resumo"] = resumo_traduzido
-
-            noticia_traduzida["traduzido"] = True
-            noticia_traduzida["idioma_original"] = noticia.get("idioma", "en")
-            noticia_traduzida["idioma"] = "pt"
-
-            logger.info(f"Notícia traduzida: {noticia['titulo']} -> {titulo_traduzido}")
-            return noticia_traduzida
-        except Exception as e:
-            logger.error(f"Erro ao traduzir notícia: {e}")
-            # Em caso de erro, retornar a notícia original
-            noticia["traduzido"] = False
-            return noticia
+        Args:
+            noticias: Lista de notícias
+
+        Returns:
+            List[Dict[str, Any]]: Notícias traduzidas, na mesma ordem
+        """
+        if not self.traduzir_automaticamente:
+            return noticias
+
+        return self.tradutor.traduzir_itens(noticias, ["titulo", "resumo"])
 
     def _verificar_credibilidade(self, noticia: Dict[str, Any], portal: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -447,10 +407,6 @@ class NoticiasCriptoScraper:
 
                 # Adicionar à lista apenas se for confiável
                 if noticia["confiavel"]:
-                    # Traduzir notícia se necessário
-                    if portal.get("idioma", "pt") != "pt" and self.traduzir_automaticamente:
-                        noticia = self._traduzir_noticia(noticia)
-
                     noticias.append(noticia)
                 else:
                     logger.warning(f"Notícia descartada por baixa credibilidade: {noticia['titulo']} (Pontuação: {noticia['credibilidade']})")
@@ -458,8 +414,41 @@ class NoticiasCriptoScraper:
             except Exception as e:
                 logger.error(f"Erro ao extrair notícia de {portal['nome']}: {e}")
 
+        # Traduzir as notícias do portal em lote, se necessário
+        if portal.get("idioma", "pt") != "pt" and self.traduzir_automaticamente:
+            noticias = self._traduzir_noticias(noticias)
+
         return noticias
 
+    def _processar_pagina(self, portal: Dict[str, str], html: str, max_noticias: int = 10,
+                          chave_cache: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Extrai as notícias do HTML de um portal e atualiza o cache.
+
+        Args:
+            portal: Configuração do portal
+            html: HTML da página do portal
+            max_noticias: Número máximo de notícias a retornar
+            chave_cache: Chave da resposta no cache HTTP, para guardar a extração
+
+        Returns:
+            List[Dict[str, Any]]: Lista de notícias encontradas
+        """
+        # Extrair notícias
+        noticias = self._extrair_noticias(portal, html)
+
+        # Guardar a extração para reaproveitar quando a página não mudar
+        if self.cache_http and chave_cache:
+            self.cache_http.salvar_extracao(chave_cache, noticias)
+
+        # Atualizar o armazém local (upsert pelo link)
+        novas = self.armazem.salvar("noticia", portal["nome"], noticias)
+
+        logger.info(f"Encontradas {novas} notícias novas em {portal['nome']}")
+
+        # Retornar as notícias mais recentes
+        return noticias[:max_noticias]
+
     def buscar_noticias(self, portal: Dict[str, str], max_noticias: int = 10) -> List[Dict[str, Any]]:
         """
         Busca notícias em um portal específico.
@@ -474,35 +463,85 @@ class NoticiasCriptoScraper:
         logger.info(f"Buscando notícias em {portal['nome']}...")
 
         try:
-            # Fazer requisição HTTP
+            # Fazer requisição HTTP (condicional, se o cache HTTP estiver ativo)
+            if self.cache_http:
+                resposta = self.cache_http.buscar(portal["url"], timeout=30, sessao=self.session)
+                if resposta["nao_modificado"] and resposta["extracao"] is not None:
+                    logger.info(f"Página de {portal['nome']} não mudou, reaproveitando notícias já extraídas")
+                    # Renovar as notícias no armazém, para que não expirem enquanto a página não mudar
+                    noticias = CacheHTTP.renovar_timestamps(resposta["extracao"])
+                    self.armazem.salvar("noticia", portal["nome"], noticias)
+                    return noticias[:max_noticias]
+
+                return self._processar_pagina(portal, resposta["texto"], max_noticias, resposta["chave"])
+
             response = self.session.get(portal["url"], timeout=30)
             response.raise_for_status()
 
-            # Extrair notícias
-            noticias = self._extrair_noticias(portal, response.text)
+            return self._processar_pagina(portal, response.text, max_noticias)
+        except Exception as e:
+            logger.error(f"Erro ao buscar notícias em {portal['nome']}: {e}")
+            return []
 
-            # Carregar cache
-            cache = self._load_cache(portal["nome"])
+    def _buscar_noticias_concorrente(self, portais: List[Dict[str, Any]], max_noticias: int = 10) -> List[List[Dict[str, Any]]]:
+        """
+        Busca as páginas de todos os portais em paralelo e extrai as notícias.
 
-            # Filtrar notícias já existentes no cache
-            links_cache = {noticia["link"] for noticia in cache}
-            noticias_novas = [noticia for noticia in noticias if noticia["link"] not in links_cache]
+        As páginas são baixadas ao mesmo tempo, mas a extração é feita na ordem
+        dos portais, para que o resultado seja o mesmo da busca sequencial.
 
-            # Atualizar cache
-            cache = noticias_novas + cache
-            cache = cache[:100]  # Manter apenas as 100 notícias mais recentes
-            self._save_cache(portal["nome"], cache)
+        Args:
+            portais: Lista de configurações de portais
+            max_noticias: Número máximo de notícias a retornar por portal
 
-            logger.info(f"Encontradas {len(noticias_novas)} notícias novas em {portal['nome']}")
+        Returns:
+            List[List[Dict[str, Any]]]: Notícias de cada portal, na ordem dos portais
+        """
+        logger.info(f"Buscando notícias em {len(portais)} portais em paralelo...")
+
+        coletor = ColetorConcorrente(
+            headers=dict(self.session.headers),
+            max_concorrencia=self.max_concorrencia,
+            max_por_host=self.max_por_host,
+            intervalo_por_host=self.intervalo_por_host,
+            prazo_total=self.prazo_coleta,
+            cache_http=self.cache_http
+        )
+        resultados = coletor.coletar([portal["url"] for portal in portais])
+
+        noticias_por_portal = []
+        for portal, resultado in zip(portais, resultados):
+            if resultado is None:
+                logger.error(f"Erro ao buscar notícias em {portal['nome']}: prazo de coleta excedido")
+                noticias_por_portal.append([])
+                continue
+
+            if resultado["erro"]:
+                logger.error(f"Erro ao buscar notícias em {portal['nome']}: {resultado['erro']}")
+                noticias_por_portal.append([])
+                continue
+
+            if resultado["nao_modificado"] and resultado["extracao"] is not None:
+                logger.info(f"Página de {portal['nome']} não mudou, reaproveitando notícias já extraídas")
+                noticias = CacheHTTP.renovar_timestamps(resultado["extracao"])
+                self.armazem.salvar("noticia", portal["nome"], noticias)
+                noticias_por_portal.append(noticias[:max_noticias])
+                continue
 
-            # Retornar as notícias mais recentes
-            return noticias[:max_noticias]
-        except Exception as e:
-            logger.error(f"Erro ao buscar notícias em {portal['nome']}: {e}")
-            return []
+            try:
+                noticias_por_portal.append(self._processar_pagina(portal, resultado["texto"], max_noticias,
+                                                                  resultado["chave_cache"]))
+            except Exception as e:
+                logger.error(f"Erro ao processar notícias de {portal['nome']}: {e}")
+                noticias_por_portal.append([])
+
+        return noticias_por_portal
 
     def buscar_todas_noticias(self, max_por_portal: int = 5, max_total: int = 20,
-                          dias_max: int = 7, usar_verificacao_cruzada: bool = True) -> List[Dict[str, Any]]:
+                          dias_max: int = 7, usar_verificacao_cruzada: bool = True,
+                          coleta_concorrente: bool = False,
+                          portais: Optional[List[Dict[str, Any]]] = None,
+                          verificacao_incremental: bool = False) -> List[Dict[str, Any]]:
         """
         Busca notícias em todos os portais configurados, filtrando por data.
 
@@ -511,10 +550,16 @@ class NoticiasCriptoScraper:
             max_total: Número máximo de notícias no total
             dias_max: Número máximo de dias de antiguidade das notícias
             usar_verificacao_cruzada: Se True, usa o sistema de verificação cruzada para melhorar a confiabilidade
+            coleta_concorrente: Se True, baixa as páginas de todos os portais em paralelo
+            portais: Lista de portais a consultar (se None, usa PORTAIS)
+            verificacao_incremental: Se True, reaproveita os grupos da verificação cruzada das execuções anteriores
 
         Returns:
             List[Dict[str, Any]]: Lista de notícias encontradas
         """
+        if portais is None:
+            portais = PORTAIS
+
         todas_noticias = []
 
         # Calcular a data limite (hoje - dias_max)
@@ -523,23 +568,22 @@ class NoticiasCriptoScraper:
 
         logger.info(f"Buscando notícias mais recentes que {data_limite.strftime('%d/%m/%Y')}")
 
-        for portal in PORTAIS:
-            # Adicionar um pequeno atraso para não sobrecarregar os servidores
-            time.sleep(random.uniform(1, 3))
+        # Na coleta concorrente, as páginas são baixadas de uma vez (com limites por host)
+        noticias_concorrentes = None
+        if coleta_concorrente:
+            noticias_concorrentes = self._buscar_noticias_concorrente(portais, max_por_portal * 2)
 
-            noticias = self.buscar_noticias(portal, max_por_portal * 2)  # Buscar mais para compensar filtragem
+        for i, portal in enumerate(portais):
+            if noticias_concorrentes is not None:
+                noticias = noticias_concorrentes[i]
+            else:
+                # Adicionar um pequeno atraso para não sobrecarregar os servidores
+                time.sleep(random.uniform(1, 3))
 
-            # Filtrar notícias pela data
-            noticias_recentes = []
-            for noticia in noticias:
-                # Se não tiver data, assumir que é recente
-                if not noticia.get("data_iso"):
-                    noticias_recentes.append(noticia)
-                    continue
+                noticias = self.buscar_noticias(portal, max_por_portal * 2)  # Buscar mais para compensar filtragem
 
-                # Verificar se a data é mais recente que o limite
-                if noticia["data_iso"] >= data_limite_iso:
-                    noticias_recentes.append(noticia)
+            # Filtrar notícias pela data (sem data, assumir que é recente)
+            noticias_recentes = filtrar_recentes("noticia", noticias, data_limite_iso)
 
             logger.info(f"Portal {portal['nome']}: {len(noticias)} notícias encontradas, {len(noticias_recentes)} dentro do período de {dias_max} dias")
 
@@ -552,7 +596,13 @@ class NoticiasCriptoScraper:
         # Aplicar verificação cruzada se disponível e solicitada
         if VERIFICADOR_DISPONIVEL and usar_verificacao_cruzada and len(todas_noticias) > 1:
             logger.info("Aplicando verificação cruzada para melhorar a confiabilidade das notícias...")
-            verificador = VerificadorNoticias()
+            if verificacao_incremental:
+                verificador = VerificadorIncremental(
+                    arquivo_estado=os.path.join(self.cache_dir, "verificador_estado.json"),
+                    dias_max=dias_max
+                )
+            else:
+                verificador = VerificadorNoticias()
             todas_noticias = verificador.verificar_noticias(todas_noticias)
 
             # Filtrar notícias com base na credibilidade atualizada
@@ -586,17 +636,25 @@ def main():
     parser.add_argument("--min-credibilidade", type=int, default=6, help="Pontuação mínima de credibilidade (1-10)")
     parser.add_argument("--no-verificacao-cruzada", action="store_true", help="Desativar verificação cruzada de notícias")
     parser.add_argument("--limiar-similaridade", type=float, default=0.7, help="Limiar de similaridade para verificação cruzada (0.0-1.0)")
+    parser.add_argument("--concorrente", action="store_true", help="Buscar todos os portais em paralelo")
+    parser.add_argument("--prazo-coleta", type=float, default=60.0, help="Tempo máximo em segundos da coleta concorrente")
+    parser.add_argument("--incremental", action="store_true", help="Reaproveitar os grupos da verificação cruzada das execuções anteriores")
 
     args = parser.parse_args()
 
     # Criar o scraper
-    scraper = NoticiasCriptoScraper(traduzir_automaticamente=not args.no_traduzir)
+    scraper = NoticiasCriptoScraper(
+        traduzir_automaticamente=not args.no_traduzir,
+        prazo_coleta=args.prazo_coleta
+    )
 
     # Buscar notícias
     noticias = scraper.buscar_todas_noticias(
         max_total=args.max,
         dias_max=args.dias,
-        usar_verificacao_cruzada=not args.no_verificacao_cruzada
+        usar_verificacao_cruzada=not args.no_verificacao_cruzada,
+        coleta_concorrente=args.concorrente,
+        verificacao_incremental=args.incremental
     )
 
     # Exibir as notícias encontradas
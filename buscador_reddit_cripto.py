@@ -13,6 +13,11 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
+from core import cliente_http
+from core.cache_http import CacheHTTP
+from core.armazem_itens import ArmazemItens, filtrar_recentes
+from core.tradutor import Tradutor
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -77,7 +82,8 @@ class RedditCriptoScraper:
     Classe para buscar posts sobre criptomoedas no Reddit.
     """
     def __init__(self, client_id: str = None, client_secret: str = None, 
-                 cache_dir: str = "cache", traduzir_automaticamente: bool = True):
+                 cache_dir: str = "cache", traduzir_automaticamente: bool = True,
+                 tradutor: Optional[Tradutor] = None):
         """
         Inicializa o scraper de posts do Reddit.
 
@@ -86,6 +92,7 @@ class RedditCriptoScraper:
             client_secret: Segredo do cliente da API do Reddit
             cache_dir: Diretório para armazenar o cache de posts
             traduzir_automaticamente: Se True, traduz automaticamente posts em outros idiomas
+            tradutor: Tradutor com memória de tradução (se None, cria um com a memória em cache_dir)
         """
         self.client_id = client_id or os.environ.get("REDDIT_CLIENT_ID")
         self.client_secret = client_secret or os.environ.get("REDDIT_CLIENT_SECRET")
@@ -102,14 +109,19 @@ class RedditCriptoScraper:
         
         # Criar diretório de cache se não existir
         os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Cache de respostas HTTP (requisições condicionais com ETag/Last-Modified)
+        self.cache_http = CacheHTTP(os.path.join(self.cache_dir, "http"))
+
+        # Armazém local dos posts coletados (compartilhado com os outros buscadores)
+        self.armazem = ArmazemItens(os.path.join(self.cache_dir, "itens.db"))
         
-        # Inicializar tradutor se necessário
+        # Inicializar tradutor (com memória de tradução persistente) se necessário
+        self.tradutor = None
         if traduzir_automaticamente:
-            try:
-                from googletrans import Translator
-                self.translator = Translator()
-            except ImportError:
-                logger.warning("Biblioteca googletrans não encontrada. Tradução automática desativada.")
+            self.tradutor = tradutor or Tradutor(arquivo_memoria=os.path.join(self.cache_dir, "traducoes.db"))
+            if not self.tradutor.disponivel:
+                logger.warning("Nenhum backend de tradução disponível. Tradução automática desativada.")
                 self.traduzir_automaticamente = False
 
     def _obter_token_acesso(self) -> None:
@@ -128,7 +140,7 @@ class RedditCriptoScraper:
             }
             headers = {'User-Agent': 'CriptoScraper/0.1 by YourUsername'}
             
-            response = requests.post(
+            response = cliente_http.post(
                 "https://www.reddit.com/api/v1/access_token",
                 auth=auth,
                 data=data,
@@ -149,102 +161,34 @@ class RedditCriptoScraper:
             logger.error(f"Erro ao obter token de acesso: {e}")
             self.usar_api = False
 
-    def _get_cache_path(self, nome: str) -> str:
+    def _traduzir_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Retorna o caminho para o arquivo de cache.
+        Traduz um post para português, se necessário.
 
         Args:
-            nome: Nome do cache
+            post: Dados do post
 
         Returns:
-            str: Caminho para o arquivo de cache
+            Dict[str, Any]: Post traduzido
         """
-        return os.path.join(self.cache_dir, f"reddit_{nome.lower().replace(' ', '_').replace('/', '')}_cache.json")
+        return self._traduzir_posts([post])[0]
 
-    def _load_cache(self, nome: str) -> List[Dict[str, Any]]:
+    def _traduzir_posts(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Carrega o cache de posts.
-
-        Args:
-            nome: Nome do cache
+        Traduz uma lista de posts para português em lote, se necessário.
 
-        Returns:
-            List[Dict[str, Any]]: Lista de posts em cache
-        """
-        cache_path = self._get_cache_path(nome)
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Erro ao carregar cache para {nome}: {e}")
-        return []
-
-    def _save_cache(self, nome: str, posts: List[Dict[str, Any]]) -> None:
-        """
-        Salva o cache de posts.
+        Textos já traduzidos antes são reaproveitados da memória de tradução.
 
         Args:
-            nome: Nome do cache
-            posts: Lista de posts a serem salvos
-        """
-        cache_path = self._get_cache_path(nome)
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(posts, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Erro ao salvar cache para {nome}: {e}")
-
-    def _traduzir_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Traduz um post para português, se necessário.
-
-        Args:
-            post: Dados do post
+            posts: Lista de posts
 
         Returns:
-            Dict[str, Any]: Post traduzido
+            List[Dict[str, Any]]: Posts traduzidos, na mesma ordem
         """
         if not self.traduzir_automaticamente:
-            return post
-
-        # Se o post já está em português, não precisa traduzir
-        if post.get("idioma", "pt") == "pt":
-            return post
+            return posts
 
-        try:
-            # Traduzir título
-            titulo_traduzido = self.translator.translate(
-                post["titulo"], src=post.get("idioma", "en"), dest="pt"
-            ).text
-
-            # Traduzir texto, se existir
-            texto_traduzido = ""
-            if post.get("texto"):
-                texto_traduzido = self.translator.translate(
-                    post["texto"], src=post.get("idioma", "en"), dest="pt"
-                ).text
-
-            # Criar cópia do post com os campos traduzidos
-            post_traduzido = post.copy()
-            post_traduzido["titulo_original"] = post["titulo"]
-            post_traduzido["titulo"] = titulo_traduzido
-            
-            if texto_traduzido:
-                post_traduzido["texto_original"] = post["texto"]
-                post_traduzido["texto"] = texto_traduzido
-            
-            post_traduzido["traduzido"] = True
-            post_traduzido["idioma_original"] = post.get("idioma", "en")
-            post_traduzido["idioma"] = "pt"
-
-            logger.info(f"Post traduzido: {post['titulo']} -> {titulo_traduzido}")
-            return post_traduzido
-        except Exception as e:
-            logger.error(f"Erro ao traduzir post: {e}")
-            # Em caso de erro, retornar o post original
-            post["traduzido"] = False
-            return post
+        return self.tradutor.traduzir_itens(posts, ["titulo", "texto"])
 
     def _verificar_credibilidade(self, post: Dict[str, Any], subreddit: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -306,12 +250,16 @@ class RedditCriptoScraper:
         """
         logger.info(f"Buscando posts no subreddit {subreddit['nome']}...")
         
-        # Implementação usando a API do Reddit
+        # Implementação usando a API do Reddit ou alternativa (sem API)
         if self.usar_api:
-            return self._buscar_posts_por_subreddit_api(subreddit, max_posts)
+            posts = self._buscar_posts_por_subreddit_api(subreddit, max_posts)
+        else:
+            posts = self._buscar_posts_por_subreddit_alternativo(subreddit, max_posts)
         
-        # Implementação alternativa (sem API)
-        return self._buscar_posts_por_subreddit_alternativo(subreddit, max_posts)
+        # Atualizar o armazém local (upsert pelo ID)
+        self.armazem.salvar("reddit", subreddit["nome"], posts)
+        
+        return posts
 
     def _buscar_posts_por_subreddit_api(self, subreddit: Dict[str, Any], max_posts: int = 5) -> List[Dict[str, Any]]:
         """
@@ -335,9 +283,11 @@ class RedditCriptoScraper:
             }
             
             # Fazer requisição
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            resposta = self.cache_http.buscar(url, params=params, headers=self.headers)
+            if resposta["nao_modificado"] and resposta["extracao"] is not None:
+                logger.info(f"Subreddit {subreddit['nome']} não mudou, reaproveitando posts já extraídos")
+                return CacheHTTP.renovar_timestamps(resposta["extracao"][:max_posts])
+            data = json.loads(resposta["texto"])
             
             # Extrair posts
             posts = []
@@ -368,12 +318,14 @@ class RedditCriptoScraper:
                 
                 # Adicionar à lista apenas se for confiável
                 if post["confiavel"]:
-                    # Traduzir se necessário
-                    if subreddit.get("idioma") != "pt" and self.traduzir_automaticamente:
-                        post = self._traduzir_post(post)
-                    
                     posts.append(post)
             
+            # Traduzir os posts em lote, se necessário
+            posts = self._traduzir_posts(posts)
+            
+            # Guardar a extração para reaproveitar quando o conteúdo não mudar
+            self.cache_http.salvar_extracao(resposta["chave"], posts)
+            
             return posts[:max_posts]
         except Exception as e:
             logger.error(f"Erro ao buscar posts no subreddit {subreddit['nome']}: {e}")
@@ -396,9 +348,11 @@ class RedditCriptoScraper:
             
             # Fazer requisição
             headers = {'User-Agent': 'CriptoScraper/0.1 by YourUsername'}
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            resposta = self.cache_http.buscar(url, headers=headers)
+            if resposta["nao_modificado"] and resposta["extracao"] is not None:
+                logger.info(f"Subreddit {subreddit['nome']} não mudou, reaproveitando posts já extraídos")
+                return CacheHTTP.renovar_timestamps(resposta["extracao"][:max_posts])
+            data = json.loads(resposta["texto"])
             
             # Extrair posts
             posts = []
@@ -429,12 +383,14 @@ class RedditCriptoScraper:
                 
                 # Adicionar à lista apenas se for confiável
                 if post["confiavel"]:
-                    # Traduzir se necessário
-                    if subreddit.get("idioma") != "pt" and self.traduzir_automaticamente:
-                        post = self._traduzir_post(post)
-                    
                     posts.append(post)
             
+            # Traduzir os posts em lote, se necessário
+            posts = self._traduzir_posts(posts)
+            
+            # Guardar a extração para reaproveitar quando o conteúdo não mudar
+            self.cache_http.salvar_extracao(resposta["chave"], posts)
+            
             return posts[:max_posts]
         except Exception as e:
             logger.error(f"Erro ao buscar posts no subreddit {subreddit['nome']} (método alternativo): {e}")
@@ -453,12 +409,16 @@ class RedditCriptoScraper:
         """
         logger.info(f"Buscando posts para o termo '{termo}'...")
         
-        # Implementação usando a API do Reddit
+        # Implementação usando a API do Reddit ou alternativa (sem API)
         if self.usar_api:
-            return self._buscar_posts_por_termo_api(termo, max_posts)
+            posts = self._buscar_posts_por_termo_api(termo, max_posts)
+        else:
+            posts = self._buscar_posts_por_termo_alternativo(termo, max_posts)
+        
+        # Atualizar o armazém local (upsert pelo ID)
+        self.armazem.salvar("reddit", termo, posts)
         
-        # Implementação alternativa (sem API)
-        return self._buscar_posts_por_termo_alternativo(termo, max_posts)
+        return posts
 
     def _buscar_posts_por_termo_api(self, termo: str, max_posts: int = 5) -> List[Dict[str, Any]]:
         """
@@ -482,9 +442,11 @@ class RedditCriptoScraper:
             }
             
             # Fazer requisição
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            resposta = self.cache_http.buscar(url, params=params, headers=self.headers)
+            if resposta["nao_modificado"] and resposta["extracao"] is not None:
+                logger.info(f"Busca por '{termo}' não mudou, reaproveitando posts já extraídos")
+                return CacheHTTP.renovar_timestamps(resposta["extracao"][:max_posts])
+            data = json.loads(resposta["texto"])
             
             # Extrair posts
             posts = []
@@ -527,12 +489,14 @@ class RedditCriptoScraper:
                 
                 # Adicionar à lista apenas se for confiável
                 if post["confiavel"]:
-                    # Traduzir se necessário
-                    if subreddit_info.get("idioma") != "pt" and self.traduzir_automaticamente:
-                        post = self._traduzir_post(post)
-                    
                     posts.append(post)
             
+            # Traduzir os posts em lote, se necessário
+            posts = self._traduzir_posts(posts)
+            
+            # Guardar a extração para reaproveitar quando o conteúdo não mudar
+            self.cache_http.salvar_extracao(resposta["chave"], posts)
+            
             return posts[:max_posts]
         except Exception as e:
             logger.error(f"Erro ao buscar posts para o termo '{termo}': {e}")
@@ -583,17 +547,8 @@ class RedditCriptoScraper:
             
             posts = self.buscar_posts_por_subreddit(subreddit, max_por_subreddit * 2)  # Buscar mais para compensar filtragem
             
-            # Filtrar posts pela data
-            posts_recentes = []
-            for post in posts:
-                # Se não tiver data, assumir que é recente
-                if not post.get("data_criacao"):
-                    posts_recentes.append(post)
-                    continue
-                
-                # Verificar se a data é mais recente que o limite
-                if post["data_criacao"] >= data_limite_iso:
-                    posts_recentes.append(post)
+            # Filtrar posts pela data (sem data, assumir que é recente)
+            posts_recentes = filtrar_recentes("reddit", posts, data_limite_iso)
             
             logger.info(f"Subreddit {subreddit['nome']}: {len(posts)} posts encontrados, {len(posts_recentes)} dentro do período de {dias_max} dias")
             
@@ -610,17 +565,8 @@ class RedditCriptoScraper:
             
             posts = self.buscar_posts_por_termo(termo, max_por_termo * 2)  # Buscar mais para compensar filtragem
             
-            # Filtrar posts pela data
-            posts_recentes = []
-            for post in posts:
-                # Se não tiver data, assumir que é recente
-                if not post.get("data_criacao"):
-                    posts_recentes.append(post)
-                    continue
-                
-                # Verificar se a data é mais recente que o limite
-                if post["data_criacao"] >= data_limite_iso:
-                    posts_recentes.append(post)
+            # Filtrar posts pela data (sem data, assumir que é recente)
+            posts_recentes = filtrar_recentes("reddit", posts, data_limite_iso)
             
             logger.info(f"Termo '{termo}': {len(posts)} posts encontrados, {len(posts_recentes)} dentro do período de {dias_max} dias")
             
@@ -13,11 +13,16 @@ import random
 import logging
 import requests
 import nltk
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from urllib.parse import quote
 from textblob import TextBlob
-from googletrans import Translator
+
+from core import cliente_http
+from core.cache_http import CacheHTTP
+from core.armazem_itens import ArmazemItens, filtrar_recentes
+from core.tradutor import Tradutor
+from core.lexico_sentimento import PontuadorLexico, normalizar_texto, classificar_polaridade
 
 # Importar o gerenciador de fontes confiáveis
 try:
@@ -40,13 +45,6 @@ try:
 except Exception as e:
     logger.warning(f"Erro ao baixar recursos do NLTK: {e}")
 
-# Inicializar tradutor
-translator = None
-try:
-    translator = Translator()
-except Exception as e:
-    logger.warning(f"Erro ao inicializar tradutor: {e}")
-
 # Contas relevantes de criptomoedas para seguir
 CONTAS_CRIPTO = [
     # Contas originais
@@ -103,12 +101,100 @@ TERMOS_BUSCA = [
 class AnalisadorSentimento:
     """
     Classe para analisar o sentimento de textos.
+
+    Textos em português são pontuados localmente com um léxico, sem tradução;
+    textos em inglês vão direto para o TextBlob e os demais idiomas são
+    traduzidos para o inglês (em lote, com memória de tradução) antes.
     """
-    def __init__(self):
+    def __init__(self, tradutor: Optional[Tradutor] = None, usar_lexico: bool = True):
         """
         Inicializa o analisador de sentimento.
+
+        Args:
+            tradutor: Tradutor com memória de tradução (se None, cria um com a memória padrão)
+            usar_lexico: Se True, pontua textos em português com o léxico local em vez de
+                traduzi-los para o inglês
+        """
+        self.tradutor = tradutor or Tradutor()
+        self.usar_lexico = usar_lexico
+        self.pontuador_lexico = PontuadorLexico()
+
+        # Memória de análises com o TextBlob, por idioma e texto normalizado
+        self._memoria = {}
+
+    def _analisar_textblob(self, textos: List[str], idioma: str) -> List[float]:
         """
-        self.translator = translator
+        Calcula a polaridade de textos com o TextBlob, traduzindo-os para o inglês se necessário.
+
+        Args:
+            textos: Textos normalizados a serem analisados
+            idioma: Idioma dos textos
+
+        Returns:
+            List[float]: Polaridades (-1 a 1), na mesma ordem
+        """
+        # Traduzir para inglês se necessário (TextBlob funciona melhor em inglês)
+        textos_para_analise = textos
+        if idioma != "en" and self.tradutor.disponivel:
+            try:
+                textos_para_analise = self.tradutor.traduzir_lote(textos, idioma, "en")
+            except Exception as e:
+                logger.warning(f"Erro ao traduzir textos para análise: {e}")
+
+        return [TextBlob(texto).sentiment.polarity for texto in textos_para_analise]
+
+    def analisar_lote(self, textos: List[str], idioma: Union[str, List[str]] = "pt") -> List[Tuple[float, str]]:
+        """
+        Analisa o sentimento de uma lista de textos.
+
+        Textos que normalizam para o mesmo conteúdo são analisados uma única vez.
+
+        Args:
+            textos: Textos a serem analisados
+            idioma: Idioma dos textos (um para todos ou um por texto)
+
+        Returns:
+            List[Tuple[float, str]]: Pontuação de polaridade (-1 a 1) e classificação
+                (positivo, negativo, neutro) de cada texto
+        """
+        idiomas = [idioma] * len(textos) if isinstance(idioma, str) else list(idioma)
+        resultados = [(0.0, "neutro")] * len(textos)
+
+        try:
+            # Separar os textos por método de análise
+            lexico = []
+            pendentes = {}
+            for i, (texto, idioma_texto) in enumerate(zip(textos, idiomas)):
+                if idioma_texto == "pt" and self.usar_lexico:
+                    lexico.append(i)
+                    continue
+
+                chave = (idioma_texto, normalizar_texto(texto))
+                if chave in self._memoria:
+                    resultados[i] = self._memoria[chave]
+                else:
+                    pendentes.setdefault(chave, []).append(i)
+
+            # Pontuar os textos em português com o léxico local
+            for i, resultado in zip(lexico, self.pontuador_lexico.analisar_lote([textos[i] for i in lexico])):
+                resultados[i] = resultado
+
+            # Analisar os demais com o TextBlob, um lote por idioma
+            por_idioma = {}
+            for chave in pendentes:
+                por_idioma.setdefault(chave[0], []).append(chave)
+
+            for idioma_lote, chaves in por_idioma.items():
+                polaridades = self._analisar_textblob([chave[1] for chave in chaves], idioma_lote)
+                for chave, polaridade in zip(chaves, polaridades):
+                    resultado = (polaridade, classificar_polaridade(polaridade))
+                    self._memoria[chave] = resultado
+                    for i in pendentes[chave]:
+                        resultados[i] = resultado
+        except Exception as e:
+            logger.error(f"Erro ao analisar sentimento: {e}")
+
+        return resultados
 
     def analisar(self, texto: str, idioma: str = "pt") -> Tuple[float, str]:
         """
@@ -121,31 +207,7 @@ class AnalisadorSentimento:
         Returns:
             Tuple[float, str]: Pontuação de polaridade (-1 a 1) e classificação (positivo, negativo, neutro)
         """
-        try:
-            # Traduzir para inglês se necessário (TextBlob funciona melhor em inglês)
-            texto_para_analise = texto
-            if idioma != "en" and self.translator:
-                try:
-                    texto_para_analise = self.translator.translate(texto, src=idioma, dest="en").text
-                except Exception as e:
-                    logger.warning(f"Erro ao traduzir texto para análise: {e}")
-
-            # Analisar sentimento
-            analise = TextBlob(texto_para_analise)
-            polaridade = analise.sentiment.polarity
-
-            # Classificar sentimento
-            if polaridade > 0.1:
-                classificacao = "positivo"
-            elif polaridade < -0.1:
-                classificacao = "negativo"
-            else:
-                classificacao = "neutro"
-
-            return polaridade, classificacao
-        except Exception as e:
-            logger.error(f"Erro ao analisar sentimento: {e}")
-            return 0.0, "neutro"
+        return self.analisar_lote([texto], idioma)[0]
 
 class TwitterCriptoScraper:
     """
@@ -154,7 +216,8 @@ class TwitterCriptoScraper:
     """
     def __init__(self, api_key: str = None, api_secret: str = None,
                  bearer_token: str = None, cache_dir: str = "cache",
-                 filtro_sentimento: str = None, usar_fontes_confiaveis: bool = True):
+                 filtro_sentimento: str = None, usar_fontes_confiaveis: bool = True,
+                 tradutor: Optional[Tradutor] = None):
         """
         Inicializa o scraper de tweets.
 
@@ -165,6 +228,7 @@ class TwitterCriptoScraper:
             cache_dir: Diretório para armazenar o cache de tweets
             filtro_sentimento: Filtro de sentimento ('positivo', 'negativo', 'neutro', None para todos)
             usar_fontes_confiaveis: Se True, usa o banco de dados de fontes confiáveis
+            tradutor: Tradutor com memória de tradução (se None, cria um com a memória em cache_dir)
         """
         self.api_key = api_key or os.environ.get("TWITTER_API_KEY")
         self.api_secret = api_secret or os.environ.get("TWITTER_API_SECRET")
@@ -175,7 +239,9 @@ class TwitterCriptoScraper:
         self.usar_fontes_confiaveis = usar_fontes_confiaveis and TRUSTED_SOURCES_AVAILABLE
 
         # Inicializar analisador de sentimento
-        self.analisador_sentimento = AnalisadorSentimento()
+        self.analisador_sentimento = AnalisadorSentimento(
+            tradutor or Tradutor(arquivo_memoria=os.path.join(cache_dir, "traducoes.db"))
+        )
 
         # Inicializar gerenciador de fontes confiáveis
         self.trusted_sources = None
@@ -200,58 +266,31 @@ class TwitterCriptoScraper:
         # Criar diretório de cache se não existir
         os.makedirs(self.cache_dir, exist_ok=True)
 
+        # Cache de respostas HTTP (requisições condicionais com ETag/Last-Modified)
+        self.cache_http = CacheHTTP(os.path.join(self.cache_dir, "http"))
+
+        # Armazém local dos tweets coletados (compartilhado com os outros buscadores)
+        self.armazem = ArmazemItens(os.path.join(self.cache_dir, "itens.db"))
+
         logger.info(f"Inicializado com {'API oficial' if self.use_api else 'método alternativo'}")
         if self.filtro_sentimento:
             logger.info(f"Filtrando tweets com sentimento: {self.filtro_sentimento}")
         if self.usar_fontes_confiaveis:
             logger.info("Usando banco de dados de fontes confiáveis")
 
-    def _get_cache_path(self, termo: str) -> str:
-        """
-        Retorna o caminho para o arquivo de cache de um termo.
-
-        Args:
-            termo: Termo de busca
-
-        Returns:
-            str: Caminho para o arquivo de cache
-        """
-        termo_sanitizado = re.sub(r'[^\w]', '_', termo.lower())
-        return os.path.join(self.cache_dir, f"twitter_{termo_sanitizado}_cache.json")
-
-    def _load_cache(self, termo: str) -> List[Dict[str, Any]]:
+    def _filtrar_por_sentimento(self, tweets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Carrega o cache de tweets de um termo.
+        Filtra os tweets pelo sentimento configurado.
 
         Args:
-            termo: Termo de busca
+            tweets: Lista de tweets analisados
 
         Returns:
-            List[Dict[str, Any]]: Lista de tweets em cache
-        """
-        cache_path = self._get_cache_path(termo)
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Erro ao carregar cache para '{termo}': {e}")
-        return []
-
-    def _save_cache(self, termo: str, tweets: List[Dict[str, Any]]) -> None:
+            List[Dict[str, Any]]: Tweets com o sentimento desejado (todos, se não houver filtro)
         """
-        Salva o cache de tweets de um termo.
-
-        Args:
-            termo: Termo de busca
-            tweets: Lista de tweets a serem salvos
-        """
-        cache_path = self._get_cache_path(termo)
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(tweets, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Erro ao salvar cache para '{termo}': {e}")
+        if self.filtro_sentimento is None:
+            return tweets
+        return [tweet for tweet in tweets if tweet["sentimento"] == self.filtro_sentimento]
 
     def _buscar_tweets_api(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """
@@ -276,15 +315,17 @@ class TwitterCriptoScraper:
             params = {
                 "query": query,
                 "max_results": max_results,
-                "tweet.fields": "created_at,author_id,public_metrics,entities",
+                "tweet.fields": "created_at,author_id,public_metrics,entities,lang",
                 "user.fields": "name,username,profile_image_url",
                 "expansions": "author_id"
             }
 
             # Fazer requisição
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            resposta = self.cache_http.buscar(url, params=params, timeout=30, sessao=self.session)
+            if resposta["nao_modificado"] and resposta["extracao"] is not None:
+                logger.info(f"Busca por '{query}' não mudou, reaproveitando tweets já analisados")
+                return self._filtrar_por_sentimento(CacheHTTP.renovar_timestamps(resposta["extracao"]))
+            data = json.loads(resposta["texto"])
 
             # Processar resultados
             tweets = []
@@ -292,22 +333,17 @@ class TwitterCriptoScraper:
             if "data" in data and "includes" in data and "users" in data["includes"]:
                 users = {user["id"]: user for user in data["includes"]["users"]}
 
-                for tweet in data["data"]:
-                    author = users.get(tweet["author_id"], {})
-
-                    # Analisar sentimento do tweet
-                    texto = tweet["text"]
-                    idioma = "en"  # Assumir inglês por padrão
+                # Idioma detectado pelo próprio Twitter (assumir inglês se indefinido)
+                idiomas = [tweet.get("lang") or "en" for tweet in data["data"]]
+                idiomas = ["en" if idioma == "und" else idioma for idioma in idiomas]
 
-                    # Detectar idioma se possível
-                    if translator:
-                        try:
-                            idioma = translator.detect(texto).lang
-                        except Exception as e:
-                            logger.warning(f"Erro ao detectar idioma: {e}")
+                # Analisar o sentimento de todos os tweets em lote
+                sentimentos = self.analisador_sentimento.analisar_lote(
+                    [tweet["text"] for tweet in data["data"]], idiomas
+                )
 
-                    # Analisar sentimento
-                    polaridade, sentimento = self.analisador_sentimento.analisar(texto, idioma)
+                for tweet, idioma, (polaridade, sentimento) in zip(data["data"], idiomas, sentimentos):
+                    author = users.get(tweet["author_id"], {})
 
                     # Verificar confiabilidade da fonte
                     confiabilidade = 5  # Valor padrão médio
@@ -354,11 +390,12 @@ class TwitterCriptoScraper:
                         "timestamp": datetime.now().isoformat()
                     }
 
-                    # Filtrar por sentimento, se necessário
-                    if self.filtro_sentimento is None or sentimento == self.filtro_sentimento:
-                        tweets.append(tweet_obj)
+                    tweets.append(tweet_obj)
+
+            # Guardar a análise (antes do filtro) para reaproveitar quando a busca não mudar
+            self.cache_http.salvar_extracao(resposta["chave"], tweets)
 
-            return tweets
+            return self._filtrar_por_sentimento(tweets)
         except Exception as e:
             logger.error(f"Erro ao buscar tweets via API para '{query}': {e}")
             return []
@@ -395,7 +432,7 @@ class TwitterCriptoScraper:
             }
 
             # Fazer requisição
-            response = requests.get(url, headers=headers, timeout=30)
+            response = cliente_http.get(url, headers=headers, timeout=30)
             response.raise_for_status()
 
             # Nota: Aqui normalmente usaríamos BeautifulSoup para extrair os tweets,
@@ -404,22 +441,22 @@ class TwitterCriptoScraper:
             # outra ferramenta para renderizar a página.
 
             # Para fins de demonstração, vamos retornar alguns tweets fictícios
-            tweets = []
-            for i in range(min(5, max_results)):
-                # Criar texto do tweet com sentimento variado
-                textos = [
-                    f"Ótimas notícias sobre {query}! O mercado está em alta! 🚀",
-                    f"Preocupante situação para {query}, os preços estão caindo rapidamente. 📉",
-                    f"Informações neutras sobre {query}. O mercado segue estável.",
-                    f"Excelente momento para investir em {query}! Muitas oportunidades! 💰",
-                    f"Cuidado com {query} neste momento, há sinais de queda. ⚠️"
-                ]
-                texto = textos[i % len(textos)]
-
-                # Analisar sentimento
-                idioma = "pt"
-                polaridade, sentimento = self.analisador_sentimento.analisar(texto, idioma)
+            # Criar textos dos tweets com sentimento variado
+            textos = [
+                f"Ótimas notícias sobre {query}! O mercado está em alta! 🚀",
+                f"Preocupante situação para {query}, os preços estão caindo rapidamente. 📉",
+                f"Informações neutras sobre {query}. O mercado segue estável.",
+                f"Excelente momento para investir em {query}! Muitas oportunidades! 💰",
+                f"Cuidado com {query} neste momento, há sinais de queda. ⚠️"
+            ]
+            textos_tweets = [textos[i % len(textos)] for i in range(min(5, max_results))]
+
+            # Analisar o sentimento de todos os tweets em lote
+            idioma = "pt"
+            sentimentos = self.analisador_sentimento.analisar_lote(textos_tweets, [idioma] * len(textos_tweets))
 
+            tweets = []
+            for i, (texto, (polaridade, sentimento)) in enumerate(zip(textos_tweets, sentimentos)):
                 # Definir autor aleatório de uma lista de contas confiáveis
                 contas_exemplo = ["bitdov", "caueconomy", "BitcoinMagazine", "cointelegraph", "BSCnews"]
                 autor_username = random.choice(contas_exemplo)
@@ -498,19 +535,10 @@ class TwitterCriptoScraper:
             # Fallback para método alternativo
             tweets = self._buscar_tweets_alternativo(query, max_results)
 
-        # Carregar cache
-        cache = self._load_cache(query)
-
-        # Filtrar tweets já existentes no cache
-        ids_cache = {tweet["id"] for tweet in cache}
-        tweets_novos = [tweet for tweet in tweets if tweet["id"] not in ids_cache]
-
-        # Atualizar cache
-        cache = tweets_novos + cache
-        cache = cache[:100]  # Manter apenas os 100 tweets mais recentes
-        self._save_cache(query, cache)
+        # Atualizar o armazém local (upsert pelo ID)
+        novos = self.armazem.salvar("twitter", query, tweets)
 
-        logger.info(f"Encontrados {len(tweets_novos)} tweets novos para '{query}'")
+        logger.info(f"Encontrados {novos} tweets novos para '{query}'")
 
         # Retornar os tweets mais recentes
         return tweets[:max_results]
@@ -543,17 +571,8 @@ class TwitterCriptoScraper:
 
             tweets = self.buscar_tweets(termo, max_por_termo * 2)  # Buscar mais para compensar filtragem
 
-            # Filtrar tweets pela data
-            tweets_recentes = []
-            for tweet in tweets:
-                # Se não tiver data, assumir que é recente
-                if not tweet.get("created_at"):
-                    tweets_recentes.append(tweet)
-                    continue
-
-                # Verificar se a data é mais recente que o limite
-                if tweet["created_at"] >= data_limite_iso:
-                    tweets_recentes.append(tweet)
+            # Filtrar tweets pela data (sem data, assumir que é recente)
+            tweets_recentes = filtrar_recentes("twitter", tweets, data_limite_iso)
 
             logger.info(f"Termo '{termo}': {len(tweets)} tweets encontrados, {len(tweets_recentes)} dentro do período de {dias_max} dias")
 
@@ -608,17 +627,8 @@ class TwitterCriptoScraper:
             query = f"from:{conta}"
             tweets = self.buscar_tweets(query, max_por_conta * 2)  # Buscar mais para compensar filtragem
 
-            # Filtrar tweets pela data
-            tweets_recentes = []
-            for tweet in tweets:
-                # Se não tiver data, assumir que é recente
-                if not tweet.get("created_at"):
-                    tweets_recentes.append(tweet)
-                    continue
-
-                # Verificar se a data é mais recente que o limite
-                if tweet["created_at"] >= data_limite_iso:
-                    tweets_recentes.append(tweet)
+            # Filtrar tweets pela data (sem data, assumir que é recente)
+            tweets_recentes = filtrar_recentes("twitter", tweets, data_limite_iso)
 
             logger.info(f"Conta '@{conta}': {len(tweets)} tweets encontrados, {len(tweets_recentes)} dentro do período de {dias_max} dias")
 
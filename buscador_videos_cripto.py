@@ -12,6 +12,10 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, parse_qs
 
+from core.cache_http import CacheHTTP
+from core.armazem_itens import ArmazemItens, filtrar_recentes
+from core.tradutor import Tradutor
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -63,7 +67,8 @@ class YouTubeCriptoScraper:
     """
     Classe para buscar vídeos sobre criptomoedas no YouTube.
     """
-    def __init__(self, api_key: str = None, cache_dir: str = "cache", traduzir_automaticamente: bool = True):
+    def __init__(self, api_key: str = None, cache_dir: str = "cache", traduzir_automaticamente: bool = True,
+                 tradutor: Optional[Tradutor] = None):
         """
         Inicializa o scraper de vídeos.
 
@@ -71,6 +76,7 @@ class YouTubeCriptoScraper:
             api_key: Chave da API do YouTube
             cache_dir: Diretório para armazenar o cache de vídeos
             traduzir_automaticamente: Se True, traduz automaticamente vídeos em outros idiomas
+            tradutor: Tradutor com memória de tradução (se None, cria um com a memória em cache_dir)
         """
         self.api_key = api_key or os.environ.get("YOUTUBE_API_KEY")
         self.cache_dir = cache_dir
@@ -86,111 +92,48 @@ class YouTubeCriptoScraper:
         # Criar diretório de cache se não existir
         os.makedirs(self.cache_dir, exist_ok=True)
         
-        # Inicializar tradutor se necessário
+        # Cache de respostas HTTP (requisições condicionais com ETag/Last-Modified)
+        self.cache_http = CacheHTTP(os.path.join(self.cache_dir, "http"))
+
+        # Armazém local dos vídeos coletados (compartilhado com os outros buscadores)
+        self.armazem = ArmazemItens(os.path.join(self.cache_dir, "itens.db"))
+        
+        # Inicializar tradutor (com memória de tradução persistente) se necessário
+        self.tradutor = None
         if traduzir_automaticamente:
-            try:
-                from googletrans import Translator
-                self.translator = Translator()
-            except ImportError:
-                logger.warning("Biblioteca googletrans não encontrada. Tradução automática desativada.")
+            self.tradutor = tradutor or Tradutor(arquivo_memoria=os.path.join(self.cache_dir, "traducoes.db"))
+            if not self.tradutor.disponivel:
+                logger.warning("Nenhum backend de tradução disponível. Tradução automática desativada.")
                 self.traduzir_automaticamente = False
 
-    def _get_cache_path(self, nome: str) -> str:
-        """
-        Retorna o caminho para o arquivo de cache.
-
-        Args:
-            nome: Nome do cache
-
-        Returns:
-            str: Caminho para o arquivo de cache
-        """
-        return os.path.join(self.cache_dir, f"youtube_{nome.lower().replace(' ', '_')}_cache.json")
-
-    def _load_cache(self, nome: str) -> List[Dict[str, Any]]:
+    def _traduzir_video(self, video: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Carrega o cache de vídeos.
+        Traduz um vídeo para português, se necessário.
 
         Args:
-            nome: Nome do cache
+            video: Dados do vídeo
 
         Returns:
-            List[Dict[str, Any]]: Lista de vídeos em cache
+            Dict[str, Any]: Vídeo traduzido
         """
-        cache_path = self._get_cache_path(nome)
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Erro ao carregar cache para {nome}: {e}")
-        return []
+        return self._traduzir_videos([video])[0]
 
-    def _save_cache(self, nome: str, videos: List[Dict[str, Any]]) -> None:
+    def _traduzir_videos(self, videos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Salva o cache de vídeos.
+        Traduz uma lista de vídeos para português em lote, se necessário.
 
-        Args:
-            nome: Nome do cache
-            videos: Lista de vídeos a serem salvos
-        """
-        cache_path = self._get_cache_path(nome)
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(videos, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.error(f"Erro ao salvar cache para {nome}: {e}")
-
-    def _traduzir_video(self, video: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Traduz um vídeo para português, se necessário.
+        Textos já traduzidos antes são reaproveitados da memória de tradução.
 
         Args:
-            video: Dados do vídeo
+            videos: Lista de vídeos
 
         Returns:
-            Dict[str, Any]: Vídeo traduzido
+            List[Dict[str, Any]]: Vídeos traduzidos, na mesma ordem
         """
         if not self.traduzir_automaticamente:
-            return video
+            return videos
 
-        # Se o vídeo já está em português, não precisa traduzir
-        if video.get("idioma", "pt") == "pt":
-            return video
-
-        try:
-            # Traduzir título
-            titulo_traduzido = self.translator.translate(
-                video["titulo"], src=video.get("idioma", "en"), dest="pt"
-            ).text
-
-            # Traduzir descrição, se existir
-            descricao_traduzida = ""
-            if video.get("descricao"):
-                descricao_traduzida = self.translator.translate(
-                    video["descricao"], src=video.get("idioma", "en"), dest="pt"
-                ).text
-
-            # Criar cópia do vídeo com os campos traduzidos
-            video_traduzido = video.copy()
-            video_traduzido["titulo_original"] = video["titulo"]
-            video_traduzido["titulo"] = titulo_traduzido
-            
-            if descricao_traduzida:
-                video_traduzido["descricao_original"] = video["descricao"]
-                video_traduzido["descricao"] = descricao_traduzida
-            
-            video_traduzido["traduzido"] = True
-            video_traduzido["idioma_original"] = video.get("idioma", "en")
-            video_traduzido["idioma"] = "pt"
-
-            logger.info(f"Vídeo traduzido: {video['titulo']} -> {titulo_traduzido}")
-            return video_traduzido
-        except Exception as e:
-            logger.error(f"Erro ao traduzir vídeo: {e}")
-            # Em caso de erro, retornar o vídeo original
-            video["traduzido"] = False
-            return video
+        return self.tradutor.traduzir_itens(videos, ["titulo", "descricao"])
 
     def buscar_videos_por_canal(self, canal: Dict[str, Any], max_videos: int = 5) -> List[Dict[str, Any]]:
         """
@@ -205,12 +148,16 @@ class YouTubeCriptoScraper:
         """
         logger.info(f"Buscando vídeos no canal {canal['nome']}...")
         
-        # Implementação usando a API do YouTube
+        # Implementação usando a API do YouTube ou alternativa (sem API)
         if self.usar_api:
-            return self._buscar_videos_por_canal_api(canal, max_videos)
+            videos = self._buscar_videos_por_canal_api(canal, max_videos)
+        else:
+            videos = self._buscar_videos_por_canal_alternativo(canal, max_videos)
+        
+        # Atualizar o armazém local (upsert pelo ID)
+        self.armazem.salvar("youtube", canal["nome"], videos)
         
-        # Implementação alternativa (sem API)
-        return self._buscar_videos_por_canal_alternativo(canal, max_videos)
+        return videos
 
     def _buscar_videos_por_canal_api(self, canal: Dict[str, Any], max_videos: int = 5) -> List[Dict[str, Any]]:
         """
@@ -236,9 +183,11 @@ class YouTubeCriptoScraper:
             }
             
             # Fazer requisição
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            resposta = self.cache_http.buscar(url, params=params)
+            if resposta["nao_modificado"] and resposta["extracao"] is not None:
+                logger.info(f"Canal {canal['nome']} não mudou, reaproveitando vídeos já extraídos")
+                return CacheHTTP.renovar_timestamps(resposta["extracao"][:max_videos])
+            data = json.loads(resposta["texto"])
             
             # Extrair vídeos
             videos = []
@@ -260,12 +209,14 @@ class YouTubeCriptoScraper:
                     "timestamp": datetime.now().isoformat()
                 }
                 
-                # Traduzir se necessário
-                if canal.get("idioma") != "pt" and self.traduzir_automaticamente:
-                    video = self._traduzir_video(video)
-                
                 videos.append(video)
             
+            # Traduzir os vídeos em lote, se necessário
+            videos = self._traduzir_videos(videos)
+            
+            # Guardar a extração para reaproveitar quando o conteúdo não mudar
+            self.cache_http.salvar_extracao(resposta["chave"], videos)
+            
             return videos[:max_videos]
         except Exception as e:
             logger.error(f"Erro ao buscar vídeos no canal {canal['nome']}: {e}")
@@ -300,12 +251,16 @@ class YouTubeCriptoScraper:
         """
         logger.info(f"Buscando vídeos para o termo '{termo}'...")
         
-        # Implementação usando a API do YouTube
+        # Implementação usando a API do YouTube ou alternativa (sem API)
         if self.usar_api:
-            return self._buscar_videos_por_termo_api(termo, max_videos)
+            videos = self._buscar_videos_por_termo_api(termo, max_videos)
+        else:
+            videos = self._buscar_videos_por_termo_alternativo(termo, max_videos)
+        
+        # Atualizar o armazém local (upsert pelo ID)
+        self.armazem.salvar("youtube", termo, videos)
         
-        # Implementação alternativa (sem API)
-        return self._buscar_videos_por_termo_alternativo(termo, max_videos)
+        return videos
 
     def _buscar_videos_por_termo_api(self, termo: str, max_videos: int = 5) -> List[Dict[str, Any]]:
         """
@@ -332,9 +287,11 @@ class YouTubeCriptoScraper:
             }
             
             # Fazer requisição
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            resposta = self.cache_http.buscar(url, params=params)
+            if resposta["nao_modificado"] and resposta["extracao"] is not None:
+                logger.info(f"Busca por '{termo}' não mudou, reaproveitando vídeos já extraídos")
+                return self._selecionar_confiaveis(CacheHTTP.renovar_timestamps(resposta["extracao"]), max_videos)
+            data = json.loads(resposta["texto"])
             
             # Extrair vídeos
             videos = []
@@ -367,25 +324,40 @@ class YouTubeCriptoScraper:
                     "timestamp": datetime.now().isoformat()
                 }
                 
-                # Traduzir se necessário
-                if idioma != "pt" and self.traduzir_automaticamente:
-                    video = self._traduzir_video(video)
-                
                 videos.append(video)
             
-            # Filtrar por confiabilidade
-            videos_confiaveis = [v for v in videos if v.get("confiabilidade", 0) >= 6]
+            # Traduzir os vídeos em lote, se necessário
+            videos = self._traduzir_videos(videos)
             
-            # Se não houver vídeos confiáveis suficientes, incluir alguns não confiáveis
-            if len(videos_confiaveis) < max_videos:
-                videos_restantes = [v for v in videos if v not in videos_confiaveis]
-                videos_confiaveis.extend(videos_restantes[:max_videos - len(videos_confiaveis)])
+            # Guardar a extração completa (antes do filtro) para reaproveitar quando o conteúdo não mudar
+            self.cache_http.salvar_extracao(resposta["chave"], videos)
             
-            return videos_confiaveis[:max_videos]
+            return self._selecionar_confiaveis(videos, max_videos)
         except Exception as e:
             logger.error(f"Erro ao buscar vídeos para o termo '{termo}': {e}")
             return []
 
+    def _selecionar_confiaveis(self, videos: List[Dict[str, Any]], max_videos: int) -> List[Dict[str, Any]]:
+        """
+        Seleciona os vídeos mais confiáveis de uma busca.
+
+        Args:
+            videos: Vídeos extraídos da busca
+            max_videos: Número máximo de vídeos a retornar
+
+        Returns:
+            List[Dict[str, Any]]: Vídeos confiáveis, completados com não confiáveis se faltarem
+        """
+        # Filtrar por confiabilidade
+        videos_confiaveis = [v for v in videos if v.get("confiabilidade", 0) >= 6]
+
+        # Se não houver vídeos confiáveis suficientes, incluir alguns não confiáveis
+        if len(videos_confiaveis) < max_videos:
+            videos_restantes = [v for v in videos if v not in videos_confiaveis]
+            videos_confiaveis.extend(videos_restantes[:max_videos - len(videos_confiaveis)])
+
+        return videos_confiaveis[:max_videos]
+
     def _buscar_videos_por_termo_alternativo(self, termo: str, max_videos: int = 5) -> List[Dict[str, Any]]:
         """
         Busca vídeos por um termo sem usar a API do YouTube (método alternativo).
@@ -431,17 +403,8 @@ class YouTubeCriptoScraper:
             
             videos = self.buscar_videos_por_canal(canal, max_por_canal * 2)  # Buscar mais para compensar filtragem
             
-            # Filtrar vídeos pela data
-            videos_recentes = []
-            for video in videos:
-                # Se não tiver data, assumir que é recente
-                if not video.get("data_publicacao"):
-                    videos_recentes.append(video)
-                    continue
-                
-                # Verificar se a data é mais recente que o limite
-                if video["data_publicacao"] >= data_limite_iso:
-                    videos_recentes.append(video)
+            # Filtrar vídeos pela data (sem data, assumir que é recente)
+            videos_recentes = filtrar_recentes("youtube", videos, data_limite_iso)
             
             logger.info(f"Canal {canal['nome']}: {len(videos)} vídeos encontrados, {len(videos_recentes)} dentro do período de {dias_max} dias")
             
@@ -458,17 +421,8 @@ class YouTubeCriptoScraper:
             
             videos = self.buscar_videos_por_termo(termo, max_por_termo * 2)  # Buscar mais para compensar filtragem
             
-            # Filtrar vídeos pela data
-            videos_recentes = []
-            for video in videos:
-                # Se não tiver data, assumir que é recente
-                if not video.get("data_publicacao"):
-                    videos_recentes.append(video)
-                    continue
-                
-                # Verificar se a data é mais recente que o limite
-                if video["data_publicacao"] >= data_limite_iso:
-                    videos_recentes.append(video)
+            # Filtrar vídeos pela data (sem data, assumir que é recente)
+            videos_recentes = filtrar_recentes("youtube", videos, data_limite_iso)
             
             logger.info(f"Termo '{termo}': {len(videos)} vídeos encontrados, {len(videos_recentes)} dentro do período de {dias_max} dias")
             
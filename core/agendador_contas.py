@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Agendador de renderizações entre as contas do HeyGen.
+Distribui os jobs simultâneos entre todas as contas configuradas, controlando
+por conta os jobs em andamento, a cota restante e as falhas recentes. Quando
+uma conta é limitada (HTTP 429 ou créditos esgotados), ela fica em espera e os
+jobs passam automaticamente para as outras contas.
+"""
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Callable, TypeVar
+
+import requests
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('agendador_contas')
+
+T = TypeVar("T")
+
+# Trechos das mensagens de erro do HeyGen que indicam conta sem créditos ou limitada
+MENSAGENS_LIMITACAO = ("quota", "credit", "crédito", "rate limit", "too many requests")
+
+class ContaIndisponivelError(RuntimeError):
+    """
+    Erro lançado quando nenhuma conta pode receber o job.
+    """
+
+def e_limitacao(erro: Exception) -> bool:
+    """
+    Verifica se um erro indica que a conta foi limitada.
+
+    Args:
+        erro: Exceção lançada pela chamada à API
+
+    Returns:
+        bool: True se o erro é de limitação (HTTP 429/402 ou créditos esgotados)
+    """
+    if isinstance(erro, requests.HTTPError) and erro.response is not None:
+        if erro.response.status_code in (402, 429):
+            return True
+    mensagem = str(erro).lower()
+    return any(trecho in mensagem for trecho in MENSAGENS_LIMITACAO)
+
+class EstadoConta:
+    """
+    Estado de uso de uma conta do HeyGen.
+    """
+    def __init__(self, max_simultaneos: int = 2, cota: Optional[int] = None):
+        """
+        Inicializa o estado.
+
+        Args:
+            max_simultaneos: Número máximo de jobs em andamento na conta
+            cota: Número de renderizações restantes (se None, sem limite conhecido)
+        """
+        self.max_simultaneos = max(1, max_simultaneos)
+        self.cota = cota
+        self.em_andamento = 0
+        self.concluidos = 0
+        self.falhas: deque = deque()
+        self.limitacoes_seguidas = 0
+        self.bloqueada_ate = 0.0
+
+    def disponivel(self, agora: float) -> bool:
+        """
+        Verifica se a conta pode receber mais um job.
+
+        Args:
+            agora: Instante atual (time.monotonic)
+
+        Returns:
+            bool: True se a conta não está bloqueada, tem cota e tem vaga
+        """
+        return (self.bloqueada_ate <= agora
+                and (self.cota is None or self.cota - self.em_andamento > 0)
+                and self.em_andamento < self.max_simultaneos)
+
+class AgendadorContas:
+    """
+    Classe para distribuir jobs entre as contas do HeyGen.
+    """
+    def __init__(self, contas: Dict[str, EstadoConta], janela_falhas: float = 600.0,
+                 espera_limitacao: float = 60.0, espera_maxima: float = 3600.0):
+        """
+        Inicializa o agendador.
+
+        Args:
+            contas: Estado de cada conta, por ID
+            janela_falhas: Janela em segundos em que uma falha conta como recente
+            espera_limitacao: Tempo em segundos que uma conta limitada fica em espera
+                (dobra a cada limitação seguida)
+            espera_maxima: Tempo máximo de espera de uma conta limitada
+        """
+        if not contas:
+            raise ValueError("Nenhuma conta do HeyGen configurada para o agendador")
+
+        self.contas = contas
+        self.janela_falhas = janela_falhas
+        self.espera_limitacao = espera_limitacao
+        self.espera_maxima = espera_maxima
+        self._condicao = threading.Condition()
+
+    @classmethod
+    def de_account_manager(cls, account_manager: Any, contas: Optional[list] = None,
+                           **kwargs) -> "AgendadorContas":
+        """
+        Cria um agendador com as contas do AccountManager que têm API key.
+
+        Os campos opcionais "max_renderizacoes" e "cota" de cada conta em
+        config/heygen_accounts.json definem os limites da conta.
+
+        Args:
+            account_manager: Gerenciador de contas
+            contas: IDs das contas a usar (se None, usa todas as configuradas)
+            **kwargs: Demais argumentos do AgendadorContas
+
+        Returns:
+            AgendadorContas: Agendador configurado
+        """
+        configuradas = account_manager.list_heygen_accounts()
+        estados = {}
+        for conta in contas or list(configuradas):
+            config = configuradas.get(conta, {})
+            if not config.get("api_key"):
+                logger.warning(f"Conta HeyGen sem API key ignorada: {conta}")
+                continue
+            estados[conta] = EstadoConta(config.get("max_renderizacoes", 2), config.get("cota"))
+        return cls(estados, **kwargs)
+
+    def _falhas_recentes(self, estado: EstadoConta, agora: float) -> int:
+        """
+        Remove as falhas fora da janela e retorna quantas restam.
+        """
+        while estado.falhas and agora - estado.falhas[0] > self.janela_falhas:
+            estado.falhas.popleft()
+        return len(estado.falhas)
+
+    def reservar(self, timeout: Optional[float] = None) -> str:
+        """
+        Reserva a conta disponível menos ocupada, aguardando se todas estiverem ocupadas.
+
+        Entre as contas com vaga, prefere a de menor ocupação relativa e, em caso
+        de empate, a com menos falhas recentes.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (se None, espera indefinidamente)
+
+        Returns:
+            str: ID da conta reservada
+
+        Raises:
+            ContaIndisponivelError: Se todas as contas estiverem sem cota ou o tempo de espera acabar
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+
+        with self._condicao:
+            while True:
+                agora = time.monotonic()
+                livres = [conta for conta, estado in self.contas.items() if estado.disponivel(agora)]
+                if livres:
+                    conta = min(livres, key=lambda c: (
+                        self.contas[c].em_andamento / self.contas[c].max_simultaneos,
+                        self._falhas_recentes(self.contas[c], agora)
+                    ))
+                    self.contas[conta].em_andamento += 1
+                    return conta
+
+                if all(estado.cota is not None and estado.cota <= 0 for estado in self.contas.values()):
+                    raise ContaIndisponivelError("Todas as contas do HeyGen estão sem cota")
+
+                espera = [estado.bloqueada_ate - agora for estado in self.contas.values()
+                          if estado.bloqueada_ate > agora]
+                if limite is not None:
+                    espera.append(limite - agora)
+                    if limite <= agora:
+                        raise ContaIndisponivelError("Tempo esgotado aguardando uma conta do HeyGen")
+
+                self._condicao.wait(min(espera) if espera else None)
+
+    def liberar(self, conta: str, sucesso: bool = True, limitada: bool = False) -> None:
+        """
+        Libera um job reservado em uma conta e registra o resultado.
+
+        Args:
+            conta: ID da conta
+            sucesso: Se o job foi concluído
+            limitada: Se a conta foi limitada pela API (a conta fica em espera)
+        """
+        with self._condicao:
+            estado = self.contas[conta]
+            estado.em_andamento -= 1
+            agora = time.monotonic()
+
+            if sucesso:
+                estado.concluidos += 1
+                estado.limitacoes_seguidas = 0
+                if estado.cota is not None:
+                    estado.cota -= 1
+            else:
+                estado.falhas.append(agora)
+
+            if limitada:
+                espera = min(self.espera_limitacao * 2 ** estado.limitacoes_seguidas, self.espera_maxima)
+                estado.limitacoes_seguidas += 1
+                estado.bloqueada_ate = agora + espera
+                logger.warning(f"Conta {conta} limitada. Em espera por {espera:.0f}s")
+
+            self._condicao.notify_all()
+
+    def executar(self, funcao: Callable[[str], T], max_tentativas: Optional[int] = None,
+                 timeout: Optional[float] = None) -> T:
+        """
+        Executa um job em uma conta, passando para outra conta se ela for limitada.
+
+        Args:
+            funcao: Função que recebe o ID da conta e executa o job
+            max_tentativas: Número máximo de contas tentadas (se None, uma por conta)
+            timeout: Tempo máximo de espera por uma conta livre em cada tentativa
+
+        Returns:
+            T: Resultado da função
+
+        Raises:
+            Exception: O erro do job, se não for de limitação ou se as tentativas acabarem
+        """
+        max_tentativas = max_tentativas or len(self.contas)
+
+        for tentativa in range(1, max_tentativas + 1):
+            conta = self.reservar(timeout)
+            try:
+                resultado = funcao(conta)
+            except Exception as e:
+                limitada = e_limitacao(e)
+                self.liberar(conta, sucesso=False, limitada=limitada)
+                if not limitada or tentativa == max_tentativas:
+                    raise
+                logger.info(f"Job transferido da conta {conta} (tentativa {tentativa + 1}/{max_tentativas})")
+                continue
+
+            self.liberar(conta)
+            return resultado
+
+    def resumo(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna o estado atual de cada conta.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Jobs em andamento, concluídos, cota restante,
+                falhas recentes e se a conta está em espera
+        """
+        with self._condicao:
+            agora = time.monotonic()
+            return {
+                conta: {
+                    "em_andamento": estado.em_andamento,
+                    "concluidos": estado.concluidos,
+                    "cota": estado.cota,
+                    "falhas_recentes": self._falhas_recentes(estado, agora),
+                    "em_espera": estado.bloqueada_ate > agora
+                }
+                for conta, estado in self.contas.items()
+            }
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Módulo de armazenamento local dos itens coletados pelos buscadores.
+Guarda notícias, posts, vídeos e tweets em um único banco SQLite, indexado
+por tipo, fonte e data, com inserção/atualização (upsert) por chave e
+remoção dos itens que não são vistos há mais tempo que o TTL configurado.
+"""
+import os
+import time
+import json
+import sqlite3
+import logging
+import threading
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('armazem_itens')
+
+# Campos de chave e de data de cada tipo de item
+TIPOS_ITEM = {
+    "noticia": ("link", "data_iso"),
+    "reddit": ("id", "data_criacao"),
+    "youtube": ("id", "data_publicacao"),
+    "twitter": ("id", "created_at")
+}
+
+def filtrar_recentes(tipo: str, itens: List[Dict[str, Any]], data_minima: str) -> List[Dict[str, Any]]:
+    """
+    Filtra em memória os itens com data >= data_minima.
+
+    Os buscadores chamam esta função logo depois de salvar os itens no armazém,
+    então a data de cada item é a mesma registrada no banco e não é preciso
+    consultá-lo. Itens sem data são considerados recentes.
+
+    Args:
+        tipo: Tipo dos itens
+        itens: Itens a filtrar
+        data_minima: Data mínima em formato ISO
+
+    Returns:
+        List[Dict[str, Any]]: Itens recentes, na ordem original
+
+    Raises:
+        ValueError: Se o tipo não for conhecido
+    """
+    if tipo not in TIPOS_ITEM:
+        raise ValueError(f"Tipo de item desconhecido: {tipo}")
+    campo_data = TIPOS_ITEM[tipo][1]
+
+    return [item for item in itens if not item.get(campo_data) or item[campo_data] >= data_minima]
+
+class ArmazemItens:
+    """
+    Classe para armazenar os itens coletados em SQLite.
+    """
+    def __init__(self, arquivo: str = os.path.join("cache", "itens.db"), ttl_dias: float = 30):
+        """
+        Inicializa o armazém de itens.
+
+        Args:
+            arquivo: Caminho do banco SQLite
+            ttl_dias: Dias sem ser visto após os quais um item é removido
+        """
+        self.arquivo = arquivo
+        self.ttl_dias = ttl_dias
+
+        diretorio = os.path.dirname(arquivo)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.executescript(
+            "CREATE TABLE IF NOT EXISTS itens ("
+            " tipo TEXT NOT NULL,"
+            " chave TEXT NOT NULL,"
+            " fonte TEXT,"
+            " data TEXT,"
+            " visto_em REAL NOT NULL,"
+            " dados TEXT NOT NULL,"
+            " PRIMARY KEY (tipo, chave));"
+            "CREATE INDEX IF NOT EXISTS idx_itens_fonte ON itens (tipo, fonte);"
+            "CREATE INDEX IF NOT EXISTS idx_itens_data ON itens (tipo, data);"
+            "CREATE INDEX IF NOT EXISTS idx_itens_visto_em ON itens (visto_em);"
+        )
+        self._conexao.commit()
+
+        self.remover_expirados()
+
+    def _campos(self, tipo: str) -> Tuple[str, str]:
+        """
+        Retorna os campos de chave e de data de um tipo de item.
+
+        Args:
+            tipo: Tipo do item ("noticia", "reddit", "youtube" ou "twitter")
+
+        Returns:
+            Tuple[str, str]: Campo de chave e campo de data
+
+        Raises:
+            ValueError: Se o tipo não for conhecido
+        """
+        if tipo not in TIPOS_ITEM:
+            raise ValueError(f"Tipo de item desconhecido: {tipo}")
+        return TIPOS_ITEM[tipo]
+
+    def salvar(self, tipo: str, fonte: str, itens: List[Dict[str, Any]]) -> int:
+        """
+        Insere ou atualiza itens de uma fonte.
+
+        Args:
+            tipo: Tipo dos itens
+            fonte: Fonte dos itens (portal, subreddit, canal ou termo de busca)
+            itens: Itens a salvar (itens sem chave são ignorados)
+
+        Returns:
+            int: Número de itens que ainda não estavam no armazém
+        """
+        campo_chave, campo_data = self._campos(tipo)
+        agora = time.time()
+
+        linhas = {}
+        for item in itens:
+            chave = item.get(campo_chave)
+            if chave:
+                linhas[str(chave)] = (tipo, str(chave), fonte, item.get(campo_data) or None, agora,
+                                      json.dumps(item, ensure_ascii=False))
+
+        if not linhas:
+            return 0
+
+        with self._lock:
+            existentes = self._chaves_armazenadas(tipo, list(linhas))
+            self._conexao.executemany(
+                "INSERT INTO itens (tipo, chave, fonte, data, visto_em, dados) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (tipo, chave) DO UPDATE SET"
+                " fonte = excluded.fonte, data = excluded.data,"
+                " visto_em = excluded.visto_em, dados = excluded.dados",
+                list(linhas.values())
+            )
+            self._conexao.commit()
+
+        return len(linhas) - len(existentes)
+
+    def _chaves_armazenadas(self, tipo: str, chaves: List[str]) -> Set[str]:
+        """
+        Consulta quais das chaves já estão no armazém.
+
+        Args:
+            tipo: Tipo dos itens
+            chaves: Chaves a consultar
+
+        Returns:
+            Set[str]: Chaves encontradas
+        """
+        encontradas = set()
+
+        # O SQLite limita o número de parâmetros de uma consulta
+        for inicio in range(0, len(chaves), 500):
+            parte = chaves[inicio:inicio + 500]
+            marcadores = ",".join("?" * len(parte))
+            cursor = self._conexao.execute(
+                f"SELECT chave FROM itens WHERE tipo = ? AND chave IN ({marcadores})",
+                [tipo] + parte
+            )
+            encontradas.update(chave for chave, in cursor)
+
+        return encontradas
+
+    def buscar(self, tipo: str, fonte: Optional[str] = None, data_minima: Optional[str] = None,
+               limite: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Busca itens armazenados, dos mais recentes para os mais antigos.
+
+        Args:
+            tipo: Tipo dos itens
+            fonte: Se informada, retorna apenas os itens dessa fonte
+            data_minima: Se informada, retorna apenas itens sem data ou com data >= data_minima
+            limite: Número máximo de itens
+
+        Returns:
+            List[Dict[str, Any]]: Itens encontrados
+        """
+        self._campos(tipo)
+
+        consulta = "SELECT dados FROM itens WHERE tipo = ?"
+        parametros = [tipo]
+        if fonte is not None:
+            consulta += " AND fonte = ?"
+            parametros.append(fonte)
+        if data_minima is not None:
+            consulta += " AND (data IS NULL OR data >= ?)"
+            parametros.append(data_minima)
+        consulta += " ORDER BY data DESC"
+        if limite is not None:
+            consulta += " LIMIT ?"
+            parametros.append(limite)
+
+        with self._lock:
+            return [json.loads(linha[0]) for linha in self._conexao.execute(consulta, parametros)]
+
+    def remover_expirados(self, ttl_dias: Optional[float] = None) -> int:
+        """
+        Remove os itens que não são vistos há mais tempo que o TTL.
+
+        Args:
+            ttl_dias: TTL em dias (se None, usa o TTL configurado)
+
+        Returns:
+            int: Número de itens removidos
+        """
+        ttl_dias = self.ttl_dias if ttl_dias is None else ttl_dias
+        limite = time.time() - ttl_dias * 86400
+
+        with self._lock:
+            cursor = self._conexao.execute("DELETE FROM itens WHERE visto_em < ?", (limite,))
+            self._conexao.commit()
+
+        if cursor.rowcount:
+            logger.info(f"{cursor.rowcount} itens expirados removidos do armazém")
+        return cursor.rowcount
+
+    def fechar(self) -> None:
+        """
+        Fecha a conexão com o banco.
+        """
+        with self._lock:
+            self._conexao.close()
@@ -5,34 +5,62 @@ Audio generation module for the CloneIA project.
 import os
 import json
 import time
+import shutil
 import logging
+import tempfile
 import requests
-from typing import Dict, List, Optional, Any, Union
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Union, Callable
 
+from core import cliente_http
 from core.utils import (
     load_api_key, load_voice_config, save_voice_config, 
     DEFAULT_VOICE_SETTINGS, ensure_directory, get_timestamp_filename,
     PROJECT_ROOT, OUTPUT_DIR
 )
-from core.text import optimize_text
+from core.text import optimize_text, TextProcessor
+from core.audio_cache import AudioCache, DEFAULT_MAX_BYTES
 
 logger = logging.getLogger('cloneia.audio')
 
+# ElevenLabs API base URL
+ELEVENLABS_API_URL = "https://api.elevenlabs.io/v1"
+
+# Size of the chunks read from a streaming TTS response
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Maximum length of each text chunk in chunked synthesis
+DEFAULT_CHUNK_LENGTH = 400
+
+# Maximum number of chunks synthesized at the same time
+DEFAULT_SYNTHESIS_WORKERS = 4
+
+# FFmpeg executable used to stitch synthesized chunks
+FFMPEG_BINARY = "ffmpeg"
+
 class AudioGenerator:
     """
     Class for generating audio from text using the ElevenLabs API.
     """
     
-    def __init__(self, api_key: Optional[str] = None, voice_profile: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, voice_profile: Optional[str] = None,
+                 use_cache: bool = True, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = DEFAULT_MAX_BYTES, api_base_url: str = ELEVENLABS_API_URL):
         """
         Initialize the audio generator.
         
         Args:
             api_key: ElevenLabs API key (if None, will try to load from environment)
             voice_profile: Name of the voice profile to use (if None, will use default)
+            use_cache: Whether to reuse audio previously generated for the same text and voice
+            cache_dir: Directory of the audio cache (if None, uses cache/audio in the project root)
+            cache_max_bytes: Maximum size of the audio cache on disk
+            api_base_url: Base URL of the ElevenLabs API
         """
         # API key
         self.api_key = api_key or load_api_key()
+        self.api_base_url = api_base_url.rstrip("/")
         
         # Directory for storing generated audio
         self.audio_dir = os.path.join(OUTPUT_DIR, "audio")
@@ -46,6 +74,11 @@ class AudioGenerator:
         self.voice_name = "Rapidinha Voice"
         self._load_voice_config(voice_profile)
         
+        # Content-addressed cache of generated audio
+        self.cache = None
+        if use_cache:
+            self.cache = AudioCache(cache_dir or os.path.join(PROJECT_ROOT, "cache", "audio"), cache_max_bytes)
+        
         logger.info(f"AudioGenerator initialized with voice: {self.voice_name} (ID: {self.voice_id})")
     
     def _load_voice_config(self, profile_name: Optional[str] = None) -> None:
@@ -69,7 +102,10 @@ class AudioGenerator:
             logger.info(f"Voice configuration loaded. ID: {self.voice_id}, Name: {self.voice_name}")
     
     def generate_audio(self, text: str, output_path: Optional[str] = None, 
-                      optimize: bool = True, dry_run: bool = False) -> Optional[str]:
+                      optimize: bool = True, dry_run: bool = False, stream: bool = False,
+                      chunk_callback: Optional[Callable[[bytes], None]] = None,
+                      chunked: bool = False, max_chunk_length: int = DEFAULT_CHUNK_LENGTH,
+                      max_workers: int = DEFAULT_SYNTHESIS_WORKERS) -> Optional[str]:
         """
         Generate audio from text using the ElevenLabs API.
         
@@ -78,16 +114,18 @@ class AudioGenerator:
             output_path: Path to save the audio file (if None, generates a name based on timestamp)
             optimize: Whether to optimize the text for speech
             dry_run: If True, simulates the generation without making API calls
+            stream: If True, uses the streaming endpoint and writes the audio to disk as it arrives
+            chunk_callback: Function called with each chunk of audio data as it is written
+            chunked: If True, splits the text into lines and sentences and synthesizes the chunks concurrently
+            max_chunk_length: Maximum length of each text chunk in chunked mode
+            max_workers: Maximum number of chunks synthesized at the same time in chunked mode
             
         Returns:
             Optional[str]: Path to the generated audio file, or None if failed
         """
-        if not self.api_key and not dry_run:
-            logger.error("ElevenLabs API key not configured. Cannot generate audio.")
-            return None
-        
-        # Optimize text if requested
-        if optimize:
+        # Optimize text if requested (in chunked mode, each chunk is optimized after
+        # splitting, because the optimizer removes the sentence punctuation)
+        if optimize and not chunked:
             original_text = text
             text = optimize_text(text)
             logger.info(f"Text optimized: {len(original_text)} chars -> {len(text)} chars")
@@ -105,12 +143,163 @@ class AudioGenerator:
             logger.info(f"[DRY RUN] Settings: {json.dumps(self.voice_settings, indent=2)}")
             return output_path
         
+        if chunked:
+            return self._synthesize_chunked(text, output_path, stream, chunk_callback,
+                                            max_chunk_length, max_workers, optimize)
+        
+        return self._synthesize(text, output_path, stream, chunk_callback)
+    
+    def _synthesize_chunked(self, text: str, output_path: str, stream: bool = False,
+                            chunk_callback: Optional[Callable[[bytes], None]] = None,
+                            max_chunk_length: int = DEFAULT_CHUNK_LENGTH,
+                            max_workers: int = DEFAULT_SYNTHESIS_WORKERS,
+                            optimize: bool = True) -> Optional[str]:
+        """
+        Synthesize long text as line- and sentence-aligned chunks on a bounded worker pool.
+        
+        The chunk boundaries depend only on each line or sentence, and each chunk
+        goes through the audio cache on its own, so editing one sentence only
+        re-synthesizes the chunk that contains it. The chunks are stitched in
+        order, and the callback receives each chunk's audio in order as soon as it
+        and all the chunks before it are ready.
+        
+        Args:
+            text: Text to convert to audio (not optimized yet)
+            output_path: Path to save the audio file
+            stream: If True, uses the streaming endpoint for each chunk
+            chunk_callback: Function called with the audio data of each chunk, in order
+            max_chunk_length: Maximum length of each text chunk
+            max_workers: Maximum number of chunks synthesized at the same time
+            optimize: Whether to optimize each chunk for speech
+            
+        Returns:
+            Optional[str]: Path to the generated audio file, or None if failed
+        """
+        chunks = TextProcessor().split_speech_units(text, max_chunk_length)
+        if optimize:
+            chunks = [optimize_text(chunk) for chunk in chunks]
+            chunks = [chunk for chunk in chunks if chunk.strip()]
+        if len(chunks) <= 1:
+            return self._synthesize(chunks[0] if chunks else text, output_path, stream, chunk_callback)
+        
+        logger.info(f"Synthesizing {len(chunks)} chunks with up to {max_workers} workers")
+        
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        ensure_directory(output_dir)
+        temp_dir = tempfile.mkdtemp(prefix="chunks_", dir=output_dir)
+        
         try:
-            # Check if we have a configured voice
-            voice_identifier = self.voice_id if self.voice_id else "Rachel"
+            chunk_paths = [os.path.join(temp_dir, f"chunk_{i:04d}.mp3") for i in range(len(chunks))]
+            
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+                futures = [
+                    executor.submit(self._synthesize, chunk, path, stream)
+                    for chunk, path in zip(chunks, chunk_paths)
+                ]
+                
+                for i, future in enumerate(futures):
+                    if not future.result():
+                        logger.error(f"Failed to synthesize chunk {i + 1}/{len(chunks)}")
+                        for pending in futures:
+                            pending.cancel()
+                        return None
+                    
+                    if chunk_callback:
+                        with open(chunk_paths[i], 'rb') as f:
+                            chunk_callback(f.read())
             
+            if not self._concat_audio(chunk_paths, output_path):
+                return None
+            
+            logger.info(f"Audio generated successfully from {len(chunks)} chunks: {output_path}")
+            return output_path
+            
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def _concat_audio(self, input_paths: List[str], output_path: str) -> bool:
+        """
+        Stitch MP3 files in order with the FFmpeg concat demuxer, without re-encoding.
+        
+        If FFmpeg is not installed, the MP3 streams are joined frame by frame,
+        which MP3 players handle because every frame is self-contained.
+        
+        Args:
+            input_paths: Paths of the audio files, in order
+            output_path: Path to save the stitched audio
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        list_path = f"{output_path}.concat.txt"
+        try:
+            with open(list_path, 'w') as f:
+                for path in input_paths:
+                    f.write(f"file '{os.path.abspath(path)}'\n")
+            
+            cmd = [
+                FFMPEG_BINARY, '-y',
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', list_path,
+                '-c', 'copy',
+                output_path
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                logger.error(f"Error stitching audio chunks: {result.stderr}")
+                return False
+            return True
+            
+        except FileNotFoundError:
+            logger.warning("FFmpeg not found, joining MP3 chunks directly")
+            with open(output_path, 'wb') as out:
+                for path in input_paths:
+                    with open(path, 'rb') as f:
+                        shutil.copyfileobj(f, out)
+            return True
+            
+        finally:
+            if os.path.exists(list_path):
+                os.remove(list_path)
+    
+    def _synthesize(self, text: str, output_path: str, stream: bool = False,
+                    chunk_callback: Optional[Callable[[bytes], None]] = None) -> Optional[str]:
+        """
+        Synthesize already optimized text, reusing cached audio when possible.
+        
+        Args:
+            text: Text to convert to audio
+            output_path: Path to save the audio file
+            stream: If True, uses the streaming endpoint and writes the audio to disk as it arrives
+            chunk_callback: Function called with each chunk of audio data as it is written
+            
+        Returns:
+            Optional[str]: Path to the generated audio file, or None if failed
+        """
+        # Check if we have a configured voice
+        voice_identifier = self.voice_id if self.voice_id else "Rachel"
+        model_id = self.voice_settings.get("model_id", "eleven_multilingual_v2")
+        
+        # Reuse the audio if this exact text was already synthesized with the same voice
+        cache_key = None
+        if self.cache:
+            cache_key = AudioCache.make_key(text, voice_identifier, model_id, self.voice_settings)
+            if self.cache.get(cache_key, output_path):
+                logger.info(f"Audio reused from cache: {output_path}")
+                if chunk_callback:
+                    with open(output_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+                            chunk_callback(chunk)
+                return output_path
+        
+        if not self.api_key:
+            logger.error("ElevenLabs API key not configured. Cannot generate audio.")
+            return None
+        
+        try:
             # Prepare the API request
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_identifier}"
+            url = f"{self.api_base_url}/text-to-speech/{voice_identifier}"
             
             headers = {
                 "Accept": "audio/mpeg",
@@ -120,18 +309,30 @@ class AudioGenerator:
             
             data = {
                 "text": text,
-                "model_id": self.voice_settings.get("model_id", "eleven_multilingual_v2"),
+                "model_id": model_id,
                 "voice_settings": self.voice_settings
             }
             
-            # Make the API request
             logger.info(f"Generating audio for text: '{text[:50]}...'")
-            response = requests.post(url, json=data, headers=headers, timeout=60)
-            response.raise_for_status()
             
-            # Save the audio
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            if stream:
+                self._stream_to_file(f"{url}/stream", data, headers, output_path, chunk_callback)
+                if cache_key:
+                    self.cache.put_file(cache_key, output_path)
+            else:
+                # Make the API request
+                response = cliente_http.post(url, json=data, headers=headers, timeout=60)
+                response.raise_for_status()
+                
+                # Save the audio
+                with open(output_path, 'wb') as f:
+                    f.write(response.content)
+                
+                if chunk_callback:
+                    chunk_callback(response.content)
+                
+                if cache_key:
+                    self.cache.put(cache_key, response.content)
             
             logger.info(f"Audio generated successfully: {output_path}")
             return output_path
@@ -143,6 +344,39 @@ class AudioGenerator:
             logger.error(f"Error generating audio: {e}")
             return None
     
+    def _stream_to_file(self, url: str, data: Dict[str, Any], headers: Dict[str, str],
+                        output_path: str, chunk_callback: Optional[Callable[[bytes], None]] = None) -> None:
+        """
+        Download a streaming TTS response, writing each chunk to disk as it arrives.
+        
+        The partial file is removed if the stream fails, so a failed request never
+        leaves a truncated audio file behind.
+        
+        Args:
+            url: Streaming endpoint URL
+            data: Request body
+            headers: Request headers
+            output_path: Path to save the audio file
+            chunk_callback: Function called with each chunk of audio data as it is written
+        """
+        # The timeout applies between chunks, not to the whole download
+        with cliente_http.post(url, json=data, headers=headers, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            
+            try:
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        if not chunk:
+                            continue
+                        f.write(chunk)
+                        f.flush()
+                        if chunk_callback:
+                            chunk_callback(chunk)
+            except Exception:
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+                raise
+    
     def clone_voice(self, audio_files: List[str], voice_name: str = "Rapidinha Voice",
                    dry_run: bool = False) -> Optional[str]:
         """
@@ -198,14 +432,14 @@ class AudioGenerator:
                     files.append(('files', (os.path.basename(audio_file), f.read(), 'audio/mpeg')))
             
             # Make the API request
-            url = "https://api.elevenlabs.io/v1/voices/add"
+            url = f"{self.api_base_url}/voices/add"
             headers = {"xi-api-key": self.api_key}
             data = {
                 "name": voice_name,
                 "description": "Cloned voice for Rapidinha Cripto"
             }
             
-            response = requests.post(url, headers=headers, data=data, files=files)
+            response = cliente_http.post(url, headers=headers, data=data, files=files)
             response.raise_for_status()
             
             # Process the response
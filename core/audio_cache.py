@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for generated audio.
+
+Audio files are stored under a hash of everything that determines the
+synthesized result (optimized text, voice ID, model ID and voice settings),
+so re-rendering a script whose narration did not change skips the TTS call.
+The cache is bounded in size on disk and evicts the least recently used files.
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Dict, Optional, Any
+
+from core.utils import evict_lru, mark_used
+
+logger = logging.getLogger('cloneia.audio_cache')
+
+# Default maximum size of the cache on disk (500 MB)
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+class AudioCache:
+    """
+    Size-bounded LRU cache of audio files on disk, keyed by content hash.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, extension: str = "mp3"):
+        """
+        Initialize the audio cache.
+
+        Args:
+            cache_dir: Directory where the cached audio files are stored
+            max_bytes: Maximum total size of the cached files in bytes
+            extension: Extension of the cached audio files
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.extension = extension
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(text: str, voice_id: Optional[str], model_id: Optional[str],
+                 settings: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Compute the cache key of a synthesis request.
+
+        Args:
+            text: Text sent to the TTS API (after optimization)
+            voice_id: Voice ID
+            model_id: Model ID
+            settings: Voice settings
+
+        Returns:
+            str: SHA-256 hex digest identifying the request
+        """
+        payload = json.dumps(
+            {"text": text, "voice_id": voice_id, "model_id": model_id, "settings": settings or {}},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """
+        Get the path of the cached file for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            str: Path to the cached file
+        """
+        return os.path.join(self.cache_dir, f"{key}.{self.extension}")
+
+    def contains(self, key: str) -> bool:
+        """
+        Check whether a key is cached.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if the audio is cached
+        """
+        return os.path.exists(self._path(key))
+
+    def get(self, key: str, output_path: str) -> bool:
+        """
+        Copy a cached audio file to the output path.
+
+        Args:
+            key: Cache key
+            output_path: Where to write the audio
+
+        Returns:
+            bool: True on a cache hit, False on a miss
+        """
+        path = self._path(key)
+        try:
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            shutil.copyfile(path, output_path)
+        except FileNotFoundError:
+            return False
+        mark_used(path)
+
+        logger.info(f"Audio cache hit: {key[:12]}")
+        return True
+
+    def put(self, key: str, data: bytes) -> str:
+        """
+        Store audio data in the cache and evict old entries if needed.
+
+        Args:
+            key: Cache key
+            data: Audio data
+
+        Returns:
+            str: Path to the cached file
+        """
+        path = self._path(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        self.evict()
+        return path
+
+    def put_file(self, key: str, source_path: str) -> str:
+        """
+        Store an existing audio file in the cache and evict old entries if needed.
+
+        Args:
+            key: Cache key
+            source_path: Path to the audio file
+
+        Returns:
+            str: Path to the cached file
+        """
+        path = self._path(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, path)
+
+        self.evict()
+        return path
+
+    def size(self) -> int:
+        """
+        Get the total size of the cached files.
+
+        Returns:
+            int: Size in bytes
+        """
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(f".{self.extension}"):
+                total += entry.stat().st_size
+        return total
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used files until the cache fits its size limit.
+
+        Returns:
+            int: Number of files removed
+        """
+        with self._lock:
+            return evict_lru(self.cache_dir, f".{self.extension}", self.max_bytes, "audio cache")
@@ -4,10 +4,11 @@ Gerador de áudio para os vídeos Rapidinha.
 """
 import os
 import logging
-import requests
 from datetime import datetime
 from typing import Optional
 
+from core import cliente_http
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -77,7 +78,7 @@ class AudioGenerator:
 
         try:
             # Fazer requisição para a API
-            response = requests.post(url, json=payload, headers=headers)
+            response = cliente_http.post(url, json=payload, headers=headers)
 
             # Verificar se a requisição foi bem-sucedida
             if response.status_code != 200:
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Módulo de cache de respostas HTTP para os buscadores de conteúdo.
+Guarda os validadores (ETag/Last-Modified) e o corpo de cada resposta em disco,
+envia requisições condicionais (If-None-Match/If-Modified-Since) e, quando o
+servidor responde 304, devolve o corpo e a extração salvos anteriormente.
+"""
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import requests
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('cache_http')
+
+class CacheHTTP:
+    """
+    Classe para fazer requisições GET condicionais com cache em disco.
+    """
+    def __init__(self, cache_dir: str = os.path.join("cache", "http")):
+        """
+        Inicializa o cache HTTP.
+
+        Args:
+            cache_dir: Diretório onde as respostas são armazenadas
+        """
+        self.cache_dir = cache_dir
+
+        # Criar diretório de cache se não existir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _chave(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Calcula a chave de cache de uma requisição.
+
+        Args:
+            url: URL da requisição
+            params: Parâmetros da query string
+
+        Returns:
+            str: Chave de cache (hash da URL e dos parâmetros)
+        """
+        partes = [url]
+        if params:
+            partes.extend(f"{k}={params[k]}" for k in sorted(params))
+        return hashlib.sha256("\n".join(partes).encode("utf-8")).hexdigest()
+
+    def _get_cache_path(self, chave: str) -> str:
+        """
+        Retorna o caminho para o arquivo de cache de uma chave.
+
+        Args:
+            chave: Chave de cache
+
+        Returns:
+            str: Caminho para o arquivo de cache
+        """
+        return os.path.join(self.cache_dir, f"{chave}.json")
+
+    def _carregar(self, chave: str) -> Optional[Dict[str, Any]]:
+        """
+        Carrega a entrada de cache de uma chave.
+
+        Args:
+            chave: Chave de cache
+
+        Returns:
+            Optional[Dict[str, Any]]: Entrada de cache ou None se não existir
+        """
+        cache_path = self._get_cache_path(chave)
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"Erro ao carregar cache HTTP {chave}: {e}")
+        return None
+
+    def _salvar(self, chave: str, entrada: Dict[str, Any]) -> None:
+        """
+        Salva a entrada de cache de uma chave.
+
+        A escrita é feita em um arquivo temporário e depois renomeada, para que
+        buscas concorrentes nunca leiam um arquivo pela metade.
+
+        Args:
+            chave: Chave de cache
+            entrada: Entrada de cache
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entrada, f, ensure_ascii=False)
+            os.replace(temp_path, self._get_cache_path(chave))
+        except Exception as e:
+            logger.error(f"Erro ao salvar cache HTTP {chave}: {e}")
+
+    def buscar(self, url: str, params: Optional[Dict[str, Any]] = None,
+               headers: Optional[Dict[str, str]] = None, timeout: float = 30,
+               sessao: Optional[requests.Session] = None) -> Dict[str, Any]:
+        """
+        Faz uma requisição GET condicional.
+
+        Args:
+            url: URL da requisição
+            params: Parâmetros da query string
+            headers: Cabeçalhos adicionais da requisição
+            timeout: Tempo máximo em segundos da requisição
+            sessao: Sessão HTTP a ser usada (se None, usa requests diretamente)
+
+        Returns:
+            Dict[str, Any]: Resposta com as chaves "chave", "status", "texto",
+                "nao_modificado" e "extracao" (extração salva, apenas em respostas 304)
+
+        Raises:
+            requests.HTTPError: Se o servidor responder com erro
+        """
+        chave = self._chave(url, params)
+        entrada = self._carregar(chave)
+
+        headers_requisicao = dict(headers or {})
+        if entrada:
+            if entrada.get("etag"):
+                headers_requisicao["If-None-Match"] = entrada["etag"]
+            if entrada.get("last_modified"):
+                headers_requisicao["If-Modified-Since"] = entrada["last_modified"]
+
+        cliente = sessao or requests
+        response = cliente.get(url, params=params, headers=headers_requisicao, timeout=timeout)
+
+        if response.status_code == 304 and entrada:
+            logger.info(f"Conteúdo não modificado (304): {url}")
+            return {
+                "chave": chave,
+                "status": 304,
+                "texto": entrada.get("corpo"),
+                "nao_modificado": True,
+                "extracao": entrada.get("extracao")
+            }
+
+        response.raise_for_status()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        # Só vale a pena guardar respostas que podem ser validadas depois
+        if etag or last_modified:
+            self._salvar(chave, {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "corpo": response.text,
+                "extracao": None,
+                "atualizado_em": datetime.now().isoformat()
+            })
+
+        return {
+            "chave": chave,
+            "status": response.status_code,
+            "texto": response.text,
+            "nao_modificado": False,
+            "extracao": None
+        }
+
+    def salvar_extracao(self, chave: str, extracao: Any) -> None:
+        """
+        Associa o resultado da extração à resposta em cache.
+
+        Assim, quando o servidor responder 304, a extração pode ser reaproveitada
+        sem processar o corpo novamente.
+
+        Args:
+            chave: Chave de cache retornada por buscar()
+            extracao: Resultado da extração (serializável em JSON)
+        """
+        entrada = self._carregar(chave)
+        if entrada is None:
+            return
+
+        entrada["extracao"] = extracao
+        self._salvar(chave, entrada)
+
+    @staticmethod
+    def renovar_timestamps(itens: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Atualiza o horário de extração dos itens reaproveitados de uma resposta 304.
+
+        A extração salva guarda o "timestamp" da primeira vez em que foi feita;
+        ao reaproveitá-la, os itens passam a ter o horário da busca atual.
+
+        Args:
+            itens: Itens da extração salva
+
+        Returns:
+            List[Dict[str, Any]]: Cópias dos itens com o "timestamp" atual
+        """
+        agora = datetime.now().isoformat()
+        return [dict(item, timestamp=agora) if "timestamp" in item else dict(item) for item in itens]
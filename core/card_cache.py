@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Cache of rendered title cards and static text for video generation.
+
+Title images are drawn with PIL on a full 1080x1920 canvas and text clips are
+rendered by ImageMagick (MoviePy's TextClip); both only depend on the text and
+its style. Rendered images are kept in memory (LRU) under a hash of (kind,
+text, size, colors, font), and images that are expensive to render are also
+stored as PNGs on disk, so repeated renders of the same template reuse them.
+Fonts are loaded from disk once per (path, size).
+"""
+import os
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import numpy as np
+from PIL import Image, ImageFont
+
+from core.utils import content_key, evict_lru, mark_used
+
+logger = logging.getLogger('cloneia.card_cache')
+
+# Default number of rendered images kept in memory
+DEFAULT_MAX_ITEMS = 64
+
+# Default maximum size of the cache on disk (200 MB)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+@lru_cache(maxsize=32)
+def load_font(font_path: Optional[str], size: int) -> ImageFont.ImageFont:
+    """
+    Load a TrueType font, or the default font if it does not exist (memoized).
+
+    Args:
+        font_path: Path to the font file
+        size: Font size
+
+    Returns:
+        ImageFont.ImageFont: Loaded font
+    """
+    try:
+        if font_path and os.path.exists(font_path):
+            return ImageFont.truetype(font_path, size)
+    except Exception as e:
+        logger.error(f"Error loading font: {e}")
+    return ImageFont.load_default()
+
+
+class CardCache:
+    """
+    Two-level (memory and disk) LRU cache of rendered images.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_items: int = DEFAULT_MAX_ITEMS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the card cache.
+
+        Args:
+            cache_dir: Directory where the rendered PNGs are stored (if None, only caches in memory)
+            max_items: Maximum number of images kept in memory
+            max_bytes: Maximum total size of the PNGs on disk in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_items = max(1, max_items)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._images: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(kind: str, **params: Any) -> str:
+        """
+        Compute the cache key of a rendered image.
+
+        Args:
+            kind: Kind of image (e.g. "title" or "text")
+            **params: Everything that determines the image (text, size, colors, font...)
+
+        Returns:
+            str: SHA-256 hex digest identifying the image
+        """
+        return content_key(kind, **params)
+
+    def _path(self, key: str) -> str:
+        """
+        Get the path of the PNG for a key.
+        """
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def _remember(self, key: str, image: np.ndarray) -> None:
+        """
+        Keep an image in memory, dropping the least recently used ones.
+        """
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_items:
+                self._images.popitem(last=False)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Get a rendered image.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[np.ndarray]: Read-only image (RGB or RGBA), or None on a miss
+        """
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                return image
+
+        if not self.cache_dir:
+            return None
+
+        path = self._path(key)
+        try:
+            with Image.open(path) as img:
+                image = np.array(img)
+        except FileNotFoundError:
+            return None
+        mark_used(path)
+
+        image.setflags(write=False)
+        self._remember(key, image)
+        return image
+
+    def put(self, key: str, image: np.ndarray, persist: bool = True) -> np.ndarray:
+        """
+        Store a rendered image.
+
+        Args:
+            key: Cache key
+            image: Image (RGB or RGBA, uint8)
+            persist: If True, also writes the PNG to disk (worth it when rendering
+                costs more than decoding the PNG, e.g. ImageMagick text)
+
+        Returns:
+            np.ndarray: Read-only copy of the image as stored in the cache
+        """
+        image = np.array(image, dtype=np.uint8)
+        image.setflags(write=False)
+        self._remember(key, image)
+
+        if self.cache_dir and persist:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                Image.fromarray(image).save(f, format="PNG", compress_level=1)
+            os.replace(temp_path, self._path(key))
+            self.evict()
+
+        return image
+
+    def get_or_render(self, key: str, render: Callable[[], np.ndarray], persist: bool = True) -> np.ndarray:
+        """
+        Get a rendered image, rendering and storing it on a miss.
+
+        Args:
+            key: Cache key
+            render: Function that renders the image
+            persist: If True, the rendered image is also stored on disk
+
+        Returns:
+            np.ndarray: Read-only image
+        """
+        image = self.get(key)
+        if image is None:
+            image = self.put(key, render(), persist)
+        return image
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used PNGs until the cache fits its size limit.
+
+        Returns:
+            int: Number of files removed
+        """
+        if not self.cache_dir:
+            return 0
+
+        with self._lock:
+            return evict_lru(self.cache_dir, ".png", self.max_bytes, "card cache")
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Cliente HTTP compartilhado pelas integrações com APIs externas (ElevenLabs,
+HeyGen, Instagram, OpenAI e coletores de notícias).
+Reaproveita conexões (uma sessão com pool de conexões por host em cada thread),
+aplica um timeout padrão, repete requisições que falharam com 429/5xx ou erro
+de conexão com espera exponencial e aleatória (jitter), respeitando o
+Retry-After, e limita o intervalo entre requisições a um mesmo host.
+"""
+import time
+import random
+import logging
+import threading
+from urllib.parse import urlparse
+from typing import Dict, Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('cliente_http')
+
+# Timeout padrão (conexão, leitura) em segundos
+TIMEOUT_PADRAO = (10, 60)
+
+# Status HTTP que indicam falha temporária
+STATUS_REPETIVEIS = {429, 500, 502, 503, 504}
+
+# Métodos que podem ser repetidos sem risco de efeito duplicado
+METODOS_IDEMPOTENTES = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Intervalo mínimo em segundos entre requisições a cada host
+INTERVALO_MINIMO_HOST = {
+    "api.heygen.com": 0.2,
+    "upload.heygen.com": 0.2,
+    "graph.facebook.com": 0.5
+}
+
+class LimiteHost:
+    """
+    Intervalo mínimo entre requisições a um host.
+    """
+    def __init__(self, intervalo_minimo: float = 0.0):
+        """
+        Inicializa o limite.
+
+        Args:
+            intervalo_minimo: Intervalo mínimo em segundos entre duas requisições
+        """
+        self.intervalo_minimo = intervalo_minimo
+        self._lock = threading.Lock()
+        self._proxima_requisicao = 0.0
+
+    def aguardar(self) -> None:
+        """
+        Aguarda até que uma nova requisição ao host seja permitida.
+        """
+        if not self.intervalo_minimo:
+            return
+
+        with self._lock:
+            agora = time.monotonic()
+            espera = self._proxima_requisicao - agora
+            self._proxima_requisicao = max(agora, self._proxima_requisicao) + self.intervalo_minimo
+
+        if espera > 0:
+            time.sleep(espera)
+
+class ClienteHTTP:
+    """
+    Classe para fazer requisições HTTP com conexões reaproveitadas e novas tentativas.
+    """
+    def __init__(self, tentativas: int = 3, espera_inicial: float = 0.5, espera_maxima: float = 30.0,
+                 timeout: Union[float, Tuple[float, float]] = TIMEOUT_PADRAO, max_conexoes_host: int = 10,
+                 intervalos_host: Optional[Dict[str, float]] = None):
+        """
+        Inicializa o cliente.
+
+        Args:
+            tentativas: Número máximo de tentativas de cada requisição
+            espera_inicial: Espera base em segundos antes da segunda tentativa (dobra a cada tentativa)
+            espera_maxima: Espera máxima em segundos entre tentativas
+            timeout: Timeout padrão das requisições (segundos, ou tupla conexão/leitura)
+            max_conexoes_host: Número máximo de conexões mantidas abertas por host em cada sessão
+            intervalos_host: Intervalo mínimo entre requisições por host (se None, usa INTERVALO_MINIMO_HOST)
+        """
+        self.tentativas = max(1, tentativas)
+        self.espera_inicial = espera_inicial
+        self.espera_maxima = espera_maxima
+        self.timeout = timeout
+        self.max_conexoes_host = max_conexoes_host
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._limites: Dict[str, LimiteHost] = {
+            host: LimiteHost(intervalo)
+            for host, intervalo in (INTERVALO_MINIMO_HOST if intervalos_host is None else intervalos_host).items()
+        }
+
+    def sessao(self, host: str) -> requests.Session:
+        """
+        Retorna a sessão da thread atual para um host, criando-a se necessário.
+
+        Args:
+            host: Host (com porta, se houver)
+
+        Returns:
+            requests.Session: Sessão exclusiva da thread para o host
+        """
+        sessoes = getattr(self._local, 'sessoes', None)
+        if sessoes is None:
+            sessoes = self._local.sessoes = {}
+
+        sessao = sessoes.get(host)
+        if sessao is None:
+            sessao = requests.Session()
+            adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_conexoes_host)
+            sessao.mount("http://", adaptador)
+            sessao.mount("https://", adaptador)
+            sessoes[host] = sessao
+        return sessao
+
+    def configurar_host(self, host: str, intervalo_minimo: float) -> None:
+        """
+        Define o intervalo mínimo entre requisições a um host.
+
+        Args:
+            host: Host
+            intervalo_minimo: Intervalo mínimo em segundos
+        """
+        with self._lock:
+            self._limites[host] = LimiteHost(intervalo_minimo)
+
+    def _limite(self, host: str) -> LimiteHost:
+        """
+        Retorna o limite de um host.
+        """
+        with self._lock:
+            if host not in self._limites:
+                self._limites[host] = LimiteHost()
+            return self._limites[host]
+
+    def _espera(self, tentativa: int, resposta: Optional[requests.Response] = None) -> float:
+        """
+        Calcula a espera antes da próxima tentativa.
+
+        Usa o Retry-After da resposta, se houver; caso contrário, uma espera
+        aleatória entre zero e o backoff exponencial da tentativa.
+
+        Args:
+            tentativa: Número da tentativa que falhou
+            resposta: Resposta que falhou, se houver
+
+        Returns:
+            float: Espera em segundos
+        """
+        retry_after = resposta.headers.get("Retry-After") if resposta is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.espera_maxima)
+        return random.uniform(0, min(self.espera_maxima, self.espera_inicial * 2 ** (tentativa - 1)))
+
+    @staticmethod
+    def _corpos(kwargs: Dict[str, Any]) -> list:
+        """
+        Lista os arquivos enviados no corpo da requisição.
+
+        Como no requests, files pode ser um dicionário ou uma lista de pares (nome, arquivo).
+        """
+        corpos = []
+        if kwargs.get("data") is not None and not isinstance(kwargs["data"], (str, bytes, dict, list, tuple)):
+            corpos.append(kwargs["data"])
+        files = kwargs.get("files") or {}
+        pares = files.items() if hasattr(files, "items") else files
+        for _, arquivo in pares:
+            if isinstance(arquivo, tuple):
+                arquivo = arquivo[1]
+            if not isinstance(arquivo, (str, bytes)):
+                corpos.append(arquivo)
+        return corpos
+
+    def request(self, metodo: str, url: str, tentativas: Optional[int] = None,
+                repetir_nao_idempotente: bool = False, **kwargs: Any) -> requests.Response:
+        """
+        Faz uma requisição HTTP.
+
+        Respostas 429 são sempre repetidas. Respostas 5xx e erros de conexão só
+        são repetidos em métodos idempotentes (ou com repetir_nao_idempotente),
+        e apenas se o corpo da requisição puder ser reenviado (arquivos precisam
+        aceitar seek).
+
+        Args:
+            metodo: Método HTTP
+            url: URL da requisição
+            tentativas: Número máximo de tentativas (se None, usa o padrão do cliente)
+            repetir_nao_idempotente: Se True, repete também POST/PATCH após 5xx ou erro de conexão
+            **kwargs: Demais argumentos de requests.Session.request
+
+        Returns:
+            requests.Response: Resposta da última tentativa
+
+        Raises:
+            requests.RequestException: Se a última tentativa falhar sem resposta
+        """
+        metodo = metodo.upper()
+        host = urlparse(url).netloc
+        tentativas = tentativas or self.tentativas
+        pode_repetir = metodo in METODOS_IDEMPOTENTES or repetir_nao_idempotente
+        kwargs.setdefault("timeout", self.timeout)
+
+        corpos = self._corpos(kwargs)
+        if all(hasattr(corpo, "seek") and hasattr(corpo, "tell") for corpo in corpos):
+            posicoes = [corpo.tell() for corpo in corpos]
+        else:
+            # Corpo enviado por streaming sem seek: não é possível reenviar
+            tentativas = 1
+            posicoes = []
+
+        sessao = self.sessao(host)
+        limite = self._limite(host)
+
+        for tentativa in range(1, tentativas + 1):
+            if tentativa > 1:
+                for corpo, posicao in zip(corpos, posicoes):
+                    corpo.seek(posicao)
+
+            limite.aguardar()
+            try:
+                resposta = sessao.request(metodo, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not pode_repetir or tentativa == tentativas:
+                    raise
+                espera = self._espera(tentativa)
+                logger.warning(f"Erro de conexão com {host} ({e}). Nova tentativa em {espera:.1f}s")
+                time.sleep(espera)
+                continue
+
+            if (resposta.status_code not in STATUS_REPETIVEIS or tentativa == tentativas
+                    or (resposta.status_code != 429 and not pode_repetir)):
+                return resposta
+
+            espera = self._espera(tentativa, resposta)
+            logger.warning(f"{metodo} {host} respondeu {resposta.status_code}. Nova tentativa em {espera:.1f}s")
+            resposta.close()
+            time.sleep(espera)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Faz uma requisição GET.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Faz uma requisição POST.
+        """
+        return self.request("POST", url, **kwargs)
+
+_cliente_padrao: Optional[ClienteHTTP] = None
+_lock_padrao = threading.Lock()
+
+def cliente_padrao() -> ClienteHTTP:
+    """
+    Retorna o cliente HTTP compartilhado pelo processo.
+
+    Returns:
+        ClienteHTTP: Cliente compartilhado
+    """
+    global _cliente_padrao
+    with _lock_padrao:
+        if _cliente_padrao is None:
+            _cliente_padrao = ClienteHTTP()
+        return _cliente_padrao
+
+def request(metodo: str, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Faz uma requisição com o cliente compartilhado.
+    """
+    return cliente_padrao().request(metodo, url, **kwargs)
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """
+    Faz uma requisição GET com o cliente compartilhado.
+    """
+    return cliente_padrao().get(url, **kwargs)
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    """
+    Faz uma requisição POST com o cliente compartilhado.
+    """
+    return cliente_padrao().post(url, **kwargs)
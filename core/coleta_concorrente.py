@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Módulo para coleta concorrente de páginas HTTP.
+Busca várias URLs em paralelo respeitando limites de cortesia por host,
+um limite global de concorrência e um prazo total para a coleta.
+"""
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from core.cache_http import CacheHTTP
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('coleta_concorrente')
+
+class ColetorConcorrente:
+    """
+    Classe para buscar várias URLs em paralelo com limites de cortesia.
+    """
+    def __init__(self, headers: Optional[Dict[str, str]] = None,
+                 max_concorrencia: int = 8,
+                 max_por_host: int = 2,
+                 intervalo_por_host: Tuple[float, float] = (1.0, 3.0),
+                 prazo_total: float = 60.0,
+                 timeout: float = 30.0,
+                 cache_http: Optional[CacheHTTP] = None):
+        """
+        Inicializa o coletor concorrente.
+
+        Args:
+            headers: Cabeçalhos HTTP enviados em todas as requisições
+            max_concorrencia: Número máximo de requisições simultâneas no total
+            max_por_host: Número máximo de requisições simultâneas para um mesmo host
+            intervalo_por_host: Intervalo (mínimo, máximo) em segundos entre requisições ao mesmo host
+            prazo_total: Tempo máximo em segundos para toda a coleta
+            timeout: Tempo máximo em segundos para cada requisição
+            cache_http: Cache de respostas HTTP para requisições condicionais (opcional)
+        """
+        self.headers = headers or {}
+        self.max_concorrencia = max(1, max_concorrencia)
+        self.max_por_host = max(1, max_por_host)
+        self.intervalo_por_host = intervalo_por_host
+        self.prazo_total = prazo_total
+        self.timeout = timeout
+        self.cache_http = cache_http
+
+        # Estado compartilhado entre as threads
+        self._lock = threading.Lock()
+        self._semaforos_host: Dict[str, threading.Semaphore] = {}
+        self._proxima_liberacao_host: Dict[str, float] = {}
+        self._local = threading.local()
+
+    def _obter_sessao(self) -> requests.Session:
+        """
+        Retorna a sessão HTTP da thread atual, criando-a se necessário.
+
+        Returns:
+            requests.Session: Sessão exclusiva da thread
+        """
+        sessao = getattr(self._local, 'sessao', None)
+        if sessao is None:
+            sessao = requests.Session()
+            sessao.headers.update(self.headers)
+            self._local.sessao = sessao
+        return sessao
+
+    def _semaforo_host(self, host: str) -> threading.Semaphore:
+        """
+        Retorna o semáforo que limita as requisições simultâneas a um host.
+
+        Args:
+            host: Host da URL
+
+        Returns:
+            threading.Semaphore: Semáforo do host
+        """
+        with self._lock:
+            if host not in self._semaforos_host:
+                self._semaforos_host[host] = threading.Semaphore(self.max_por_host)
+            return self._semaforos_host[host]
+
+    def _aguardar_vez_host(self, host: str, limite: float) -> bool:
+        """
+        Aguarda o intervalo de cortesia do host antes de uma nova requisição.
+
+        Args:
+            host: Host da URL
+            limite: Instante (time.monotonic) em que o prazo total expira
+
+        Returns:
+            bool: True se a requisição pode ser feita, False se o prazo expiraria antes
+        """
+        with self._lock:
+            agora = time.monotonic()
+            inicio = max(agora, self._proxima_liberacao_host.get(host, agora))
+            if inicio >= limite:
+                return False
+            intervalo_min, intervalo_max = self.intervalo_por_host
+            self._proxima_liberacao_host[host] = inicio + random.uniform(intervalo_min, intervalo_max)
+
+        espera = inicio - time.monotonic()
+        if espera > 0:
+            time.sleep(espera)
+        return True
+
+    def _buscar(self, url: str, limite: float) -> Dict[str, Any]:
+        """
+        Busca uma URL respeitando os limites do host e o prazo total.
+
+        Args:
+            url: URL a ser buscada
+            limite: Instante (time.monotonic) em que o prazo total expira
+
+        Returns:
+            Dict[str, Any]: Resultado da coleta (status, texto, erro, duração e,
+                com cache HTTP, chave de cache, se não foi modificado e a extração salva)
+        """
+        host = urlparse(url).netloc
+        resultado = {"url": url, "status": None, "texto": None, "erro": None, "duracao": 0.0,
+                     "chave_cache": None, "nao_modificado": False, "extracao": None}
+
+        with self._semaforo_host(host):
+            if not self._aguardar_vez_host(host, limite):
+                resultado["erro"] = "Prazo total esgotado antes da requisição"
+                return resultado
+
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                resultado["erro"] = "Prazo total esgotado antes da requisição"
+                return resultado
+
+            inicio = time.monotonic()
+            try:
+                if self.cache_http:
+                    resposta = self.cache_http.buscar(url, timeout=min(self.timeout, restante),
+                                                      sessao=self._obter_sessao())
+                    resultado["status"] = resposta["status"]
+                    resultado["texto"] = resposta["texto"]
+                    resultado["chave_cache"] = resposta["chave"]
+                    resultado["nao_modificado"] = resposta["nao_modificado"]
+                    resultado["extracao"] = resposta["extracao"]
+                else:
+                    response = self._obter_sessao().get(url, timeout=min(self.timeout, restante))
+                    response.raise_for_status()
+                    resultado["status"] = response.status_code
+                    resultado["texto"] = response.text
+            except Exception as e:
+                resultado["erro"] = str(e)
+            resultado["duracao"] = time.monotonic() - inicio
+
+        return resultado
+
+    def coletar(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Busca todas as URLs em paralelo.
+
+        Os resultados são devolvidos na mesma ordem das URLs, para que o
+        processamento posterior seja determinístico. URLs que não terminaram
+        dentro do prazo total têm resultado None.
+
+        Args:
+            urls: Lista de URLs a serem buscadas
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Resultados na ordem das URLs
+        """
+        if not urls:
+            return []
+
+        limite = time.monotonic() + self.prazo_total
+        resultados: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_concorrencia, len(urls)))
+        try:
+            futuros = {executor.submit(self._buscar, url, limite): i for i, url in enumerate(urls)}
+            concluidos, pendentes = wait(futuros, timeout=max(0.0, limite - time.monotonic()))
+
+            for futuro in concluidos:
+                resultados[futuros[futuro]] = futuro.result()
+
+            for futuro in pendentes:
+                futuro.cancel()
+                logger.warning(f"Prazo total de {self.prazo_total}s excedido para {urls[futuros[futuro]]}")
+        finally:
+            # Não esperar requisições presas: o prazo total já foi respeitado
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        concluidas = sum(1 for r in resultados if r and r["erro"] is None)
+        logger.info(f"Coleta concorrente concluída: {concluidas}/{len(urls)} URLs obtidas")
+
+        return resultados
@@ -42,9 +42,9 @@ class ContentSplitter:
         # Remover datas no formato DD/MM/AAAA
         texto = re.sub(r'\d{1,2}/\d{1,2}/\d{2,4}', '', texto)
 
-        # Remover espaços extras
-        texto = re.sub(r'\s+', ' ', texto)
-        texto = re.sub(r'\s+\.', '.', texto)
+        # Remover espaços extras, preservando as quebras de parágrafo
+        texto = re.sub(r'[ \t]+', ' ', texto)
+        texto = re.sub(r'[ \t]+\.', '.', texto)
 
         return texto.strip()
 
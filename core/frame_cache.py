@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of frames extracted from the reference videos.
+
+Decoding a frame means opening the video with MoviePy and seeking from the
+nearest keyframe, which VideoGenerator used to do for the intro, every news
+item and the outro of each render. The cache does two things:
+
+- Pre-extraction: N frames evenly spaced over each reference video are decoded
+  once and stored as one memory-mapped array (.npy), so picking a frame for a
+  section is an in-memory lookup.
+- Frames at an explicit timestamp are stored individually, keyed by
+  (video path, modification time, size, timestamp).
+
+Editing or replacing a reference video changes its key, and stale entries are
+evicted (least recently used first) when the cache exceeds its size limit.
+"""
+import os
+import random
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.utils import evict_lru, mark_used
+
+logger = logging.getLogger('cloneia.frame_cache')
+
+# Number of frames pre-extracted from each reference video
+DEFAULT_FRAMES_PER_VIDEO = 12
+
+# Default maximum size of the cache on disk (2 GB)
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+
+def _open_with_moviepy(video_path: str) -> Any:
+    """
+    Open a video with MoviePy.
+
+    Args:
+        video_path: Path to the video
+
+    Returns:
+        Any: VideoFileClip (with duration, get_frame and close)
+    """
+    import moviepy.editor as mp
+    return mp.VideoFileClip(video_path)
+
+
+class FrameCache:
+    """
+    Size-bounded cache of video frames on disk, stored as NumPy arrays.
+    """
+
+    def __init__(self, cache_dir: str, frames_per_video: int = DEFAULT_FRAMES_PER_VIDEO,
+                 max_bytes: int = DEFAULT_MAX_BYTES, opener: Optional[Callable[[str], Any]] = None):
+        """
+        Initialize the frame cache.
+
+        Args:
+            cache_dir: Directory where the cached frames are stored
+            frames_per_video: Number of frames pre-extracted from each video
+            max_bytes: Maximum total size of the cached files in bytes
+            opener: Function that opens a video and returns an object with duration,
+                get_frame(t) and close() (if None, uses MoviePy's VideoFileClip)
+        """
+        self.cache_dir = cache_dir
+        self.frames_per_video = max(1, frames_per_video)
+        self.max_bytes = max_bytes
+        self.opener = opener or _open_with_moviepy
+
+        self._lock = threading.Lock()
+        # Memory-mapped samples already loaded by this process, by source key
+        self._samples: Dict[str, np.ndarray] = {}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _source_key(video_path: str) -> str:
+        """
+        Identify the current contents of a video file.
+
+        Args:
+            video_path: Path to the video
+
+        Returns:
+            str: Absolute path, modification time and size
+        """
+        stat = os.stat(video_path)
+        return f"{os.path.abspath(video_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+
+    def _path(self, kind: str, *parts: Any) -> str:
+        """
+        Get the path of a cached array.
+
+        Args:
+            kind: Entry kind ("samples" or "frame")
+            *parts: Values that identify the entry
+
+        Returns:
+            str: Path to the .npy file
+        """
+        digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{kind}_{digest}.npy")
+
+    def sample_times(self, duration: float) -> List[float]:
+        """
+        Get the time points pre-extracted from a video.
+
+        The points are evenly spaced over the same range the random frame
+        selection used (0 to duration - 0.1 seconds).
+
+        Args:
+            duration: Duration of the video in seconds
+
+        Returns:
+            List[float]: Time points in seconds
+        """
+        span = max(0.1, duration - 0.1)
+        return [(i + 0.5) * span / self.frames_per_video for i in range(self.frames_per_video)]
+
+    def prepare(self, video_path: str) -> np.ndarray:
+        """
+        Pre-extract the sample frames of a video (only decodes on the first call).
+
+        Args:
+            video_path: Path to the video
+
+        Returns:
+            np.ndarray: Read-only memory-mapped array of shape (frames, height, width, 3)
+        """
+        source_key = self._source_key(video_path)
+        with self._lock:
+            samples = self._samples.get(source_key)
+            if samples is not None:
+                return samples
+
+            path = self._path("samples", source_key, self.frames_per_video)
+            if not mark_used(path):
+                self._extract_samples(video_path, path)
+
+            samples = self._samples[source_key] = np.load(path, mmap_mode='r')
+
+        self.evict()
+        return samples
+
+    def _extract_samples(self, video_path: str, path: str) -> None:
+        """
+        Decode the sample frames of a video into a .npy file.
+
+        Args:
+            video_path: Path to the video
+            path: Path of the .npy file
+        """
+        logger.info(f"Pre-extracting {self.frames_per_video} frames from {video_path}")
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        video = self.opener(video_path)
+        try:
+            samples = None
+            for i, time_point in enumerate(self.sample_times(video.duration)):
+                frame = np.asarray(video.get_frame(time_point), dtype=np.uint8)
+                if samples is None:
+                    samples = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.uint8,
+                                                        shape=(self.frames_per_video,) + frame.shape)
+                samples[i] = frame
+            samples.flush()
+            del samples
+            os.replace(temp_path, path)
+        finally:
+            video.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def get_frame(self, video_path: str, time_point: Optional[float] = None,
+                  rng: Optional[random.Random] = None) -> np.ndarray:
+        """
+        Get a frame of a video.
+
+        Args:
+            video_path: Path to the video
+            time_point: Time point of the frame (if None, picks one of the pre-extracted frames at random)
+            rng: Random generator used to pick the frame (if None, uses the random module)
+
+        Returns:
+            np.ndarray: Frame (height, width, 3) as uint8
+        """
+        if time_point is None:
+            samples = self.prepare(video_path)
+            return np.array(samples[(rng or random).randrange(len(samples))])
+
+        path = self._path("frame", self._source_key(video_path), f"{time_point:.3f}")
+        try:
+            frame = np.load(path)
+            mark_used(path)
+            return frame
+        except FileNotFoundError:
+            pass
+
+        video = self.opener(video_path)
+        try:
+            frame = np.asarray(video.get_frame(time_point), dtype=np.uint8)
+        finally:
+            video.close()
+
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, frame)
+        os.replace(temp_path, path)
+
+        self.evict()
+        return frame
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used files until the cache fits its size limit.
+
+        Returns:
+            int: Number of files removed
+        """
+        with self._lock:
+            return evict_lru(self.cache_dir, ".npy", self.max_bytes, "frame cache")
@@ -203,6 +203,17 @@ class GeradorScript:
         Returns:
             List[Dict[str, Any]]: Lista de tweets selecionados
         """
+        # Analisar em lote o sentimento dos tweets que ainda não foram analisados
+        sem_sentimento = [t for t in tweets if not t.get('sentimento')]
+        if sem_sentimento:
+            sentimentos = self.buscador_tweets.analisador_sentimento.analisar_lote(
+                [t.get('text', '') for t in sem_sentimento],
+                [t.get('idioma', 'pt') for t in sem_sentimento]
+            )
+            for tweet, (polaridade, sentimento) in zip(sem_sentimento, sentimentos):
+                tweet['polaridade'] = polaridade
+                tweet['sentimento'] = sentimento
+
         # Filtrar tweets com sentimento positivo ou neutro
         tweets_filtrados = [t for t in tweets if t.get('sentimento') in ['positivo', 'neutro']]
 
@@ -0,0 +1,695 @@
+#!/usr/bin/env python3
+"""
+Cliente da API do HeyGen usado pelos geradores de vídeo.
+Reúne as chamadas de upload de áudio, criação de vídeo, consulta de status
+e download, e inclui um cliente simulado para uso offline (modo de simulação
+e testes).
+"""
+import os
+import re
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+import logging
+import threading
+import requests
+from typing import Dict, Any, Optional, List, Tuple
+
+from core import cliente_http
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('heygen_api')
+
+# URLs base da API do HeyGen
+HEYGEN_API_URL = "https://api.heygen.com"
+HEYGEN_UPLOAD_URL = "https://upload.heygen.com"
+
+# Dimensão padrão dos vídeos (formato vertical do Reels)
+DIMENSAO_REELS = {"width": 720, "height": 1280}
+
+# Tamanho dos blocos lidos no download dos vídeos
+TAMANHO_BLOCO_DOWNLOAD = 1024 * 1024
+
+def _ler_origem_parcial(caminho: str) -> Optional[Dict[str, Any]]:
+    """
+    Lê os metadados da origem de um download parcial.
+
+    Args:
+        caminho: Caminho do arquivo de metadados
+
+    Returns:
+        dict: URL, ETag e Last-Modified da origem, ou None se não existir ou estiver corrompido
+    """
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            origem = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return origem if isinstance(origem, dict) else None
+
+def _validador(origem: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Escolhe o validador usado no cabeçalho If-Range.
+
+    Um ETag fraco (W/...) não pode ser usado no If-Range; nesse caso usa o Last-Modified.
+
+    Args:
+        origem: Metadados da origem do download parcial
+
+    Returns:
+        str: ETag forte ou Last-Modified, ou None se não houver nenhum
+    """
+    if not origem:
+        return None
+    etag = origem.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return origem.get("last_modified")
+
+def _faixa_resposta(content_range: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Lê o início e o tamanho total de um cabeçalho Content-Range.
+
+    Args:
+        content_range: Valor do cabeçalho ("bytes 100-199/1000" ou "bytes */1000")
+
+    Returns:
+        Tuple[Optional[int], Optional[int]]: Primeiro byte da faixa e tamanho total
+            (None para o que não estiver no cabeçalho)
+    """
+    correspondencia = re.match(r"bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)", content_range or "")
+    if not correspondencia:
+        return None, None
+    inicio, total = correspondencia.groups()
+    return (int(inicio) if inicio else None), (int(total) if total != "*" else None)
+
+def _tamanho_corpo(resposta: requests.Response) -> Optional[int]:
+    """
+    Retorna o tamanho do corpo gravado em disco, se o servidor o informou.
+
+    Com Content-Encoding, o Content-Length se refere ao corpo comprimido.
+
+    Args:
+        resposta: Resposta HTTP
+
+    Returns:
+        Optional[int]: Tamanho em bytes, ou None se não for conhecido
+    """
+    if resposta.headers.get("Content-Length") and not resposta.headers.get("Content-Encoding"):
+        return int(resposta.headers["Content-Length"])
+    return None
+
+def _descartar(*caminhos: str) -> None:
+    """
+    Remove os arquivos que existirem.
+
+    Args:
+        *caminhos: Caminhos dos arquivos
+    """
+    for caminho in caminhos:
+        if os.path.lexists(caminho):
+            os.remove(caminho)
+
+def baixar_arquivo(url: str, caminho_saida: str, timeout: float = 60, tentativas: int = 3,
+                   sha256: Optional[str] = None) -> str:
+    """
+    Baixa um arquivo em blocos, retomando downloads interrompidos.
+
+    O conteúdo é gravado em um arquivo ".part" e só é movido para o caminho
+    final depois de verificado. Ao lado dele fica um ".part.json" com a URL,
+    o ETag, o Last-Modified e o tamanho informados pela resposta que o originou.
+    Se a conexão cair ou a resposta terminar antes do tamanho esperado, a
+    próxima tentativa (ou uma nova chamada) pede apenas os bytes que faltam
+    (cabeçalho Range), condicionados ao validador salvo (If-Range). O arquivo
+    parcial é descartado se veio de outra URL, se o servidor responder com o
+    conteúdo completo (200), por exemplo porque o arquivo mudou, ou se a faixa
+    recebida não começar onde o parcial termina. O hash SHA-256 do arquivo
+    concluído é gravado em "<caminho_saida>.sha256" (ver verificar_arquivo).
+    O uso de memória não depende do tamanho do arquivo.
+
+    Args:
+        url: URL do arquivo
+        caminho_saida: Caminho do arquivo de saída
+        timeout: Tempo limite das requisições em segundos
+        tentativas: Número máximo de tentativas
+        sha256: Hash SHA-256 esperado do conteúdo (se None, verifica apenas o tamanho, quando informado)
+
+    Returns:
+        str: Caminho do arquivo baixado
+
+    Raises:
+        RuntimeError: Se o download não se completar nas tentativas ou o hash não conferir
+        requests.RequestException: Se todas as tentativas falharem
+    """
+    parcial = f"{caminho_saida}.part"
+    arquivo_origem = f"{parcial}.json"
+
+    origem = _ler_origem_parcial(arquivo_origem)
+    if os.path.exists(parcial) and (not origem or origem.get("url") != url):
+        # O arquivo parcial não é desta URL: não pode ser completado
+        logger.info(f"Descartando download parcial de outra origem: {parcial}")
+        os.remove(parcial)
+
+    completo = False
+    for tentativa in range(1, tentativas + 1):
+        recebido = os.path.getsize(parcial) if os.path.exists(parcial) else 0
+        headers = {}
+        if recebido:
+            headers["Range"] = f"bytes={recebido}-"
+            validador = _validador(origem)
+            if validador:
+                headers["If-Range"] = validador
+
+        try:
+            with cliente_http.get(url, headers=headers, stream=True, timeout=timeout) as resposta:
+                if resposta.status_code == 416 and recebido:
+                    # Nada mais a receber, desde que o parcial tenha exatamente o tamanho do arquivo
+                    tamanho_total = _faixa_resposta(resposta.headers.get("Content-Range"))[1]
+                    if tamanho_total is None:
+                        tamanho_total = origem.get("tamanho")
+                    if tamanho_total is None or tamanho_total == recebido:
+                        completo = True
+                        break
+                    logger.warning(f"Download parcial com {recebido} de {tamanho_total} bytes. Recomeçando...")
+                    _descartar(parcial)
+                    continue
+                resposta.raise_for_status()
+
+                if recebido and resposta.status_code == 206:
+                    inicio, tamanho_total = _faixa_resposta(resposta.headers.get("Content-Range"))
+                    if inicio != recebido:
+                        logger.warning(f"Faixa recebida começa em {inicio}, não em {recebido}. Recomeçando...")
+                        _descartar(parcial)
+                        continue
+                    if tamanho_total is None:
+                        tamanho_corpo = _tamanho_corpo(resposta)
+                        tamanho_total = (recebido + tamanho_corpo if tamanho_corpo is not None
+                                         else origem.get("tamanho"))
+                else:
+                    # O servidor mandou o arquivo inteiro (ignorou o Range ou o
+                    # arquivo mudou): descartar o parcial e recomeçar do início
+                    recebido = 0
+                    tamanho_total = _tamanho_corpo(resposta)
+                    origem = {"url": url, "etag": resposta.headers.get("ETag"),
+                              "last_modified": resposta.headers.get("Last-Modified"),
+                              "tamanho": tamanho_total}
+                    with open(arquivo_origem, 'w', encoding='utf-8') as f:
+                        json.dump(origem, f)
+
+                with open(parcial, 'ab' if recebido else 'wb') as f:
+                    for bloco in resposta.iter_content(chunk_size=TAMANHO_BLOCO_DOWNLOAD):
+                        if bloco:
+                            f.write(bloco)
+
+        except requests.RequestException as e:
+            if tentativa == tentativas:
+                raise
+            logger.warning(f"Download interrompido ({e}). Retomando (tentativa {tentativa + 1}/{tentativas})...")
+            continue
+
+        tamanho = os.path.getsize(parcial)
+        if tamanho_total is None or tamanho == tamanho_total:
+            completo = True
+            break
+        if tamanho > tamanho_total:
+            logger.warning(f"Download com {tamanho} de {tamanho_total} bytes. Recomeçando...")
+            _descartar(parcial)
+        else:
+            logger.warning(f"Resposta terminou com {tamanho} de {tamanho_total} bytes. "
+                           f"Retomando (tentativa {tentativa + 1}/{tentativas})...")
+
+    if not completo:
+        raise RuntimeError(f"Download incompleto de {url} após {tentativas} tentativas")
+
+    hash_conteudo = hash_arquivo(parcial)
+    if sha256 and hash_conteudo != sha256.lower():
+        _descartar(parcial, arquivo_origem)
+        raise RuntimeError(f"Hash do arquivo baixado de {url} não confere")
+
+    os.replace(parcial, caminho_saida)
+    _registrar_hash(caminho_saida, hash_conteudo)
+    _descartar(arquivo_origem)
+    return caminho_saida
+
+def _registrar_hash(caminho: str, hash_conteudo: str) -> None:
+    """
+    Grava o hash SHA-256 de um arquivo em "<caminho>.sha256" (formato do sha256sum).
+
+    Args:
+        caminho: Caminho do arquivo
+        hash_conteudo: Hash SHA-256 em hexadecimal
+    """
+    with open(f"{caminho}.sha256", 'w', encoding='utf-8') as f:
+        f.write(f"{hash_conteudo}  {os.path.basename(caminho)}\n")
+
+def hash_registrado(caminho: str) -> Optional[str]:
+    """
+    Retorna o hash SHA-256 registrado para um arquivo baixado.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        Optional[str]: Hash em hexadecimal, ou None se não houver registro
+    """
+    try:
+        with open(f"{caminho}.sha256", 'r', encoding='utf-8') as f:
+            return f.read().split()[0]
+    except (OSError, IndexError):
+        return None
+
+def verificar_arquivo(caminho: str) -> bool:
+    """
+    Verifica se um arquivo existe e confere com o hash registrado no download.
+
+    Arquivos sem hash registrado (por exemplo, gravados pelo cliente simulado)
+    são aceitos se existirem.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        bool: True se o arquivo existe e não diverge do hash registrado
+    """
+    if not os.path.exists(caminho):
+        return False
+    esperado = hash_registrado(caminho)
+    return esperado is None or hash_arquivo(caminho) == esperado
+
+def vincular_copia(origem: str, destino: str) -> str:
+    """
+    Cria uma cópia de um arquivo sem regravar o conteúdo, quando possível.
+
+    Usa um hardlink; se o sistema de arquivos não permitir, copia o arquivo.
+    O hash registrado da origem também é registrado para a cópia, e uma cópia
+    feita byte a byte é conferida com ele.
+
+    Args:
+        origem: Caminho do arquivo existente
+        destino: Caminho da cópia
+
+    Returns:
+        str: Caminho da cópia
+
+    Raises:
+        RuntimeError: Se a cópia não conferir com o hash registrado da origem
+    """
+    if os.path.abspath(origem) == os.path.abspath(destino):
+        return destino
+    _descartar(destino, f"{destino}.sha256")
+
+    hash_origem = hash_registrado(origem)
+    try:
+        os.link(origem, destino)
+    except OSError:
+        shutil.copyfile(origem, destino)
+        if hash_origem and hash_arquivo(destino) != hash_origem:
+            _descartar(destino)
+            raise RuntimeError(f"Cópia de {origem} não confere com o hash registrado")
+
+    if hash_origem:
+        _registrar_hash(destino, hash_origem)
+    return destino
+
+def hash_arquivo(caminho: str) -> str:
+    """
+    Calcula o hash SHA-256 de um arquivo, lendo-o em blocos.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        str: Hash SHA-256 em hexadecimal
+    """
+    hash_conteudo = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(TAMANHO_BLOCO_DOWNLOAD), b""):
+            hash_conteudo.update(bloco)
+    return hash_conteudo.hexdigest()
+
+class RegistroAssets:
+    """
+    Classe para lembrar os assets já enviados ao HeyGen, indexados pelo hash do conteúdo.
+
+    Os assets pertencem a uma conta, por isso o registro é separado por API key
+    (guardada apenas como hash).
+    """
+    def __init__(self, arquivo: str = os.path.join("cache", "assets_heygen.db")):
+        """
+        Inicializa o registro.
+
+        Args:
+            arquivo: Caminho do banco SQLite
+        """
+        self.arquivo = arquivo
+
+        diretorio = os.path.dirname(arquivo)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS assets ("
+            " conta TEXT NOT NULL,"
+            " hash TEXT NOT NULL,"
+            " asset_id TEXT NOT NULL,"
+            " content_type TEXT,"
+            " enviado_em REAL NOT NULL,"
+            " PRIMARY KEY (conta, hash))"
+        )
+        self._conexao.commit()
+
+    @staticmethod
+    def _conta(api_key: str) -> str:
+        """
+        Identifica a conta sem guardar a API key.
+
+        Args:
+            api_key: Chave da API do HeyGen
+
+        Returns:
+            str: Identificador da conta
+        """
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+    def buscar(self, api_key: str, hash_conteudo: str) -> Optional[str]:
+        """
+        Busca o asset de um conteúdo já enviado.
+
+        Args:
+            api_key: Chave da API da conta
+            hash_conteudo: Hash SHA-256 do conteúdo
+
+        Returns:
+            Optional[str]: ID do asset, ou None se o conteúdo ainda não foi enviado
+        """
+        with self._lock:
+            linha = self._conexao.execute("SELECT asset_id FROM assets WHERE conta = ? AND hash = ?",
+                                          (self._conta(api_key), hash_conteudo)).fetchone()
+        return linha[0] if linha else None
+
+    def salvar(self, api_key: str, hash_conteudo: str, asset_id: str, content_type: Optional[str] = None) -> None:
+        """
+        Registra o asset de um conteúdo enviado.
+
+        Args:
+            api_key: Chave da API da conta
+            hash_conteudo: Hash SHA-256 do conteúdo
+            asset_id: ID do asset
+            content_type: Content-Type do conteúdo
+        """
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO assets (conta, hash, asset_id, content_type, enviado_em) VALUES (?, ?, ?, ?, ?)",
+                (self._conta(api_key), hash_conteudo, asset_id, content_type, time.time())
+            )
+            self._conexao.commit()
+
+def enviar_asset(caminho: str, api_key: str, content_type: str = "audio/mpeg",
+                 registro: Optional[RegistroAssets] = None, upload_url: str = HEYGEN_UPLOAD_URL,
+                 timeout: float = 60) -> str:
+    """
+    Envia um arquivo para o HeyGen, reaproveitando o asset se o conteúdo já foi enviado.
+
+    O arquivo é enviado direto do disco, sem ser carregado inteiro na memória.
+
+    Args:
+        caminho: Caminho do arquivo
+        api_key: Chave da API do HeyGen
+        content_type: Content-Type do arquivo
+        registro: Registro de assets enviados (se None, sempre envia)
+        upload_url: URL base do endpoint de upload
+        timeout: Tempo limite da requisição em segundos
+
+    Returns:
+        str: ID do asset
+
+    Raises:
+        RuntimeError: Se a resposta não trouxer o ID do asset
+    """
+    hash_conteudo = hash_arquivo(caminho) if registro else None
+    if registro:
+        asset_id = registro.buscar(api_key, hash_conteudo)
+        if asset_id:
+            logger.info(f"Asset reaproveitado: {os.path.basename(caminho)} (asset {asset_id})")
+            return asset_id
+
+    with open(caminho, 'rb') as f:
+        resposta = cliente_http.post(f"{upload_url.rstrip('/')}/v1/asset",
+                                     headers={"Content-Type": content_type, "X-Api-Key": api_key},
+                                     data=f, timeout=timeout)
+    resposta.raise_for_status()
+
+    asset_id = (resposta.json().get("data") or {}).get("id")
+    if not asset_id:
+        raise RuntimeError(f"ID do asset não encontrado na resposta: {resposta.text}")
+
+    if registro:
+        registro.salvar(api_key, hash_conteudo, asset_id, content_type)
+
+    logger.info(f"Asset enviado: {os.path.basename(caminho)} (asset {asset_id})")
+    return asset_id
+
+class ClienteHeyGen:
+    """
+    Classe para acessar a API do HeyGen com as credenciais de uma conta.
+    """
+    def __init__(self, api_key: str, avatar_id: str, api_url: str = HEYGEN_API_URL,
+                 upload_url: str = HEYGEN_UPLOAD_URL, timeout: float = 60,
+                 registro_assets: Optional[RegistroAssets] = None):
+        """
+        Inicializa o cliente.
+
+        Args:
+            api_key: Chave da API do HeyGen
+            avatar_id: ID do avatar usado nos vídeos
+            api_url: URL base da API
+            upload_url: URL base do endpoint de upload
+            timeout: Tempo limite das requisições em segundos
+            registro_assets: Registro dos assets enviados (se None, usa cache/assets_heygen.db)
+        """
+        self.api_key = api_key
+        self.avatar_id = avatar_id
+        self.api_url = api_url.rstrip("/")
+        self.upload_url = upload_url.rstrip("/")
+        self.timeout = timeout
+        self.registro_assets = registro_assets or RegistroAssets()
+
+    def _headers(self, content_type: str = "application/json") -> Dict[str, str]:
+        """
+        Monta os headers das requisições.
+
+        Args:
+            content_type: Content-Type da requisição
+
+        Returns:
+            Dict[str, str]: Headers com a chave da API
+        """
+        return {
+            "Content-Type": content_type,
+            "X-Api-Key": self.api_key
+        }
+
+    def enviar_audio(self, caminho_audio: str) -> str:
+        """
+        Faz upload de um arquivo de áudio, reaproveitando o asset de um áudio idêntico já enviado.
+
+        Args:
+            caminho_audio: Caminho do arquivo de áudio
+
+        Returns:
+            str: ID do asset de áudio
+
+        Raises:
+            RuntimeError: Se a resposta não trouxer o ID do asset
+        """
+        return enviar_asset(caminho_audio, self.api_key, "audio/mpeg", registro=self.registro_assets,
+                            upload_url=self.upload_url, timeout=self.timeout)
+
+    def criar_video(self, audio_asset_id: str, dimensao: Optional[Dict[str, int]] = None,
+                    cor_fundo: str = "#000000") -> str:
+        """
+        Solicita a geração de um vídeo com o avatar falando o áudio enviado.
+
+        Args:
+            audio_asset_id: ID do asset de áudio
+            dimensao: Dimensão do vídeo (se None, usa o formato do Reels)
+            cor_fundo: Cor de fundo do vídeo
+
+        Returns:
+            str: ID do vídeo
+
+        Raises:
+            RuntimeError: Se a resposta não trouxer o ID do vídeo
+        """
+        payload = {
+            "dimension": dimensao or DIMENSAO_REELS,
+            "video_inputs": [
+                {
+                    "character": {
+                        "type": "avatar",
+                        "avatar_id": self.avatar_id,
+                        "avatar_style": "normal"
+                    },
+                    "voice": {
+                        "type": "audio",
+                        "audio_asset_id": audio_asset_id
+                    },
+                    "background": {
+                        "type": "color",
+                        "value": cor_fundo
+                    }
+                }
+            ]
+        }
+
+        resposta = cliente_http.post(f"{self.api_url}/v2/video/generate", headers=self._headers(),
+                                     json=payload, timeout=self.timeout)
+        resposta.raise_for_status()
+
+        dados = resposta.json().get("data") or {}
+        video_id = dados.get("video_id") or dados.get("id")
+        if not video_id:
+            raise RuntimeError(f"ID do vídeo não encontrado na resposta: {resposta.text}")
+
+        logger.info(f"Vídeo solicitado: {video_id}")
+        return video_id
+
+    def status_video(self, video_id: str) -> Dict[str, Any]:
+        """
+        Consulta o status de um vídeo.
+
+        Args:
+            video_id: ID do vídeo
+
+        Returns:
+            Dict[str, Any]: Status ("pending", "processing", "completed" ou "failed"),
+                URL do vídeo e erro informado pela API
+        """
+        resposta = cliente_http.get(f"{self.api_url}/v1/video_status.get", params={"video_id": video_id},
+                                    headers=self._headers(), timeout=self.timeout)
+        resposta.raise_for_status()
+
+        dados = resposta.json().get("data") or {}
+        return {
+            "status": dados.get("status"),
+            "video_url": dados.get("video_url"),
+            "erro": dados.get("error")
+        }
+
+    def baixar_video(self, video_url: str, caminho_saida: str) -> str:
+        """
+        Baixa um vídeo gerado, gravando-o em disco em blocos e retomando se a conexão cair.
+
+        O HeyGen não informa o hash dos vídeos: o tamanho é conferido durante o
+        download e o hash do arquivo concluído fica registrado para verificações
+        posteriores (verificar_arquivo).
+
+        Args:
+            video_url: URL do vídeo
+            caminho_saida: Caminho do arquivo de saída
+
+        Returns:
+            str: Caminho do arquivo baixado
+        """
+        baixar_arquivo(video_url, caminho_saida, timeout=self.timeout)
+        logger.info(f"Vídeo baixado: {caminho_saida}")
+        return caminho_saida
+
+class ClienteHeyGenSimulado:
+    """
+    Cliente com a mesma interface do ClienteHeyGen que não acessa a rede.
+
+    O vídeo "gerado" contém o áudio enviado precedido de um cabeçalho, o que
+    permite verificar a ordem de montagem sem renderizar nada.
+    """
+    def __init__(self, avatar_id: str = "avatar_simulado", consultas_ate_concluir: int = 1,
+                 latencia: float = 0.0, falhar_com: Optional[bytes] = None):
+        """
+        Inicializa o cliente simulado.
+
+        Args:
+            avatar_id: ID do avatar
+            consultas_ate_concluir: Número de consultas de status até o vídeo ficar pronto
+            latencia: Tempo em segundos simulado para cada chamada
+            falhar_com: Se informado, vídeos cujo áudio contém esses bytes falham
+        """
+        self.avatar_id = avatar_id
+        self.consultas_ate_concluir = consultas_ate_concluir
+        self.latencia = latencia
+        self.falhar_com = falhar_com
+
+        self.chamadas: List[str] = []
+        self._assets: Dict[str, bytes] = {}
+        self._videos: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _registrar(self, chamada: str) -> None:
+        """
+        Registra uma chamada e simula sua latência.
+
+        Args:
+            chamada: Nome da chamada
+        """
+        with self._lock:
+            self.chamadas.append(chamada)
+        if self.latencia:
+            time.sleep(self.latencia)
+
+    def enviar_audio(self, caminho_audio: str) -> str:
+        """
+        Simula o upload de um áudio, guardando seu conteúdo.
+        """
+        self._registrar("enviar_audio")
+        with open(caminho_audio, 'rb') as f:
+            dados = f.read()
+        with self._lock:
+            audio_asset_id = f"asset_{len(self._assets) + 1}"
+            self._assets[audio_asset_id] = dados
+        return audio_asset_id
+
+    def criar_video(self, audio_asset_id: str, dimensao: Optional[Dict[str, int]] = None,
+                    cor_fundo: str = "#000000") -> str:
+        """
+        Simula a solicitação de um vídeo.
+        """
+        self._registrar("criar_video")
+        with self._lock:
+            video_id = f"video_{len(self._videos) + 1}"
+            self._videos[video_id] = {"asset": audio_asset_id, "consultas": 0}
+        return video_id
+
+    def status_video(self, video_id: str) -> Dict[str, Any]:
+        """
+        Simula a consulta de status, concluindo após o número configurado de consultas.
+        """
+        self._registrar("status_video")
+        with self._lock:
+            video = self._videos[video_id]
+            video["consultas"] += 1
+            dados = self._assets[video["asset"]]
+
+        if self.falhar_com is not None and self.falhar_com in dados:
+            return {"status": "failed", "video_url": None, "erro": "falha simulada"}
+        if video["consultas"] < self.consultas_ate_concluir:
+            return {"status": "processing", "video_url": None, "erro": None}
+        return {"status": "completed", "video_url": f"simulado://{video_id}", "erro": None}
+
+    def baixar_video(self, video_url: str, caminho_saida: str) -> str:
+        """
+        Grava o vídeo simulado em disco.
+        """
+        self._registrar("baixar_video")
+        video_id = video_url.split("://", 1)[1]
+        with self._lock:
+            dados = self._assets[self._videos[video_id]["asset"]]
+        with open(caminho_saida, 'wb') as f:
+            f.write(b"VIDEO:" + dados)
+        return caminho_saida
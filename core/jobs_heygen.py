@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Gerenciador de jobs de renderização do HeyGen.
+Envia vários vídeos de uma vez, registra cada job em uma tabela SQLite e
+acompanha todos os jobs pendentes em um único laço de consulta de status, com
+intervalo crescente (backoff exponencial) por job. Os vídeos concluídos são
+baixados em paralelo. Como o estado fica em disco, um processo interrompido
+pode retomar os jobs pendentes na próxima execução.
+"""
+import os
+import time
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Dict, Any, Optional, Set
+
+from core.heygen_api import hash_arquivo, verificar_arquivo
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('jobs_heygen')
+
+# Status dos jobs
+PENDENTE = "pendente"        # Registrado, ainda não enviado ao HeyGen
+PROCESSANDO = "processando"  # Enviado, aguardando a renderização
+CONCLUIDO = "concluido"      # Vídeo baixado
+FALHOU = "falhou"
+
+class GerenciadorJobsHeyGen:
+    """
+    Classe para enviar e acompanhar jobs de renderização do HeyGen.
+    """
+    def __init__(self, cliente: Any, arquivo: str = os.path.join("cache", "jobs_heygen.db"),
+                 intervalo_inicial: float = 5.0, intervalo_maximo: float = 60.0, fator_backoff: float = 2.0,
+                 max_downloads: int = 4):
+        """
+        Inicializa o gerenciador.
+
+        Args:
+            cliente: Cliente do HeyGen (ClienteHeyGen ou ClienteHeyGenSimulado)
+            arquivo: Caminho do banco SQLite com a tabela de jobs
+            intervalo_inicial: Intervalo em segundos até a primeira consulta de status de um job
+            intervalo_maximo: Intervalo máximo em segundos entre consultas de um job
+            fator_backoff: Fator de crescimento do intervalo a cada consulta sem conclusão
+            max_downloads: Número máximo de vídeos baixados ao mesmo tempo
+        """
+        self.cliente = cliente
+        self.arquivo = arquivo
+        self.intervalo_inicial = intervalo_inicial
+        self.intervalo_maximo = intervalo_maximo
+        self.fator_backoff = fator_backoff
+        self.max_downloads = max(1, max_downloads)
+
+        diretorio = os.path.dirname(arquivo)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._fechado = False
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.row_factory = sqlite3.Row
+        self._conexao.executescript(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " saida TEXT PRIMARY KEY,"
+            " audio TEXT NOT NULL,"
+            " hash_audio TEXT,"
+            " video_id TEXT,"
+            " status TEXT NOT NULL,"
+            " intervalo REAL NOT NULL,"
+            " proxima_consulta REAL NOT NULL,"
+            " consultas INTEGER NOT NULL DEFAULT 0,"
+            " erro TEXT,"
+            " criado_em REAL NOT NULL,"
+            " atualizado_em REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, proxima_consulta);"
+        )
+        # Tabelas criadas antes do hash do áudio: os jobs antigos nunca são reaproveitados
+        colunas = {linha["name"] for linha in self._conexao.execute("PRAGMA table_info(jobs)")}
+        if "hash_audio" not in colunas:
+            self._conexao.execute("ALTER TABLE jobs ADD COLUMN hash_audio TEXT")
+        self._conexao.commit()
+
+    def _atualizar(self, saida: str, **campos: Any) -> None:
+        """
+        Atualiza os campos de um job.
+
+        Args:
+            saida: Caminho de saída do job
+            **campos: Campos a atualizar
+        """
+        campos["atualizado_em"] = time.time()
+        atribuicoes = ", ".join(f"{campo} = ?" for campo in campos)
+        with self._lock:
+            if self._fechado:
+                # Download que terminou depois do tempo máximo de aguardar() e do fechamento:
+                # o job continua registrado como em processamento e é retomado na próxima execução
+                logger.warning(f"Banco de jobs fechado; {saida} será retomado na próxima execução")
+                return
+            self._conexao.execute(f"UPDATE jobs SET {atribuicoes} WHERE saida = ?", list(campos.values()) + [saida])
+            self._conexao.commit()
+
+    def job(self, caminho_saida: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna um job pelo caminho de saída.
+
+        Args:
+            caminho_saida: Caminho do vídeo do job
+
+        Returns:
+            Optional[Dict[str, Any]]: Dados do job, ou None se não existir
+        """
+        with self._lock:
+            linha = self._conexao.execute("SELECT * FROM jobs WHERE saida = ?",
+                                          (os.path.abspath(caminho_saida),)).fetchone()
+        return dict(linha) if linha else None
+
+    def jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Lista os jobs registrados, na ordem de criação.
+
+        Args:
+            status: Se informado, retorna apenas os jobs com esse status
+
+        Returns:
+            List[Dict[str, Any]]: Dados dos jobs
+        """
+        consulta = "SELECT * FROM jobs"
+        parametros = []
+        if status is not None:
+            consulta += " WHERE status = ?"
+            parametros.append(status)
+        consulta += " ORDER BY criado_em, rowid"
+
+        with self._lock:
+            return [dict(linha) for linha in self._conexao.execute(consulta, parametros)]
+
+    def submeter(self, caminho_audio: str, caminho_saida: str, propagar_erros: bool = False) -> Dict[str, Any]:
+        """
+        Registra um job e envia o áudio para renderização.
+
+        Um job com o mesmo caminho de saída e o mesmo áudio (pelo hash do conteúdo)
+        que não tenha falhado é reaproveitado em vez de reenviado (um job concluído,
+        apenas se o vídeo ainda existir e conferir com o hash registrado no download).
+        Se o áudio mudou, o job é substituído.
+
+        Args:
+            caminho_audio: Caminho do áudio do vídeo
+            caminho_saida: Caminho onde o vídeo será baixado
+            propagar_erros: Se True, um erro no envio é lançado depois de registrado no job
+                (usado pelo AgendadorContas para trocar de conta quando uma delas é limitada)
+
+        Returns:
+            Dict[str, Any]: Dados do job
+        """
+        saida = os.path.abspath(caminho_saida)
+        try:
+            hash_audio = hash_arquivo(caminho_audio)
+        except OSError:
+            # O envio vai falhar e registrar o erro no job
+            hash_audio = None
+
+        existente = self.job(saida)
+        if existente and existente["status"] != FALHOU:
+            if (hash_audio is not None and existente["hash_audio"] == hash_audio
+                    and (existente["status"] != CONCLUIDO or verificar_arquivo(saida))):
+                logger.info(f"Job já registrado para {saida} ({existente['status']})")
+                return existente
+            logger.info(f"Áudio de {saida} mudou, substituindo o job anterior")
+
+        self._registrar(saida, os.path.abspath(caminho_audio), hash_audio, None, PENDENTE, time.time())
+        self._enviar(saida, caminho_audio, propagar_erros)
+        return self.job(saida)
+
+    def acompanhar(self, video_id: str, caminho_saida: str) -> Dict[str, Any]:
+        """
+        Registra um vídeo já solicitado ao HeyGen para ser acompanhado e baixado por aguardar().
+
+        Usado quando o vídeo é criado com opções que o cliente não cobre (voz a
+        partir de texto, pasta no HeyGen etc.).
+
+        Args:
+            video_id: ID do vídeo
+            caminho_saida: Caminho onde o vídeo será baixado
+
+        Returns:
+            Dict[str, Any]: Dados do job
+        """
+        saida = os.path.abspath(caminho_saida)
+        self._registrar(saida, "", None, video_id, PROCESSANDO, time.time() + self.intervalo_inicial)
+        return self.job(saida)
+
+    def _registrar(self, saida: str, audio: str, hash_audio: Optional[str], video_id: Optional[str],
+                   status: str, proxima_consulta: float) -> None:
+        """
+        Grava um job novo, substituindo o anterior com o mesmo caminho de saída.
+
+        Args:
+            saida: Caminho de saída do job
+            audio: Caminho do áudio do vídeo (vazio se o vídeo não foi criado a partir de um arquivo)
+            hash_audio: Hash SHA-256 do áudio
+            video_id: ID do vídeo, se já foi solicitado
+            status: Status inicial
+            proxima_consulta: Horário da primeira consulta de status
+        """
+        agora = time.time()
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO jobs (saida, audio, hash_audio, video_id, status, intervalo,"
+                " proxima_consulta, consultas, erro, criado_em, atualizado_em)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, 0, NULL, ?, ?)",
+                (saida, audio, hash_audio, video_id, status, self.intervalo_inicial, proxima_consulta, agora, agora)
+            )
+            self._conexao.commit()
+
+    def submeter_lote(self, itens: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Registra e envia vários jobs.
+
+        Args:
+            itens: Itens com as chaves "audio" e "saida"
+
+        Returns:
+            List[Dict[str, Any]]: Dados dos jobs, na ordem dos itens
+        """
+        return [self.submeter(item["audio"], item["saida"]) for item in itens]
+
+    def _enviar(self, saida: str, caminho_audio: str, propagar_erros: bool = False) -> None:
+        """
+        Envia o áudio de um job e solicita o vídeo.
+
+        Args:
+            saida: Caminho de saída do job
+            caminho_audio: Caminho do áudio do vídeo
+            propagar_erros: Se True, lança o erro do envio depois de registrá-lo no job
+        """
+        try:
+            audio_asset_id = self.cliente.enviar_audio(caminho_audio)
+            video_id = self.cliente.criar_video(audio_asset_id)
+        except Exception as e:
+            logger.error(f"Erro ao enviar o job {saida}: {e}")
+            self._atualizar(saida, status=FALHOU, erro=str(e))
+            if propagar_erros:
+                raise
+            return
+
+        self._atualizar(saida, video_id=video_id, status=PROCESSANDO,
+                        proxima_consulta=time.time() + self.intervalo_inicial)
+        logger.info(f"Job enviado: {os.path.basename(saida)} (vídeo {video_id})")
+
+    def aguardar(self, tempo_maximo: Optional[float] = None,
+                 saidas: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Acompanha os jobs pendentes até que terminem.
+
+        Jobs que ficaram pendentes em uma execução anterior (por exemplo, após
+        uma interrupção) são enviados ou consultados normalmente. Várias threads
+        podem aguardar ao mesmo tempo, cada uma com os seus caminhos de saída.
+
+        Args:
+            tempo_maximo: Tempo máximo de espera em segundos (se None, espera todos terminarem).
+                Ao fim do prazo a função retorna sem esperar os downloads em andamento,
+                que terminam em segundo plano. Jobs que não terminarem continuam
+                registrados para uma próxima execução.
+            saidas: Se informado, acompanha apenas os jobs desses caminhos de saída
+
+        Returns:
+            List[Dict[str, Any]]: Dados dos jobs acompanhados
+        """
+        filtro = {os.path.abspath(saida) for saida in saidas} if saidas is not None else None
+
+        def selecionados(status: Optional[str] = None) -> List[Dict[str, Any]]:
+            return [job for job in self.jobs(status) if filtro is None or job["saida"] in filtro]
+
+        for job in selecionados(PENDENTE):
+            self._enviar(job["saida"], job["audio"])
+
+        inicio = time.monotonic()
+        baixando: Dict[str, Future] = {}
+
+        # Sem "with": a saída do bloco esperaria os downloads e o tempo máximo não seria respeitado
+        executor = ThreadPoolExecutor(max_workers=self.max_downloads)
+        try:
+            while True:
+                for saida in [saida for saida, futuro in baixando.items() if futuro.done()]:
+                    del baixando[saida]
+
+                pendentes = [job for job in selecionados(PROCESSANDO) if job["saida"] not in baixando]
+                if not pendentes and not baixando:
+                    break
+
+                if tempo_maximo is not None and time.monotonic() - inicio > tempo_maximo:
+                    logger.warning(f"Tempo limite excedido com {len(pendentes) + len(baixando)} jobs pendentes")
+                    break
+
+                agora = time.time()
+                for job in pendentes:
+                    if job["proxima_consulta"] <= agora:
+                        video_url = self._consultar(job)
+                        if video_url:
+                            baixando[job["saida"]] = executor.submit(self._baixar, job, video_url)
+
+                self._esperar(baixando, filtro)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return selecionados()
+
+    def _esperar(self, baixando: Dict[str, Future], filtro: Optional[Set[str]] = None) -> None:
+        """
+        Dorme até a próxima consulta agendada ou até um download terminar.
+
+        Args:
+            baixando: Downloads em andamento
+            filtro: Caminhos de saída acompanhados (se None, todos os jobs)
+        """
+        with self._lock:
+            linhas = self._conexao.execute(
+                "SELECT saida, proxima_consulta FROM jobs WHERE status = ?", (PROCESSANDO,)
+            ).fetchall()
+        consultas = [proxima for saida, proxima in linhas if filtro is None or saida in filtro]
+
+        proxima = min(consultas) if consultas else time.time() + self.intervalo_inicial
+        espera = max(0.0, proxima - time.time())
+        if baixando:
+            # Acordar periodicamente para liberar os downloads concluídos
+            espera = min(espera, 0.1)
+        if espera:
+            time.sleep(espera)
+
+    def _consultar(self, job: Dict[str, Any]) -> Optional[str]:
+        """
+        Consulta o status de um job e agenda a próxima consulta.
+
+        Args:
+            job: Dados do job
+
+        Returns:
+            Optional[str]: URL do vídeo, se a renderização terminou
+        """
+        try:
+            status = self.cliente.status_video(job["video_id"])
+        except Exception as e:
+            logger.warning(f"Erro ao consultar o vídeo {job['video_id']}: {e}")
+            status = {"status": None}
+
+        if status["status"] == "completed" and status.get("video_url"):
+            self._atualizar(job["saida"], consultas=job["consultas"] + 1)
+            return status["video_url"]
+
+        if status["status"] in ("completed", "failed"):
+            erro = status.get("erro") or "URL do vídeo não encontrada"
+            logger.error(f"Falha ao renderizar o vídeo {job['video_id']}: {erro}")
+            self._atualizar(job["saida"], status=FALHOU, erro=str(erro), consultas=job["consultas"] + 1)
+            return None
+
+        intervalo = min(job["intervalo"] * self.fator_backoff, self.intervalo_maximo)
+        self._atualizar(job["saida"], intervalo=intervalo, proxima_consulta=time.time() + intervalo,
+                        consultas=job["consultas"] + 1)
+        return None
+
+    def _baixar(self, job: Dict[str, Any], video_url: str) -> None:
+        """
+        Baixa o vídeo de um job concluído.
+
+        Args:
+            job: Dados do job
+            video_url: URL do vídeo
+        """
+        try:
+            diretorio = os.path.dirname(job["saida"])
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            self.cliente.baixar_video(video_url, job["saida"])
+        except Exception as e:
+            logger.error(f"Erro ao baixar o vídeo {job['video_id']}: {e}")
+            self._atualizar(job["saida"], status=FALHOU, erro=str(e))
+            return
+
+        self._atualizar(job["saida"], status=CONCLUIDO, erro=None)
+        logger.info(f"Job concluído: {job['saida']}")
+
+    def fechar(self) -> None:
+        """
+        Fecha a conexão com o banco.
+        """
+        with self._lock:
+            self._fechado = True
+            self._conexao.close()
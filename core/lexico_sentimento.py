@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Módulo de análise de sentimento local para textos em português.
+Pontua os textos com um léxico de termos do mercado cripto, tratando negações,
+intensificadores e emojis, sem precisar traduzir os textos para o inglês.
+"""
+import re
+import math
+import logging
+import unicodedata
+from typing import List, Dict, Tuple, Optional
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('lexico_sentimento')
+
+# Léxico de sentimento (termos sem acentos, no masculino singular quando possível)
+LEXICO_SENTIMENTO = {
+    # Positivos
+    "alta": 1.5, "subir": 1.5, "sobe": 1.5, "subiu": 1.5, "subindo": 1.5, "disparar": 2.0,
+    "dispara": 2.0, "disparou": 2.0, "valorizacao": 2.0, "valorizar": 1.5, "valoriza": 1.5,
+    "valorizou": 1.5, "ganho": 1.5, "lucro": 2.0, "recorde": 1.5, "maxima": 1.5, "rali": 2.0,
+    "rally": 2.0, "otimo": 2.5, "excelente": 3.0, "bom": 1.5, "boa": 1.5, "positivo": 1.5,
+    "otimismo": 2.0, "otimista": 2.0, "oportunidade": 1.5, "crescimento": 1.5, "crescer": 1.5,
+    "cresce": 1.5, "cresceu": 1.5, "aprovacao": 1.5, "aprovado": 1.5, "aprova": 1.5,
+    "adocao": 1.5, "sucesso": 2.0, "forte": 1.0, "recuperacao": 1.5, "recupera": 1.5,
+    "recuperou": 1.5, "avanco": 1.5, "avanca": 1.5, "avancou": 1.5, "seguro": 1.0,
+    "confianca": 1.5, "promissor": 2.0, "incrivel": 2.5, "melhor": 1.5, "melhora": 1.5,
+    "vitoria": 2.0, "bullish": 2.0, "lua": 1.0, "parceria": 1.0, "inovacao": 1.0,
+    "beneficio": 1.5, "favoravel": 1.5, "animador": 2.0, "empolgante": 2.0, "feliz": 2.0,
+
+    # Negativos
+    "queda": -1.5, "cair": -1.5, "cai": -1.5, "caiu": -1.5, "caindo": -1.5, "despencar": -2.5,
+    "despenca": -2.5, "despencou": -2.5, "desvalorizacao": -2.0, "perda": -2.0,
+    "prejuizo": -2.0, "crise": -2.5, "colapso": -3.0, "crash": -3.0, "golpe": -3.0,
+    "fraude": -3.0, "hack": -2.5, "hacker": -2.5, "ataque": -2.0, "roubo": -3.0,
+    "roubado": -3.0, "falencia": -3.0, "preocupante": -2.0, "preocupacao": -1.5,
+    "medo": -2.0, "panico": -2.5, "risco": -1.0, "arriscado": -1.5, "cuidado": -1.0,
+    "alerta": -1.5, "ruim": -2.0, "pessimo": -3.0, "negativo": -1.5, "pessimismo": -2.0,
+    "pessimista": -2.0, "proibicao": -2.0, "proibe": -2.0, "proibido": -2.0,
+    "processo": -1.0, "investigacao": -1.5, "multa": -1.5, "liquidacao": -1.5,
+    "liquidado": -1.5, "volatilidade": -0.5, "incerteza": -1.5, "instabilidade": -1.5,
+    "bearish": -2.0, "pior": -2.0, "piora": -1.5, "fracasso": -2.5, "falha": -2.0,
+    "vulnerabilidade": -2.0, "rejeitado": -1.5, "rejeita": -1.5,
+    "triste": -2.0
+}
+
+# Palavras que invertem o sentido dos próximos termos
+NEGACOES = {"nao", "nem", "nunca", "jamais", "sem", "nenhum", "nenhuma"}
+
+# Palavras que reforçam (ou atenuam) o próximo termo
+INTENSIFICADORES = {
+    "muito": 1.5, "muita": 1.5, "muitos": 1.5, "muitas": 1.5, "extremamente": 2.0, "super": 1.5,
+    "bastante": 1.3, "totalmente": 1.5, "fortemente": 1.5, "enorme": 1.5, "pouco": 0.5, "levemente": 0.5
+}
+
+EMOJIS_SENTIMENTO = {
+    "🚀": 2.0, "📈": 1.5, "💰": 1.5, "💎": 1.0, "🔥": 1.0, "✅": 1.0, "🎉": 2.0, "😀": 1.5,
+    "😃": 1.5, "😍": 2.0, "👍": 1.5, "📉": -1.5, "⚠": -1.5, "🚨": -1.5, "❌": -1.5,
+    "😱": -2.0, "😢": -2.0, "😡": -2.5, "👎": -1.5, "💀": -1.5
+}
+
+# Número de termos afetados por uma negação
+ALCANCE_NEGACAO = 3
+
+# Constante de normalização da soma das pontuações para o intervalo (-1, 1)
+ALFA_NORMALIZACAO = 15.0
+
+# Limiares de classificação (os mesmos usados com o TextBlob)
+LIMIAR_POSITIVO = 0.1
+LIMIAR_NEGATIVO = -0.1
+
+_PADRAO_TOKEN = re.compile(r"[a-z0-9]+")
+_PADRAO_URL = re.compile(r"https?://\S+|www\.\S+")
+_PADRAO_MENCAO = re.compile(r"[@#]\w+")
+_PADRAO_ESPACOS = re.compile(r"\s+")
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Normaliza um texto para pontuação e memorização.
+
+    Remove URLs e menções, converte para minúsculas e junta espaços repetidos.
+    Os acentos são mantidos aqui e removidos apenas na tokenização.
+
+    Args:
+        texto: Texto original
+
+    Returns:
+        str: Texto normalizado
+    """
+    texto = _PADRAO_URL.sub(" ", texto or "")
+    texto = _PADRAO_MENCAO.sub(" ", texto)
+    return _PADRAO_ESPACOS.sub(" ", texto.lower()).strip()
+
+def _remover_acentos(texto: str) -> str:
+    """
+    Remove os acentos de um texto.
+
+    Args:
+        texto: Texto com acentos
+
+    Returns:
+        str: Texto sem acentos
+    """
+    return "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+
+def classificar_polaridade(polaridade: float) -> str:
+    """
+    Classifica uma polaridade em positivo, negativo ou neutro.
+
+    Args:
+        polaridade: Pontuação de polaridade (-1 a 1)
+
+    Returns:
+        str: Classificação do sentimento
+    """
+    if polaridade > LIMIAR_POSITIVO:
+        return "positivo"
+    if polaridade < LIMIAR_NEGATIVO:
+        return "negativo"
+    return "neutro"
+
+class PontuadorLexico:
+    """
+    Classe para pontuar o sentimento de textos em português com um léxico.
+    """
+    def __init__(self, lexico: Optional[Dict[str, float]] = None):
+        """
+        Inicializa o pontuador.
+
+        Args:
+            lexico: Léxico de sentimento (se None, usa LEXICO_SENTIMENTO)
+        """
+        lexico = lexico if lexico is not None else LEXICO_SENTIMENTO
+        self.termos = {_remover_acentos(termo.lower()): valor for termo, valor in lexico.items()}
+
+        # Memória de pontuações por texto normalizado
+        self._memoria = {}
+
+    def _valor_termo(self, token: str) -> Optional[float]:
+        """
+        Busca o valor de um token no léxico, tentando também as formas sem plural
+        e no masculino.
+
+        Args:
+            token: Token sem acentos
+
+        Returns:
+            Optional[float]: Valor do termo ou None se não estiver no léxico
+        """
+        for forma in (token, token[:-1] if token.endswith("s") else None):
+            if not forma:
+                continue
+            if forma in self.termos:
+                return self.termos[forma]
+            if forma.endswith("a") and forma[:-1] + "o" in self.termos:
+                return self.termos[forma[:-1] + "o"]
+        return None
+
+    def _pontuar_normalizado(self, texto: str) -> float:
+        """
+        Pontua um texto já normalizado.
+
+        Args:
+            texto: Texto normalizado
+
+        Returns:
+            float: Polaridade (-1 a 1)
+        """
+        soma = sum(valor * texto.count(emoji) for emoji, valor in EMOJIS_SENTIMENTO.items())
+
+        tokens = _PADRAO_TOKEN.findall(_remover_acentos(texto))
+        negacao_restante = 0
+        intensidade = 1.0
+
+        for token in tokens:
+            if token in NEGACOES:
+                negacao_restante = ALCANCE_NEGACAO
+                continue
+            if token in INTENSIFICADORES:
+                intensidade = INTENSIFICADORES[token]
+                continue
+
+            valor = self._valor_termo(token)
+            if valor is not None:
+                valor *= intensidade
+                if negacao_restante > 0:
+                    # Termos negados invertem o sentido, com peso menor
+                    valor = -valor * 0.75
+                soma += valor
+                intensidade = 1.0
+
+            if negacao_restante > 0:
+                negacao_restante -= 1
+
+        return soma / math.sqrt(soma * soma + ALFA_NORMALIZACAO)
+
+    def pontuar(self, texto: str) -> float:
+        """
+        Pontua o sentimento de um texto.
+
+        Args:
+            texto: Texto a ser pontuado
+
+        Returns:
+            float: Polaridade (-1 a 1)
+        """
+        return self.pontuar_lote([texto])[0]
+
+    def pontuar_lote(self, textos: List[str]) -> List[float]:
+        """
+        Pontua o sentimento de uma lista de textos, reaproveitando as pontuações
+        de textos que normalizam para o mesmo conteúdo.
+
+        Args:
+            textos: Textos a serem pontuados
+
+        Returns:
+            List[float]: Polaridades (-1 a 1), na mesma ordem
+        """
+        polaridades = []
+        for texto in textos:
+            normalizado = normalizar_texto(texto)
+            polaridade = self._memoria.get(normalizado)
+            if polaridade is None:
+                polaridade = self._pontuar_normalizado(normalizado)
+                self._memoria[normalizado] = polaridade
+            polaridades.append(polaridade)
+        return polaridades
+
+    def analisar_lote(self, textos: List[str]) -> List[Tuple[float, str]]:
+        """
+        Analisa o sentimento de uma lista de textos.
+
+        Args:
+            textos: Textos a serem analisados
+
+        Returns:
+            List[Tuple[float, str]]: Polaridade e classificação de cada texto
+        """
+        return [(polaridade, classificar_polaridade(polaridade)) for polaridade in self.pontuar_lote(textos)]
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Pipeline de geração de vídeo por seções para os vídeos Rapidinha.
+Divide o script nos marcadores de corte e processa as seções em paralelo:
+cada seção passa por geração de áudio, upload para o HeyGen, renderização e
+download. As renderizações são acompanhadas pelo GerenciadorJobsHeyGen (com
+backoff e, fora do modo simulado, jobs gravados em disco para retomar após
+uma interrupção) e são distribuídas entre as contas pelo
+AgendadorContas, que respeita o limite de cada conta e troca de conta
+quando uma delas é limitada.
+Ao final, os vídeos das seções são montados na ordem do script.
+"""
+import os
+import time
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable
+
+from core.content_splitter import ContentSplitter, MARCADOR_CORTE
+from core.heygen_api import ClienteHeyGen, ClienteHeyGenSimulado
+from core.jobs_heygen import GerenciadorJobsHeyGen, CONCLUIDO, FALHOU
+from core.agendador_contas import AgendadorContas, EstadoConta
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('pipeline_secoes')
+
+# Executável do FFmpeg usado na montagem do vídeo final
+FFMPEG_BINARIO = "ffmpeg"
+
+# Diretório dos bancos de jobs do pipeline (um por conta)
+DIRETORIO_JOBS = os.path.join("cache", "jobs_secoes")
+
+# ID do avatar padrão do Flukaku
+AVATAR_PADRAO = "431f819b1a8e42bb8f095e98e1e805a4"
+
+def dividir_secoes(script: str) -> List[str]:
+    """
+    Divide um script em seções.
+
+    Usa os marcadores de corte quando o script já os contém; caso contrário,
+    divide o script com o ContentSplitter.
+
+    Args:
+        script: Texto do script
+
+    Returns:
+        List[str]: Seções não vazias, na ordem do script
+    """
+    if MARCADOR_CORTE in script:
+        secoes = [secao.strip() for secao in script.split(MARCADOR_CORTE)]
+    else:
+        secoes = ContentSplitter().processar_script(script)["secoes"]
+
+    return [secao for secao in secoes if secao.strip()]
+
+def concatenar_videos(videos: List[str], caminho_saida: str) -> Optional[str]:
+    """
+    Concatena vídeos na ordem informada com o FFmpeg, sem recodificar.
+
+    Args:
+        videos: Caminhos dos vídeos
+        caminho_saida: Caminho do vídeo final
+
+    Returns:
+        Optional[str]: Caminho do vídeo final, ou None em caso de erro
+    """
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as lista:
+        for video in videos:
+            lista.write(f"file '{os.path.abspath(video)}'\n")
+
+    try:
+        cmd = [
+            FFMPEG_BINARIO, '-y',
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', lista.name,
+            '-c', 'copy',
+            caminho_saida
+        ]
+        resultado = subprocess.run(cmd, capture_output=True, text=True)
+        if resultado.returncode != 0:
+            logger.error(f"Erro ao concatenar vídeos: {resultado.stderr}")
+            return None
+        return caminho_saida
+    except FileNotFoundError:
+        logger.error("FFmpeg não encontrado. Não é possível montar o vídeo final.")
+        return None
+    finally:
+        os.remove(lista.name)
+
+def juntar_arquivos(arquivos: List[str], caminho_saida: str) -> Optional[str]:
+    """
+    Junta o conteúdo dos arquivos na ordem informada (montagem do modo simulado).
+
+    Args:
+        arquivos: Caminhos dos arquivos
+        caminho_saida: Caminho do arquivo final
+
+    Returns:
+        Optional[str]: Caminho do arquivo final
+    """
+    with open(caminho_saida, 'wb') as saida:
+        for arquivo in arquivos:
+            with open(arquivo, 'rb') as f:
+                shutil.copyfileobj(f, saida)
+    return caminho_saida
+
+class GeradorAudioSimulado:
+    """
+    Gerador de áudio com a mesma interface do AudioGenerator que não acessa a rede.
+    """
+    def __init__(self, latencia: float = 0.0):
+        """
+        Inicializa o gerador simulado.
+
+        Args:
+            latencia: Tempo em segundos simulado para cada geração
+        """
+        self.latencia = latencia
+
+    def generate_audio(self, text: str, output_path: str) -> Optional[str]:
+        """
+        Grava um áudio fictício com o próprio texto.
+
+        Args:
+            text: Texto da seção
+            output_path: Caminho do arquivo de áudio
+
+        Returns:
+            Optional[str]: Caminho do arquivo de áudio
+        """
+        if self.latencia:
+            time.sleep(self.latencia)
+        with open(output_path, 'wb') as f:
+            f.write(b"AUDIO:" + text.encode("utf-8"))
+        return output_path
+
+class LimiteConta:
+    """
+    Limites de uso da API do HeyGen por conta.
+    """
+    def __init__(self, max_renderizacoes: int = 2, intervalo_minimo: float = 1.0):
+        """
+        Inicializa os limites.
+
+        Args:
+            max_renderizacoes: Número máximo de vídeos renderizando ao mesmo tempo na conta
+            intervalo_minimo: Intervalo mínimo em segundos entre duas requisições à API
+        """
+        self.max_renderizacoes = max(1, max_renderizacoes)
+        self.intervalo_minimo = intervalo_minimo
+        self._lock = threading.Lock()
+        self._proxima_requisicao = 0.0
+
+    def aguardar_requisicao(self) -> None:
+        """
+        Aguarda até que uma nova requisição à API da conta seja permitida.
+        """
+        with self._lock:
+            agora = time.monotonic()
+            espera = self._proxima_requisicao - agora
+            self._proxima_requisicao = max(agora, self._proxima_requisicao) + self.intervalo_minimo
+
+        if espera > 0:
+            time.sleep(espera)
+
+class ClienteComLimite:
+    """
+    Cliente do HeyGen que respeita o intervalo mínimo entre requisições da conta.
+    """
+    def __init__(self, cliente: Any, limite: LimiteConta):
+        """
+        Inicializa o cliente.
+
+        Args:
+            cliente: Cliente do HeyGen (ClienteHeyGen ou ClienteHeyGenSimulado)
+            limite: Limites de uso da conta
+        """
+        self.cliente = cliente
+        self.limite = limite
+
+    def enviar_audio(self, caminho_audio: str) -> str:
+        """
+        Envia um áudio para o HeyGen.
+        """
+        self.limite.aguardar_requisicao()
+        return self.cliente.enviar_audio(caminho_audio)
+
+    def criar_video(self, audio_asset_id: str, *args: Any, **kwargs: Any) -> str:
+        """
+        Solicita a renderização de um vídeo.
+        """
+        self.limite.aguardar_requisicao()
+        return self.cliente.criar_video(audio_asset_id, *args, **kwargs)
+
+    def status_video(self, video_id: str) -> Dict[str, Any]:
+        """
+        Consulta o status de um vídeo.
+        """
+        self.limite.aguardar_requisicao()
+        return self.cliente.status_video(video_id)
+
+    def baixar_video(self, video_url: str, caminho_saida: str) -> str:
+        """
+        Baixa um vídeo renderizado.
+        """
+        return self.cliente.baixar_video(video_url, caminho_saida)
+
+class PipelineSecoes:
+    """
+    Classe para gerar os vídeos das seções de um script em paralelo.
+    """
+    def __init__(self, gerador_audio: Any, clientes: Dict[str, Any],
+                 limites: Optional[Dict[str, LimiteConta]] = None, max_workers: int = 4,
+                 intervalo_status: float = 10.0, tempo_maximo: float = 1800.0,
+                 montador: Optional[Callable[[List[str], str], Optional[str]]] = None,
+                 agendador: Optional[AgendadorContas] = None, diretorio_jobs: Optional[str] = None):
+        """
+        Inicializa o pipeline.
+
+        Args:
+            gerador_audio: Gerador de áudio com o método generate_audio(text, output_path)
+            clientes: Clientes do HeyGen por ID de conta
+            limites: Limites de uso por ID de conta (contas sem limite usam os valores padrão)
+            max_workers: Número máximo de seções processadas ao mesmo tempo
+            intervalo_status: Intervalo em segundos até a primeira consulta de status de um vídeo
+                (as consultas seguintes se espaçam com backoff)
+            tempo_maximo: Tempo máximo em segundos de espera pela renderização de um vídeo
+            montador: Função que monta o vídeo final a partir dos vídeos das seções
+            agendador: Agendador das contas (se None, usa os limites de renderização de cada conta)
+            diretorio_jobs: Diretório dos bancos de jobs, um por conta (se None, os jobs
+                ficam em memória e não são retomados em outra execução)
+        """
+        if not clientes:
+            raise ValueError("Nenhuma conta do HeyGen configurada para o pipeline")
+
+        self.gerador_audio = gerador_audio
+        self.clientes = clientes
+        self.limites = {conta: (limites or {}).get(conta) or LimiteConta() for conta in clientes}
+        self.max_workers = max_workers
+        self.intervalo_status = intervalo_status
+        self.tempo_maximo = tempo_maximo
+        self.montador = montador or concatenar_videos
+        self.agendador = agendador or AgendadorContas(
+            {conta: EstadoConta(limite.max_renderizacoes) for conta, limite in self.limites.items()}
+        )
+
+        # Um gerenciador por conta: um vídeo só pode ser consultado pela conta que o criou
+        self.gerenciadores = {
+            conta: GerenciadorJobsHeyGen(
+                ClienteComLimite(cliente, self.limites[conta]),
+                arquivo=os.path.join(diretorio_jobs, f"{conta}.db") if diretorio_jobs else ":memory:",
+                intervalo_inicial=intervalo_status,
+                intervalo_maximo=max(intervalo_status, 60.0)
+            )
+            for conta, cliente in clientes.items()
+        }
+
+    def processar_script(self, script: str, diretorio_saida: str, prefixo: str = "rapidinha") -> Dict[str, Any]:
+        """
+        Gera o vídeo de um script, processando as seções em paralelo.
+
+        Args:
+            script: Texto do script (com ou sem marcadores de corte)
+            diretorio_saida: Diretório dos áudios e vídeos gerados
+            prefixo: Prefixo dos nomes dos arquivos
+
+        Returns:
+            Dict[str, Any]: Resultado de cada seção e caminho do vídeo final
+                (None se alguma seção falhar)
+        """
+        secoes = [{"indice": i + 1, "texto": texto} for i, texto in enumerate(dividir_secoes(script))]
+        logger.info(f"Script dividido em {len(secoes)} seções")
+        return self._executar(secoes, diretorio_saida, prefixo)
+
+    def processar_audios(self, audios: List[str], diretorio_saida: str, prefixo: str = "rapidinha") -> Dict[str, Any]:
+        """
+        Gera os vídeos de seções cujo áudio já foi gerado, em paralelo.
+
+        Args:
+            audios: Caminhos dos áudios das seções, na ordem do script
+            diretorio_saida: Diretório dos vídeos gerados
+            prefixo: Prefixo dos nomes dos arquivos
+
+        Returns:
+            Dict[str, Any]: Resultado de cada seção e caminho do vídeo final
+                (None se alguma seção falhar)
+        """
+        secoes = [{"indice": i + 1, "audio": audio} for i, audio in enumerate(audios)]
+        return self._executar(secoes, diretorio_saida, prefixo)
+
+    def _executar(self, secoes: List[Dict[str, Any]], diretorio_saida: str, prefixo: str) -> Dict[str, Any]:
+        """
+        Processa as seções em paralelo e monta o vídeo final.
+
+        Args:
+            secoes: Seções a processar
+            diretorio_saida: Diretório dos arquivos gerados
+            prefixo: Prefixo dos nomes dos arquivos
+
+        Returns:
+            Dict[str, Any]: Resultado de cada seção e caminho do vídeo final
+        """
+        os.makedirs(diretorio_saida, exist_ok=True)
+        inicio = time.time()
+
+        if not secoes:
+            return {"secoes": [], "video_final": None}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(secoes)))) as executor:
+            futuros = [executor.submit(self._processar_secao, secao, diretorio_saida, prefixo) for secao in secoes]
+            resultados = [futuro.result() for futuro in futuros]
+
+        falhas = [secao["indice"] for secao in resultados if secao["status"] != "concluido"]
+        video_final = None
+        if falhas:
+            logger.error(f"Seções com falha: {falhas}. O vídeo final não será montado.")
+        else:
+            caminho_final = os.path.join(diretorio_saida, f"{prefixo}_final.mp4")
+            video_final = self.montador([secao["video"] for secao in resultados], caminho_final)
+
+        logger.info(f"{len(resultados) - len(falhas)}/{len(resultados)} seções geradas em {time.time() - inicio:.1f}s")
+        return {"secoes": resultados, "video_final": video_final}
+
+    def _processar_secao(self, secao: Dict[str, Any], diretorio_saida: str, prefixo: str) -> Dict[str, Any]:
+        """
+        Gera o áudio e o vídeo de uma seção.
+
+        Args:
+            secao: Seção com índice e texto ou áudio
+            diretorio_saida: Diretório dos arquivos gerados
+            prefixo: Prefixo dos nomes dos arquivos
+
+        Returns:
+            Dict[str, Any]: Seção com áudio, vídeo, conta usada, status e erro
+        """
+        resultado = dict(secao, video=None, conta=None, status="falhou", erro=None)
+        nome_base = os.path.join(diretorio_saida, f"{prefixo}_secao_{secao['indice']}")
+
+        try:
+            if not resultado.get("audio"):
+                logger.info(f"Gerando áudio da seção {secao['indice']}...")
+                audio = self.gerador_audio.generate_audio(secao["texto"], f"{nome_base}.mp3")
+                if not audio:
+                    raise RuntimeError("falha ao gerar o áudio")
+                resultado["audio"] = audio
+
+            def renderizar(conta: str) -> str:
+                resultado["conta"] = conta
+                return self._renderizar(conta, resultado["audio"], f"{nome_base}.mp4")
+
+            resultado["video"] = self.agendador.executar(renderizar)
+            resultado["status"] = "concluido"
+            logger.info(f"Seção {secao['indice']} concluída na conta {resultado['conta']}: {resultado['video']}")
+
+        except Exception as e:
+            resultado["erro"] = str(e)
+            logger.error(f"Erro na seção {secao['indice']}: {e}")
+
+        return resultado
+
+    def _renderizar(self, conta: str, caminho_audio: str, caminho_video: str) -> str:
+        """
+        Envia o áudio, solicita o vídeo, aguarda a renderização e baixa o resultado.
+
+        Um job da mesma seção com o mesmo áudio, registrado em uma execução
+        anterior, é retomado em vez de reenviado.
+
+        Args:
+            conta: ID da conta
+            caminho_audio: Caminho do áudio da seção
+            caminho_video: Caminho do vídeo a ser baixado
+
+        Returns:
+            str: Caminho do vídeo baixado
+
+        Raises:
+            RuntimeError: Se a renderização falhar ou exceder o tempo máximo
+        """
+        gerenciador = self.gerenciadores[conta]
+
+        # Erros no envio são lançados para o agendador trocar de conta se esta foi limitada
+        gerenciador.submeter(caminho_audio, caminho_video, propagar_erros=True)
+        job = gerenciador.aguardar(tempo_maximo=self.tempo_maximo, saidas=[caminho_video])[0]
+
+        if job["status"] == CONCLUIDO:
+            return caminho_video
+        if job["status"] == FALHOU:
+            raise RuntimeError(f"falha ao renderizar o vídeo {job['video_id']}: {job['erro']}")
+        raise RuntimeError(f"tempo limite excedido aguardando o vídeo {job['video_id']}")
+
+    def fechar(self) -> None:
+        """
+        Fecha os bancos de jobs.
+        """
+        for gerenciador in self.gerenciadores.values():
+            gerenciador.fechar()
+
+def criar_pipeline(simulado: bool = False, account_manager: Any = None, contas: Optional[List[str]] = None,
+                   max_workers: int = 4, **kwargs) -> PipelineSecoes:
+    """
+    Cria um pipeline com os serviços reais ou simulados.
+
+    Args:
+        simulado: Se True, usa serviços simulados que não acessam a rede
+        account_manager: Gerenciador de contas (se None, usa HEYGEN_API_KEY do ambiente)
+        contas: IDs das contas do HeyGen a usar (se None, usa todas as contas com API key)
+        max_workers: Número máximo de seções processadas ao mesmo tempo
+        **kwargs: Demais argumentos do PipelineSecoes
+
+    Returns:
+        PipelineSecoes: Pipeline configurado
+
+    Raises:
+        ValueError: Se nenhuma conta do HeyGen estiver configurada
+    """
+    if simulado:
+        kwargs.setdefault("intervalo_status", 0.0)
+        kwargs.setdefault("limites", {"simulada": LimiteConta(max_renderizacoes=max_workers, intervalo_minimo=0.0)})
+        kwargs.setdefault("montador", juntar_arquivos)
+        return PipelineSecoes(GeradorAudioSimulado(), {"simulada": ClienteHeyGenSimulado()},
+                              max_workers=max_workers, **kwargs)
+
+    from core.audio import AudioGenerator
+
+    clientes = {}
+    limites = {}
+    if account_manager:
+        agendador = AgendadorContas.de_account_manager(account_manager, contas)
+        configuradas = account_manager.list_heygen_accounts()
+        for conta in agendador.contas:
+            api_key, avatar_id = account_manager.get_heygen_account(conta)
+            clientes[conta] = ClienteHeyGen(api_key, avatar_id or AVATAR_PADRAO)
+            config = configuradas.get(conta, {})
+            limites[conta] = LimiteConta(config.get("max_renderizacoes", 2), config.get("intervalo_minimo", 1.0))
+        kwargs.setdefault("agendador", agendador)
+    elif os.environ.get("HEYGEN_API_KEY"):
+        clientes["env"] = ClienteHeyGen(os.environ["HEYGEN_API_KEY"], AVATAR_PADRAO)
+
+    kwargs.setdefault("limites", limites)
+    kwargs.setdefault("diretorio_jobs", DIRETORIO_JOBS)
+    return PipelineSecoes(AudioGenerator(), clientes, max_workers=max_workers, **kwargs)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Cache of encoded video segments.
+
+The segmented render encodes every section of the timeline (intro, each news
+title and content card, outro, credits) as its own video file and joins them
+without re-encoding. The encoded segments are stored here under a hash of
+everything that determines them: text, background frame, number of frames,
+style (colors, fonts, sizes) and codec settings. When a script is rendered
+again after one news item changes, only that item's segments miss the cache
+and are encoded; the others are reused from disk.
+
+Segments are evicted (least recently used first) when the cache exceeds its
+size limit.
+"""
+import os
+import logging
+import threading
+from typing import Any, Optional
+
+from core.utils import content_key, evict_lru, mark_used
+
+logger = logging.getLogger('cloneia.segment_cache')
+
+# Default maximum size of the cache on disk (1 GB)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+class SegmentCache:
+    """
+    Size-bounded cache of encoded video segments on disk.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the segment cache.
+
+        Args:
+            cache_dir: Directory where the segments are stored
+            max_bytes: Maximum total size of the segments in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(kind: str, **params: Any) -> str:
+        """
+        Compute the cache key of a segment.
+
+        Args:
+            kind: Kind of segment (e.g. "segment")
+            **params: Everything that determines the encoded segment
+
+        Returns:
+            str: SHA-256 hex digest identifying the segment
+        """
+        return content_key(kind, **params)
+
+    def _path(self, key: str) -> str:
+        """
+        Get the path of the segment for a key.
+        """
+        return os.path.join(self.cache_dir, f"{key}.mp4")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached segment.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Path to the segment, or None on a miss
+        """
+        path = self._path(key)
+        return path if mark_used(path) else None
+
+    def put(self, key: str, segment_path: str) -> str:
+        """
+        Store an encoded segment (the file is moved into the cache).
+
+        Args:
+            key: Cache key
+            segment_path: Path to the encoded segment (ideally on the same file system as the cache)
+
+        Returns:
+            str: Path to the segment in the cache
+        """
+        path = self._path(key)
+        os.replace(segment_path, path)
+        return path
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used segments until the cache fits its size limit.
+
+        Returns:
+            int: Number of files removed
+        """
+        with self._lock:
+            return evict_lru(self.cache_dir, ".mp4", self.max_bytes, "segment cache")
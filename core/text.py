@@ -8,6 +8,8 @@ import logging
 from typing import Dict, List, Optional, Tuple, Any
 
 from core.utils import optimize_text
+from core.text_optimizer import (CRYPTO_TERMS, EMPHASIS_WORDS, GREETING_PATTERNS,
+                                  speech_optimizer)
 
 logger = logging.getLogger('cloneia.text')
 
@@ -16,45 +18,27 @@ class TextProcessor:
     Class for processing and optimizing text for speech synthesis.
     """
 
-    def __init__(self):
+    def __init__(self, use_compiled: bool = True):
         """
         Initialize the text processor.
+
+        Args:
+            use_compiled: If True, optimize_for_speech uses the compiled "speech" profile
+                of core.text_optimizer; if False, the sequential reference implementation
         """
         # Common crypto terms and their pronunciations
-        self.crypto_terms = {
-            "Bitcoin": "Bitcoim",
-            "Ethereum": "Etherium",
-            "Cardano": "Cardâno",
-            "Solana": "Solâna",
-            "Polkadot": "Polcadot",
-            "Binance": "Bináns",
-            "Coinbase": "Cóinbeis",
-            "NFT": "ÊnÊfeTê",
-            "DeFi": "DêFai",
-            "staking": "stêiking",
-            "blockchain": "blókcheim",
-            "wallet": "wólet",
-            "token": "tôken",
-            "altcoin": "ôltcoin",
-            "mining": "máining",
-            "miner": "máiner"
-        }
+        self.crypto_terms = dict(CRYPTO_TERMS)
 
         # Words to emphasize
-        self.emphasis_words = [
-            "bombando", "muito", "super", "mega", "alta", "subindo",
-            "disparou", "explodiu", "recorde", "máxima", "forte",
-            "incrível", "enorme", "gigante", "absurdo", "impressionante",
-            "surpreendente", "extraordinário", "fenomenal", "espetacular"
-        ]
+        self.emphasis_words = list(EMPHASIS_WORDS)
 
         # Greeting patterns
-        self.greeting_patterns = [
-            (r"e\s+aí\s+cambada", "EAÍCAMBADA"),
-            (r"fala\s+cambada", "FALACAMBADA"),
-            (r"e\s+aí\s+galera", "EAÍGALERA"),
-            (r"fala\s+galera", "FALAGALERA")
-        ]
+        self.greeting_patterns = list(GREETING_PATTERNS)
+
+        # The rules are compiled once; changing the tables above after this point has no effect
+        self.use_compiled = use_compiled
+        self.speech_optimizer = speech_optimizer(self.crypto_terms, self.emphasis_words,
+                                                 self.greeting_patterns)
 
         logger.info("TextProcessor initialized")
 
@@ -62,6 +46,24 @@ class TextProcessor:
         """
         Optimize text for speech synthesis.
 
+        Args:
+            text: Original text
+
+        Returns:
+            str: Optimized text
+        """
+        if not self.use_compiled:
+            return self._optimize_for_speech_sequential(text)
+
+        optimized = self.speech_optimizer.optimize(text)
+        if optimized:
+            logger.debug(f"Optimized text: {optimized[:50]}...")
+        return optimized
+
+    def _optimize_for_speech_sequential(self, text: str) -> str:
+        """
+        Reference implementation of optimize_for_speech (one re.sub per rule).
+
         Args:
             text: Original text
 
@@ -228,15 +230,59 @@ class TextProcessor:
             if len(current_chunk) + len(sentence) <= max_length:
                 current_chunk += sentence + " "
             else:
-                chunks.append(current_chunk.strip())
+                # A first sentence longer than max_length must not leave an empty chunk
+                if current_chunk.strip():
+                    chunks.append(current_chunk.strip())
                 current_chunk = sentence + " "
 
-        if current_chunk:
+        if current_chunk.strip():
             chunks.append(current_chunk.strip())
 
         return chunks
 
 
+    def split_speech_units(self, text: str, max_length: int = 1000) -> List[str]:
+        """
+        Split text into chunks whose boundaries depend only on their own content.
+
+        Each non-empty line is one chunk. A line longer than max_length is split
+        into sentences, and a sentence longer than max_length at word boundaries.
+        Unlike split_long_text, editing one sentence never moves the boundaries
+        of the other chunks.
+
+        Args:
+            text: Text to split (before optimization, so the punctuation is still there)
+            max_length: Maximum length of each chunk (a single word may exceed it)
+
+        Returns:
+            List[str]: List of text chunks
+        """
+        chunks = []
+        for line in text.splitlines():
+            line = line.strip()
+            if len(line) <= max_length:
+                if line:
+                    chunks.append(line)
+                continue
+
+            for sentence in re.split(r'(?<=[.!?])\s+', line):
+                if len(sentence) <= max_length:
+                    chunks.append(sentence)
+                    continue
+
+                current_chunk = ""
+                for word in sentence.split():
+                    if current_chunk and len(current_chunk) + 1 + len(word) > max_length:
+                        chunks.append(current_chunk)
+                        current_chunk = word
+                    else:
+                        current_chunk = f"{current_chunk} {word}" if current_chunk else word
+                if current_chunk:
+                    chunks.append(current_chunk)
+
+        return chunks
+
+
 # For backward compatibility
 def optimize_text_legacy(text: str) -> str:
     """
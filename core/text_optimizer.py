@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Rule-table text optimization engine for the CloneIA project.
+
+Every text optimizer of the project is a named profile of this engine:
+
+- "speech": TextProcessor.optimize_for_speech (whole-word rules, pauses after conjunctions)
+- "natural": core.utils.optimize_text, optimize_text_legacy and AudioGenerator._optimize_text
+- "fast": gerar_audio_rapido.optimize_text_for_speed (keeps some punctuation, faster prosody)
+
+A profile is an ordered list of stages built from the rule tables below and
+compiled once. Word and greeting tables run as a single regex pass with a dict
+lookup; literal tables run as a chain of C-level str.replace calls, which is
+faster than an alternation regex in CPython. Rules that depend on each other's
+output keep their original order, so every profile produces the same output as
+the code it replaced.
+"""
+import re
+import logging
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('cloneia.text_optimizer')
+
+# Common crypto terms and their pronunciations
+CRYPTO_TERMS = {
+    "Bitcoin": "Bitcoim",
+    "Ethereum": "Etherium",
+    "Cardano": "Cardâno",
+    "Solana": "Solâna",
+    "Polkadot": "Polcadot",
+    "Binance": "Bináns",
+    "Coinbase": "Cóinbeis",
+    "NFT": "ÊnÊfeTê",
+    "DeFi": "DêFai",
+    "staking": "stêiking",
+    "blockchain": "blókcheim",
+    "wallet": "wólet",
+    "token": "tôken",
+    "altcoin": "ôltcoin",
+    "mining": "máining",
+    "miner": "máiner"
+}
+
+# Only the most important terms, used by the fast profile
+FAST_CRYPTO_TERMS = {
+    "Bitcoin": "Bitcoim",
+    "Ethereum": "Etherium",
+    "NFT": "ÊnÊfeTê",
+    "DeFi": "DêFai"
+}
+
+# Words to emphasize (written in uppercase)
+EMPHASIS_WORDS = [
+    "bombando", "muito", "super", "mega", "alta", "subindo",
+    "disparou", "explodiu", "recorde", "máxima", "forte",
+    "incrível", "enorme", "gigante", "absurdo", "impressionante",
+    "surpreendente", "extraordinário", "fenomenal", "espetacular"
+]
+
+# Greeting patterns (case-insensitive regexes) and their fluid versions
+GREETING_PATTERNS = [
+    (r"e\s+aí\s+cambada", "EAÍCAMBADA"),
+    (r"fala\s+cambada", "FALACAMBADA"),
+    (r"e\s+aí\s+galera", "EAÍGALERA"),
+    (r"fala\s+galera", "FALAGALERA")
+]
+
+# Greetings replaced only at the start of the text by the natural profile
+INTRO_GREETINGS = [
+    ("e aí cambada", "EAÍCAMBADA"),
+    ("fala cambada", "FALACAMBADA")
+]
+
+# Greetings replaced by the fast profile (case-sensitive)
+FAST_GREETINGS = [
+    ("E aí cambada", "EAÍCAMBADA"),
+    ("Fala cambada", "FALACAMBADA"),
+    ("Eaí cambada", "EAÍCAMBADA")
+]
+
+# Conjunctions that get a subtle pause (hyphen) after them, in the order they are applied
+PAUSE_WORDS = ("mas", "e", "então", "porém")
+
+# Punctuation rules of the speech profile, in the order they are applied
+PUNCTUATION_RULES = [
+    (r'[!?]', ''),          # Remove exclamation and question marks completely
+    (r'\.{3,}', ''),        # Remove ellipses
+    (r'[;:]', ' '),         # Replace semicolons and colons with spaces
+    (r',\s+', ' '),         # Replace ", " with space
+    (r'\.\s+', ' '),        # Replace ". " with space
+    (r'(\d),(\d)', r'\1\2')  # Remove commas in numbers
+]
+
+# Punctuation removed by the natural profile
+NATURAL_REMOVED_PUNCTUATION = ",.!?;:"
+
+# Punctuation reduced (not removed) by the fast profile to keep the intonation
+FAST_PUNCTUATION = [
+    (",", ""),
+    (";", ""),
+    ("...", "."),
+    ("!!", "!"),
+    ("??", "?")
+]
+
+# Speed marker added by the fast profile (25% faster)
+FAST_PROSODY = ("<prosody rate='1.25'>", "</prosody>")
+
+_WORD_REGEX = re.compile(r'\w+')
+
+
+class Stage:
+    """
+    One compiled step of a profile.
+    """
+
+    def apply(self, text: str) -> str:
+        """
+        Apply the stage to a text.
+
+        Args:
+            text: Text to transform
+
+        Returns:
+            str: Transformed text
+        """
+        raise NotImplementedError
+
+
+class ReplaceLiterals(Stage):
+    """
+    Replace substrings, in order, anywhere in the text (str.replace semantics).
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]]):
+        """
+        Args:
+            rules: Substrings and their replacements, in the order they are applied
+        """
+        self.rules = [(old, new) for old, new in rules if old != new]
+
+    def apply(self, text: str) -> str:
+        for old, new in self.rules:
+            text = text.replace(old, new)
+        return text
+
+
+class ReplacePrefix(Stage):
+    """
+    Replace the start of the text if it matches one of the prefixes (case-insensitive).
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]]):
+        """
+        Args:
+            rules: Lowercase prefixes and their replacements; the first match wins
+        """
+        self.rules = [(prefix.lower(), replacement) for prefix, replacement in rules]
+
+    def apply(self, text: str) -> str:
+        for prefix, replacement in self.rules:
+            if text[:len(prefix)].lower() == prefix:
+                return replacement + text[len(prefix):]
+        return text
+
+
+class RegexRules(Stage):
+    """
+    Apply regex substitutions one after the other.
+
+    Used for rules that depend on each other's output (e.g. removing "!" can
+    create a ", " that the next rule replaces), so they cannot be merged.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]], flags: int = 0):
+        """
+        Args:
+            rules: Regexes and their replacements, in the order they are applied
+            flags: Regex flags
+        """
+        self.rules = [(re.compile(pattern, flags), replacement) for pattern, replacement in rules]
+
+    def apply(self, text: str) -> str:
+        for regex, replacement in self.rules:
+            text = regex.sub(replacement, text)
+        return text
+
+
+class RegexAlternation(Stage):
+    """
+    Apply independent regex rules in a single pass.
+
+    The rules are joined in one alternation with a group per rule, and the
+    replacement is looked up from the group that matched.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]], flags: int = 0, whole_words: bool = False):
+        """
+        Args:
+            rules: Regexes (without groups) and their literal replacements
+            flags: Regex flags
+            whole_words: If True, the rules only match whole words
+        """
+        self.replacements = [replacement for _, replacement in rules]
+        alternation = "|".join(f"({pattern})" for pattern, _ in rules)
+        if whole_words:
+            alternation = rf'\b(?:{alternation})\b'
+        self.regex = re.compile(alternation, flags) if rules else None
+
+    def _replace(self, match: re.Match) -> str:
+        return self.replacements[match.lastindex - 1]
+
+    def apply(self, text: str) -> str:
+        if self.regex is None:
+            return text
+        return self.regex.sub(self._replace, text)
+
+
+class ReplaceWords(Stage):
+    """
+    Replace whole words from a table in a single scan over the words of the text.
+
+    Equivalent to one re.sub(r'\\bword\\b', ...) per word, in table order, as long
+    as no replacement is itself a word of the table. Tables with entries that are
+    not made only of word characters fall back to a whole-word alternation.
+    """
+
+    def __init__(self, table: Dict[str, str], ignore_case: bool = False):
+        """
+        Args:
+            table: Words and their replacements
+            ignore_case: If True, words match regardless of case (re.IGNORECASE semantics)
+        """
+        self.ignore_case = ignore_case
+        self.lookup = {(word.lower() if ignore_case else word): replacement
+                       for word, replacement in table.items() if _WORD_REGEX.fullmatch(word)}
+        # The alternation is the fallback and checks the case-insensitive matches
+        # that lowercasing misses (e.g. "ſ" for "s")
+        self.alternation = RegexAlternation([(re.escape(word), replacement) for word, replacement in table.items()],
+                                            re.IGNORECASE if ignore_case else 0, whole_words=True)
+        self.fallback = len(self.lookup) < len(table)
+
+    def _replace(self, match: re.Match) -> str:
+        word = match.group()
+        if not self.ignore_case:
+            return self.lookup.get(word, word)
+
+        replacement = self.lookup.get(word.lower())
+        if replacement is not None:
+            return replacement
+        if not word.isascii():
+            full = self.alternation.regex.fullmatch(word)
+            if full:
+                return self.alternation.replacements[full.lastindex - 1]
+        return word
+
+    def apply(self, text: str) -> str:
+        if self.fallback:
+            return self.alternation.apply(text)
+        if not self.lookup:
+            return text
+        return _WORD_REGEX.sub(self._replace, text)
+
+
+class PauseWords(Stage):
+    """
+    Add a hyphen (subtle pause) after conjunctions surrounded by whitespace.
+
+    Equivalent to one re.sub(r'\\s+word\\s+', ' word- ', ...) per conjunction,
+    in order, handling each run of consecutive conjunctions in a single pass.
+    """
+
+    def __init__(self, words: Sequence[str]):
+        """
+        Args:
+            words: Conjunctions, in the order they are applied (case-insensitive)
+        """
+        alternation = "|".join(words)
+        self.run_regex = re.compile(rf'\s+(?:(?:{alternation})\s+)+', re.IGNORECASE)
+        self.token_regex = re.compile(r'(\s+)(\S+)')
+        self.word_regexes = [(word, re.compile(word, re.IGNORECASE)) for word in words]
+
+    def _replace_run(self, match: re.Match) -> str:
+        """
+        Add pauses to a run of consecutive conjunctions.
+
+        A match of the per-word rule consumes the whitespace around the word, so
+        within one word's pass two adjacent occurrences cannot both match, but
+        the next word's pass sees the single spaces written by the previous one.
+
+        Args:
+            match: Match of run_regex
+
+        Returns:
+            str: Run with the pauses added
+        """
+        run = match.group()
+        tokens = self.token_regex.findall(run)
+        gaps = [gap for gap, _ in tokens] + [run[len("".join(gap + word for gap, word in tokens)):]]
+        words = [word for _, word in tokens]
+
+        for pause_word, word_regex in self.word_regexes:
+            last_consumed_gap = -1
+            for i, word in enumerate(words):
+                if last_consumed_gap != i and word_regex.fullmatch(word):
+                    words[i] = f"{pause_word}-"
+                    gaps[i] = " "
+                    gaps[i + 1] = " "
+                    last_consumed_gap = i + 1
+
+        return "".join(gap + word for gap, word in zip(gaps, words)) + gaps[-1]
+
+    def apply(self, text: str) -> str:
+        return self.run_regex.sub(self._replace_run, text)
+
+
+class CollapseWhitespace(Stage):
+    """
+    Turn runs of whitespace (and optional extra characters) into single spaces and strip the text.
+    """
+
+    def __init__(self, extra_chars: str = ""):
+        """
+        Args:
+            extra_chars: Characters treated as whitespace (e.g. "-" to split hyphenated words)
+        """
+        self.extra_chars = extra_chars
+
+    def apply(self, text: str) -> str:
+        for char in self.extra_chars:
+            text = text.replace(char, " ")
+        return " ".join(text.split())
+
+
+class Wrap(Stage):
+    """
+    Surround the text with markers.
+    """
+
+    def __init__(self, before: str, after: str):
+        """
+        Args:
+            before: Text added at the start
+            after: Text added at the end
+        """
+        self.before = before
+        self.after = after
+
+    def apply(self, text: str) -> str:
+        return self.before + text + self.after
+
+
+class TextOptimizer:
+    """
+    Text optimizer that applies the compiled stages of a profile.
+    """
+
+    def __init__(self, stages: List[Stage], name: str = "custom", optimize_empty: bool = False):
+        """
+        Initialize the optimizer.
+
+        Args:
+            stages: Stages, in the order they are applied
+            name: Profile name
+            optimize_empty: If False, empty texts are returned unchanged
+        """
+        self.stages = stages
+        self.name = name
+        self.optimize_empty = optimize_empty
+
+    def optimize(self, text: str) -> str:
+        """
+        Optimize a text.
+
+        Args:
+            text: Original text
+
+        Returns:
+            str: Optimized text
+        """
+        if not text and not self.optimize_empty:
+            return text
+
+        for stage in self.stages:
+            text = stage.apply(text)
+        return text
+
+
+def speech_optimizer(crypto_terms: Optional[Dict[str, str]] = None,
+                     emphasis_words: Optional[List[str]] = None,
+                     greeting_patterns: Optional[List[Tuple[str, str]]] = None) -> TextOptimizer:
+    """
+    Build the speech profile (TextProcessor.optimize_for_speech).
+
+    Args:
+        crypto_terms: Crypto terms and their pronunciations (if None, uses CRYPTO_TERMS)
+        emphasis_words: Words to emphasize (if None, uses EMPHASIS_WORDS)
+        greeting_patterns: Greeting regexes and their replacements (if None, uses GREETING_PATTERNS)
+
+    Returns:
+        TextOptimizer: Speech optimizer
+    """
+    crypto_terms = CRYPTO_TERMS if crypto_terms is None else crypto_terms
+    emphasis_words = EMPHASIS_WORDS if emphasis_words is None else emphasis_words
+    greeting_patterns = GREETING_PATTERNS if greeting_patterns is None else greeting_patterns
+
+    return TextOptimizer([
+        RegexAlternation(greeting_patterns, re.IGNORECASE),
+        RegexRules(PUNCTUATION_RULES),
+        PauseWords(PAUSE_WORDS),
+        ReplaceWords(crypto_terms),
+        ReplaceWords({word: word.upper() for word in emphasis_words}, ignore_case=True)
+    ], name="speech")
+
+
+def natural_optimizer() -> TextOptimizer:
+    """
+    Build the natural profile (core.utils.optimize_text).
+
+    Greetings are replaced only at the start of the text, all pausing
+    punctuation is removed, and terms and emphasis words (lowercase or
+    capitalized) are replaced anywhere, even inside other words.
+
+    Returns:
+        TextOptimizer: Natural optimizer
+    """
+    emphasis = []
+    for word in EMPHASIS_WORDS:
+        emphasis.append((word, word.upper()))
+        emphasis.append((word.capitalize(), word.upper()))
+
+    return TextOptimizer([
+        ReplacePrefix(INTRO_GREETINGS),
+        ReplaceLiterals([(char, "") for char in NATURAL_REMOVED_PUNCTUATION]
+                        + list(CRYPTO_TERMS.items()) + emphasis)
+    ], name="natural")
+
+
+def fast_optimizer() -> TextOptimizer:
+    """
+    Build the fast profile (gerar_audio_rapido.optimize_text_for_speed).
+
+    Hyphens and extra spaces are collapsed, some punctuation is kept to
+    preserve the intonation and the text is wrapped in a faster prosody.
+
+    Returns:
+        TextOptimizer: Fast optimizer
+    """
+    return TextOptimizer([
+        CollapseWhitespace("-"),
+        ReplaceLiterals(FAST_GREETINGS + FAST_PUNCTUATION + list(FAST_CRYPTO_TERMS.items())),
+        Wrap(*FAST_PROSODY)
+    ], name="fast", optimize_empty=True)
+
+
+# Available profiles
+PROFILES: Dict[str, Callable[[], TextOptimizer]] = {
+    "speech": speech_optimizer,
+    "natural": natural_optimizer,
+    "fast": fast_optimizer
+}
+
+_optimizers: Dict[str, TextOptimizer] = {}
+
+
+def get_optimizer(profile: str) -> TextOptimizer:
+    """
+    Get the compiled optimizer of a profile (compiled on first use).
+
+    Args:
+        profile: Profile name (see PROFILES)
+
+    Returns:
+        TextOptimizer: Optimizer of the profile
+
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    optimizer = _optimizers.get(profile)
+    if optimizer is None:
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown text optimization profile: {profile} "
+                             f"(available: {', '.join(PROFILES)})")
+        optimizer = _optimizers[profile] = PROFILES[profile]()
+        logger.debug(f"Text optimization profile compiled: {profile}")
+    return optimizer
+
+
+def optimize(text: str, profile: str = "speech") -> str:
+    """
+    Optimize a text with one of the profiles.
+
+    Args:
+        text: Original text
+        profile: Profile name (see PROFILES)
+
+    Returns:
+        str: Optimized text
+    """
+    return get_optimizer(profile).optimize(text)
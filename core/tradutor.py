@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Módulo de tradução compartilhado pelos buscadores de conteúdo.
+Mantém uma memória de tradução em SQLite indexada pelo hash do conteúdo,
+agrupa os textos que ainda não foram traduzidos em lotes e permite trocar o
+backend de tradução (googletrans ou um backend offline, usado nos testes).
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import List, Dict, Any, Optional, Sequence
+
+# Verificar se o googletrans está disponível
+try:
+    from googletrans import Translator
+    GOOGLETRANS_DISPONIVEL = True
+except ImportError:
+    GOOGLETRANS_DISPONIVEL = False
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('tradutor')
+
+# Tamanho máximo (em caracteres) de uma requisição de tradução em lote
+MAX_CARACTERES_LOTE = 4500
+
+class BackendGoogletrans:
+    """
+    Backend de tradução que usa o googletrans.
+
+    Os textos de um lote são enviados em uma única requisição, separados por
+    quebras de linha; se a resposta não tiver o mesmo número de linhas, os
+    textos do lote são traduzidos um a um.
+    """
+    def __init__(self, max_caracteres: int = MAX_CARACTERES_LOTE):
+        """
+        Inicializa o backend.
+
+        Args:
+            max_caracteres: Tamanho máximo em caracteres de cada requisição
+        """
+        if not GOOGLETRANS_DISPONIVEL:
+            raise ImportError("Biblioteca googletrans não encontrada")
+
+        self.translator = Translator()
+        self.max_caracteres = max_caracteres
+
+    def _lotes(self, textos: Sequence[str]) -> List[List[int]]:
+        """
+        Divide os textos em lotes que cabem em uma requisição.
+
+        Textos com quebras de linha ou maiores que o limite vão sozinhos.
+
+        Args:
+            textos: Textos a traduzir
+
+        Returns:
+            List[List[int]]: Índices dos textos de cada lote
+        """
+        lotes = []
+        atual = []
+        tamanho = 0
+
+        for i, texto in enumerate(textos):
+            if "\n" in texto or len(texto) >= self.max_caracteres:
+                lotes.append([i])
+                continue
+
+            if atual and tamanho + len(texto) + 1 > self.max_caracteres:
+                lotes.append(atual)
+                atual = []
+                tamanho = 0
+
+            atual.append(i)
+            tamanho += len(texto) + 1
+
+        if atual:
+            lotes.append(atual)
+
+        return lotes
+
+    def traduzir_lote(self, textos: Sequence[str], origem: str, destino: str) -> List[str]:
+        """
+        Traduz uma lista de textos.
+
+        Args:
+            textos: Textos a traduzir
+            origem: Idioma de origem
+            destino: Idioma de destino
+
+        Returns:
+            List[str]: Textos traduzidos, na mesma ordem
+        """
+        traducoes = [""] * len(textos)
+
+        for lote in self._lotes(textos):
+            if len(lote) == 1:
+                traducoes[lote[0]] = self.translator.translate(textos[lote[0]], src=origem, dest=destino).text
+                continue
+
+            juntos = "\n".join(textos[i] for i in lote)
+            linhas = self.translator.translate(juntos, src=origem, dest=destino).text.split("\n")
+
+            if len(linhas) == len(lote):
+                for i, linha in zip(lote, linhas):
+                    traducoes[i] = linha.strip()
+            else:
+                logger.warning("Tradução em lote desalinhada, traduzindo os textos individualmente")
+                for i in lote:
+                    traducoes[i] = self.translator.translate(textos[i], src=origem, dest=destino).text
+
+        return traducoes
+
+class BackendDicionario:
+    """
+    Backend de tradução offline baseado em um dicionário de traduções.
+
+    Textos que não estão no dicionário são devolvidos sem alteração. Útil para
+    testes e para rodar o pipeline sem acesso à rede.
+    """
+    def __init__(self, traducoes: Optional[Dict[str, str]] = None):
+        """
+        Inicializa o backend.
+
+        Args:
+            traducoes: Mapeamento de texto original para texto traduzido
+        """
+        self.traducoes = traducoes or {}
+
+    def traduzir_lote(self, textos: Sequence[str], origem: str, destino: str) -> List[str]:
+        """
+        Traduz uma lista de textos.
+
+        Args:
+            textos: Textos a traduzir
+            origem: Idioma de origem
+            destino: Idioma de destino
+
+        Returns:
+            List[str]: Textos traduzidos, na mesma ordem
+        """
+        return [self.traducoes.get(texto, texto) for texto in textos]
+
+class MemoriaTraducao:
+    """
+    Classe para armazenar traduções em SQLite, indexadas pelo hash do conteúdo.
+    """
+    def __init__(self, arquivo: str = os.path.join("cache", "traducoes.db")):
+        """
+        Inicializa a memória de tradução.
+
+        Args:
+            arquivo: Caminho do banco SQLite
+        """
+        self.arquivo = arquivo
+
+        diretorio = os.path.dirname(arquivo)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS traducoes ("
+            " chave TEXT PRIMARY KEY,"
+            " origem TEXT NOT NULL,"
+            " destino TEXT NOT NULL,"
+            " texto_traduzido TEXT NOT NULL,"
+            " criado_em REAL NOT NULL)"
+        )
+        self._conexao.commit()
+
+    @staticmethod
+    def chave(texto: str, origem: str, destino: str) -> str:
+        """
+        Calcula a chave de um texto na memória de tradução.
+
+        Args:
+            texto: Texto original
+            origem: Idioma de origem
+            destino: Idioma de destino
+
+        Returns:
+            str: Hash SHA-256 dos idiomas e do conteúdo
+        """
+        return hashlib.sha256(f"{origem}\n{destino}\n{texto}".encode("utf-8")).hexdigest()
+
+    def buscar(self, chaves: Sequence[str]) -> Dict[str, str]:
+        """
+        Busca várias traduções de uma vez.
+
+        Args:
+            chaves: Chaves dos textos
+
+        Returns:
+            Dict[str, str]: Traduções encontradas, por chave
+        """
+        encontradas = {}
+        chaves = list(chaves)
+
+        with self._lock:
+            # O SQLite limita o número de parâmetros de uma consulta
+            for inicio in range(0, len(chaves), 500):
+                parte = chaves[inicio:inicio + 500]
+                marcadores = ",".join("?" * len(parte))
+                cursor = self._conexao.execute(
+                    f"SELECT chave, texto_traduzido FROM traducoes WHERE chave IN ({marcadores})", parte
+                )
+                encontradas.update(cursor.fetchall())
+
+        return encontradas
+
+    def salvar(self, traducoes: Dict[str, str], origem: str, destino: str) -> None:
+        """
+        Salva várias traduções de uma vez.
+
+        Args:
+            traducoes: Traduções por chave
+            origem: Idioma de origem
+            destino: Idioma de destino
+        """
+        agora = time.time()
+        with self._lock:
+            self._conexao.executemany(
+                "INSERT OR REPLACE INTO traducoes (chave, origem, destino, texto_traduzido, criado_em)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(chave, origem, destino, texto, agora) for chave, texto in traducoes.items()]
+            )
+            self._conexao.commit()
+
+    def fechar(self) -> None:
+        """
+        Fecha a conexão com o banco.
+        """
+        with self._lock:
+            self._conexao.close()
+
+class Tradutor:
+    """
+    Classe para traduzir textos em lote com memória de tradução persistente.
+    """
+    def __init__(self, backend: Any = None,
+                 arquivo_memoria: str = os.path.join("cache", "traducoes.db")):
+        """
+        Inicializa o tradutor.
+
+        Args:
+            backend: Objeto com o método traduzir_lote(textos, origem, destino).
+                Se None, usa o googletrans quando estiver disponível.
+            arquivo_memoria: Caminho do banco SQLite da memória de tradução
+        """
+        if backend is None and GOOGLETRANS_DISPONIVEL:
+            try:
+                backend = BackendGoogletrans()
+            except Exception as e:
+                logger.warning(f"Erro ao inicializar tradutor: {e}")
+
+        if backend is None:
+            logger.warning("Nenhum backend de tradução disponível. Apenas traduções já memorizadas serão usadas.")
+
+        self.backend = backend
+        self.memoria = MemoriaTraducao(arquivo_memoria)
+
+        # Número de textos enviados ao backend (útil para medir o reaproveitamento da memória)
+        self.chamadas_backend = 0
+
+    @property
+    def disponivel(self) -> bool:
+        """
+        Indica se há um backend para traduzir textos novos.
+        """
+        return self.backend is not None
+
+    def traduzir_lote(self, textos: Sequence[str], origem: str = "en", destino: str = "pt") -> List[str]:
+        """
+        Traduz uma lista de textos, consultando antes a memória de tradução.
+
+        Apenas os textos distintos que ainda não estão na memória são enviados
+        ao backend, em uma única chamada.
+
+        Args:
+            textos: Textos a traduzir
+            origem: Idioma de origem
+            destino: Idioma de destino
+
+        Returns:
+            List[str]: Textos traduzidos, na mesma ordem
+
+        Raises:
+            RuntimeError: Se houver textos novos e nenhum backend disponível
+        """
+        if origem == destino:
+            return list(textos)
+
+        chaves = [MemoriaTraducao.chave(texto, origem, destino) if texto else None for texto in textos]
+        conhecidas = self.memoria.buscar({chave for chave in chaves if chave})
+
+        # Textos distintos que ainda precisam ser traduzidos
+        pendentes = {}
+        for texto, chave in zip(textos, chaves):
+            if chave and chave not in conhecidas and chave not in pendentes:
+                pendentes[chave] = texto
+
+        if pendentes:
+            if not self.backend:
+                raise RuntimeError("Nenhum backend de tradução disponível")
+
+            originais = list(pendentes.values())
+            traduzidos = self.backend.traduzir_lote(originais, origem, destino)
+            self.chamadas_backend += len(originais)
+
+            novas = dict(zip(pendentes.keys(), traduzidos))
+            self.memoria.salvar(novas, origem, destino)
+            conhecidas.update(novas)
+
+            logger.info(f"{len(novas)} textos traduzidos, {len(textos) - len(novas)} reaproveitados da memória")
+
+        return [conhecidas[chave] if chave else texto for texto, chave in zip(textos, chaves)]
+
+    def traduzir(self, texto: str, origem: str = "en", destino: str = "pt") -> str:
+        """
+        Traduz um texto.
+
+        Args:
+            texto: Texto a traduzir
+            origem: Idioma de origem
+            destino: Idioma de destino
+
+        Returns:
+            str: Texto traduzido
+        """
+        return self.traduzir_lote([texto], origem, destino)[0]
+
+    def traduzir_itens(self, itens: List[Dict[str, Any]], campos: Sequence[str],
+                       destino: str = "pt") -> List[Dict[str, Any]]:
+        """
+        Traduz os campos de texto de uma lista de itens (notícias, posts, vídeos).
+
+        Os itens que já estão no idioma de destino são devolvidos sem alteração.
+        Os traduzidos são copiados, com o texto original guardado em
+        "<campo>_original" e as chaves "traduzido" e "idioma_original". Os itens
+        da entrada nunca são modificados, nem quando a tradução falha.
+
+        Args:
+            itens: Itens a traduzir (cada um com a chave "idioma")
+            campos: Campos de texto a traduzir; o primeiro é o título, usado no log
+            destino: Idioma de destino
+
+        Returns:
+            List[Dict[str, Any]]: Itens traduzidos, na mesma ordem
+        """
+        resultado = list(itens)
+
+        # Agrupar os itens por idioma de origem para traduzir cada idioma em um lote
+        por_idioma = {}
+        for i, item in enumerate(itens):
+            origem = item.get("idioma", "en")
+            if origem != destino:
+                por_idioma.setdefault(origem, []).append(i)
+
+        for origem, indices in por_idioma.items():
+            textos = [itens[i].get(campo) or "" for i in indices for campo in campos]
+
+            try:
+                traduzidos = self.traduzir_lote(textos, origem, destino)
+            except Exception as e:
+                logger.error(f"Erro ao traduzir textos de '{origem}': {e}")
+                # Em caso de erro, devolver cópias marcadas como não traduzidas (a entrada não muda)
+                for i in indices:
+                    resultado[i] = dict(itens[i], traduzido=False)
+                continue
+
+            for n, i in enumerate(indices):
+                item = itens[i]
+                item_traduzido = item.copy()
+
+                for m, campo in enumerate(campos):
+                    traduzido = traduzidos[n * len(campos) + m]
+                    if traduzido:
+                        item_traduzido[f"{campo}_original"] = item[campo]
+                        item_traduzido[campo] = traduzido
+
+                item_traduzido["traduzido"] = True
+                item_traduzido["idioma_original"] = origem
+                item_traduzido["idioma"] = destino
+
+                logger.info(f"Traduzido: {item[campos[0]]} -> {item_traduzido[campos[0]]}")
+                resultado[i] = item_traduzido
+
+        return resultado
@@ -4,11 +4,14 @@ Utility functions for the CloneIA project.
 """
 import os
 import json
+import hashlib
 import platform
 import subprocess
 import logging
 from typing import Dict, Optional, Any, List, Union
 
+from core.text_optimizer import get_optimizer
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -221,51 +224,8 @@ def optimize_text(text: str) -> str:
     if not text:
         return text
 
-    # Replace introduction for maximum energy
-    if text.lower().startswith("e aí cambada"):
-        text = "EAÍCAMBADA" + text[len("e aí cambada"):]
-    elif text.lower().startswith("fala cambada"):
-        text = "FALACAMBADA" + text[len("fala cambada"):]
-
-    # Remove excessive punctuation that causes pauses
-    for char in [',', '.', '!', '?', '...', ';', ':']:
-        text = text.replace(char, '')
-
-    # Replace terms for better pronunciation
-    replacements = {
-        "Bitcoin": "Bitcoim",
-        "Ethereum": "Etherium",
-        "Cardano": "Cardâno",
-        "Solana": "Solâna",
-        "Polkadot": "Polcadot",
-        "Binance": "Bináns",
-        "Coinbase": "Cóinbeis",
-        "NFT": "ÊnÊfeTê",
-        "DeFi": "DêFai",
-        "staking": "stêiking",
-        "blockchain": "blókcheim",
-        "wallet": "wólet",
-        "token": "tôken",
-        "altcoin": "ôltcoin",
-        "mining": "máining",
-        "miner": "máiner"
-    }
-
-    for original, replacement in replacements.items():
-        text = text.replace(original, replacement)
-
-    # Use uppercase for emphasis on keywords
-    emphasis_words = [
-        "bombando", "muito", "super", "mega", "alta", "subindo",
-        "disparou", "explodiu", "recorde", "máxima", "forte",
-        "incrível", "enorme", "gigante", "absurdo", "impressionante",
-        "surpreendente", "extraordinário", "fenomenal", "espetacular"
-    ]
-
-    for word in emphasis_words:
-        if word in text.lower():
-            text = text.replace(word, word.upper())
-            text = text.replace(word.capitalize(), word.upper())
+    # Compiled rules of the "natural" profile (see core.text_optimizer)
+    text = get_optimizer("natural").optimize(text)
 
     logger.debug(f"Optimized text: {text[:50]}...")
     return text
@@ -318,6 +278,77 @@ def ensure_directory(path: str) -> bool:
         logger.error(f"Error creating directory {path}: {e}")
         return False
 
+def content_key(kind: str, **params: Any) -> str:
+    """
+    Compute a cache key from everything that determines a cached artifact.
+
+    Args:
+        kind: Kind of artifact (e.g. "title", "text" or "segment")
+        **params: Everything that determines the artifact (text, size, colors, codec...)
+
+    Returns:
+        str: SHA-256 hex digest identifying the artifact
+    """
+    payload = json.dumps({"kind": kind, **params}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def mark_used(path: str) -> bool:
+    """
+    Record the use of a cached file for evict_lru.
+
+    The modification time of a cached file records its last use.
+
+    Args:
+        path: Path to the cached file
+
+    Returns:
+        bool: True if the file exists, False otherwise
+    """
+    try:
+        os.utime(path, None)
+    except FileNotFoundError:
+        return False
+    return True
+
+def evict_lru(directory: str, suffix: str, max_bytes: int, label: str = "cache") -> int:
+    """
+    Remove the least recently used files of a cache until it fits its size limit.
+
+    Only the files whose name ends with suffix count towards the limit; the
+    last use of each file is its modification time (see mark_used).
+
+    Args:
+        directory: Cache directory
+        suffix: Suffix of the cached files (e.g. ".png")
+        max_bytes: Maximum total size of the cached files in bytes
+        label: Name of the cache used in the log messages
+
+    Returns:
+        int: Number of files removed
+    """
+    entries = []
+    total = 0
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith(suffix):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            removed += 1
+        except OSError as e:
+            logger.warning(f"Could not evict {path} from the {label}: {e}")
+
+    if removed:
+        logger.info(f"Evicted {removed} files from the {label}")
+    return removed
+
 def get_timestamp_filename(prefix: str, extension: str) -> str:
     """
     Generate a filename with a timestamp.
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Módulo para verificação incremental de notícias.
+Mantém os grupos de notícias similares entre execuções, de modo que cada nova
+verificação só compara as notícias novas com as já conhecidas.
+"""
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from collections import defaultdict, Counter
+from itertools import chain
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Set
+
+from core.verificador_noticias import VerificadorNoticias
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('verificador_incremental')
+
+class VerificadorIncremental(VerificadorNoticias):
+    """
+    Verificador de notícias que reaproveita os grupos das execuções anteriores.
+
+    Notícias novas entram no grupo da notícia conhecida mais similar (acima do
+    limiar) ou formam um grupo novo. Os metadados de consistência de cada grupo
+    são atualizados a cada entrada ou saída de notícia, sem recalcular o grupo
+    inteiro. Notícias mais antigas que dias_max são removidas.
+    """
+    def __init__(self, arquivo_estado: str = os.path.join("cache", "verificador_estado.json"),
+                 dias_max: int = 7,
+                 limiar_similaridade: float = 0.7,
+                 min_confirmacoes: int = 2,
+                 bonus_confirmacao: int = 1):
+        """
+        Inicializa o verificador incremental.
+
+        Args:
+            arquivo_estado: Arquivo JSON onde os grupos são mantidos entre execuções
+            dias_max: Número máximo de dias que uma notícia permanece nos grupos
+            limiar_similaridade: Limiar de similaridade para considerar duas notícias como relacionadas (0.0 a 1.0)
+            min_confirmacoes: Número mínimo de fontes para considerar uma notícia como confirmada
+            bonus_confirmacao: Bônus de credibilidade para cada confirmação adicional
+        """
+        super().__init__(limiar_similaridade=limiar_similaridade,
+                         min_confirmacoes=min_confirmacoes,
+                         bonus_confirmacao=bonus_confirmacao)
+        self.arquivo_estado = arquivo_estado
+        self.dias_max = dias_max
+
+        # Estado persistente
+        self.noticias: Dict[str, Dict[str, Any]] = {}
+        self.grupos: Dict[int, Dict[str, Any]] = {}
+        self.proximo_grupo = 1
+        self.proxima_ordem = 1
+
+        # Índices em memória (reconstruídos a partir do estado)
+        self._indice_palavras: Dict[str, Set[str]] = defaultdict(set)
+        self._indice_titulos: Dict[str, Set[str]] = defaultdict(set)
+        self._dados: Dict[str, Dict[str, Any]] = {}
+
+        self._carregar_estado()
+
+    def _carregar_estado(self) -> None:
+        """
+        Carrega os grupos salvos e reconstrói os índices em memória.
+        """
+        if not os.path.exists(self.arquivo_estado):
+            return
+
+        try:
+            with open(self.arquivo_estado, 'r', encoding='utf-8') as f:
+                estado = json.load(f)
+        except Exception as e:
+            logger.error(f"Erro ao carregar estado do verificador incremental: {e}")
+            return
+
+        self.noticias = estado.get("noticias", {})
+        self.grupos = {int(grupo_id): grupo for grupo_id, grupo in estado.get("grupos", {}).items()}
+        self.proximo_grupo = estado.get("proximo_grupo", max(self.grupos, default=0) + 1)
+        self.proxima_ordem = estado.get("proxima_ordem", len(self.noticias) + 1)
+
+        for chave, registro in self.noticias.items():
+            self._indexar(chave, registro)
+
+        logger.info(f"Estado carregado: {len(self.noticias)} notícias em {len(self.grupos)} grupos")
+
+    def _salvar_estado(self) -> None:
+        """
+        Salva os grupos em disco (escrita atômica).
+        """
+        estado = {
+            "noticias": self.noticias,
+            "grupos": {str(grupo_id): grupo for grupo_id, grupo in self.grupos.items()},
+            "proximo_grupo": self.proximo_grupo,
+            "proxima_ordem": self.proxima_ordem
+        }
+
+        diretorio = os.path.dirname(self.arquivo_estado) or "."
+        try:
+            os.makedirs(diretorio, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(estado, f, ensure_ascii=False)
+            os.replace(temp_path, self.arquivo_estado)
+        except Exception as e:
+            logger.error(f"Erro ao salvar estado do verificador incremental: {e}")
+
+    @staticmethod
+    def _chave_noticia(noticia: Dict[str, Any]) -> str:
+        """
+        Retorna o identificador de uma notícia (o link ou, sem link, um hash do título e do portal).
+
+        Args:
+            noticia: Dados da notícia
+
+        Returns:
+            str: Identificador da notícia
+        """
+        if noticia.get('link'):
+            return noticia['link']
+        texto = f"{noticia.get('portal', '')}\n{noticia['titulo']}"
+        return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+    def _indexar(self, chave: str, registro: Dict[str, Any]) -> None:
+        """
+        Adiciona uma notícia aos índices em memória.
+
+        Args:
+            chave: Identificador da notícia
+            registro: Registro da notícia no estado
+        """
+        palavras = set(registro['palavras'])
+        for palavra in palavras:
+            self._indice_palavras[palavra].add(chave)
+        self._indice_titulos[registro['titulo']].add(chave)
+        self._dados[chave] = self._dados_comparacao(registro['titulo'], registro['resumo'], palavras)
+
+    def _desindexar(self, chave: str, registro: Dict[str, Any]) -> None:
+        """
+        Remove uma notícia dos índices em memória.
+
+        Args:
+            chave: Identificador da notícia
+            registro: Registro da notícia no estado
+        """
+        for palavra in registro['palavras']:
+            self._indice_palavras[palavra].discard(chave)
+            if not self._indice_palavras[palavra]:
+                del self._indice_palavras[palavra]
+        self._indice_titulos[registro['titulo']].discard(chave)
+        if not self._indice_titulos[registro['titulo']]:
+            del self._indice_titulos[registro['titulo']]
+        self._dados.pop(chave, None)
+
+    def _data_referencia(self, noticia: Dict[str, Any], visto_em: str) -> str:
+        """
+        Retorna a data usada para decidir quando a notícia sai dos grupos.
+
+        Args:
+            noticia: Dados da notícia
+            visto_em: Data em que a notícia foi vista pela primeira vez (ISO)
+
+        Returns:
+            str: Data de publicação (ISO, em UTC) ou, se ausente ou inválida, a data em que foi vista
+        """
+        # Datas com fuso são convertidas para UTC (e as sem fuso, tratadas como locais),
+        # para que notícias de fusos diferentes sejam comparadas corretamente
+        if noticia.get('data_iso'):
+            try:
+                data = datetime.fromisoformat(noticia['data_iso'])
+                return data.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+            except (ValueError, TypeError, OverflowError, OSError):
+                pass
+        return datetime.fromisoformat(visto_em).astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+    def _remover_antigas(self) -> int:
+        """
+        Remove dos grupos as notícias mais antigas que dias_max.
+
+        Returns:
+            int: Número de notícias removidas
+        """
+        limite = (datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=self.dias_max)).isoformat()
+        antigas = [chave for chave, registro in self.noticias.items() if registro['referencia'] < limite]
+
+        for chave in antigas:
+            registro = self.noticias.pop(chave)
+            self._desindexar(chave, registro)
+            self._remover_do_grupo(registro['grupo'], chave, registro['noticia'])
+
+        if antigas:
+            logger.info(f"{len(antigas)} notícias com mais de {self.dias_max} dias removidas dos grupos")
+
+        return len(antigas)
+
+    def _candidatos(self, dados: Dict[str, Any]) -> Set[str]:
+        """
+        Retorna as notícias conhecidas que podem atingir o limiar com uma notícia nova.
+
+        Args:
+            dados: Dados de comparação da notícia nova
+
+        Returns:
+            Set[str]: Identificadores das notícias candidatas
+        """
+        # Abaixo deste limiar, pares sem palavras-chave em comum também podem ser agrupados
+        if self.limiar_similaridade < self.SIMILARIDADE_MAXIMA_SEM_PALAVRAS:
+            return set(self.noticias)
+
+        em_comum = Counter(chain.from_iterable(
+            self._indice_palavras.get(palavra, ()) for palavra in dados['palavras']
+        ))
+
+        # Mesmo teto do agrupamento indexado: nenhum par descartado atingiria o limiar
+        tamanho = len(dados['palavras'])
+        candidatos = {chave for chave, quantidade in em_comum.items()
+                      if self._pode_atingir_limiar(quantidade, tamanho, len(self._dados[chave]['palavras']),
+                                                   bool(dados['resumo'] and self._dados[chave]['resumo']))}
+        candidatos.update(self._indice_titulos.get(dados['titulo'], ()))
+
+        return candidatos
+
+    def _adicionar_ao_grupo(self, grupo_id: int, chave: str, noticia: Dict[str, Any]) -> None:
+        """
+        Adiciona uma notícia a um grupo, atualizando os metadados de consistência.
+
+        Args:
+            grupo_id: Identificador do grupo
+            chave: Identificador da notícia
+            noticia: Dados da notícia
+        """
+        grupo = self.grupos[grupo_id]
+        metadados = grupo['metadados']
+
+        # Contradições: apenas os pares novos (membros atuais x notícia nova)
+        if noticia.get('resumo'):
+            for chave_membro in grupo['membros']:
+                membro = self.noticias[chave_membro]['noticia']
+                if not membro.get('resumo'):
+                    continue
+                similaridade = self._calcular_similaridade(membro['resumo'], noticia['resumo'])
+                if similaridade < self.LIMIAR_CONTRADICAO:
+                    contradicao = self._descrever_contradicao(membro, noticia, similaridade)
+                    contradicao['noticias'] = [chave_membro, chave]
+                    metadados['contradições'].append(contradicao)
+
+        quantidade = len(grupo['membros'])
+        grupo['membros'].append(chave)
+
+        metadados['num_fontes'] = quantidade + 1
+        metadados['fontes'].append(noticia['portal'])
+        metadados['fontes_unicas'] = len(set(metadados['fontes']))
+        metadados['confirmado'] = metadados['num_fontes'] >= self.min_confirmacoes
+        metadados['credibilidade_media'] = (
+            metadados['credibilidade_media'] * quantidade + noticia.get('credibilidade', 5)
+        ) / (quantidade + 1)
+
+        data = self._data_publicacao(noticia)
+        if data and (not metadados['data_mais_recente'] or data > metadados['data_mais_recente']):
+            metadados['data_mais_recente'] = data
+
+    def _remover_do_grupo(self, grupo_id: int, chave: str, noticia: Dict[str, Any]) -> None:
+        """
+        Remove uma notícia de um grupo, atualizando os metadados de consistência.
+
+        Args:
+            grupo_id: Identificador do grupo
+            chave: Identificador da notícia
+            noticia: Dados da notícia
+        """
+        grupo = self.grupos.get(grupo_id)
+        if grupo is None or chave not in grupo['membros']:
+            return
+
+        posicao = grupo['membros'].index(chave)
+        del grupo['membros'][posicao]
+
+        if not grupo['membros']:
+            del self.grupos[grupo_id]
+            return
+
+        metadados = grupo['metadados']
+        del metadados['fontes'][posicao]
+        metadados['contradições'] = [c for c in metadados['contradições'] if chave not in c.get('noticias', [])]
+        metadados['num_fontes'] = len(grupo['membros'])
+        metadados['fontes_unicas'] = len(set(metadados['fontes']))
+        metadados['confirmado'] = metadados['num_fontes'] >= self.min_confirmacoes
+
+        membros = [self.noticias[c]['noticia'] for c in grupo['membros']]
+        metadados['credibilidade_media'] = sum(m.get('credibilidade', 5) for m in membros) / len(membros)
+        datas = [d for d in (self._data_publicacao(m) for m in membros) if d]
+        metadados['data_mais_recente'] = max(datas) if datas else None
+
+    @staticmethod
+    def _data_publicacao(noticia: Dict[str, Any]) -> Optional[str]:
+        """
+        Retorna a data de publicação de uma notícia, se válida.
+
+        Args:
+            noticia: Dados da notícia
+
+        Returns:
+            Optional[str]: Data de publicação (ISO) ou None
+        """
+        if noticia.get('data_iso'):
+            try:
+                return datetime.fromisoformat(noticia['data_iso']).isoformat()
+            except (ValueError, TypeError):
+                pass
+        return None
+
+    def _registrar_noticia(self, noticia: Dict[str, Any]) -> str:
+        """
+        Registra uma notícia nova no grupo mais adequado.
+
+        Args:
+            noticia: Dados da notícia
+
+        Returns:
+            str: Identificador da notícia
+        """
+        chave = self._chave_noticia(noticia)
+
+        resumo = noticia.get('resumo', '')
+        titulo_norm = self._normalizar_texto(noticia['titulo'])
+        resumo_norm = self._normalizar_texto(resumo) if resumo else ''
+        palavras = self._extrair_palavras_chave(f"{noticia['titulo']} {resumo}")
+        dados = self._dados_comparacao(titulo_norm, resumo_norm, palavras)
+
+        # Encontrar a notícia conhecida mais similar (empates: a mais antiga no estado)
+        melhor_chave = None
+        melhor_similaridade = -1.0
+        for candidata in sorted(self._candidatos(dados), key=lambda c: self.noticias[c]['ordem']):
+            pontuacao = self._pontuar_par(self._dados[candidata], dados)
+            if pontuacao and pontuacao['similaridade'] > melhor_similaridade:
+                melhor_chave = candidata
+                melhor_similaridade = pontuacao['similaridade']
+
+        if melhor_chave is not None:
+            grupo_id = self.noticias[melhor_chave]['grupo']
+        else:
+            grupo_id = self.proximo_grupo
+            self.proximo_grupo += 1
+            self.grupos[grupo_id] = {
+                'membros': [],
+                'metadados': {
+                    'num_fontes': 0,
+                    'fontes': [],
+                    'confirmado': False,
+                    'contradições': [],
+                    'credibilidade_media': 0,
+                    'data_mais_recente': None,
+                    'fontes_unicas': 0
+                }
+            }
+
+        self._adicionar_ao_grupo(grupo_id, chave, noticia)
+
+        visto_em = datetime.now().isoformat()
+        registro = {
+            'noticia': noticia,
+            'titulo': titulo_norm,
+            'resumo': resumo_norm,
+            'palavras': sorted(palavras),
+            'grupo': grupo_id,
+            'visto_em': visto_em,
+            'referencia': self._data_referencia(noticia, visto_em),
+            'ordem': self.proxima_ordem
+        }
+        self.proxima_ordem += 1
+        self.noticias[chave] = registro
+        self._indexar(chave, registro)
+
+        return chave
+
+    def verificar_noticias(self, noticias: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Verifica a credibilidade de notícias reaproveitando os grupos das execuções anteriores.
+        Apenas as notícias ainda não conhecidas são comparadas e agrupadas.
+
+        Args:
+            noticias: Lista de notícias a serem verificadas
+
+        Returns:
+            List[Dict[str, Any]]: Lista de notícias com informações de credibilidade atualizadas
+        """
+        self._remover_antigas()
+
+        if not noticias:
+            self._salvar_estado()
+            return []
+
+        novas = 0
+        chaves = []
+        for noticia in noticias:
+            chave = self._chave_noticia(noticia)
+            if chave not in self.noticias:
+                chave = self._registrar_noticia(noticia)
+                novas += 1
+            chaves.append(chave)
+
+        logger.info(f"Verificando {len(noticias)} notícias ({novas} novas) em {len(self.grupos)} grupos conhecidos")
+
+        noticias_verificadas = [
+            self._aplicar_cruzamento(noticia, self.grupos[self.noticias[chave]['grupo']]['metadados'])
+            for noticia, chave in zip(noticias, chaves)
+        ]
+
+        # Ordenar por credibilidade (mais confiáveis primeiro) e depois por data (mais recentes primeiro)
+        noticias_verificadas.sort(
+            key=lambda x: (x.get('credibilidade', 0), x.get('data_iso', '')),
+            reverse=True
+        )
+
+        self._salvar_estado()
+
+        logger.info(f"Verificação concluída: {len(noticias_verificadas)} notícias processadas")
+
+        return noticias_verificadas
@@ -6,10 +6,22 @@ Implementa algoritmos para agrupar notícias similares e verificar sua credibili
 import re
 import logging
 from functools import lru_cache
+from bisect import bisect_right
+from collections import defaultdict, Counter
+from itertools import chain
 import difflib
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator
 from datetime import datetime
 
+# Backend vetorizado de similaridade (opcional)
+try:
+    import numpy as np
+    from scipy import sparse
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    SKLEARN_DISPONIVEL = True
+except ImportError:
+    SKLEARN_DISPONIVEL = False
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +35,9 @@ class VerificadorNoticias:
     """
     def __init__(self, limiar_similaridade: float = 0.7,
                  min_confirmacoes: int = 2,
-                 bonus_confirmacao: int = 1):
+                 bonus_confirmacao: int = 1,
+                 usar_indice: bool = True,
+                 backend_similaridade: str = "difflib"):
         """
         Inicializa o verificador de notícias.
 
@@ -31,10 +45,36 @@ class VerificadorNoticias:
             limiar_similaridade: Limiar de similaridade para considerar duas notícias como relacionadas (0.0 a 1.0)
             min_confirmacoes: Número mínimo de fontes para considerar uma notícia como confirmada
             bonus_confirmacao: Bônus de credibilidade para cada confirmação adicional
+            usar_indice: Se True, compara apenas pares candidatos de um índice invertido de palavras-chave
+                (se False, ou com limiar abaixo de 0.7, compara todos os pares, como o algoritmo original)
+            backend_similaridade: "difflib" (implementação de referência) ou "tfidf" (similaridade de
+                cosseno entre vetores TF-IDF, calculada em lote com matrizes esparsas)
         """
+        if backend_similaridade not in self.BACKENDS_SIMILARIDADE:
+            raise ValueError(f"Backend de similaridade inválido: {backend_similaridade} "
+                             f"(opções: {', '.join(self.BACKENDS_SIMILARIDADE)})")
+
+        if backend_similaridade == "tfidf" and not SKLEARN_DISPONIVEL:
+            logger.warning("scikit-learn não encontrado. Usando o backend de similaridade difflib.")
+            backend_similaridade = "difflib"
+
         self.limiar_similaridade = limiar_similaridade
         self.min_confirmacoes = min_confirmacoes
         self.bonus_confirmacao = bonus_confirmacao
+        self.usar_indice = usar_indice
+        self.backend_similaridade = backend_similaridade
+
+    # Backends de similaridade disponíveis
+    BACKENDS_SIMILARIDADE = ("difflib", "tfidf")
+
+    # Número de linhas por bloco no produto de matrizes do backend TF-IDF
+    TAMANHO_BLOCO_TFIDF = 1000
+
+    # Similaridade máxima de um par sem palavras-chave em comum (título 0.4 + resumo 0.3)
+    SIMILARIDADE_MAXIMA_SEM_PALAVRAS = 0.7
+
+    # Abaixo desta similaridade, resumos do mesmo grupo são considerados contraditórios
+    LIMIAR_CONTRADICAO = 0.3
 
     # Lista de stop words (palavras comuns que não agregam significado)
     STOP_WORDS = {
@@ -137,25 +177,17 @@ class VerificadorNoticias:
         # Calcular similaridade usando difflib
         return difflib.SequenceMatcher(None, texto1_norm, texto2_norm).ratio()
 
-    def _agrupar_noticias_similares(self, noticias: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    def _preprocessar_noticias(self, noticias: List[Dict[str, Any]]) -> Tuple[List[str], List[str], List[Set[str]]]:
         """
-        Agrupa notícias similares com base no título, conteúdo e palavras-chave.
-        Utiliza algoritmo otimizado para identificar grupos de notícias relacionadas.
+        Normaliza títulos e resumos e extrai as palavras-chave de cada notícia.
 
         Args:
-            noticias: Lista de notícias a serem agrupadas
+            noticias: Lista de notícias
 
         Returns:
-            List[List[Dict[str, Any]]]: Lista de grupos de notícias similares
+            Tuple[List[str], List[str], List[Set[str]]]: Títulos normalizados, resumos normalizados
+                e conjuntos de palavras-chave, na ordem das notícias
         """
-        if not noticias:
-            return []
-
-        # Estruturas para armazenar resultados
-        grupos = []
-        noticias_processadas = set()
-
-        # Pré-processar todos os títulos e resumos para comparação mais eficiente
         titulos_normalizados = []
         resumos_normalizados = []
         palavras_chave = []
@@ -176,8 +208,27 @@ class VerificadorNoticias:
             palavras = self._extrair_palavras_chave(texto_completo)
             palavras_chave.append(palavras)
 
-        # Matriz de similaridade para evitar recálculos
-        similaridades = {}
+        return titulos_normalizados, resumos_normalizados, palavras_chave
+
+    def _similaridades_exaustivas(self, noticias: List[Dict[str, Any]], titulos_normalizados: List[str],
+                                  resumos_normalizados: List[str], palavras_chave: List[Set[str]],
+                                  similaridades_resumo: Dict[Tuple[int, int], float]) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Compara todas as notícias entre si (algoritmo de referência, O(n²)).
+
+        Args:
+            noticias: Lista de notícias
+            titulos_normalizados: Títulos normalizados
+            resumos_normalizados: Resumos normalizados
+            palavras_chave: Conjuntos de palavras-chave
+            similaridades_resumo: Armazém onde são guardadas as similaridades de resumo
+                dos pares acima do limiar, para reaproveitar na análise de consistência
+
+        Returns:
+            Dict[int, List[Tuple[int, float]]]: Para cada notícia, as notícias com similaridade
+                acima do limiar e o valor da similaridade
+        """
+        similares = defaultdict(list)
 
         # Calcular similaridades entre todas as notícias
         for i in range(len(noticias)):
@@ -206,71 +257,468 @@ class VerificadorNoticias:
                 # Calcular similaridade combinada (média ponderada)
                 similaridade = (similaridade_titulo * 0.4) + (similaridade_resumo * 0.3) + (similaridade_palavras * 0.3)
 
-                # Armazenar na matriz de similaridade
-                similaridades[(i, j)] = similaridade
-                similaridades[(j, i)] = similaridade  # Simetria
+                # Guardar apenas os pares relevantes para o agrupamento
+                if similaridade >= self.limiar_similaridade:
+                    similares[i].append((j, similaridade))
+                    similares[j].append((i, similaridade))
+                    if resumos_normalizados[i] and resumos_normalizados[j]:
+                        similaridades_resumo[(i, j)] = similaridade_resumo
+
+                    # Log para depuração de alta similaridade
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Alta similaridade ({similaridade:.2f}) entre:")
+                        logger.debug(f"  - {noticias[i]['titulo']} ({noticias[i]['portal']})")
+                        logger.debug(f"  - {noticias[j]['titulo']} ({noticias[j]['portal']})")
+                        logger.debug(f"  - Similaridade título: {similaridade_titulo:.2f}")
+                        logger.debug(f"  - Similaridade resumo: {similaridade_resumo:.2f}")
+                        logger.debug(f"  - Similaridade palavras: {similaridade_palavras:.2f}")
+                        logger.debug(f"  - Palavras em comum: {palavras_i.intersection(palavras_j)}")
+
+        return similares
+
+    def _pares_candidatos(self, titulos_normalizados: List[str], resumos_normalizados: List[str],
+                          palavras_chave: List[Set[str]]) -> Iterator[Tuple[int, int]]:
+        """
+        Gera os pares de notícias que podem atingir o limiar de similaridade.
+
+        Usa um índice invertido das palavras-chave, que dá o número de palavras em
+        comum de cada par e, com ele, o coeficiente de Jaccard exato. Título e resumo
+        contribuem no máximo 0.4 e 0.3 (o resumo só se os dois existirem), então um
+        par só é candidato se esse teto atingir o limiar (ver _pode_atingir_limiar).
+        Sem palavras-chave em comum, o teto só é atingido com títulos idênticos, que
+        são buscados à parte. Nenhum par descartado atingiria o limiar, então os
+        grupos são os mesmos do algoritmo exaustivo.
+
+        Args:
+            titulos_normalizados: Títulos normalizados
+            resumos_normalizados: Resumos normalizados
+            palavras_chave: Conjuntos de palavras-chave
+
+        Returns:
+            Iterator[Tuple[int, int]]: Pares (i, j) com i < j, cada um gerado uma única vez
+        """
+        total = len(palavras_chave)
+
+        # Índice invertido: palavra-chave -> notícias que a contêm (em ordem crescente)
+        indice = defaultdict(list)
+        for i, palavras in enumerate(palavras_chave):
+            for palavra in palavras:
+                indice[palavra].append(i)
+
+        # Notícias com o mesmo título normalizado
+        por_titulo = defaultdict(list)
+        for i, titulo in enumerate(titulos_normalizados):
+            por_titulo[titulo].append(i)
+
+        for i in range(total):
+            # Contar as palavras-chave em comum com as notícias seguintes
+            em_comum = Counter(chain.from_iterable(
+                indice[palavra][bisect_right(indice[palavra], i):] for palavra in palavras_chave[i]
+            ))
+
+            tamanho_i = len(palavras_chave[i])
+            candidatos = {j for j, quantidade in em_comum.items()
+                          if self._pode_atingir_limiar(quantidade, tamanho_i, len(palavras_chave[j]),
+                                                       bool(resumos_normalizados[i] and resumos_normalizados[j]))}
+            candidatos.update(j for j in por_titulo[titulos_normalizados[i]] if j > i)
+
+            for j in sorted(candidatos):
+                yield i, j
+
+    def _pode_atingir_limiar(self, em_comum: int, tamanho_i: int, tamanho_j: int, tem_resumos: bool) -> bool:
+        """
+        Verifica se um par com palavras-chave em comum pode atingir o limiar de similaridade.
+
+        O teto é a média ponderada com título e resumo idênticos e o coeficiente de
+        Jaccard exato, calculada como em _pontuar_par, então é um limite superior
+        da similaridade real.
+
+        Args:
+            em_comum: Número de palavras-chave em comum
+            tamanho_i: Número de palavras-chave da primeira notícia
+            tamanho_j: Número de palavras-chave da segunda notícia
+            tem_resumos: Se as duas notícias têm resumo
+
+        Returns:
+            bool: True se o par precisa ser comparado
+        """
+        uniao = tamanho_i + tamanho_j - em_comum
+        similaridade_palavras = em_comum / uniao if uniao > 0 else 0.0
+        teto_resumo = 1.0 if tem_resumos else 0.0
+        return (1.0 * 0.4) + (teto_resumo * 0.3) + (similaridade_palavras * 0.3) >= self.limiar_similaridade
+
+    def _similaridades_indexadas(self, noticias: List[Dict[str, Any]], titulos_normalizados: List[str],
+                                 resumos_normalizados: List[str], palavras_chave: List[Set[str]],
+                                 similaridades_resumo: Dict[Tuple[int, int], float]) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Compara apenas os pares candidatos do índice invertido.
+
+        Args:
+            noticias: Lista de notícias
+            titulos_normalizados: Títulos normalizados
+            resumos_normalizados: Resumos normalizados
+            palavras_chave: Conjuntos de palavras-chave
+            similaridades_resumo: Armazém onde são guardadas as similaridades de resumo
+                dos pares acima do limiar, para reaproveitar na análise de consistência
+
+        Returns:
+            Dict[int, List[Tuple[int, float]]]: Para cada notícia, as notícias com similaridade
+                acima do limiar e o valor da similaridade
+        """
+        similares = defaultdict(list)
+        pares_avaliados = 0
+
+        dados = [self._dados_comparacao(titulo, resumo, palavras)
+                 for titulo, resumo, palavras in zip(titulos_normalizados, resumos_normalizados, palavras_chave)]
+
+        for i, j in self._pares_candidatos(titulos_normalizados, resumos_normalizados, palavras_chave):
+            pares_avaliados += 1
+
+            pontuacao = self._pontuar_par(dados[i], dados[j])
+            if pontuacao is None:
+                continue
+
+            similaridade = pontuacao['similaridade']
+            similares[i].append((j, similaridade))
+            similares[j].append((i, similaridade))
+            if resumos_normalizados[i] and resumos_normalizados[j]:
+                similaridades_resumo[(i, j)] = pontuacao['resumo']
 
-                # Log para depuração de alta similaridade
-                if similaridade >= self.limiar_similaridade and logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"Alta similaridade ({similaridade:.2f}) entre:")
-                    logger.debug(f"  - {noticias[i]['titulo']} ({noticias[i]['portal']})")
-                    logger.debug(f"  - {noticias[j]['titulo']} ({noticias[j]['portal']})")
-                    logger.debug(f"  - Similaridade título: {similaridade_titulo:.2f}")
-                    logger.debug(f"  - Similaridade resumo: {similaridade_resumo:.2f}")
-                    logger.debug(f"  - Similaridade palavras: {similaridade_palavras:.2f}")
-                    logger.debug(f"  - Palavras em comum: {palavras_i.intersection(palavras_j)}")
+            # Log para depuração de alta similaridade
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Alta similaridade ({similaridade:.2f}) entre:")
+                logger.debug(f"  - {noticias[i]['titulo']} ({noticias[i]['portal']})")
+                logger.debug(f"  - {noticias[j]['titulo']} ({noticias[j]['portal']})")
+                logger.debug(f"  - Similaridade título: {pontuacao['titulo']:.2f}")
+                logger.debug(f"  - Similaridade resumo: {pontuacao['resumo']:.2f}")
+                logger.debug(f"  - Similaridade palavras: {pontuacao['palavras']:.2f}")
+                logger.debug(f"  - Palavras em comum: {palavras_chave[i].intersection(palavras_chave[j])}")
+
+        logger.debug(f"Índice de candidatos: {pares_avaliados} pares avaliados")
+
+        return similares
+
+    @staticmethod
+    def _dados_comparacao(titulo_normalizado: str, resumo_normalizado: str, palavras: Set[str]) -> Dict[str, Any]:
+        """
+        Reúne os dados de uma notícia usados na comparação par a par.
+
+        Args:
+            titulo_normalizado: Título normalizado
+            resumo_normalizado: Resumo normalizado
+            palavras: Conjunto de palavras-chave
+
+        Returns:
+            Dict[str, Any]: Textos, palavras-chave e contagens de caracteres da notícia
+        """
+        return {
+            'titulo': titulo_normalizado,
+            'resumo': resumo_normalizado,
+            'palavras': palavras,
+            # Contagem de caracteres, para o limite do quick_ratio sem criar o SequenceMatcher
+            'caracteres_titulo': Counter(titulo_normalizado),
+            'caracteres_resumo': Counter(resumo_normalizado)
+        }
+
+    def _pontuar_par(self, dados_i: Dict[str, Any], dados_j: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """
+        Calcula a similaridade de um par de notícias, se ela puder atingir o limiar.
+
+        Antes de rodar o difflib, o par passa por limites superiores baratos
+        (tamanho dos textos e caracteres em comum, como no quick_ratio). Como são
+        limites superiores da mesma média ponderada, um par descartado nunca
+        atingiria o limiar. A ordem (i, j) é a mesma do algoritmo de referência.
+
+        Args:
+            dados_i: Dados de comparação da primeira notícia
+            dados_j: Dados de comparação da segunda notícia
+
+        Returns:
+            Optional[Dict[str, float]]: Similaridade combinada e de cada componente,
+                ou None se o par ficar abaixo do limiar
+        """
+        limiar = self.limiar_similaridade
+
+        # Coeficiente de Jaccard (exato e barato)
+        palavras_i = dados_i['palavras']
+        palavras_j = dados_j['palavras']
+        uniao = len(palavras_i | palavras_j)
+        similaridade_palavras = len(palavras_i & palavras_j) / uniao if uniao > 0 else 0.0
+
+        titulo_i, titulo_j = dados_i['titulo'], dados_j['titulo']
+        resumo_i, resumo_j = dados_i['resumo'], dados_j['resumo']
+        tem_resumos = bool(resumo_i and resumo_j)
+
+        # Limite pelo tamanho dos textos (equivalente ao real_quick_ratio)
+        teto_titulo = self._teto_por_tamanho(titulo_i, titulo_j)
+        teto_resumo = self._teto_por_tamanho(resumo_i, resumo_j) if tem_resumos else 0.0
+        if (teto_titulo * 0.4) + (teto_resumo * 0.3) + (similaridade_palavras * 0.3) < limiar:
+            return None
+
+        # Limite pelos caracteres em comum (equivalente ao quick_ratio)
+        teto_titulo = self._teto_por_caracteres(dados_i['caracteres_titulo'], dados_j['caracteres_titulo'],
+                                                titulo_i, titulo_j)
+        if tem_resumos:
+            teto_resumo = self._teto_por_caracteres(dados_i['caracteres_resumo'], dados_j['caracteres_resumo'],
+                                                    resumo_i, resumo_j)
+        if (teto_titulo * 0.4) + (teto_resumo * 0.3) + (similaridade_palavras * 0.3) < limiar:
+            return None
+
+        # Similaridade exata (mesma fórmula do algoritmo de referência)
+        similaridade_titulo = difflib.SequenceMatcher(None, titulo_i, titulo_j).ratio()
+        if (similaridade_titulo * 0.4) + (teto_resumo * 0.3) + (similaridade_palavras * 0.3) < limiar:
+            return None
+        similaridade_resumo = difflib.SequenceMatcher(None, resumo_i, resumo_j).ratio() if tem_resumos else 0.0
+
+        similaridade = (similaridade_titulo * 0.4) + (similaridade_resumo * 0.3) + (similaridade_palavras * 0.3)
+        if similaridade < limiar:
+            return None
+
+        return {
+            'similaridade': similaridade,
+            'titulo': similaridade_titulo,
+            'resumo': similaridade_resumo,
+            'palavras': similaridade_palavras
+        }
+
+    def _similaridades_tfidf(self, titulos_normalizados: List[str], resumos_normalizados: List[str],
+                             palavras_chave: List[Set[str]]) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Calcula as similaridades com vetores TF-IDF e operações em lote sobre matrizes esparsas.
+
+        Títulos e resumos viram matrizes TF-IDF normalizadas (a similaridade de cosseno é
+        o produto escalar) e as palavras-chave viram uma matriz binária, da qual sai o
+        coeficiente de Jaccard. A média ponderada 0.4/0.3/0.3 é a mesma do difflib e o
+        produto é feito em blocos de linhas para limitar a memória. O cosseno entre
+        vetores de palavras costuma ficar abaixo da razão do difflib para o mesmo par,
+        então os grupos não são idênticos; o difflib continua sendo a referência.
+
+        Args:
+            titulos_normalizados: Títulos normalizados
+            resumos_normalizados: Resumos normalizados
+            palavras_chave: Conjuntos de palavras-chave
+
+        Returns:
+            Dict[int, List[Tuple[int, float]]]: Para cada notícia, as notícias com similaridade
+                acima do limiar e o valor da similaridade
+        """
+        similares = defaultdict(list)
+        total = len(titulos_normalizados)
+        if total < 2:
+            return similares
+
+        matriz_titulos = self._matriz_tfidf(titulos_normalizados)
+        matriz_resumos = self._matriz_tfidf(resumos_normalizados)
+
+        # Matriz binária de palavras-chave (linhas: notícias, colunas: palavras)
+        vocabulario = {}
+        linhas, colunas = [], []
+        for i, palavras in enumerate(palavras_chave):
+            for palavra in palavras:
+                linhas.append(i)
+                colunas.append(vocabulario.setdefault(palavra, len(vocabulario)))
+        matriz_palavras = sparse.csr_matrix(
+            (np.ones(len(linhas), dtype=np.float64), (linhas, colunas)),
+            shape=(total, max(1, len(vocabulario)))
+        )
+        tamanhos = np.array([len(palavras) for palavras in palavras_chave], dtype=np.float64)
+
+        for inicio in range(0, total, self.TAMANHO_BLOCO_TFIDF):
+            fim = min(inicio + self.TAMANHO_BLOCO_TFIDF, total)
+
+            # Coeficiente de Jaccard: |A ∩ B| / (|A| + |B| - |A ∩ B|)
+            intersecao = (matriz_palavras[inicio:fim] @ matriz_palavras.T).tocoo()
+            uniao = tamanhos[intersecao.row + inicio] + tamanhos[intersecao.col] - intersecao.data
+            jaccard = sparse.csr_matrix((intersecao.data / uniao, (intersecao.row, intersecao.col)),
+                                        shape=intersecao.shape)
+
+            similaridade = (matriz_titulos[inicio:fim] @ matriz_titulos.T) * 0.4
+            similaridade = similaridade + (matriz_resumos[inicio:fim] @ matriz_resumos.T) * 0.3
+            similaridade = (similaridade + jaccard * 0.3).tocoo()
+
+            # Filtrar em lote: cada par uma vez (i < j) e apenas acima do limiar
+            linhas_bloco = similaridade.row + inicio
+            selecionados = (similaridade.col > linhas_bloco) & (similaridade.data >= self.limiar_similaridade)
+
+            for i, j, valor in zip(linhas_bloco[selecionados].tolist(), similaridade.col[selecionados].tolist(),
+                                   similaridade.data[selecionados].tolist()):
+                similares[i].append((j, valor))
+                similares[j].append((i, valor))
+
+        return similares
+
+    @staticmethod
+    def _matriz_tfidf(textos: List[str]) -> "sparse.csr_matrix":
+        """
+        Constrói a matriz TF-IDF (linhas normalizadas em L2) de uma lista de textos.
+
+        Args:
+            textos: Textos normalizados (textos vazios geram linhas nulas)
+
+        Returns:
+            sparse.csr_matrix: Matriz TF-IDF com uma linha por texto
+        """
+        if not any(textos):
+            return sparse.csr_matrix((len(textos), 1), dtype=np.float64)
+
+        vetorizador = TfidfVectorizer(token_pattern=r"(?u)\b\w+\b", lowercase=False)
+        return vetorizador.fit_transform(textos).tocsr()
+
+    @staticmethod
+    def _teto_por_tamanho(texto1: str, texto2: str) -> float:
+        """
+        Limite superior da razão do difflib calculado apenas pelo tamanho dos textos.
+
+        Args:
+            texto1: Primeiro texto
+            texto2: Segundo texto
+
+        Returns:
+            float: Valor máximo que SequenceMatcher.ratio() pode retornar
+        """
+        total = len(texto1) + len(texto2)
+        return 2.0 * min(len(texto1), len(texto2)) / total if total else 1.0
+
+    @staticmethod
+    def _teto_por_caracteres(caracteres1: Counter, caracteres2: Counter, texto1: str, texto2: str) -> float:
+        """
+        Limite superior da razão do difflib pelos caracteres em comum (mesmo cálculo do quick_ratio).
+
+        Args:
+            caracteres1: Contagem de caracteres do primeiro texto
+            caracteres2: Contagem de caracteres do segundo texto
+            texto1: Primeiro texto
+            texto2: Segundo texto
+
+        Returns:
+            float: Valor máximo que SequenceMatcher.ratio() pode retornar
+        """
+        total = len(texto1) + len(texto2)
+        if not total:
+            return 1.0
+        if len(caracteres1) > len(caracteres2):
+            caracteres1, caracteres2 = caracteres2, caracteres1
+        comuns = sum(min(quantidade, caracteres2[caractere]) for caractere, quantidade in caracteres1.items())
+        return 2.0 * comuns / total
+
+    def _agrupar_noticias_similares(self, noticias: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Agrupa notícias similares com base no título, conteúdo e palavras-chave.
+        Utiliza algoritmo otimizado para identificar grupos de notícias relacionadas.
+
+        Args:
+            noticias: Lista de notícias a serem agrupadas
+
+        Returns:
+            List[List[Dict[str, Any]]]: Lista de grupos de notícias similares
+        """
+        grupos_indices, _ = self._agrupar_indices(noticias)
+        return [[noticias[idx] for idx in indices] for indices in grupos_indices]
+
+    def _agrupar_indices(self, noticias: List[Dict[str, Any]]) -> Tuple[List[List[int]], Dict[Tuple[int, int], float]]:
+        """
+        Agrupa notícias similares, representando cada grupo pelos índices das notícias.
+
+        Args:
+            noticias: Lista de notícias a serem agrupadas
+
+        Returns:
+            Tuple[List[List[int]], Dict[Tuple[int, int], float]]: Grupos de índices (maiores primeiro)
+                e o armazém de similaridades de resumo calculadas no agrupamento, por par (i, j)
+                na ordem em que foram comparados
+        """
+        similaridades_resumo: Dict[Tuple[int, int], float] = {}
+        if not noticias:
+            return [], similaridades_resumo
+
+        # Pré-processar todos os títulos e resumos para comparação mais eficiente
+        titulos_normalizados, resumos_normalizados, palavras_chave = self._preprocessar_noticias(noticias)
+
+        # Abaixo deste limiar, pares sem palavras-chave em comum também podem ser agrupados
+        if self.backend_similaridade == "tfidf":
+            # O cosseno não é a medida usada nas contradições, então nada vai para o armazém
+            similares = self._similaridades_tfidf(titulos_normalizados, resumos_normalizados, palavras_chave)
+        elif self.usar_indice and self.limiar_similaridade >= self.SIMILARIDADE_MAXIMA_SEM_PALAVRAS:
+            similares = self._similaridades_indexadas(noticias, titulos_normalizados, resumos_normalizados,
+                                                      palavras_chave, similaridades_resumo)
+        else:
+            similares = self._similaridades_exaustivas(noticias, titulos_normalizados, resumos_normalizados,
+                                                       palavras_chave, similaridades_resumo)
 
         # Algoritmo de agrupamento baseado em similaridade
-        for i, noticia in enumerate(noticias):
+        grupos_indices = []
+        noticias_processadas = set()
+
+        for i in range(len(noticias)):
             if i in noticias_processadas:
                 continue
 
             # Iniciar novo grupo
-            grupo_atual = [noticia]
+            grupo_atual = [i]
             noticias_processadas.add(i)
 
-            # Encontrar todas as notícias similares
-            candidatos = [(j, similaridades.get((i, j), 0.0))
-                         for j in range(len(noticias))
-                         if j != i and j not in noticias_processadas]
+            # Encontrar todas as notícias similares ainda não agrupadas
+            candidatos = [(j, similaridade) for j, similaridade in similares.get(i, [])
+                          if j not in noticias_processadas]
 
-            # Ordenar candidatos por similaridade (mais similares primeiro)
-            candidatos.sort(key=lambda x: x[1], reverse=True)
+            # Ordenar candidatos por similaridade (mais similares primeiro, empates na ordem original)
+            candidatos.sort(key=lambda x: (-x[1], x[0]))
 
             # Adicionar notícias similares ao grupo
             for j, similaridade in candidatos:
-                if similaridade >= self.limiar_similaridade:
-                    grupo_atual.append(noticias[j])
-                    noticias_processadas.add(j)
+                grupo_atual.append(j)
+                noticias_processadas.add(j)
 
-            # Adicionar o grupo se tiver pelo menos uma notícia
-            if grupo_atual:
-                grupos.append(grupo_atual)
+            grupos_indices.append(grupo_atual)
 
         # Ordenar grupos por tamanho (maiores primeiro)
-        grupos.sort(key=len, reverse=True)
+        grupos_indices.sort(key=len, reverse=True)
 
         # Log para depuração
-        for i, grupo in enumerate(grupos):
-            if len(grupo) > 1:
-                logger.info(f"Grupo {i+1}: {len(grupo)} notícias similares")
-                for noticia in grupo:
-                    logger.info(f"  - {noticia['titulo']} ({noticia['portal']})")
+        for i, indices in enumerate(grupos_indices):
+            if len(indices) > 1:
+                logger.info(f"Grupo {i+1}: {len(indices)} notícias similares")
+                for idx in indices:
+                    logger.info(f"  - {noticias[idx]['titulo']} ({noticias[idx]['portal']})")
 
                 # Mostrar palavras-chave em comum
-                indices = [noticias.index(n) for n in grupo]
                 palavras_comuns = set.intersection(*[palavras_chave[idx] for idx in indices])
                 logger.info(f"  - Palavras-chave em comum: {palavras_comuns}")
 
-        return grupos
+        return grupos_indices, similaridades_resumo
+
+    @staticmethod
+    def _descrever_contradicao(noticia1: Dict[str, Any], noticia2: Dict[str, Any], similaridade: float) -> Dict[str, Any]:
+        """
+        Descreve uma possível contradição entre os resumos de duas notícias.
+
+        Args:
+            noticia1: Primeira notícia
+            noticia2: Segunda notícia
+            similaridade: Similaridade entre os resumos
+
+        Returns:
+            Dict[str, Any]: Fontes, similaridade e trechos dos resumos
+        """
+        return {
+            'fonte1': noticia1['portal'],
+            'fonte2': noticia2['portal'],
+            'similaridade': similaridade,
+            'resumo1': noticia1['resumo'][:100] + '...' if len(noticia1['resumo']) > 100 else noticia1['resumo'],
+            'resumo2': noticia2['resumo'][:100] + '...' if len(noticia2['resumo']) > 100 else noticia2['resumo']
+        }
 
-    def _analisar_consistencia_grupo(self, grupo: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analisar_consistencia_grupo(self, grupo: List[Dict[str, Any]],
+                                     indices: Optional[List[int]] = None,
+                                     similaridades_resumo: Optional[Dict[Tuple[int, int], float]] = None) -> Dict[str, Any]:
         """
         Analisa a consistência entre notícias de um mesmo grupo.
         Identifica contradições e calcula métricas de confiabilidade.
 
         Args:
             grupo: Grupo de notícias similares
+            indices: Índices das notícias do grupo na lista original
+            similaridades_resumo: Armazém de similaridades de resumo calculadas no agrupamento
 
         Returns:
             Dict[str, Any]: Metadados sobre a consistência do grupo
@@ -327,22 +775,81 @@ class VerificadorNoticias:
 
                     # Verificar contradições nos resumos
                     if noticia1.get('resumo') and noticia2.get('resumo'):
-                        similaridade = self._calcular_similaridade(
-                            noticia1['resumo'], noticia2['resumo']
-                        )
+                        # Reaproveitar a similaridade do agrupamento (mesma ordem de comparação)
+                        similaridade = None
+                        if indices is not None and similaridades_resumo:
+                            similaridade = similaridades_resumo.get((indices[i], indices[j]))
+
+                        if similaridade is None:
+                            similaridade = self._calcular_similaridade(
+                                noticia1['resumo'], noticia2['resumo']
+                            )
 
                         # Se a similaridade for muito baixa, pode indicar contradição
-                        if similaridade < 0.3:
-                            metadados['contradições'].append({
-                                'fonte1': noticia1['portal'],
-                                'fonte2': noticia2['portal'],
-                                'similaridade': similaridade,
-                                'resumo1': noticia1['resumo'][:100] + '...' if len(noticia1['resumo']) > 100 else noticia1['resumo'],
-                                'resumo2': noticia2['resumo'][:100] + '...' if len(noticia2['resumo']) > 100 else noticia2['resumo']
-                            })
+                        if similaridade < self.LIMIAR_CONTRADICAO:
+                            metadados['contradições'].append(
+                                self._descrever_contradicao(noticia1, noticia2, similaridade)
+                            )
 
         return metadados
 
+    def _aplicar_cruzamento(self, noticia: Dict[str, Any], metadados: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Aplica os metadados de cruzamento de um grupo a uma notícia.
+
+        Args:
+            noticia: Notícia original
+            metadados: Metadados de consistência do grupo da notícia
+
+        Returns:
+            Dict[str, Any]: Cópia da notícia com cruzamento e credibilidade atualizados
+        """
+        # Copiar a notícia para não modificar a original
+        noticia_atualizada = noticia.copy()
+
+        # Adicionar metadados de cruzamento
+        noticia_atualizada['cruzamento'] = {
+            'num_fontes': metadados['num_fontes'],
+            'fontes': metadados['fontes'],
+            'fontes_unicas': metadados.get('fontes_unicas', len(set(metadados['fontes']))),
+            'confirmado': metadados['confirmado'],
+            'tem_contradicoes': len(metadados['contradições']) > 0
+        }
+
+        # Atualizar credibilidade com base no cruzamento
+        credibilidade_original = noticia.get('credibilidade', 5)
+
+        # Adicionar bônus para cada confirmação adicional (fonte única)
+        fontes_unicas = metadados.get('fontes_unicas', len(set(metadados['fontes'])))
+        bonus = max(0, fontes_unicas - 1) * self.bonus_confirmacao
+
+        # Penalizar se houver contradições
+        penalidade = len(metadados['contradições']) * 2
+
+        # Calcular nova credibilidade
+        nova_credibilidade = credibilidade_original + bonus - penalidade
+
+        # Limitar entre 0 e 10
+        nova_credibilidade = max(0, min(10, nova_credibilidade))
+
+        # Atualizar campos de credibilidade
+        noticia_atualizada['credibilidade'] = nova_credibilidade
+        noticia_atualizada['credibilidade_original'] = credibilidade_original
+        noticia_atualizada['confiavel'] = nova_credibilidade >= 6
+
+        # Adicionar razões para a mudança na credibilidade
+        razoes = noticia.get('razoes_credibilidade', []).copy()
+
+        if bonus > 0:
+            razoes.append(f"Confirmada por {fontes_unicas} fontes diferentes (+{bonus})")
+
+        if penalidade > 0:
+            razoes.append(f"Contradições entre fontes (-{penalidade})")
+
+        noticia_atualizada['razoes_credibilidade'] = razoes
+
+        return noticia_atualizada
+
     def verificar_noticias(self, noticias: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Verifica a credibilidade de notícias através de cruzamento de informações.
@@ -359,66 +866,23 @@ class VerificadorNoticias:
 
         logger.info(f"Verificando {len(noticias)} notícias através de cruzamento de informações...")
 
-        # Agrupar notícias similares
-        grupos = self._agrupar_noticias_similares(noticias)
+        # Agrupar notícias similares (grupos de índices e similaridades já calculadas)
+        grupos_indices, similaridades_resumo = self._agrupar_indices(noticias)
 
-        logger.info(f"Notícias agrupadas em {len(grupos)} grupos")
+        logger.info(f"Notícias agrupadas em {len(grupos_indices)} grupos")
 
         # Processar cada grupo e atualizar notícias
         noticias_verificadas = []
 
-        for grupo in grupos:
+        for indices in grupos_indices:
+            grupo = [noticias[idx] for idx in indices]
+
             # Analisar consistência do grupo
-            metadados = self._analisar_consistencia_grupo(grupo)
+            metadados = self._analisar_consistencia_grupo(grupo, indices, similaridades_resumo)
 
             # Atualizar cada notícia no grupo
             for noticia in grupo:
-                # Copiar a notícia para não modificar a original
-                noticia_atualizada = noticia.copy()
-
-                # Adicionar metadados de cruzamento
-                noticia_atualizada['cruzamento'] = {
-                    'num_fontes': metadados['num_fontes'],
-                    'fontes': metadados['fontes'],
-                    'fontes_unicas': metadados.get('fontes_unicas', len(set(metadados['fontes']))),
-                    'confirmado': metadados['confirmado'],
-                    'tem_contradicoes': len(metadados['contradições']) > 0
-                }
-
-                # Atualizar credibilidade com base no cruzamento
-                credibilidade_original = noticia.get('credibilidade', 5)
-
-                # Adicionar bônus para cada confirmação adicional (fonte única)
-                fontes_unicas = metadados.get('fontes_unicas', len(set(metadados['fontes'])))
-                bonus = max(0, fontes_unicas - 1) * self.bonus_confirmacao
-
-                # Penalizar se houver contradições
-                penalidade = len(metadados['contradições']) * 2
-
-                # Calcular nova credibilidade
-                nova_credibilidade = credibilidade_original + bonus - penalidade
-
-                # Limitar entre 0 e 10
-                nova_credibilidade = max(0, min(10, nova_credibilidade))
-
-                # Atualizar campos de credibilidade
-                noticia_atualizada['credibilidade'] = nova_credibilidade
-                noticia_atualizada['credibilidade_original'] = credibilidade_original
-                noticia_atualizada['confiavel'] = nova_credibilidade >= 6
-
-                # Adicionar razões para a mudança na credibilidade
-                razoes = noticia.get('razoes_credibilidade', []).copy()
-
-                if bonus > 0:
-                    razoes.append(f"Confirmada por {fontes_unicas} fontes diferentes (+{bonus})")
-
-                if penalidade > 0:
-                    razoes.append(f"Contradições entre fontes (-{penalidade})")
-
-                noticia_atualizada['razoes_credibilidade'] = razoes
-
-                # Adicionar à lista de notícias verificadas
-                noticias_verificadas.append(noticia_atualizada)
+                noticias_verificadas.append(self._aplicar_cruzamento(noticia, metadados))
 
         # Ordenar por credibilidade (mais confiáveis primeiro) e depois por data (mais recentes primeiro)
         noticias_verificadas.sort(
@@ -4,6 +4,8 @@ Video generation module for the CloneIA project.
 """
 import os
 import random
+import hashlib
+import tempfile
 import time
 import logging
 import json
@@ -11,7 +13,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple, Union
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 try:
     import moviepy.editor as mp
@@ -27,18 +29,51 @@ from core.utils import (
     BG_COLOR, TEXT_COLOR, HIGHLIGHT_COLOR
 )
 from core.text import TextProcessor
+from core.frame_cache import FrameCache, DEFAULT_FRAMES_PER_VIDEO
+from core.card_cache import CardCache, load_font
+from core.segment_cache import SegmentCache
+from core.video_ffmpeg import FilterGraphRenderer, blit, center_position, fit_frame
 
 logger = logging.getLogger('cloneia.video')
 
+# Available render backends
+RENDER_BACKENDS = ("moviepy", "ffmpeg", "segmented")
+DEFAULT_RENDER_BACKEND = "segmented"
+
 class VideoGenerator:
     """
     Class for generating videos from audio and images.
     """
     
-    def __init__(self):
+    def __init__(self, use_frame_cache: bool = True, cache_dir: Optional[str] = None,
+                 frames_per_video: int = DEFAULT_FRAMES_PER_VIDEO, use_card_cache: bool = True,
+                 card_cache_dir: Optional[str] = None, render_backend: str = DEFAULT_RENDER_BACKEND,
+                 render_workers: Optional[int] = None, use_segment_cache: bool = True,
+                 segment_cache_dir: Optional[str] = None):
         """
         Initialize the video generator.
+        
+        Args:
+            use_frame_cache: Whether to reuse frames already decoded from the reference videos
+            cache_dir: Directory of the frame cache (if None, uses cache/frames in the project root)
+            frames_per_video: Number of frames pre-extracted from each reference video
+            use_card_cache: Whether to reuse title cards and text already rendered with the same style
+            card_cache_dir: Directory of the card cache (if None, uses cache/cards in the project root)
+            render_backend: How the timeline is rendered: "moviepy" (composites every frame in Python),
+                "ffmpeg" (composites each section once and renders with a single ffmpeg filtergraph)
+                or "segmented" (like "ffmpeg", but encodes the sections in parallel and joins them)
+            render_workers: Number of sections encoded at the same time by the "segmented" backend
+                (if None, the number of CPUs)
+            use_segment_cache: Whether the "segmented" backend reuses segments already encoded
+                from the same inputs
+            segment_cache_dir: Directory of the segment cache (if None, uses cache/segments in the project root)
+                
+        Raises:
+            ValueError: If the render backend is unknown
         """
+        if render_backend not in RENDER_BACKENDS:
+            raise ValueError(f"Unknown render backend: {render_backend} (expected one of {', '.join(RENDER_BACKENDS)})")
+        
         if not MOVIEPY_AVAILABLE:
             logger.error("MoviePy library not found. Video generation will not work.")
         
@@ -55,6 +90,8 @@ class VideoGenerator:
         self.video_width = VIDEO_WIDTH
         self.video_height = VIDEO_HEIGHT
         self.fps = FPS
+        self.render_backend = render_backend
+        self.render_workers = render_workers
         
         # Colors
         self.bg_color = BG_COLOR
@@ -64,6 +101,22 @@ class VideoGenerator:
         # Text processor
         self.text_processor = TextProcessor()
         
+        # Cache of frames decoded from the reference videos
+        self.frame_cache = None
+        if use_frame_cache:
+            self.frame_cache = FrameCache(cache_dir or os.path.join(PROJECT_ROOT, "cache", "frames"),
+                                          frames_per_video)
+        
+        # Cache of rendered title cards and static text
+        self.card_cache = None
+        if use_card_cache:
+            self.card_cache = CardCache(card_cache_dir or os.path.join(PROJECT_ROOT, "cache", "cards"))
+        
+        # Cache of encoded segments (only the segmented render produces segments)
+        self.segment_cache = None
+        if use_segment_cache and render_backend == "segmented":
+            self.segment_cache = SegmentCache(segment_cache_dir or os.path.join(PROJECT_ROOT, "cache", "segments"))
+        
         logger.info("VideoGenerator initialized")
     
     def create_title_image(self, title: str, width: int = VIDEO_WIDTH, 
@@ -71,10 +124,54 @@ class VideoGenerator:
         """
         Create an image with the video title.
         
+        The image is rendered once per title and style and then reused from the card cache (in memory).
+        
+        Args:
+            title: Title of the video
+            width: Width of the image
+            height: Height of the image
+            
+        Returns:
+            np.ndarray: NumPy array representing the image
+        """
+        font_path = os.path.join(self.resources_dir, "fonts", "Roboto-Bold.ttf")
+        if not self.card_cache:
+            return self._draw_title_image(title, width, height, font_path)
+        
+        key = CardCache.make_key(
+            "title", title=title, width=width, height=height,
+            bg_color=self.bg_color, text_color=self.text_color, highlight_color=self.highlight_color,
+            font=self._font_signature(font_path)
+        )
+        # Drawing with PIL is cheaper than decoding a PNG, so titles are only kept in memory
+        return self.card_cache.get_or_render(
+            key, lambda: self._draw_title_image(title, width, height, font_path), persist=False
+        )
+    
+    @staticmethod
+    def _font_signature(font_path: Optional[str]) -> str:
+        """
+        Identify a font file for the card cache keys (path and modification time).
+        
+        Args:
+            font_path: Path to the font file
+            
+        Returns:
+            str: Font signature
+        """
+        if font_path and os.path.exists(font_path):
+            return f"{font_path}|{os.stat(font_path).st_mtime_ns}"
+        return str(font_path)
+    
+    def _draw_title_image(self, title: str, width: int, height: int, font_path: str) -> np.ndarray:
+        """
+        Draw the title image.
+        
         Args:
             title: Title of the video
             width: Width of the image
             height: Height of the image
+            font_path: Path to the font (the default font is used if it does not exist)
             
         Returns:
             np.ndarray: NumPy array representing the image
@@ -83,19 +180,9 @@ class VideoGenerator:
         img = Image.new('RGB', (width, height), self.bg_color)
         draw = ImageDraw.Draw(img)
         
-        # Try to load a custom font, or use the default
-        try:
-            font_path = os.path.join(self.resources_dir, "fonts", "Roboto-Bold.ttf")
-            if os.path.exists(font_path):
-                title_font = ImageFont.truetype(font_path, 80)
-                subtitle_font = ImageFont.truetype(font_path, 60)
-            else:
-                title_font = ImageFont.load_default()
-                subtitle_font = ImageFont.load_default()
-        except Exception as e:
-            logger.error(f"Error loading font: {e}")
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
+        # Load the custom font (once per size), or use the default
+        title_font = load_font(font_path, 80)
+        subtitle_font = load_font(font_path, 60)
         
         # Add the title
         title_text = "RAPIDINHA NO CRIPTO"
@@ -151,12 +238,7 @@ class VideoGenerator:
             return None
         
         try:
-            font_path = os.path.join(self.resources_dir, "fonts", "Roboto-Regular.ttf")
-            if os.path.exists(font_path):
-                text_clip = TextClip(text, fontsize=fontsize, color='white', font=font_path)
-            else:
-                text_clip = TextClip(text, fontsize=fontsize, color='white')
-            
+            text_clip = self._static_text_clip(text, **self._text_args(fontsize))
             text_clip = text_clip.set_position(position).set_duration(duration)
             return text_clip
         except Exception as e:
@@ -164,14 +246,90 @@ class VideoGenerator:
             # Fallback to a color clip with the same duration
             return ColorClip(size=(100, 100), color=(0, 0, 0), duration=duration)
     
-    def extract_frame_from_video(self, video_path: str, 
-                                time_point: Optional[float] = None) -> np.ndarray:
+    def _text_args(self, fontsize: int) -> Dict[str, Any]:
+        """
+        Get the TextClip arguments of the text shown over the video.
+        
+        Args:
+            fontsize: Font size
+            
+        Returns:
+            Dict[str, Any]: TextClip arguments (the custom font is only used if it exists)
+        """
+        text_args = {'fontsize': fontsize, 'color': 'white'}
+        font_path = os.path.join(self.resources_dir, "fonts", "Roboto-Regular.ttf")
+        if os.path.exists(font_path):
+            text_args['font'] = font_path
+        return text_args
+    
+    def _static_text_clip(self, text: str, **text_args: Any) -> Any:
+        """
+        Create a clip with rendered text, reusing the card cache.
+        
+        TextClip renders the text with ImageMagick into an RGBA image; the same
+        pixels are stored in the card cache, so later renders build the clip
+        from them without calling ImageMagick.
+        
+        Args:
+            text: Text to render
+            **text_args: TextClip arguments (fontsize, color, font...)
+            
+        Returns:
+            ImageClip: Clip with the text and its transparency mask
+        """
+        if not self.card_cache:
+            return TextClip(text, **text_args)
+        
+        return mp.ImageClip(self._render_text(text, **text_args))
+    
+    def _render_text(self, text: str, **text_args: Any) -> np.ndarray:
+        """
+        Render text into an RGBA image, reusing the card cache.
+        
+        Args:
+            text: Text to render
+            **text_args: TextClip arguments (fontsize, color, font...)
+            
+        Returns:
+            np.ndarray: RGBA image with the text
+        """
+        def render() -> np.ndarray:
+            clip = TextClip(text, **text_args)
+            alpha = np.full(clip.img.shape[:2], 255, dtype=np.uint8)
+            if clip.mask is not None:
+                alpha = np.round(clip.mask.img * 255).astype(np.uint8)
+            return np.dstack([clip.img, alpha])
+        
+        if not self.card_cache:
+            return render()
+        
+        key = CardCache.make_key("text", text=text, **self._text_signature(text_args))
+        return self.card_cache.get_or_render(key, render)
+    
+    def _text_signature(self, text_args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Identify the style of rendered text for the cache keys.
+        
+        Args:
+            text_args: TextClip arguments (fontsize, color, font...)
+            
+        Returns:
+            Dict[str, Any]: Arguments with the font replaced by its signature
+        """
+        signature = dict(text_args)
+        if signature.get('font'):
+            signature['font'] = self._font_signature(signature['font'])
+        return signature
+    
+    def extract_frame_from_video(self, video_path: str, time_point: Optional[float] = None,
+                                rng: Optional[random.Random] = None) -> np.ndarray:
         """
         Extract a frame from a video.
         
         Args:
             video_path: Path to the video
             time_point: Time point to extract the frame (if None, uses a random point)
+            rng: Random generator used to pick the point (if None, uses the random module)
             
         Returns:
             np.ndarray: NumPy array representing the frame
@@ -181,10 +339,13 @@ class VideoGenerator:
             return np.zeros((self.video_height, self.video_width, 3), dtype=np.uint8)
         
         try:
+            if self.frame_cache:
+                return self.frame_cache.get_frame(video_path, time_point, rng)
+            
             video = mp.VideoFileClip(video_path)
             
             if time_point is None:
-                time_point = random.uniform(0, max(0.1, video.duration - 0.1))
+                time_point = (rng or random).uniform(0, max(0.1, video.duration - 0.1))
             
             frame = video.get_frame(time_point)
             video.close()
@@ -195,6 +356,53 @@ class VideoGenerator:
             # Return a black frame as fallback
             return np.zeros((self.video_height, self.video_width, 3), dtype=np.uint8)
     
+    def prepare_reference_frames(self, reference_videos: List[str]) -> int:
+        """
+        Pre-extract frames from the reference videos into the frame cache.
+        
+        Only videos that are new or changed since the last call are decoded, so
+        frame selection during the render is an in-memory lookup.
+        
+        Args:
+            reference_videos: Paths to the reference videos
+            
+        Returns:
+            int: Number of videos with frames available in the cache
+        """
+        if not self.frame_cache or not MOVIEPY_AVAILABLE:
+            return 0
+        
+        prepared = 0
+        for video_path in reference_videos:
+            try:
+                self.frame_cache.prepare(video_path)
+                prepared += 1
+            except Exception as e:
+                logger.error(f"Error pre-extracting frames from video {video_path}: {e}")
+        
+        return prepared
+    
+    def _intro_texts(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get the title and subtitle of the intro animation.
+        
+        Returns:
+            List[Tuple[str, Dict[str, Any]]]: (text, TextClip arguments) of the title and the subtitle
+        """
+        return [
+            ("RAPIDINHA NO CRIPTO", {
+                'fontsize': 80,
+                # TextClip passes the color to ImageMagick, which expects a string
+                'color': 'rgb({},{},{})'.format(*self.highlight_color),
+                'font': 'Arial-Bold' if os.path.exists('/Library/Fonts/Arial Bold.ttf') else None
+            }),
+            ("com Renato Santanna Silva", {
+                'fontsize': 40,
+                'color': 'white',
+                'font': 'Arial' if os.path.exists('/Library/Fonts/Arial.ttf') else None
+            }),
+        ]
+    
     def create_intro_animation(self, duration: float = 3.0) -> CompositeVideoClip:
         """
         Create an intro animation for the video.
@@ -217,27 +425,17 @@ class VideoGenerator:
                 duration=duration
             )
             
+            (title_text, title_args), (subtitle_text, subtitle_args) = self._intro_texts()
+            
             # Create the title text
-            title_text = "RAPIDINHA NO CRIPTO"
-            title_clip = TextClip(
-                title_text,
-                fontsize=80,
-                color=self.highlight_color,
-                font='Arial-Bold' if os.path.exists('/Library/Fonts/Arial Bold.ttf') else None
-            )
+            title_clip = self._static_text_clip(title_text, **title_args)
             
             # Animate the title (fade in and zoom)
             title_clip = title_clip.set_position('center').set_duration(duration)
             title_clip = title_clip.crossfadein(1.0)
             
             # Create the subtitle
-            subtitle_text = "com Renato Santanna Silva"
-            subtitle_clip = TextClip(
-                subtitle_text,
-                fontsize=40,
-                color='white',
-                font='Arial' if os.path.exists('/Library/Fonts/Arial.ttf') else None
-            )
+            subtitle_clip = self._static_text_clip(subtitle_text, **subtitle_args)
             
             # Animate the subtitle (appear after the title)
             subtitle_clip = subtitle_clip.set_position(('center', self.video_height // 2 + 80)).set_duration(duration - 0.5)
@@ -260,6 +458,351 @@ class VideoGenerator:
                 duration=duration
             )
     
+    def _plan_sections(self, parsed_script: Dict[str, Any], reference_videos: List[str],
+                       total_duration: float) -> List[Dict[str, Any]]:
+        """
+        Plan the sections of the video timeline.
+        
+        Each section is a dict with its kind ("intro_animation", "intro", "title",
+        "content", "outro" or "credits"), duration and what is drawn on it: the
+        background frame, how much it is darkened, the height of the box behind
+        the text (fraction of the video height), the text and its font size.
+        
+        Args:
+            parsed_script: Script parsed by TextProcessor.parse_script
+            reference_videos: Paths to the reference videos
+            total_duration: Duration of the narration in seconds
+            
+        Returns:
+            List[Dict[str, Any]]: Sections in the order they are shown
+        """
+        intro_text = parsed_script['intro']
+        news_items = parsed_script['news']
+        outro_text = parsed_script['outro']
+        
+        # Duration of each section
+        intro_animation_duration = 3.0  # Fixed duration for the intro animation
+        intro_duration = total_duration * 0.1
+        news_duration = total_duration * 0.8 / max(1, len(news_items))
+        outro_duration = total_duration * 0.1
+        credits_duration = 3.0
+        
+        sections = [{"kind": "intro_animation", "duration": intro_animation_duration}]
+        
+        # Intro with the script content
+        if intro_text:
+            rng = self._section_rng(intro_text)
+            sections.append({
+                "kind": "intro",
+                "duration": intro_duration,
+                "frame": self.extract_frame_from_video(rng.choice(reference_videos), rng=rng),
+                "darken": 1.0,
+                "box": None,
+                "text": intro_text,
+                "fontsize": 70
+            })
+        
+        for i, news in enumerate(news_items):
+            # Title card with the news number
+            sections.append({
+                "kind": "title",
+                "duration": news_duration * 0.3,
+                "title": f"{i+1}. {news['title']}"
+            })
+            
+            # Try to use a different frame for each news item
+            rng = self._section_rng(news['content'])
+            if len(reference_videos) > i:
+                video_for_content = reference_videos[i]
+            else:
+                video_for_content = rng.choice(reference_videos)
+            
+            # Darkened frame with a semi-transparent box behind the text to improve readability
+            sections.append({
+                "kind": "content",
+                "duration": news_duration * 0.7,
+                "frame": self.extract_frame_from_video(video_for_content, rng=rng),
+                "darken": 0.7,
+                "box": 0.4,
+                "text": news['content'],
+                "fontsize": 60
+            })
+        
+        if outro_text:
+            rng = self._section_rng(outro_text)
+            sections.append({
+                "kind": "outro",
+                "duration": outro_duration,
+                "frame": self.extract_frame_from_video(rng.choice(reference_videos), rng=rng),
+                "darken": 0.7,
+                "box": 0.3,
+                "text": outro_text,
+                "fontsize": 70
+            })
+        
+        # Final screen with credits
+        sections.append({
+            "kind": "credits",
+            "duration": credits_duration,
+            "frame": None,
+            "darken": 1.0,
+            "box": None,
+            "text": "Gerado por Clone IA\nRapidinha no Cripto\n\n© " + datetime.now().strftime("%Y"),
+            "fontsize": 50
+        })
+        
+        return sections
+    
+    def _section_rng(self, seed: str) -> Any:
+        """
+        Get the random generator that picks the background frame of a section.
+        
+        With the segment cache, the frame only depends on the section text, so
+        an unchanged section gets the same frame (and the same cached segment)
+        on every render.
+        
+        Args:
+            seed: Text of the section
+            
+        Returns:
+            Any: random.Random seeded with the text, or the random module
+        """
+        if self.segment_cache:
+            return random.Random(seed)
+        return random
+
+    def _section_clip(self, section: Dict[str, Any]) -> Any:
+        """
+        Build the MoviePy clip of a section.
+        
+        Args:
+            section: Section planned by _plan_sections
+            
+        Returns:
+            VideoClip: Clip of the section
+        """
+        duration = section["duration"]
+        if section["kind"] == "intro_animation":
+            return self.create_intro_animation(duration=duration)
+        
+        if section["kind"] == "title":
+            title_clip = mp.ImageClip(self.create_title_image(section["title"])).set_duration(duration)
+            return title_clip.crossfadein(0.5)
+        
+        if section["frame"] is None:
+            background = ColorClip(
+                size=(self.video_width, self.video_height),
+                color=self.bg_color,
+                duration=duration
+            )
+        else:
+            frame = section["frame"]
+            if section["darken"] != 1.0:
+                # Reduce the brightness to improve text readability
+                frame = frame * section["darken"]
+            background = mp.ImageClip(frame).set_duration(duration)
+        
+        layers = [background]
+        if section["box"]:
+            # Black box with 50% transparency behind the text
+            layers.append(ColorClip(
+                size=(int(self.video_width * 0.9), int(self.video_height * section["box"])),
+                color=(0, 0, 0),
+                duration=duration
+            ).set_opacity(0.5).set_position('center'))
+        
+        layers.append(self.create_text_clip(
+            section["text"],
+            duration,
+            position=('center', 'center'),
+            fontsize=section["fontsize"]
+        ))
+        
+        # Add fade in transition
+        return CompositeVideoClip(layers).crossfadein(0.5)
+    
+    def _section_layers(self, section: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pre-render the static pictures of a section for the FFmpeg backend.
+        
+        The pictures are composited the same way MoviePy composites each frame
+        of the section, but only once. The crossfadein of the top-level clips
+        only changes their masks, which write_videofile ignores, so sections
+        start without a fade, as in the MoviePy output.
+        
+        Args:
+            section: Section planned by _plan_sections
+            
+        Returns:
+            Dict[str, Any]: Section for FilterGraphRenderer
+        """
+        duration = section["duration"]
+        if section["kind"] == "intro_animation":
+            return self._intro_animation_layers(duration)
+        
+        if section["kind"] == "title":
+            return {"image": self.create_title_image(section["title"]), "duration": duration}
+        
+        if section["frame"] is None:
+            canvas = np.empty((self.video_height, self.video_width, 3), dtype=np.float32)
+            canvas[...] = self.bg_color
+        else:
+            canvas = np.asarray(section["frame"], dtype=np.float32) * section["darken"]
+        canvas_size = (canvas.shape[1], canvas.shape[0])
+        
+        if section["box"]:
+            box_size = (int(self.video_width * 0.9), int(self.video_height * section["box"]))
+            box = np.zeros((box_size[1], box_size[0], 3), dtype=np.uint8)
+            blit(canvas, box, center_position(canvas_size, box_size), opacity=0.5)
+        
+        try:
+            text_image = self._render_text(section["text"], **self._text_args(section["fontsize"]))
+            position = center_position(canvas_size, (text_image.shape[1], text_image.shape[0]))
+        except Exception as e:
+            logger.error(f"Error creating text clip: {e}")
+            # Same fallback as create_text_clip: a black square at the top left corner
+            text_image = np.zeros((100, 100, 3), dtype=np.uint8)
+            position = (0, 0)
+        blit(canvas, text_image, position)
+        
+        image = fit_frame(canvas.astype(np.uint8), self.video_width, self.video_height)
+        return {"image": image, "duration": duration}
+    
+    def _intro_animation_layers(self, duration: float) -> Dict[str, Any]:
+        """
+        Pre-render the intro animation for the FFmpeg backend.
+        
+        The title fades in over the background and the subtitle is a separate
+        layer that fades in after 0.5 seconds, as in create_intro_animation.
+        
+        Args:
+            duration: Duration of the intro in seconds
+            
+        Returns:
+            Dict[str, Any]: Section for FilterGraphRenderer
+        """
+        canvas = np.empty((self.video_height, self.video_width, 3), dtype=np.float32)
+        canvas[...] = self.bg_color
+        background = canvas.astype(np.uint8)
+        canvas_size = (self.video_width, self.video_height)
+        
+        try:
+            (title_text, title_args), (subtitle_text, subtitle_args) = self._intro_texts()
+            title_image = self._render_text(title_text, **title_args)
+            subtitle_image = self._render_text(subtitle_text, **subtitle_args)
+        except Exception as e:
+            logger.error(f"Error creating intro animation: {e}")
+            # Same fallback as create_intro_animation: the background only
+            return {"image": background, "duration": duration}
+        
+        blit(canvas, title_image, center_position(canvas_size, (title_image.shape[1], title_image.shape[0])))
+        
+        overlay = np.zeros((self.video_height, self.video_width, 4), dtype=np.uint8)
+        x = center_position(canvas_size, (subtitle_image.shape[1], subtitle_image.shape[0]))[0]
+        y = self.video_height // 2 + 80
+        height = max(0, min(subtitle_image.shape[0], self.video_height - y))
+        left, right = max(0, x), min(self.video_width, x + subtitle_image.shape[1])
+        subtitle = subtitle_image[:height, left - x:right - x]
+        overlay[y:y + height, left:right, :subtitle.shape[2]] = subtitle
+        if subtitle.shape[2] == 3:
+            overlay[y:y + height, left:right, 3] = 255
+        
+        return {
+            "image": canvas.astype(np.uint8),
+            "duration": duration,
+            "fade_in": 1.0,
+            "fade_color": self.bg_color,
+            "overlay": overlay,
+            "overlay_start": 0.5,
+            "overlay_fade": 0.5
+        }
+    
+    def _segment_key(self, section: Dict[str, Any], frames: int, renderer: FilterGraphRenderer) -> str:
+        """
+        Compute the segment cache key of a section.
+        
+        The key covers everything that changes the encoded segment: the text,
+        the background frame (hash of its pixels), the number of frames, the
+        style (colors, fonts, sizes) and the codec settings.
+        
+        Args:
+            section: Section planned by _plan_sections
+            frames: Number of frames of the section
+            renderer: Renderer that encodes the segment
+            
+        Returns:
+            str: Cache key
+        """
+        params = {name: value for name, value in section.items() if name not in ("frame", "duration")}
+        if section.get("frame") is not None:
+            frame = np.ascontiguousarray(section["frame"])
+            params["frame"] = f"{frame.shape}|{hashlib.sha1(frame).hexdigest()}"
+        
+        if section["kind"] == "intro_animation":
+            text_style = [(text, self._text_signature(text_args)) for text, text_args in self._intro_texts()]
+        elif section["kind"] == "title":
+            text_style = self._font_signature(os.path.join(self.resources_dir, "fonts", "Roboto-Bold.ttf"))
+        else:
+            text_style = self._text_signature(self._text_args(section["fontsize"]))
+        
+        return SegmentCache.make_key(
+            "segment", section=params, frames=frames, text_style=text_style,
+            bg_color=self.bg_color, text_color=self.text_color, highlight_color=self.highlight_color,
+            width=self.video_width, height=self.video_height, codec=renderer.video_codec_args()
+        )
+    
+    def _render_sections(self, sections: List[Dict[str, Any]], output_path: str,
+                         audio_path: Optional[str] = None) -> Optional[str]:
+        """
+        Render planned sections with the FFmpeg backends.
+        
+        With the segment cache, only sections whose inputs changed since a
+        previous render are composited and encoded; the other segments are
+        reused from disk before the concat.
+        
+        Args:
+            sections: Sections planned by _plan_sections
+            output_path: Path to save the video
+            audio_path: Path to the audio (optional)
+            
+        Returns:
+            Optional[str]: Path to the generated video, or None if failed
+        """
+        renderer = FilterGraphRenderer(self.video_width, self.video_height, self.fps)
+        if self.render_backend == "ffmpeg":
+            return renderer.render([self._section_layers(section) for section in sections], output_path, audio_path)
+        if not self.segment_cache:
+            return renderer.render_segments([self._section_layers(section) for section in sections],
+                                            output_path, audio_path, self.render_workers)
+        
+        segment_paths = []
+        missing = []
+        counts = renderer.frame_counts([section["duration"] for section in sections])
+        for section, frames in zip(sections, counts):
+            if frames == 0:
+                continue
+            key = self._segment_key(section, frames, renderer)
+            path = self.segment_cache.get(key)
+            if path is None:
+                missing.append((len(segment_paths), key, section, frames))
+            segment_paths.append(path)
+        
+        logger.info(f"Reusing {len(segment_paths) - len(missing)} of {len(segment_paths)} cached segments")
+        if missing:
+            # Encode next to the cache, so the segments are moved into it without copying
+            with tempfile.TemporaryDirectory(dir=self.segment_cache.cache_dir) as temp_dir:
+                encoded = renderer.encode_segments([self._section_layers(section) for _, _, section, _ in missing],
+                                                   [frames for _, _, _, frames in missing],
+                                                   temp_dir, self.render_workers)
+                if encoded is None:
+                    return None
+                for (index, key, _, _), path in zip(missing, encoded):
+                    segment_paths[index] = self.segment_cache.put(key, path)
+        
+        result = renderer.join_segments(segment_paths, output_path, audio_path)
+        self.segment_cache.evict()
+        return result
+
     def generate_video_from_script(self, script_path: str, audio_path: Optional[str] = None, 
                                   output_path: Optional[str] = None) -> Optional[str]:
         """
@@ -303,13 +846,10 @@ class VideoGenerator:
             
             # Parse the script
             parsed_script = self.text_processor.parse_script(script_content)
-            intro_text = parsed_script['intro']
-            news_items = parsed_script['news']
-            outro_text = parsed_script['outro']
             
             # Find reference videos
             reference_videos = []
-            for filename in os.listdir(self.reference_dir):
+            for filename in sorted(os.listdir(self.reference_dir)):
                 if filename.lower().endswith(('.mp4', '.avi', '.mov', '.mkv')):
                     reference_videos.append(os.path.join(self.reference_dir, filename))
             
@@ -317,6 +857,9 @@ class VideoGenerator:
                 logger.error("No reference videos found.")
                 return None
             
+            # Decode the reference frames once; each section then picks one from memory
+            self.prepare_reference_frames(reference_videos)
+            
             # Estimated total duration (will be adjusted based on audio)
             total_duration = 180  # 3 minutes by default
             
@@ -326,141 +869,18 @@ class VideoGenerator:
                 total_duration = audio.duration
                 audio.close()
             
-            # Duration of each section
-            intro_animation_duration = 3.0  # Fixed duration for the intro animation
-            intro_duration = total_duration * 0.1
-            news_duration = total_duration * 0.8 / max(1, len(news_items))
-            outro_duration = total_duration * 0.1
-            
-            # Create clips for each section
-            clips = []
+            # Plan the sections of the timeline (frames are picked once for both backends)
+            sections = self._plan_sections(parsed_script, reference_videos, total_duration)
             
-            # Add intro animation
-            intro_animation = self.create_intro_animation(duration=intro_animation_duration)
-            clips.append(intro_animation)
+            if self.render_backend != "moviepy":
+                logger.info(f"Generating video with FFmpeg ({self.render_backend}): {output_path}")
+                result = self._render_sections(sections, output_path, audio_path)
+                if result:
+                    logger.info(f"Video generated successfully: {output_path}")
+                return result
             
-            # Create intro clip with script content
-            if intro_text:
-                intro_frame = self.extract_frame_from_video(random.choice(reference_videos))
-                intro_clip = mp.ImageClip(intro_frame).set_duration(intro_duration)
-                
-                # Add intro text
-                intro_text_clip = self.create_text_clip(
-                    intro_text,
-                    intro_duration,
-                    position=('center', 'center'),
-                    fontsize=70
-                )
-                
-                intro_clip = CompositeVideoClip([intro_clip, intro_text_clip])
-                intro_clip = intro_clip.crossfadein(0.5)  # Add fade in
-                clips.append(intro_clip)
-            
-            # Create clips for each news item
-            for i, news in enumerate(news_items):
-                # Extract title and content
-                title = news['title']
-                content = news['content']
-                
-                # Create title image with news number
-                numbered_title = f"{i+1}. {title}"
-                title_image = self.create_title_image(numbered_title)
-                title_clip = mp.ImageClip(title_image).set_duration(news_duration * 0.3)
-                
-                # Add fade in transition for the title
-                title_clip = title_clip.crossfadein(0.5)
-                
-                # Extract a frame from the reference video for the content
-                # Try to use a different frame for each news item
-                if len(reference_videos) > i:
-                    video_for_content = reference_videos[i]
-                else:
-                    video_for_content = random.choice(reference_videos)
-                
-                content_frame = self.extract_frame_from_video(video_for_content)
-                
-                # Apply a darkening effect to the frame to improve text readability
-                darkened_frame = content_frame * 0.7  # Reduce brightness to 70%
-                content_clip = mp.ImageClip(darkened_frame).set_duration(news_duration * 0.7)
-                
-                # Add content text with improved style
-                content_text_clip = self.create_text_clip(
-                    content,
-                    news_duration * 0.7,
-                    position=('center', 'center'),
-                    fontsize=60
-                )
-                
-                # Add a semi-transparent rectangle behind the text to improve readability
-                text_bg = ColorClip(
-                    size=(self.video_width * 0.9, self.video_height * 0.4),
-                    color=(0, 0, 0, 0.5),  # Black with 50% transparency
-                    duration=news_duration * 0.7
-                ).set_position('center')
-                
-                # Combine the elements
-                content_clip = CompositeVideoClip([content_clip, text_bg, content_text_clip])
-                
-                # Add transition between title and content
-                content_clip = content_clip.crossfadein(0.5)
-                
-                # Add the clips
-                clips.append(title_clip)
-                clips.append(content_clip)
-            
-            # Create outro clip
-            if outro_text:
-                outro_frame = self.extract_frame_from_video(random.choice(reference_videos))
-                
-                # Apply a darkening effect to the frame
-                darkened_outro_frame = outro_frame * 0.7
-                outro_clip = mp.ImageClip(darkened_outro_frame).set_duration(outro_duration)
-                
-                # Add outro text
-                outro_text_clip = self.create_text_clip(
-                    outro_text,
-                    outro_duration,
-                    position=('center', 'center'),
-                    fontsize=70
-                )
-                
-                # Add a semi-transparent rectangle behind the text
-                outro_bg = ColorClip(
-                    size=(self.video_width * 0.9, self.video_height * 0.3),
-                    color=(0, 0, 0, 0.5),
-                    duration=outro_duration
-                ).set_position('center')
-                
-                outro_clip = CompositeVideoClip([outro_clip, outro_bg, outro_text_clip])
-                
-                # Add fade in transition
-                outro_clip = outro_clip.crossfadein(0.5)
-                
-                clips.append(outro_clip)
-            
-            # Add a final screen with credits
-            credits_duration = 3.0
-            credits_clip = ColorClip(
-                size=(self.video_width, self.video_height),
-                color=self.bg_color,
-                duration=credits_duration
-            )
-            
-            # Add credits text
-            credits_text = "Gerado por Clone IA\nRapidinha no Cripto\n\n© " + datetime.now().strftime("%Y")
-            credits_text_clip = self.create_text_clip(
-                credits_text,
-                credits_duration,
-                position=('center', 'center'),
-                fontsize=50
-            )
-            
-            credits_clip = CompositeVideoClip([credits_clip, credits_text_clip])
-            
-            # Add fade in transition
-            credits_clip = credits_clip.crossfadein(0.5)
-            
-            clips.append(credits_clip)
+            # Create clips for each section
+            clips = [self._section_clip(section) for section in sections]
             
             # Concatenate all clips
             final_clip = mp.concatenate_videoclips(clips)
@@ -471,7 +891,8 @@ class VideoGenerator:
                 final_clip = final_clip.set_audio(audio)
             
             # Set final resolution
-            final_clip = final_clip.resize(height=self.video_height, width=self.video_width)
+            if tuple(final_clip.size) != (self.video_width, self.video_height):
+                final_clip = final_clip.resize(height=self.video_height, width=self.video_width)
             
             # Save the video
             logger.info(f"Generating video: {output_path}")
@@ -523,6 +944,31 @@ class VideoGenerator:
                 filename = get_timestamp_filename("simple_video", "mp4")
                 output_path = os.path.join(self.output_dir, filename)
             
+            if self.render_backend != "moviepy":
+                # The whole video is a single section: the text over the background
+                duration = 60  # Default duration
+                if audio_path and os.path.exists(audio_path):
+                    audio = mp.AudioFileClip(audio_path)
+                    duration = audio.duration
+                    audio.close()
+                else:
+                    audio_path = None
+                
+                section = {
+                    "kind": "text",
+                    "duration": duration,
+                    "frame": None,
+                    "darken": 1.0,
+                    "box": None,
+                    "text": script_content,
+                    "fontsize": 60
+                }
+                logger.info(f"Generating simple video with FFmpeg ({self.render_backend}): {output_path}")
+                result = self._render_sections([section], output_path, audio_path)
+                if result:
+                    logger.info(f"Simple video generated successfully: {output_path}")
+                return result
+            
             # Create a background clip
             bg_clip = ColorClip(
                 size=(self.video_width, self.video_height),
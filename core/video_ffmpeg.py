@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+FFmpeg filtergraph render backend for video generation.
+
+The MoviePy path composites every frame in Python (nested CompositeVideoClips,
+darkening and overlays evaluated per frame) before piping raw frames to the
+encoder. Every section of the "Rapidinha no Cripto" timeline is a static
+picture, though, so this backend composites each section once with NumPy,
+writes it as a PNG and lets a single ffmpeg invocation loop the pictures,
+apply the fades, concatenate the sections and encode the result together with
+the audio.
+
+A single encoder only keeps part of the cores busy. In segmented mode every
+section is encoded by its own ffmpeg process (in a process pool) with the same
+codec parameters, and the segments are joined with the concat demuxer without
+re-encoding the video.
+
+A section is described by a dict with:
+
+- "image": RGB picture of the section (height, width, 3) as uint8
+- "duration": Duration in seconds
+- "fade_in": Fade in from "fade_color" at the start, in seconds (optional)
+- "fade_color": RGB color the section fades in from (optional, black)
+- "overlay": RGBA picture (height, width, 4) drawn over the image (optional)
+- "overlay_start": Time the overlay appears, in seconds (optional)
+- "overlay_fade": Duration of the overlay fade in, in seconds (optional)
+"""
+import os
+import math
+import logging
+import tempfile
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger('cloneia.video_ffmpeg')
+
+# FFmpeg binary used to render the videos
+FFMPEG_BINARY = "ffmpeg"
+
+
+def fit_frame(image: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Resize a picture to the video size (only if it has a different size).
+
+    Args:
+        image: Picture as uint8
+        width: Width of the video
+        height: Height of the video
+
+    Returns:
+        np.ndarray: Picture of shape (height, width, channels)
+    """
+    if image.shape[1] == width and image.shape[0] == height:
+        return image
+    return np.array(Image.fromarray(image).resize((width, height), Image.LANCZOS))
+
+
+def center_position(canvas_size: Tuple[int, int], image_size: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Get the position that centers an image on a canvas (as MoviePy does).
+
+    Args:
+        canvas_size: (width, height) of the canvas
+        image_size: (width, height) of the image
+
+    Returns:
+        Tuple[int, int]: (x, y) of the top left corner of the image
+    """
+    return int((canvas_size[0] - image_size[0]) / 2), int((canvas_size[1] - image_size[1]) / 2)
+
+
+def blit(canvas: np.ndarray, image: np.ndarray, position: Tuple[int, int], opacity: float = 1.0) -> None:
+    """
+    Draw an image over a canvas in place, using its alpha channel if it has one.
+
+    Parts of the image that fall outside the canvas are cropped.
+
+    Args:
+        canvas: Float canvas (height, width, 3)
+        image: RGB or RGBA image as uint8
+        position: (x, y) of the top left corner of the image on the canvas
+        opacity: Opacity multiplied into the alpha channel
+    """
+    x, y = position
+    height, width = image.shape[:2]
+    left, top = max(0, x), max(0, y)
+    right, bottom = min(canvas.shape[1], x + width), min(canvas.shape[0], y + height)
+    if right <= left or bottom <= top:
+        return
+
+    crop = image[top - y:bottom - y, left - x:right - x]
+    region = canvas[top:bottom, left:right]
+    color = crop[:, :, :3].astype(np.float32)
+
+    if crop.shape[2] == 4:
+        alpha = crop[:, :, 3:4].astype(np.float32) / 255 * opacity
+    else:
+        alpha = np.float32(opacity)
+    region[...] = alpha * color + (1 - alpha) * region
+
+
+class FilterGraphRenderer:
+    """
+    Renders a timeline of static sections with a single ffmpeg filter_complex,
+    or as segments encoded in parallel and joined without re-encoding.
+    """
+
+    def __init__(self, width: int, height: int, fps: int, video_codec: str = 'libx264',
+                 audio_codec: str = 'aac', preset: str = 'medium'):
+        """
+        Initialize the renderer.
+
+        Args:
+            width: Width of the video
+            height: Height of the video
+            fps: Frames per second
+            video_codec: Video codec
+            audio_codec: Audio codec
+            preset: Encoder preset
+        """
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.video_codec = video_codec
+        self.audio_codec = audio_codec
+        self.preset = preset
+
+    def frame_counts(self, durations: Sequence[float]) -> List[int]:
+        """
+        Get the number of frames of each section.
+
+        Frames are sampled at n / fps over the whole timeline, as MoviePy does
+        when writing concatenated clips, so the sections stay in sync with the
+        audio however their durations round.
+
+        Args:
+            durations: Duration of each section in seconds
+
+        Returns:
+            List[int]: Number of frames of each section
+        """
+        counts = []
+        start = 0.0
+        first_frame = 0
+        for duration in durations:
+            end = start + duration
+            last_frame = math.ceil(round(end * self.fps, 6))
+            counts.append(max(0, last_frame - first_frame))
+            start, first_frame = end, last_frame
+        return counts
+
+    def video_codec_args(self) -> List[str]:
+        """
+        Get the video encoder arguments of the output.
+
+        Returns:
+            List[str]: FFmpeg output arguments
+        """
+        return ['-c:v', self.video_codec, '-preset', self.preset, '-pix_fmt', 'yuv420p', '-r', str(self.fps)]
+
+    def audio_codec_args(self) -> List[str]:
+        """
+        Get the audio encoder arguments of the output.
+
+        Returns:
+            List[str]: FFmpeg output arguments
+        """
+        return ['-c:a', self.audio_codec, '-ar', '44100']
+
+    def section_filters(self, section: Dict[str, Any], frames: int, first_input: int,
+                        has_overlay: bool, label: str) -> List[str]:
+        """
+        Build the filter chains that produce the frames of one section.
+
+        Args:
+            section: Section of the timeline (see the module docstring)
+            frames: Number of frames of the section
+            first_input: Index of the ffmpeg input with the section image (the
+                overlay, if any, is the next input)
+            has_overlay: Whether the section has an overlay input
+            label: Label of the output pad
+
+        Returns:
+            List[str]: Filter chains for the filter_complex
+        """
+        # Decode the picture once and repeat it for exactly the frames of the section
+        loop = f"loop=loop={frames - 1}:size=1:start=0,settb=1/{self.fps},setpts=N"
+
+        chain = f"[{first_input}:v]format=yuv420p,{loop},setsar=1"
+        fade_in = section.get("fade_in", 0.0)
+        if fade_in:
+            color = '0x' + ''.join(f"{c:02X}" for c in section.get("fade_color", (0, 0, 0)))
+            chain += f",fade=t=in:st=0:d={fade_in:.6f}:color={color}"
+
+        if not has_overlay:
+            return [f"{chain}[{label}]"]
+
+        overlay_fade = max(section.get("overlay_fade", 0.0), 1 / self.fps)
+        overlay = (f"[{first_input + 1}:v]format=yuva420p,{loop},"
+                   f"fade=t=in:st={section.get('overlay_start', 0.0):.6f}:d={overlay_fade:.6f}:alpha=1")
+        return [
+            f"{chain}[{label}_base]",
+            f"{overlay}[{label}_over]",
+            f"[{label}_base][{label}_over]overlay=format=yuv420[{label}]",
+        ]
+
+    def build_command(self, sections: List[Dict[str, Any]], image_paths: List[Tuple[str, Optional[str]]],
+                      output_path: str, audio_path: Optional[str] = None) -> List[str]:
+        """
+        Build the ffmpeg command that renders the sections.
+
+        Args:
+            sections: Sections of the timeline (see the module docstring)
+            image_paths: (image, overlay) PNG paths of each section (overlay may be None)
+            output_path: Path to save the video
+            audio_path: Path to the audio (optional)
+
+        Returns:
+            List[str]: FFmpeg command
+        """
+        inputs = []
+        filters = []
+        labels = []
+        counts = self.frame_counts([section["duration"] for section in sections])
+
+        for i, (section, (image_path, overlay_path), frames) in enumerate(zip(sections, image_paths, counts)):
+            if frames == 0:
+                continue
+
+            filters += self.section_filters(section, frames, len(inputs) // 2, bool(overlay_path), f"s{i}")
+            inputs += ['-i', image_path]
+            if overlay_path:
+                inputs += ['-i', overlay_path]
+            labels.append(f"[s{i}]")
+
+        filters.append(f"{''.join(labels)}concat=n={len(labels)}:v=1:a=0[v]")
+
+        cmd = [FFMPEG_BINARY, '-y'] + inputs
+        maps = ['-map', '[v]']
+        if audio_path:
+            cmd += ['-i', audio_path]
+            maps += ['-map', f"{len(inputs) // 2}:a"]
+
+        return (cmd + ['-filter_complex', ';'.join(filters)] + maps
+                + self.video_codec_args() + self.audio_codec_args() + [output_path])
+
+    def build_segment_command(self, section: Dict[str, Any], frames: int, image_path: str,
+                              overlay_path: Optional[str], output_path: str) -> List[str]:
+        """
+        Build the ffmpeg command that encodes one section on its own (video only).
+
+        Every segment is encoded with the same codec arguments as a full
+        render, so the segments can be joined without re-encoding.
+
+        Args:
+            section: Section of the timeline (see the module docstring)
+            frames: Number of frames of the section
+            image_path: PNG with the section image
+            overlay_path: PNG with the section overlay (optional)
+            output_path: Path to save the segment
+
+        Returns:
+            List[str]: FFmpeg command
+        """
+        inputs = ['-i', image_path]
+        if overlay_path:
+            inputs += ['-i', overlay_path]
+        filters = self.section_filters(section, frames, 0, bool(overlay_path), "v")
+
+        return ([FFMPEG_BINARY, '-y'] + inputs + ['-filter_complex', ';'.join(filters), '-map', '[v]', '-an']
+                + self.video_codec_args() + [output_path])
+
+    def write_images(self, section: Dict[str, Any], directory: str, name: str) -> Tuple[str, Optional[str]]:
+        """
+        Write the pictures of a section as PNGs.
+
+        Args:
+            section: Section of the timeline (see the module docstring)
+            directory: Directory where the PNGs are written
+            name: Base name of the files
+
+        Returns:
+            Tuple[str, Optional[str]]: Paths of the image and of the overlay (None if there is none)
+        """
+        image_path = os.path.join(directory, f"{name}.png")
+        Image.fromarray(fit_frame(section["image"], self.width, self.height)).save(image_path, compress_level=1)
+
+        overlay_path = None
+        if section.get("overlay") is not None:
+            overlay_path = os.path.join(directory, f"{name}_overlay.png")
+            Image.fromarray(fit_frame(section["overlay"], self.width, self.height)).save(
+                overlay_path, compress_level=1)
+
+        return image_path, overlay_path
+
+    def render(self, sections: List[Dict[str, Any]], output_path: str,
+               audio_path: Optional[str] = None) -> Optional[str]:
+        """
+        Render the sections into a video.
+
+        Args:
+            sections: Sections of the timeline (see the module docstring)
+            output_path: Path to save the video
+            audio_path: Path to the audio (optional)
+
+        Returns:
+            Optional[str]: Path to the generated video, or None if failed
+        """
+        with tempfile.TemporaryDirectory(prefix="cloneia_render_") as temp_dir:
+            image_paths = [self.write_images(section, temp_dir, f"section_{i:03d}")
+                           for i, section in enumerate(sections)]
+
+            cmd = self.build_command(sections, image_paths, output_path, audio_path)
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True)
+            except FileNotFoundError:
+                logger.error(f"FFmpeg not found: {FFMPEG_BINARY}")
+                return None
+
+        if result.returncode != 0:
+            logger.error(f"Error rendering video with FFmpeg: {result.stderr[-2000:]}")
+            return None
+
+        return output_path
+
+    def render_segments(self, sections: List[Dict[str, Any]], output_path: str,
+                        audio_path: Optional[str] = None, workers: Optional[int] = None) -> Optional[str]:
+        """
+        Render the sections as separate segments in parallel and join them.
+
+        Each section is encoded by its own ffmpeg process, up to `workers` at
+        a time, so the encoders use all cores. The segments are then joined
+        with the concat demuxer without re-encoding the video, and the audio
+        is added in the same step.
+
+        Args:
+            sections: Sections of the timeline (see the module docstring)
+            output_path: Path to save the video
+            audio_path: Path to the audio (optional)
+            workers: Number of sections encoded at the same time (if None, the number of CPUs)
+
+        Returns:
+            Optional[str]: Path to the generated video, or None if failed
+        """
+        counts = self.frame_counts([section["duration"] for section in sections])
+        pending = [(section, frames) for section, frames in zip(sections, counts) if frames > 0]
+
+        with tempfile.TemporaryDirectory(prefix="cloneia_segments_") as temp_dir:
+            segment_paths = self.encode_segments([section for section, _ in pending],
+                                                 [frames for _, frames in pending], temp_dir, workers)
+            if segment_paths is None:
+                return None
+            return self.join_segments(segment_paths, output_path, audio_path)
+
+    def encode_segments(self, sections: List[Dict[str, Any]], frame_counts: List[int], directory: str,
+                        workers: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Encode sections as separate video segments in a process pool.
+
+        Args:
+            sections: Sections of the timeline (see the module docstring)
+            frame_counts: Number of frames of each section (see frame_counts)
+            directory: Directory where the segments are written
+            workers: Number of sections encoded at the same time (if None, the number of CPUs)
+
+        Returns:
+            Optional[List[str]]: Paths of the segments, in order, or None if any of them failed
+        """
+        if not sections:
+            return []
+
+        workers = max(1, workers or os.cpu_count() or 1)
+        tasks = [(FFMPEG_BINARY, self, section, frames, directory, f"segment_{i:03d}")
+                 for i, (section, frames) in enumerate(zip(sections, frame_counts))]
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_encode_segment, tasks))
+
+        errors = [error for _, error in results if error]
+        if errors:
+            logger.error(f"Error rendering video segment with FFmpeg: {errors[0]}")
+            return None
+
+        return [path for path, _ in results]
+
+    def join_segments(self, segment_paths: List[str], output_path: str,
+                      audio_path: Optional[str] = None) -> Optional[str]:
+        """
+        Join encoded segments with the concat demuxer, without re-encoding the video.
+
+        Args:
+            segment_paths: Paths of the segments, in order
+            output_path: Path to save the video
+            audio_path: Path to the audio (optional)
+
+        Returns:
+            Optional[str]: Path to the generated video, or None if failed
+        """
+        list_path = f"{output_path}.concat.txt"
+        try:
+            with open(list_path, 'w') as f:
+                for path in segment_paths:
+                    f.write(f"file '{os.path.abspath(path)}'\n")
+
+            cmd = [FFMPEG_BINARY, '-y', '-f', 'concat', '-safe', '0', '-i', list_path]
+            maps = ['-map', '0:v']
+            audio_args = []
+            if audio_path:
+                cmd += ['-i', audio_path]
+                maps += ['-map', '1:a']
+                audio_args = self.audio_codec_args()
+
+            result = subprocess.run(cmd + maps + ['-c:v', 'copy'] + audio_args + [output_path],
+                                    capture_output=True, text=True)
+            if result.returncode != 0:
+                logger.error(f"Error joining video segments: {result.stderr[-2000:]}")
+                return None
+            return output_path
+
+        except FileNotFoundError:
+            logger.error(f"FFmpeg not found: {FFMPEG_BINARY}")
+            return None
+
+        finally:
+            if os.path.exists(list_path):
+                os.remove(list_path)
+
+
+def _encode_segment(task: Tuple[str, FilterGraphRenderer, Dict[str, Any], int, str, str]) -> Tuple[str, Optional[str]]:
+    """
+    Encode one section (runs in a worker process).
+
+    Args:
+        task: (FFmpeg binary, renderer, section, number of frames, directory, segment name)
+
+    Returns:
+        Tuple[str, Optional[str]]: Path of the segment and the error message (None if it succeeded)
+    """
+    ffmpeg_binary, renderer, section, frames, directory, name = task
+
+    image_path, overlay_path = renderer.write_images(section, directory, name)
+    segment_path = os.path.join(directory, f"{name}.mp4")
+    cmd = renderer.build_segment_command(section, frames, image_path, overlay_path, segment_path)
+    # Use the binary configured in the parent process (a spawned worker does not share its module state)
+    cmd[0] = ffmpeg_binary
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        return segment_path, f"FFmpeg not found: {ffmpeg_binary}"
+
+    if result.returncode != 0:
+        return segment_path, result.stderr[-2000:]
+    return segment_path, None
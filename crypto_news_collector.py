@@ -3,12 +3,13 @@ Módulo para coletar notícias reais sobre criptomoedas de diversas APIs.
 """
 import os
 import json
-import requests
 from datetime import datetime
 import time
 import random
 from dotenv import load_dotenv
 
+from core import cliente_http
+
 # Carregar variáveis de ambiente
 load_dotenv()
 
@@ -48,7 +49,7 @@ class CryptoNewsCollector:
             url += f"&api_key={self.cryptocompare_api_key}"
         
         try:
-            response = requests.get(url)
+            response = cliente_http.get(url)
             response.raise_for_status()
             data = response.json()
             
@@ -83,7 +84,7 @@ class CryptoNewsCollector:
         url = f"https://newsapi.org/v2/everything?q=bitcoin OR cryptocurrency OR blockchain&language=pt&sortBy=publishedAt&apiKey={self.newsapi_key}"
         
         try:
-            response = requests.get(url)
+            response = cliente_http.get(url)
             response.raise_for_status()
             data = response.json()
             
@@ -114,7 +115,7 @@ class CryptoNewsCollector:
         url = "https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page=10&page=1"
         
         try:
-            response = requests.get(url)
+            response = cliente_http.get(url)
             response.raise_for_status()
             data = response.json()
             
@@ -9,6 +9,8 @@ import requests
 from typing import Optional
 from datetime import datetime
 
+from core import cliente_http
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -190,7 +192,7 @@ class ReelVideoGenerator:
             }
 
             logger.info("Gerando áudio otimizado para reels...")
-            response = requests.post(url, headers=headers, json=data)
+            response = cliente_http.post(url, headers=headers, json=data)
             response.raise_for_status()
 
             # Salvar o áudio
@@ -256,7 +258,7 @@ class ReelVideoGenerator:
 
             with open(audio_path, 'rb') as f:
                 files = {'file': f}
-                response = requests.post(upload_url, headers=headers, files=files)
+                response = cliente_http.post(upload_url, headers=headers, files=files)
                 response.raise_for_status()
 
             upload_data = response.json()
@@ -305,7 +307,7 @@ class ReelVideoGenerator:
 
             logger.debug(f"Dados da requisição: {json.dumps(video_data, indent=2)}")
 
-            response = requests.post(video_url, headers=headers, json=video_data)
+            response = cliente_http.post(video_url, headers=headers, json=video_data)
             logger.debug(f"Status code: {response.status_code}")
             logger.debug(f"Resposta: {json.dumps(response.json(), indent=2)}")
 
@@ -328,7 +330,7 @@ class ReelVideoGenerator:
             max_attempts = 60  # 5 minutos (5 segundos por tentativa)
 
             for attempt in range(max_attempts):
-                response = requests.get(f"{status_url}?video_id={video_id}", headers=headers)
+                response = cliente_http.get(f"{status_url}?video_id={video_id}", headers=headers)
                 response.raise_for_status()
 
                 status_data = response.json()
@@ -347,7 +349,7 @@ class ReelVideoGenerator:
                     logger.info(f"Vídeo pronto! Baixando de {video_url}...")
 
                     # Baixar o vídeo
-                    response = requests.get(video_url)
+                    response = cliente_http.get(video_url)
                     response.raise_for_status()
 
                     with open(output_path, 'wb') as f:
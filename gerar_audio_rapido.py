@@ -7,6 +7,7 @@ import argparse
 import logging
 from core.audio import AudioGenerator
 from core.utils import ensure_directory, get_timestamp_filename, OUTPUT_DIR
+from core.text_optimizer import get_optimizer
 
 # Configurar logging
 logging.basicConfig(
@@ -20,42 +21,7 @@ def optimize_text_for_speed(text):
     Otimiza o texto para reduzir espaços entre palavras e aumentar a velocidade,
     preservando melhor as características da voz original.
     """
-    # Processar hífens que foram adicionados para juntar palavras
-    text = text.replace("-", " ")
-
-    # Remover espaços extras
-    text = ' '.join(text.split())
-
-    # Substituir espaços por espaços reduzidos em certas frases
-    text = text.replace("E aí cambada", "EAÍCAMBADA")
-    text = text.replace("Fala cambada", "FALACAMBADA")
-    text = text.replace("Eaí cambada", "EAÍCAMBADA")
-
-    # Reduzir pontuação que causa pausas (mas não remover completamente)
-    for char in [',', ';']:
-        text = text.replace(char, '')
-
-    # Manter alguns sinais de pontuação para preservar a entonação natural
-    # mas reduzir a quantidade para diminuir as pausas
-    text = text.replace("...", ".")
-    text = text.replace("!!", "!")
-    text = text.replace("??", "?")
-
-    # Substituir termos para melhor pronúncia (apenas os mais importantes)
-    replacements = {
-        "Bitcoin": "Bitcoim",
-        "Ethereum": "Etherium",
-        "NFT": "ÊnÊfeTê",
-        "DeFi": "DêFai"
-    }
-
-    for original, replacement in replacements.items():
-        text = text.replace(original, replacement)
-
-    # Adicionar marcadores de velocidade (25% mais rápido)
-    text = "<prosody rate='1.25'>" + text + "</prosody>"
-
-    return text
+    return get_optimizer("fast").optimize(text)
 
 def generate_audio(script_path: str, output_path: str = None, profile_name: str = "flukakuia",
                 validate: bool = True, force: bool = False):
@@ -8,6 +8,8 @@ import logging
 import argparse
 from datetime import datetime
 
+from core import cliente_http
+
 # Carregar variáveis de ambiente do arquivo .env
 try:
     from dotenv import load_dotenv
@@ -78,7 +80,6 @@ def gerar_audio(script_path, dry_run=False):
         import elevenlabs
         import os
         import json
-        import requests
 
         # Verificar API key
         api_key = os.environ.get("ELEVENLABS_API_KEY")
@@ -122,7 +123,7 @@ def gerar_audio(script_path, dry_run=False):
             "voice_settings": voice_settings
         }
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = cliente_http.post(url, json=payload, headers=headers)
 
         if response.status_code != 200:
             logger.error(f"Erro ao gerar áudio: {response.text}")
@@ -169,11 +170,6 @@ def gerar_video(audio_path, dry_run=False):
         return video_path
 
     try:
-        # Importar bibliotecas necessárias
-        import requests
-        import json
-        import time
-
         # Obter credenciais do gerenciador de contas ou do ambiente
         if account_manager:
             api_key, avatar_id = account_manager.get_heygen_account()
@@ -196,183 +192,28 @@ def gerar_video(audio_path, dry_run=False):
         logger.info(f"Usando API key do HeyGen: {api_key[:10]}...")
         logger.info(f"Usando avatar ID: {avatar_id}")
 
-        # Configurar headers
-        headers = {
-            "Content-Type": "application/json",
-            "X-Api-Key": api_key
-        }
-
-        # Criar vídeo
-        url = "https://api.heygen.com/v2/video/generate"
-
-        payload = {
-            "dimension": {
-                "width": 720,
-                "height": 1280
-            },
-            "video_inputs": [
-                {
-                    "character": {
-                        "type": "avatar",
-                        "avatar_id": avatar_id,
-                        "avatar_style": "normal"
-                    },
-                    "voice": {
-                        "type": "audio"
-                    },
-                    "background": {
-                        "type": "color",
-                        "value": "#000000"
-                    }
-                }
-            ]
-        }
-
-        # Ler o arquivo de áudio
-        with open(audio_path, 'rb') as audio_file:
-            audio_data = audio_file.read()
-
-        # Fazer upload do áudio para o endpoint de upload
-        upload_url = "https://upload.heygen.com/v1/asset"
-
-        # Configurar headers para upload
-        upload_headers = {
-            "Content-Type": "audio/mpeg",
-            "X-Api-Key": api_key
-        }
-
-        # Salvar o áudio em um arquivo temporário
-        temp_audio_path = os.path.join("output", "audio", "temp_audio.mp3")
-        with open(temp_audio_path, "wb") as f:
-            f.write(audio_data)
-
-        # Enviar o áudio como um arquivo
-        with open(temp_audio_path, "rb") as f:
-            upload_response = requests.post(
-                upload_url,
-                headers=upload_headers,
-                data=f.read()
-            )
-
-        # Remover o arquivo temporário
-        if os.path.exists(temp_audio_path):
-            os.remove(temp_audio_path)
-
-        if upload_response.status_code != 200:
-            logger.error(f"Erro ao fazer upload do áudio: {upload_response.text}")
-            return None
-
-        # Obter o ID do áudio
-        audio_asset_id = upload_response.json().get("data", {}).get("id")
-
-        if not audio_asset_id:
-            logger.error("ID do áudio não encontrado na resposta.")
-            return None
-
-        # Atualizar o payload com o ID do áudio
-        payload["video_inputs"][0]["voice"]["audio_asset_id"] = audio_asset_id
-
-        # Enviar a requisição para gerar o vídeo
-        logger.info(f"Enviando requisição para gerar vídeo: {url}")
-        logger.info(f"Payload: {payload}")
+        # Enviar o áudio, criar o vídeo e baixá-lo pelo gerenciador de jobs
+        # (reaproveita o asset de um áudio idêntico e consulta o status com backoff)
+        from core.heygen_api import ClienteHeyGen
+        from core.jobs_heygen import GerenciadorJobsHeyGen, CONCLUIDO
 
-        response = requests.post(
-            url,
-            headers=headers,
-            json=payload
-        )
-
-        logger.info(f"Resposta: {response.status_code} - {response.text}")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        video_path = os.path.join("output", "videos", f"rapidinha_video_{timestamp}.mp4")
 
-        if response.status_code != 200:
-            logger.error(f"Erro ao criar vídeo: {response.text}")
-            return None
+        manager = GerenciadorJobsHeyGen(ClienteHeyGen(api_key, avatar_id))
+        try:
+            manager.submeter(audio_path, video_path)
+            manager.aguardar(tempo_maximo=30 * 60, saidas=[video_path])  # 30 minutos
+            job = manager.job(video_path)
+        finally:
+            manager.fechar()
 
-        # Obter ID do vídeo
-        video_id = response.json().get("data", {}).get("video_id")
-        if not video_id:
-            logger.error("ID do vídeo não encontrado na resposta.")
+        if job["status"] != CONCLUIDO:
+            logger.error(f"Falha ao gerar vídeo: {job['erro'] or 'tempo limite excedido'}")
             return None
 
-        # Verificar status do vídeo
-        url_status = f"https://api.heygen.com/v1/video_status.get?video_id={video_id}"
-        logger.info(f"Verificando status do vídeo: {url_status}")
-
-        max_attempts = 30  # Reduzir para 30 tentativas
-        attempts = 0
-        wait_time = 60  # Aguardar 60 segundos entre as verificações
-
-        while attempts < max_attempts:
-            attempts += 1
-            logger.info(f"Tentativa {attempts}/{max_attempts}")
-
-            try:
-                response = requests.get(url_status, headers=headers)
-                logger.info(f"Resposta: {response.status_code} - {response.text}")
-
-                if response.status_code != 200:
-                    logger.error(f"Erro ao verificar status do vídeo: {response.text}")
-                    return None
-
-                status = response.json().get("data", {}).get("status")
-                logger.info(f"Status do vídeo: {status}")
-            except Exception as e:
-                logger.error(f"Erro ao verificar status do vídeo: {e}")
-                return None
-
-            if status == "completed":
-                # Obter URL do vídeo
-                video_url = response.json().get("data", {}).get("video_url")
-
-                if not video_url:
-                    logger.error("URL do vídeo não encontrada na resposta.")
-                    return None
-
-                # Baixar vídeo
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                video_path = os.path.join("output", "videos", f"rapidinha_video_{timestamp}.mp4")
-
-                try:
-                    # Usar curl para baixar o vídeo
-                    import subprocess
-                    logger.info(f"Baixando vídeo: {video_url}")
-                    logger.info(f"Salvando em: {video_path}")
-
-                    # Escapar a URL para o shell
-                    escaped_url = video_url.replace('"', '\\"')
-
-                    # Executar o comando curl
-                    cmd = f'curl -o "{video_path}" "{escaped_url}"'
-                    subprocess.run(cmd, shell=True, check=True)
-
-                    logger.info(f"Vídeo gerado com sucesso: {video_path}")
-                    return video_path
-                except Exception as e:
-                    logger.error(f"Erro ao baixar vídeo: {e}")
-
-                    # Tentar método alternativo com requests
-                    try:
-                        logger.info("Tentando método alternativo para baixar o vídeo...")
-                        response = requests.get(video_url)
-
-                        with open(video_path, "wb") as f:
-                            f.write(response.content)
-
-                        logger.info(f"Vídeo gerado com sucesso: {video_path}")
-                        return video_path
-                    except Exception as e2:
-                        logger.error(f"Erro ao baixar vídeo (método alternativo): {e2}")
-                        return None
-
-            elif status == "failed":
-                logger.error("Falha ao gerar vídeo.")
-                return None
-
-            # Aguardar antes de verificar novamente
-            time.sleep(wait_time)
-
-        logger.error("Tempo limite excedido ao aguardar a geração do vídeo.")
-        return None
+        logger.info(f"Vídeo gerado com sucesso: {video_path}")
+        return video_path
 
     except Exception as e:
         logger.error(f"Erro ao gerar vídeo: {e}")
@@ -407,6 +248,54 @@ def abrir_arquivo(file_path):
     except Exception as e:
         logger.error(f"Erro ao abrir arquivo: {e}")
 
+def gerar_reels_por_secoes(args):
+    """
+    Gera o Reels processando as seções do script em paralelo.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        int: Código de saída
+    """
+    from core.pipeline_secoes import criar_pipeline
+
+    with open(args.script, 'r', encoding='utf-8') as f:
+        script = f.read()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    diretorio = os.path.join("output", "videos", "simulacao" if args.dry_run else "")
+    try:
+        contas = [args.conta] if getattr(args, 'conta', None) else None
+        pipeline = criar_pipeline(simulado=args.dry_run, account_manager=account_manager, contas=contas,
+                                  max_workers=args.paralelo)
+    except ValueError as e:
+        logger.error(f"Erro ao configurar a geração dos vídeos: {e}")
+        return 1
+
+    try:
+        resultado = pipeline.processar_script(script, diretorio, prefixo=f"reels_{timestamp}")
+    finally:
+        pipeline.fechar()
+    for secao in resultado["secoes"]:
+        if secao["status"] != "concluido":
+            logger.error(f"Falha na seção {secao['indice']}: {secao['erro']}")
+
+    if not resultado["video_final"]:
+        logger.error("Falha ao montar o vídeo final")
+        return 1
+
+    logger.info("Reels gerado com sucesso!")
+    logger.info(f"Script: {args.script}")
+    logger.info(f"Vídeo: {resultado['video_final']}")
+
+    if args.dry_run:
+        logger.info("NOTA: Este foi um teste em modo de simulação. Nenhum recurso de API foi consumido.")
+    elif not args.no_abrir:
+        abrir_arquivo(resultado["video_final"])
+
+    return 0
+
 def main():
     """
     Função principal.
@@ -426,6 +315,9 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Simular operações sem fazer chamadas de API")
     parser.add_argument("--no-abrir", action="store_true", help="Não abrir os arquivos gerados")
     parser.add_argument("--debug", action="store_true", help="Ativar modo de depuração")
+    parser.add_argument("--secoes", action="store_true",
+                        help="Gerar as seções do script (marcadores de corte) em paralelo e montar o vídeo final")
+    parser.add_argument("--paralelo", type=int, default=4, help="Número máximo de seções geradas ao mesmo tempo")
 
     args = parser.parse_args()
 
@@ -467,6 +359,9 @@ def main():
     # Criar diretórios necessários
     criar_diretorios()
 
+    if args.secoes:
+        return gerar_reels_por_secoes(args)
+
     # Gerar áudio
     audio_path = gerar_audio(args.script, args.dry_run)
     if not audio_path:
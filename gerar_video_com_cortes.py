@@ -7,7 +7,6 @@ import sys
 import logging
 import argparse
 import glob
-from datetime import datetime
 
 # Configurar logging
 logging.basicConfig(
@@ -32,6 +31,8 @@ except ImportError:
     logger.warning("Módulo account_manager não encontrado. Usando configurações padrão.")
     account_manager = None
 
+from core.pipeline_secoes import criar_pipeline
+
 def criar_diretorios():
     """
     Cria os diretórios necessários para o funcionamento do script.
@@ -46,232 +47,40 @@ def criar_diretorios():
             os.makedirs(diretorio)
             logger.info(f"Diretório criado: {diretorio}")
 
-def gerar_video_para_secao(audio_path, dry_run=False):
+def numero_secao(audio_path):
     """
-    Gera um vídeo para uma seção de áudio.
+    Extrai o número da seção do nome de um arquivo de áudio.
 
     Args:
-        audio_path: Caminho para o arquivo de áudio
-        dry_run: Se True, simula a geração sem fazer chamadas de API
+        audio_path: Caminho no formato rapidinha_secao_N_YYYYMMDD_HHMMSS.mp3
 
     Returns:
-        str: Caminho para o vídeo gerado, ou None em caso de erro
+        int: Número da seção (0 se o nome não seguir o formato)
     """
-    if dry_run:
-        # Simular geração de vídeo
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        video_path = os.path.join("output", "videos", f"rapidinha_video_secao_{timestamp}.mp4")
-        logger.info(f"[SIMULAÇÃO] Vídeo gerado: {video_path}")
-        return video_path
-
-    try:
-        # Importar bibliotecas necessárias
-        import requests
-        import json
-        import time
-
-        # Obter credenciais do gerenciador de contas ou do ambiente
-        if account_manager:
-            api_key, avatar_id = account_manager.get_heygen_account()
-            active_account = account_manager.get_active_heygen_account_id()
-            logger.info(f"Usando conta HeyGen: {active_account}")
-        else:
-            # Verificar API key
-            api_key = os.environ.get("HEYGEN_API_KEY")
-            if not api_key:
-                logger.error("API key do HeyGen não encontrada.")
-                return None
-
-            # ID do avatar padrão do Flukaku
-            avatar_id = "431f819b1a8e42bb8f095e98e1e805a4"
-
-        logger.info(f"Usando API key do HeyGen: {api_key[:10]}...")
-        logger.info(f"Usando avatar ID: {avatar_id}")
-
-        # Configurar headers
-        headers = {
-            "Content-Type": "application/json",
-            "X-Api-Key": api_key
-        }
-
-        # Criar vídeo
-        url = "https://api.heygen.com/v2/video/generate"
-
-        payload = {
-            "dimension": {
-                "width": 720,
-                "height": 1280
-            },
-            "video_inputs": [
-                {
-                    "character": {
-                        "type": "avatar",
-                        "avatar_id": avatar_id,
-                        "avatar_style": "normal"
-                    },
-                    "voice": {
-                        "type": "audio"
-                    },
-                    "background": {
-                        "type": "color",
-                        "value": "#000000"
-                    }
-                }
-            ]
-        }
-
-        # Ler o arquivo de áudio
-        with open(audio_path, 'rb') as audio_file:
-            audio_data = audio_file.read()
-
-        # Fazer upload do áudio para o endpoint de upload
-        upload_url = "https://upload.heygen.com/v1/asset"
-
-        # Configurar headers para upload
-        upload_headers = {
-            "Content-Type": "audio/mpeg",
-            "X-Api-Key": api_key
-        }
-
-        # Salvar o áudio em um arquivo temporário
-        temp_audio_path = os.path.join("output", "audio", "temp_audio.mp3")
-        with open(temp_audio_path, "wb") as f:
-            f.write(audio_data)
-
-        # Enviar o áudio como um arquivo
-        with open(temp_audio_path, "rb") as f:
-            upload_response = requests.post(
-                upload_url,
-                headers=upload_headers,
-                data=f.read()
-            )
-
-        # Remover o arquivo temporário
-        if os.path.exists(temp_audio_path):
-            os.remove(temp_audio_path)
-
-        if upload_response.status_code != 200:
-            logger.error(f"Erro ao fazer upload do áudio: {upload_response.text}")
-            return None
-
-        # Obter o ID do áudio
-        audio_asset_id = upload_response.json().get("data", {}).get("id")
-
-        if not audio_asset_id:
-            logger.error("ID do áudio não encontrado na resposta.")
-            return None
-
-        # Atualizar o payload com o ID do áudio
-        payload["video_inputs"][0]["voice"]["audio_asset_id"] = audio_asset_id
-
-        # Enviar a requisição para gerar o vídeo
-        logger.info(f"Enviando requisição para gerar vídeo: {url}")
-        logger.info(f"Payload: {payload}")
-
-        response = requests.post(
-            url,
-            headers=headers,
-            json=payload
-        )
-
-        logger.info(f"Resposta: {response.status_code} - {response.text}")
-
-        if response.status_code != 200:
-            logger.error(f"Erro ao criar vídeo: {response.text}")
-            return None
-
-        # Obter ID do vídeo
-        video_id = response.json().get("data", {}).get("video_id")
-        if not video_id:
-            logger.error("ID do vídeo não encontrado na resposta.")
-            return None
-
-        # Verificar status do vídeo
-        url_status = f"https://api.heygen.com/v1/video_status.get?video_id={video_id}"
-        logger.info(f"Verificando status do vídeo: {url_status}")
-
-        max_attempts = 30  # 30 tentativas
-        attempts = 0
-        wait_time = 60  # Aguardar 60 segundos entre as verificações
-
-        while attempts < max_attempts:
-            attempts += 1
-            logger.info(f"Tentativa {attempts}/{max_attempts}")
-
-            try:
-                response = requests.get(url_status, headers=headers)
-                logger.info(f"Resposta: {response.status_code} - {response.text}")
-
-                if response.status_code != 200:
-                    logger.error(f"Erro ao verificar status do vídeo: {response.text}")
-                    return None
-
-                status = response.json().get("data", {}).get("status")
-                logger.info(f"Status do vídeo: {status}")
-            except Exception as e:
-                logger.error(f"Erro ao verificar status do vídeo: {e}")
-                return None
-
-            if status == "completed":
-                # Obter URL do vídeo
-                video_url = response.json().get("data", {}).get("video_url")
-
-                if not video_url:
-                    logger.error("URL do vídeo não encontrada na resposta.")
-                    return None
-
-                # Extrair o número da seção do nome do arquivo de áudio
-                secao = os.path.basename(audio_path).split("_")[2]
-
-                # Baixar vídeo
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                video_path = os.path.join("output", "videos", f"rapidinha_video_secao_{secao}_{timestamp}.mp4")
-
-                try:
-                    # Usar curl para baixar o vídeo
-                    import subprocess
-                    logger.info(f"Baixando vídeo: {video_url}")
-                    logger.info(f"Salvando em: {video_path}")
-
-                    # Escapar a URL para o shell
-                    escaped_url = video_url.replace('"', '\\"')
-
-                    # Executar o comando curl
-                    cmd = f'curl -o "{video_path}" "{escaped_url}"'
-                    subprocess.run(cmd, shell=True, check=True)
-
-                    logger.info(f"Vídeo gerado com sucesso: {video_path}")
-                    return video_path
-                except Exception as e:
-                    logger.error(f"Erro ao baixar vídeo: {e}")
-
-                    # Tentar método alternativo com requests
-                    try:
-                        logger.info("Tentando método alternativo para baixar o vídeo...")
-                        response = requests.get(video_url)
+    partes = os.path.basename(audio_path).split("_")
+    return int(partes[2]) if len(partes) > 2 and partes[2].isdigit() else 0
 
-                        with open(video_path, "wb") as f:
-                            f.write(response.content)
-
-                        logger.info(f"Vídeo gerado com sucesso: {video_path}")
-                        return video_path
-                    except Exception as e2:
-                        logger.error(f"Erro ao baixar vídeo (método alternativo): {e2}")
-                        return None
-
-            elif status == "failed":
-                logger.error("Falha ao gerar vídeo.")
-                return None
+def gerar_videos_secoes(audio_files, timestamp, dry_run=False, contas=None, max_workers=4):
+    """
+    Gera os vídeos das seções em paralelo e monta o vídeo final.
 
-            # Aguardar antes de verificar novamente
-            time.sleep(wait_time)
-
-        logger.error("Tempo limite excedido ao aguardar a geração do vídeo.")
-        return None
+    Args:
+        audio_files: Caminhos dos arquivos de áudio das seções, na ordem do script
+        timestamp: Timestamp usado nos nomes dos vídeos
+        dry_run: Se True, usa serviços simulados sem fazer chamadas de API
+        contas: IDs das contas HeyGen a usar (se None, usa todas as contas configuradas)
+        max_workers: Número máximo de seções processadas ao mesmo tempo
 
-    except Exception as e:
-        logger.error(f"Erro ao gerar vídeo: {e}")
-        return None
+    Returns:
+        Dict: Resultado de cada seção e caminho do vídeo final
+    """
+    diretorio = os.path.join("output", "videos", "simulacao" if dry_run else "")
+    pipeline = criar_pipeline(simulado=dry_run, account_manager=account_manager, contas=contas,
+                              max_workers=max_workers)
+    try:
+        return pipeline.processar_audios(audio_files, diretorio, prefixo=f"rapidinha_video_{timestamp}")
+    finally:
+        pipeline.fechar()
 
 def abrir_arquivo(file_path):
     """
@@ -312,6 +121,7 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Simular operações sem fazer chamadas de API")
     parser.add_argument("--no-abrir", action="store_true", help="Não abrir os arquivos gerados")
     parser.add_argument("--debug", action="store_true", help="Ativar modo de depuração")
+    parser.add_argument("--paralelo", type=int, default=4, help="Número máximo de seções geradas ao mesmo tempo")
 
     # Argumentos para gerenciamento de contas
     if account_manager:
@@ -319,6 +129,7 @@ def main():
                            help="Conta HeyGen a ser utilizada")
         parser.add_argument("--listar-contas", action="store_true",
                            help="Listar contas HeyGen disponíveis")
+        parser.add_argument("--contas", help="Contas HeyGen usadas em paralelo, separadas por vírgula (padrão: todas)")
 
     args = parser.parse_args()
 
@@ -392,19 +203,35 @@ def main():
         logger.error("Nenhum arquivo de áudio encontrado.")
         return 1
 
+    # Ordenar pelo número da seção, que define a ordem de montagem (secao_10 vem depois de secao_2)
+    audio_files.sort(key=numero_secao)
+
     logger.info(f"Encontrados {len(audio_files)} arquivos de áudio:")
     for audio_file in audio_files:
         logger.info(f"  - {audio_file}")
 
-    # Gerar vídeo para cada seção
+    # Gerar os vídeos das seções em paralelo
+    # Sem --contas, as seções são distribuídas entre todas as contas configuradas (ou só a de --conta)
+    if getattr(args, 'contas', None):
+        contas = args.contas.split(",")
+    else:
+        contas = [args.conta] if getattr(args, 'conta', None) else None
+    try:
+        resultado = gerar_videos_secoes(audio_files, args.timestamp or latest_timestamp, args.dry_run,
+                                        contas, args.paralelo)
+    except ValueError as e:
+        logger.error(f"Erro ao configurar a geração dos vídeos: {e}")
+        return 1
+
     video_files = []
-    for audio_file in audio_files:
-        logger.info(f"Gerando vídeo para {audio_file}...")
-        video_path = gerar_video_para_secao(audio_file, args.dry_run)
-        if video_path:
-            video_files.append(video_path)
+    for secao in resultado["secoes"]:
+        if secao["video"]:
+            video_files.append(secao["video"])
         else:
-            logger.error(f"Falha ao gerar vídeo para {audio_file}")
+            logger.error(f"Falha ao gerar vídeo para {secao['audio']}: {secao['erro']}")
+
+    if resultado["video_final"]:
+        logger.info(f"Vídeo final montado: {resultado['video_final']}")
 
     # Exibir resultado
     if video_files:
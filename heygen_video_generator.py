@@ -9,6 +9,12 @@ import requests
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
+from core import cliente_http
+from core.heygen_api import (
+    HEYGEN_UPLOAD_URL, ClienteHeyGen, ClienteHeyGenSimulado, RegistroAssets, enviar_asset, vincular_copia
+)
+from core.jobs_heygen import GerenciadorJobsHeyGen, CONCLUIDO
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,7 +43,10 @@ class HeyGenVideoGenerator:
         # URLs base da API
         self.api_base_url = "https://api.heygen.com/v1"
         self.api_base_url_v2 = "https://api.heygen.com/v2"
-        self.upload_base_url = "https://upload.heygen.com/v1"
+        self.upload_host = HEYGEN_UPLOAD_URL
+
+        # Registro dos assets já enviados, para não reenviar arquivos idênticos
+        self.asset_registry = RegistroAssets()
 
         # Diretório para armazenar os vídeos gerados
         self.videos_dir = os.path.join(os.getcwd(), "output", "videos")
@@ -135,7 +144,7 @@ class HeyGenVideoGenerator:
                 "Content-Type": "application/json"
             }
 
-            response = requests.get(url, headers=headers)
+            response = cliente_http.get(url, headers=headers)
             response.raise_for_status()
 
             result = response.json()
@@ -207,28 +216,9 @@ class HeyGenVideoGenerator:
             # Fazer upload do vídeo
             logger.info(f"Fazendo upload do vídeo {video_path}...")
 
-            # Configurar cabeçalhos para upload
-            upload_url = f"{self.upload_base_url}/asset"
-            upload_headers = {
-                "X-Api-Key": self.api_key,
-                "Content-Type": content_type
-            }
-
-            # Fazer upload do vídeo diretamente
-            with open(video_path, 'rb') as f:
-                video_data = f.read()
-
-            upload_response = requests.post(upload_url, headers=upload_headers, data=video_data)
-            upload_response.raise_for_status()
-
-            # Processar a resposta
-            upload_result = upload_response.json()
-            asset_id = upload_result.get("data", {}).get("id")
-
-            if not asset_id:
-                logger.error("Falha ao fazer upload do vídeo. Nenhum ID de asset retornado.")
-                logger.error(f"Resposta: {upload_result}")
-                return None
+            # Fazer upload do vídeo direto do disco (reaproveita o asset de um vídeo idêntico)
+            asset_id = enviar_asset(video_path, self.api_key, content_type, registro=self.asset_registry,
+                                    upload_url=self.upload_host)
 
             logger.info(f"Vídeo enviado com sucesso. Asset ID: {asset_id}")
 
@@ -246,7 +236,7 @@ class HeyGenVideoGenerator:
                 "avatar_type": "talking_photo"  # ou "digital_human" dependendo do tipo desejado
             }
 
-            avatar_response = requests.post(avatar_url, headers=avatar_headers, json=avatar_data)
+            avatar_response = cliente_http.post(avatar_url, headers=avatar_headers, json=avatar_data)
             avatar_response.raise_for_status()
 
             avatar_result = avatar_response.json()
@@ -371,28 +361,9 @@ class HeyGenVideoGenerator:
                 # Fazer upload do áudio
                 logger.info(f"Fazendo upload do áudio {audio_path}...")
 
-                # Configurar cabeçalhos para upload
-                upload_url = f"{self.upload_base_url}/asset"
-                upload_headers = {
-                    "X-Api-Key": self.api_key,
-                    "Content-Type": "audio/mpeg"
-                }
-
-                # Fazer upload do áudio diretamente
-                with open(audio_path, 'rb') as f:
-                    audio_data = f.read()
-
-                upload_response = requests.post(upload_url, headers=upload_headers, data=audio_data)
-                upload_response.raise_for_status()
-
-                # Processar a resposta
-                upload_result = upload_response.json()
-                audio_asset_id = upload_result.get("data", {}).get("id")
-
-                if not audio_asset_id:
-                    logger.error("Falha ao fazer upload do áudio. Nenhum ID de asset retornado.")
-                    logger.error(f"Resposta: {upload_result}")
-                    return None
+                # Fazer upload do áudio direto do disco (reaproveita o asset de um áudio idêntico)
+                audio_asset_id = enviar_asset(audio_path, self.api_key, "audio/mpeg",
+                                              registro=self.asset_registry, upload_url=self.upload_host)
 
                 logger.info(f"Áudio enviado com sucesso. Asset ID: {audio_asset_id}")
 
@@ -414,7 +385,7 @@ class HeyGenVideoGenerator:
             logger.debug(f"Dados da requisição: {json.dumps(video_data, indent=2)}")
 
             # Fazer a requisição para criar o vídeo
-            video_response = requests.post(video_url, headers=headers, json=video_data)
+            video_response = cliente_http.post(video_url, headers=headers, json=video_data)
 
             if video_response.status_code != 200:
                 logger.error(f"Erro: {video_response.status_code}")
@@ -434,59 +405,31 @@ class HeyGenVideoGenerator:
                 logger.error(f"Resposta completa: {video_result}")
                 return None
 
-            # Verificar o status do vídeo e baixá-lo quando estiver pronto
+            # Acompanhar a renderização e baixar o vídeo com o gerenciador de jobs
             logger.info(f"Vídeo em processamento (ID: {video_id}). Aguardando conclusão...")
 
-            status_url = f"{self.api_base_url}/video_status.get?video_id={video_id}"
-            max_attempts = 60  # 5 minutos (5 segundos por tentativa)
-
-            for attempt in range(max_attempts):
-                status_response = requests.get(status_url, headers=headers)
-                status_response.raise_for_status()
-
-                status_result = status_response.json()
-                status = status_result.get("data", {}).get("status")
-
-                if status == "completed":
-                    # Vídeo pronto, baixar
-                    video_url = status_result.get("data", {}).get("video_url")
-
-                    if video_url:
-                        try:
-                            logger.info(f"Vídeo pronto! Baixando de {video_url}...")
-                            video_content_response = requests.get(video_url)
-                            video_content_response.raise_for_status()
-
-                            with open(output_path, 'wb') as f:
-                                f.write(video_content_response.content)
-
-                            logger.info(f"Vídeo salvo em {output_path}")
-
-                            # Salvar uma cópia do vídeo com o ID para referência
-                            video_id_path = os.path.join(os.path.dirname(output_path), f"heygen_{video_id}.mp4")
-                            with open(video_id_path, 'wb') as f:
-                                f.write(video_content_response.content)
-
-                            logger.info(f"Cópia do vídeo salva em {video_id_path}")
+            cliente = ClienteHeyGen(self.api_key, avatar_id, registro_assets=self.asset_registry)
+            manager = GerenciadorJobsHeyGen(cliente, arquivo=":memory:")
+            try:
+                manager.acompanhar(video_id, output_path)
+                manager.aguardar(tempo_maximo=300, saidas=[output_path])  # 5 minutos
+                job = manager.job(output_path)
+            finally:
+                manager.fechar()
+
+            if job["status"] != CONCLUIDO:
+                logger.error(f"Falha ao processar o vídeo: {job['erro'] or 'tempo limite excedido'}")
+                return None
 
-                            return output_path
-                        except Exception as e:
-                            logger.error(f"Erro ao baixar o vídeo: {e}")
-                            return None
-                    else:
-                        logger.error("URL do vídeo não encontrada na resposta.")
-                        return None
+            logger.info(f"Vídeo salvo em {output_path}")
 
-                elif status == "failed":
-                    logger.error("Falha ao processar o vídeo.")
-                    return None
+            # Salvar uma cópia do vídeo com o ID para referência (hardlink, sem regravar)
+            video_id_path = os.path.join(os.path.dirname(output_path), f"heygen_{video_id}.mp4")
+            vincular_copia(output_path, video_id_path)
 
-                # Aguardar 5 segundos antes de verificar novamente
-                logger.info(f"Status do vídeo: {status}. Verificando novamente em 5 segundos...")
-                time.sleep(5)
+            logger.info(f"Cópia do vídeo salva em {video_id_path}")
 
-            logger.error("Tempo limite excedido ao aguardar o processamento do vídeo.")
-            return None
+            return output_path
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Erro na requisição à API: {e}")
@@ -497,6 +440,57 @@ class HeyGenVideoGenerator:
             logger.error(f"Erro ao gerar vídeo: {e}")
             return None
 
+    def generate_videos(self, audio_paths: List[str], output_dir: Optional[str] = None,
+                        avatar_id: Optional[str] = None, timeout: Optional[float] = None,
+                        dry_run: bool = False) -> List[Optional[str]]:
+        """
+        Gera vários vídeos em paralelo, um para cada áudio.
+
+        Os jobs ficam registrados em cache/jobs_heygen.db; uma nova chamada com os
+        mesmos áudios retoma os jobs pendentes em vez de enviá-los de novo.
+
+        Args:
+            audio_paths: Caminhos dos arquivos de áudio
+            output_dir: Diretório dos vídeos (se None, usa output/videos)
+            avatar_id: ID do avatar a ser usado (se None, usa o avatar configurado)
+            timeout: Tempo máximo de espera em segundos (se None, espera todos os vídeos)
+            dry_run: Se True, usa um cliente simulado sem fazer chamadas de API
+
+        Returns:
+            List[Optional[str]]: Caminho de cada vídeo gerado (None para os que falharam
+                ou não terminaram), na ordem dos áudios
+        """
+        if dry_run:
+            cliente = ClienteHeyGenSimulado()
+            manager = GerenciadorJobsHeyGen(cliente, arquivo=":memory:", intervalo_inicial=0.0)
+        else:
+            if not self.api_key:
+                logger.error("API key do HeyGen não configurada. Não é possível gerar vídeos.")
+                return [None] * len(audio_paths)
+            cliente = ClienteHeyGen(self.api_key, avatar_id or self.avatar_id or "Daisy-inshirt-20220818")
+            manager = GerenciadorJobsHeyGen(cliente, arquivo=os.path.join("cache", "jobs_heygen.db"))
+
+        output_dir = output_dir or self.videos_dir
+        output_paths = [
+            os.path.join(output_dir, f"{os.path.splitext(os.path.basename(audio_path))[0]}.mp4")
+            for audio_path in audio_paths
+        ]
+
+        try:
+            manager.submeter_lote([{"audio": audio_path, "saida": output_path}
+                                   for audio_path, output_path in zip(audio_paths, output_paths)])
+            manager.aguardar(tempo_maximo=timeout, saidas=output_paths)
+
+            results = []
+            for output_path in output_paths:
+                job = manager.job(output_path)
+                results.append(job["saida"] if job and job["status"] == CONCLUIDO else None)
+        finally:
+            manager.fechar()
+
+        logger.info(f"{sum(1 for r in results if r)}/{len(results)} vídeos gerados")
+        return results
+
 
 def open_video_file(file_path: str) -> bool:
     """
@@ -541,6 +535,8 @@ if __name__ == "__main__":
     parser.add_argument("--generate", action="store_true", help="Gerar um vídeo com o avatar configurado")
     parser.add_argument("--script", help="Texto do script para o vídeo")
     parser.add_argument("--audio", help="Caminho para o arquivo de áudio")
+    parser.add_argument("--audios", nargs="+", metavar="AUDIO_PATH",
+                        help="Gerar um vídeo para cada áudio, em paralelo")
     parser.add_argument("--avatar-id", help="ID do avatar a ser usado (opcional)")
     parser.add_argument("--voice-id", help="ID da voz a ser usada (opcional)")
     parser.add_argument("--play", action="store_true", help="Reproduzir o vídeo gerado")
@@ -556,6 +552,11 @@ if __name__ == "__main__":
     elif args.create_avatar:
         generator.create_avatar_from_video(args.create_avatar, args.avatar_name, dry_run=args.dry_run)
 
+    elif args.audios:
+        video_paths = generator.generate_videos(args.audios, avatar_id=args.avatar_id, dry_run=args.dry_run)
+        for audio_path, video_path in zip(args.audios, video_paths):
+            logger.info(f"{audio_path} -> {video_path or 'falhou'}")
+
     elif args.generate:
         if not args.script and not args.audio:
             logger.error("Erro: Você deve fornecer um script ou um arquivo de áudio.")
@@ -8,11 +8,12 @@ import sys
 import json
 import time
 import logging
-import requests
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
+from core import cliente_http
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -144,7 +145,7 @@ class InstagramPublisher:
                 "access_token": self.access_token
             }
 
-            response = requests.get(url, params=params)
+            response = cliente_http.get(url, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -205,7 +206,7 @@ class InstagramPublisher:
                 "code": code
             }
 
-            response = requests.get(url, params=params)
+            response = cliente_http.get(url, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -244,7 +245,7 @@ class InstagramPublisher:
                 "fb_exchange_token": self.access_token
             }
 
-            response = requests.get(url, params=params)
+            response = cliente_http.get(url, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -281,7 +282,7 @@ class InstagramPublisher:
                 "access_token": self.access_token
             }
 
-            response = requests.get(url, params=params)
+            response = cliente_http.get(url, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -334,7 +335,7 @@ class InstagramPublisher:
 
             # Obter URL para upload do vídeo
             logger.info("Solicitando URL para upload do vídeo...")
-            response = requests.post(url, data=params)
+            response = cliente_http.post(url, data=params)
 
             if response.status_code != 200:
                 logger.error(f"Erro ao iniciar container de mídia: {response.status_code} - {response.text}")
@@ -357,7 +358,7 @@ class InstagramPublisher:
             # Fazer upload do vídeo para a URL fornecida
             logger.info(f"Fazendo upload do vídeo para {upload_url}...")
             with open(video_path, 'rb') as video_file:
-                upload_response = requests.post(upload_url, files={"file": video_file})
+                upload_response = cliente_http.post(upload_url, files={"file": video_file})
 
             if upload_response.status_code not in [200, 201]:
                 logger.error(f"Erro ao fazer upload do vídeo: {upload_response.status_code} - {upload_response.text}")
@@ -396,7 +397,7 @@ class InstagramPublisher:
                     "access_token": self.access_token
                 }
 
-                response = requests.get(url, params=params)
+                response = cliente_http.get(url, params=params)
 
                 if response.status_code != 200:
                     logger.error(f"Erro ao verificar status do container: {response.status_code} - {response.text}")
@@ -428,7 +429,7 @@ class InstagramPublisher:
             }
 
             logger.info("Publicando mídia no Instagram...")
-            response = requests.post(url, data=params)
+            response = cliente_http.post(url, data=params)
 
             if response.status_code != 200:
                 logger.error(f"Erro ao publicar mídia: {response.status_code} - {response.text}")
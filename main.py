@@ -14,7 +14,7 @@ from core.utils import (
 )
 from core.text import TextProcessor
 from core.audio import AudioGenerator
-from core.video import VideoGenerator
+from core.video import VideoGenerator, RENDER_BACKENDS, DEFAULT_RENDER_BACKEND
 
 # Configure logging
 logging.basicConfig(
@@ -32,13 +32,15 @@ class CloneIA:
     Main class for the CloneIA project.
     """
 
-    def __init__(self, api_key: Optional[str] = None, voice_profile: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, voice_profile: Optional[str] = None,
+                 render_backend: str = DEFAULT_RENDER_BACKEND):
         """
         Initialize the CloneIA.
 
         Args:
             api_key: ElevenLabs API key (if None, will try to load from environment)
             voice_profile: Name of the voice profile to use (if None, will use default)
+            render_backend: How the video timeline is rendered ("moviepy", "ffmpeg" or "segmented")
         """
         # API key
         self.api_key = api_key or load_api_key()
@@ -56,7 +58,7 @@ class CloneIA:
         # Components
         self.text_processor = TextProcessor()
         self.audio_generator = AudioGenerator(self.api_key, voice_profile)
-        self.video_generator = VideoGenerator()
+        self.video_generator = VideoGenerator(render_backend=render_backend)
 
         logger.info("CloneIA initialized")
 
@@ -288,11 +290,13 @@ def main():
     parser.add_argument("--avatar", help="ID of the avatar to use for HeyGen")
     parser.add_argument("--folder", default="augment", help="Name of the folder in HeyGen to save the video")
     parser.add_argument("--open", action="store_true", help="Open the generated audio file")
+    parser.add_argument("--render-backend", choices=RENDER_BACKENDS, default=DEFAULT_RENDER_BACKEND,
+                        help="How the video is rendered (segmented reuses sections that did not change)")
 
     args = parser.parse_args()
 
     # Create the CloneIA instance
-    clone = CloneIA(voice_profile=args.profile)
+    clone = CloneIA(voice_profile=args.profile, render_backend=args.render_backend)
 
     # Get the text content
     text = args.text
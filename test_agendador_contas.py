@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Testes do agendador de renderizações entre as contas do HeyGen.
+"""
+import threading
+
+import pytest
+import requests
+
+from core.agendador_contas import AgendadorContas, EstadoConta, ContaIndisponivelError, e_limitacao
+from core.heygen_api import ClienteHeyGenSimulado
+from core.pipeline_secoes import PipelineSecoes, GeradorAudioSimulado, LimiteConta, juntar_arquivos
+from test_pipeline_secoes import SCRIPT
+
+
+def _erro_http(status):
+    resposta = requests.Response()
+    resposta.status_code = status
+    return requests.HTTPError(f"{status} Client Error", response=resposta)
+
+
+class _ClienteLimitado(ClienteHeyGenSimulado):
+    """Cliente simulado cuja conta responde 429 ao criar vídeos."""
+
+    def criar_video(self, audio_asset_id, dimensao=None, cor_fundo="#000000"):
+        self._registrar("criar_video")
+        raise _erro_http(429)
+
+
+class _AccountManagerFalso:
+    def list_heygen_accounts(self):
+        return {
+            "conta1": {"api_key": "chave1", "max_renderizacoes": 3},
+            "conta2": {"api_key": "chave2", "cota": 5},
+            "conta3": {"api_key": ""}
+        }
+
+
+def test_distribui_entre_contas_e_respeita_cota():
+    agendador = AgendadorContas({"a": EstadoConta(2), "b": EstadoConta(2, cota=1)})
+
+    reservadas = [agendador.reservar(timeout=0) for _ in range(3)]
+    assert sorted(reservadas) == ["a", "a", "b"]
+
+    with pytest.raises(ContaIndisponivelError):
+        agendador.reservar(timeout=0.01)
+
+    agendador.liberar("b")
+    agendador.liberar("a")
+    # A conta b esgotou a cota: o próximo job vai para a conta a
+    assert agendador.reservar(timeout=0) == "a"
+    assert agendador.resumo()["b"] == {"em_andamento": 0, "concluidos": 1, "cota": 0,
+                                       "falhas_recentes": 0, "em_espera": False}
+
+
+def test_conta_limitada_entra_em_espera_e_job_troca_de_conta():
+    agendador = AgendadorContas({"a": EstadoConta(1), "b": EstadoConta(1)}, espera_limitacao=60)
+    tentativas = []
+
+    def job(conta):
+        tentativas.append(conta)
+        if conta == tentativas[0]:
+            raise _erro_http(429)
+        return f"ok em {conta}"
+
+    resultado = agendador.executar(job)
+
+    assert len(tentativas) == 2 and tentativas[0] != tentativas[1]
+    assert resultado == f"ok em {tentativas[1]}"
+    resumo = agendador.resumo()
+    assert resumo[tentativas[0]]["em_espera"] and resumo[tentativas[0]]["falhas_recentes"] == 1
+    assert all(conta["em_andamento"] == 0 for conta in resumo.values())
+
+
+def test_erro_comum_nao_troca_de_conta():
+    agendador = AgendadorContas({"a": EstadoConta(1), "b": EstadoConta(1)})
+    chamadas = []
+
+    def job(conta):
+        chamadas.append(conta)
+        raise RuntimeError("áudio inválido")
+
+    with pytest.raises(RuntimeError):
+        agendador.executar(job)
+    assert len(chamadas) == 1
+
+
+def test_e_limitacao():
+    assert e_limitacao(_erro_http(429))
+    assert e_limitacao(RuntimeError("Insufficient credit"))
+    assert not e_limitacao(_erro_http(500))
+
+
+def test_de_account_manager_ignora_contas_sem_chave():
+    agendador = AgendadorContas.de_account_manager(_AccountManagerFalso())
+
+    assert sorted(agendador.contas) == ["conta1", "conta2"]
+    assert agendador.contas["conta1"].max_simultaneos == 3
+    assert agendador.contas["conta2"].cota == 5
+
+
+def test_pipeline_transfere_secoes_da_conta_limitada(tmp_path):
+    clientes = {"limitada": _ClienteLimitado(), "normal": ClienteHeyGenSimulado()}
+    limites = {conta: LimiteConta(max_renderizacoes=2, intervalo_minimo=0.0) for conta in clientes}
+    pipeline = PipelineSecoes(GeradorAudioSimulado(), clientes, limites, max_workers=4,
+                              intervalo_status=0.0, montador=juntar_arquivos)
+
+    resultado = pipeline.processar_script(SCRIPT, str(tmp_path))
+
+    assert [secao["status"] for secao in resultado["secoes"]] == ["concluido"] * 5
+    assert {secao["conta"] for secao in resultado["secoes"]} == {"normal"}
+    assert resultado["video_final"]
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Testes do armazém SQLite dos itens coletados pelos buscadores.
+"""
+import time
+
+import pytest
+
+from core.armazem_itens import ArmazemItens, filtrar_recentes
+from buscador_noticias_cripto import NoticiasCriptoScraper
+from test_tradutor import HTML_PORTAL
+
+
+def _noticia(link, data_iso, titulo="Bitcoin sobe"):
+    return {"titulo": titulo, "link": link, "data_iso": data_iso, "portal": "Portal A"}
+
+
+def test_upsert_e_busca_por_fonte_e_data(tmp_path):
+    armazem = ArmazemItens(str(tmp_path / "itens.db"))
+
+    novas = armazem.salvar("noticia", "Portal A", [
+        _noticia("a", "2025-05-10T10:00:00"),
+        _noticia("b", "2025-05-01T10:00:00"),
+        _noticia("c", None)
+    ])
+    assert novas == 3
+
+    # Reenviar um item existente atualiza os dados sem contá-lo como novo
+    novas = armazem.salvar("noticia", "Portal A", [_noticia("a", "2025-05-10T10:00:00", "Bitcoin dispara")])
+    assert novas == 0
+
+    recentes = armazem.buscar("noticia", fonte="Portal A", data_minima="2025-05-05T00:00:00")
+    assert sorted(n["link"] for n in recentes) == ["a", "c"]
+    assert [n["titulo"] for n in recentes if n["link"] == "a"] == ["Bitcoin dispara"]
+    assert armazem.buscar("noticia", fonte="Portal B") == []
+
+
+def test_filtrar_recentes_mantem_ordem():
+    itens = [
+        _noticia("a", "2025-05-01T10:00:00"),
+        _noticia("b", None),
+        _noticia("c", "2025-05-10T10:00:00"),
+        _noticia(None, "2025-05-09T10:00:00"),
+        _noticia(None, "2025-04-01T10:00:00")
+    ]
+
+    recentes = filtrar_recentes("noticia", itens, "2025-05-05T00:00:00")
+
+    assert [n["link"] for n in recentes] == ["b", "c", None]
+    assert recentes[2]["data_iso"] == "2025-05-09T10:00:00"
+
+
+def test_remove_itens_expirados(tmp_path):
+    armazem = ArmazemItens(str(tmp_path / "itens.db"), ttl_dias=1)
+    armazem.salvar("twitter", "bitcoin", [{"id": "1", "created_at": "2025-05-01T10:00:00"}])
+
+    # Simular um item visto há dois dias
+    armazem._conexao.execute("UPDATE itens SET visto_em = ?", (time.time() - 2 * 86400,))
+    armazem.salvar("twitter", "bitcoin", [{"id": "2", "created_at": "2025-05-02T10:00:00"}])
+
+    assert armazem.remover_expirados() == 1
+    assert [t["id"] for t in armazem.buscar("twitter")] == ["2"]
+
+
+def test_tipo_desconhecido(tmp_path):
+    with pytest.raises(ValueError):
+        ArmazemItens(str(tmp_path / "itens.db")).salvar("instagram", "x", [{"id": "1"}])
+
+
+def test_scraper_grava_no_armazem(tmp_path):
+    portal = {
+        "nome": "Portal Local",
+        "url": "https://example.com/",
+        "seletor_noticias": "article.noticia",
+        "seletor_titulo": "h2 a",
+        "seletor_link": "h2 a",
+        "seletor_data": "time.data",
+        "seletor_resumo": "p.resumo",
+        "formato_data": "%d/%m/%Y",
+        "idioma": "pt",
+        "confiabilidade": 8
+    }
+    scraper = NoticiasCriptoScraper(cache_dir=str(tmp_path), traduzir_automaticamente=False,
+                                    usar_cache_http=False)
+
+    noticias = scraper._processar_pagina(portal, HTML_PORTAL)
+
+    armazenadas = scraper.armazem.buscar("noticia", fonte="Portal Local")
+    assert sorted(n["link"] for n in armazenadas) == sorted(n["link"] for n in noticias)
+    assert len(noticias) == 2
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Testes do envio de assets ao HeyGen com reaproveitamento por hash do conteúdo.
+Usa um servidor HTTP local no lugar do endpoint de upload.
+"""
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from core.heygen_api import RegistroAssets, ClienteHeyGen, enviar_asset
+
+
+class _HandlerUpload(BaseHTTPRequestHandler):
+    recebidos = []
+
+    def do_POST(self):
+        corpo = self.rfile.read(int(self.headers["Content-Length"]))
+        _HandlerUpload.recebidos.append((self.headers["X-Api-Key"], corpo))
+
+        resposta = json.dumps({"data": {"id": f"asset_{len(_HandlerUpload.recebidos)}"}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(resposta)))
+        self.end_headers()
+        self.wfile.write(resposta)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    _HandlerUpload.recebidos = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _HandlerUpload)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_conteudo_repetido_reaproveita_asset(servidor, tmp_path):
+    registro = RegistroAssets(str(tmp_path / "assets.db"))
+    audio = tmp_path / "secao_1.mp3"
+    audio.write_bytes(b"audio da secao 1")
+    copia = tmp_path / "secao_1_copia.mp3"
+    copia.write_bytes(b"audio da secao 1")
+
+    primeiro = enviar_asset(str(audio), "chave_a", registro=registro, upload_url=servidor)
+    # Mesmo conteúdo com outro nome, e um novo registro lendo o mesmo banco
+    segundo = enviar_asset(str(copia), "chave_a", registro=RegistroAssets(str(tmp_path / "assets.db")),
+                           upload_url=servidor)
+
+    assert primeiro == segundo == "asset_1"
+    assert _HandlerUpload.recebidos == [("chave_a", b"audio da secao 1")]
+
+
+def test_assets_separados_por_conta_e_conteudo(servidor, tmp_path):
+    registro = RegistroAssets(str(tmp_path / "assets.db"))
+    audio = tmp_path / "secao_1.mp3"
+    audio.write_bytes(b"audio da secao 1")
+
+    cliente_a = ClienteHeyGen("chave_a", "avatar", upload_url=servidor, registro_assets=registro)
+    cliente_b = ClienteHeyGen("chave_b", "avatar", upload_url=servidor, registro_assets=registro)
+
+    assert cliente_a.enviar_audio(str(audio)) == "asset_1"
+    assert cliente_b.enviar_audio(str(audio)) == "asset_2"
+
+    audio.write_bytes(b"audio regravado")
+    assert cliente_a.enviar_audio(str(audio)) == "asset_3"
+    assert cliente_a.enviar_audio(str(audio)) == "asset_3"
+    assert len(_HandlerUpload.recebidos) == 3
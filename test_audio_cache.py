@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Testes do cache de áudio indexado pelo conteúdo.
+A chamada à API da ElevenLabs é substituída por uma resposta fixa.
+"""
+import os
+import time
+
+import core.audio
+import audio_generator
+from core.audio_cache import AudioCache
+
+
+class _RespostaFalsa:
+    def __init__(self, conteudo):
+        self.content = conteudo
+
+    def raise_for_status(self):
+        pass
+
+
+def _post_contando(chamadas):
+    def post(url, json=None, headers=None, timeout=None):
+        chamadas.append(json["text"])
+        return _RespostaFalsa(f"mp3:{json['text']}".encode("utf-8"))
+    return post
+
+
+def test_chave_depende_do_texto_voz_e_configuracoes():
+    base = AudioCache.make_key("Olá", "voz", "modelo", {"stability": 0.5})
+
+    assert base == AudioCache.make_key("Olá", "voz", "modelo", {"stability": 0.5})
+    assert base != AudioCache.make_key("Olá!", "voz", "modelo", {"stability": 0.5})
+    assert base != AudioCache.make_key("Olá", "outra", "modelo", {"stability": 0.5})
+    assert base != AudioCache.make_key("Olá", "voz", "modelo", {"stability": 0.6})
+
+
+def test_remove_os_menos_usados(tmp_path):
+    cache = AudioCache(str(tmp_path), max_bytes=25)
+
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 10)
+    os.utime(tmp_path / "a.mp3", (time.time() - 100, time.time() - 100))
+    os.utime(tmp_path / "b.mp3", (time.time() - 50, time.time() - 50))
+
+    # Usar "a" faz de "b" o menos usado recentemente
+    assert cache.get("a", str(tmp_path / "saida.wav"))
+    cache.put("c", b"x" * 10)
+
+    assert cache.contains("a") and cache.contains("c")
+    assert not cache.contains("b")
+    assert cache.size() <= 25
+
+
+def test_core_audio_nao_repete_sintese(tmp_path, monkeypatch):
+    chamadas = []
+    monkeypatch.setattr(core.audio.cliente_http, "post", _post_contando(chamadas))
+
+    gerador = core.audio.AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"))
+    primeiro = gerador.generate_audio("Bitcoin sobe 5% hoje.", str(tmp_path / "um.mp3"))
+    segundo = gerador.generate_audio("Bitcoin sobe 5% hoje.", str(tmp_path / "dois.mp3"))
+
+    assert len(chamadas) == 1
+    with open(primeiro, "rb") as f1, open(segundo, "rb") as f2:
+        assert f1.read() == f2.read()
+
+    # Mudar as configurações da voz invalida o cache
+    gerador.voice_settings["stability"] = 0.9
+    gerador.generate_audio("Bitcoin sobe 5% hoje.", str(tmp_path / "tres.mp3"))
+    assert len(chamadas) == 2
+
+
+def test_audio_generator_nao_repete_sintese(tmp_path, monkeypatch):
+    chamadas = []
+    monkeypatch.setattr(audio_generator.cliente_http, "post", _post_contando(chamadas))
+
+    gerador = audio_generator.AudioGenerator(cache_dir=str(tmp_path / "cache"))
+    gerador.api_key = "teste"
+    gerador.generate_audio("Ethereum em alta.", str(tmp_path / "um.mp3"))
+    gerador.generate_audio("Ethereum em alta.", str(tmp_path / "dois.mp3"))
+
+    assert len(chamadas) == 1
+    assert os.path.exists(tmp_path / "dois.mp3")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Testes da síntese em partes (chunks) para roteiros longos.
+A chamada à API da ElevenLabs é substituída por uma resposta fixa.
+"""
+import os
+import re
+import time
+import threading
+import subprocess
+
+import pytest
+
+import core.audio
+from core.audio import AudioGenerator
+from core.text import TextProcessor
+from core.utils import optimize_text
+from test_audio_cache import _RespostaFalsa
+
+ROTEIRO = (
+    "Bitcoin sobe cinco por cento hoje. "
+    "Ethereum acompanha o movimento do mercado. "
+    "Solana registra novo recorde de transações. "
+    "Investidores seguem atentos ao próximo halving."
+)
+
+# Roteiro em parágrafos, no formato dos arquivos em scripts/
+ROTEIRO_PARAGRAFOS = (
+    "Salve cambada, hoje vamos falar do mercado!\n\n"
+    "O Bitcoin subiu cinco por cento. Os investidores seguem otimistas, mas atentos.\n\n"
+    "O Ethereum acompanhou o movimento. A rede prepara uma nova atualização.\n\n"
+    "Até a próxima!"
+)
+
+
+def _post_concorrente(chamadas, estado, conteudo=None):
+    trava = threading.Lock()
+
+    def post(url, json=None, headers=None, timeout=None):
+        with trava:
+            chamadas.append(json["text"])
+            estado["ativas"] += 1
+            estado["maximo"] = max(estado["maximo"], estado["ativas"])
+        time.sleep(0.05)
+        with trava:
+            estado["ativas"] -= 1
+        return _RespostaFalsa(conteudo(json["text"]) if conteudo else f"[{json['text']}]".encode("utf-8"))
+    return post
+
+
+@pytest.fixture
+def sem_ffmpeg(monkeypatch):
+    monkeypatch.setattr(core.audio, "FFMPEG_BINARY", "ffmpeg-inexistente")
+
+
+def test_split_long_text_nao_gera_parte_vazia():
+    partes = TextProcessor().split_long_text("Uma frase bem longa que passa do limite. Curta.", 20)
+
+    assert partes == ["Uma frase bem longa que passa do limite.", "Curta."]
+
+
+def test_sintetiza_partes_em_paralelo_e_em_ordem(tmp_path, monkeypatch, sem_ffmpeg):
+    chamadas, estado = [], {"ativas": 0, "maximo": 0}
+    monkeypatch.setattr(core.audio.cliente_http, "post", _post_concorrente(chamadas, estado))
+
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"))
+    recebidas = []
+    caminho = gerador.generate_audio(ROTEIRO, str(tmp_path / "roteiro.mp3"), optimize=False,
+                                     chunked=True, max_chunk_length=50, max_workers=2,
+                                     chunk_callback=recebidas.append)
+
+    frases = TextProcessor().split_speech_units(ROTEIRO, 50)
+    esperado = b"".join(f"[{frase}]".encode("utf-8") for frase in frases)
+
+    assert len(frases) == 4 and len(chamadas) == 4
+    assert estado["maximo"] == 2
+    with open(caminho, "rb") as f:
+        assert f.read() == esperado
+    assert b"".join(recebidas) == esperado
+    # Os arquivos temporários das partes são removidos
+    assert sorted(os.listdir(tmp_path)) == ["cache", "roteiro.mp3"]
+
+
+def test_editar_uma_frase_ressintetiza_so_a_parte(tmp_path, monkeypatch, sem_ffmpeg):
+    chamadas, estado = [], {"ativas": 0, "maximo": 0}
+    monkeypatch.setattr(core.audio.cliente_http, "post", _post_concorrente(chamadas, estado))
+
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"))
+    gerador.generate_audio(ROTEIRO, str(tmp_path / "v1.mp3"), optimize=False,
+                           chunked=True, max_chunk_length=50)
+    chamadas.clear()
+
+    editado = ROTEIRO.replace("novo recorde", "recorde")
+    gerador.generate_audio(editado, str(tmp_path / "v2.mp3"), optimize=False,
+                           chunked=True, max_chunk_length=50)
+
+    assert chamadas == ["Solana registra recorde de transações."]
+
+
+def test_otimiza_cada_parte_depois_de_dividir(tmp_path, monkeypatch, sem_ffmpeg):
+    chamadas, estado = [], {"ativas": 0, "maximo": 0}
+    monkeypatch.setattr(core.audio.cliente_http, "post", _post_concorrente(chamadas, estado))
+
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"))
+    gerador.generate_audio(ROTEIRO, str(tmp_path / "roteiro.mp3"), optimize=True,
+                           chunked=True, max_chunk_length=50)
+
+    # A otimização remove a pontuação: dividir antes dela mantém as quatro frases
+    frases = TextProcessor().split_speech_units(ROTEIRO, 50)
+    assert sorted(chamadas) == sorted(optimize_text(frase) for frase in frases)
+    assert len(chamadas) == 4
+
+
+def test_editar_frase_do_meio_com_otimizacao(tmp_path, monkeypatch, sem_ffmpeg):
+    chamadas, estado = [], {"ativas": 0, "maximo": 0}
+    monkeypatch.setattr(core.audio.cliente_http, "post", _post_concorrente(chamadas, estado))
+
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"))
+    gerador.generate_audio(ROTEIRO_PARAGRAFOS, str(tmp_path / "v1.mp3"), chunked=True)
+    assert len(chamadas) == 4
+    chamadas.clear()
+
+    editado = ROTEIRO_PARAGRAFOS.replace("cinco por cento", "seis por cento")
+    gerador.generate_audio(editado, str(tmp_path / "v2.mp3"), chunked=True)
+
+    # Só o parágrafo editado é sintetizado; os demais vêm do cache
+    assert chamadas == [optimize_text("O Bitcoin subiu seis por cento. Os investidores seguem otimistas, mas atentos.")]
+
+
+def test_divide_linha_longa_em_frases_e_palavras():
+    partes = TextProcessor().split_speech_units(
+        "Curta.\nPrimeira frase da linha. Uma frase comprida demais para caber no limite.", 30)
+
+    assert partes == ["Curta.", "Primeira frase da linha.", "Uma frase comprida demais para",
+                      "caber no limite."]
+
+
+def test_falha_em_uma_parte(tmp_path, monkeypatch, sem_ffmpeg):
+    def post(url, json=None, headers=None, timeout=None):
+        if "Solana" in json["text"]:
+            raise core.audio.requests.exceptions.Timeout("timeout")
+        return _RespostaFalsa(b"mp3")
+
+    monkeypatch.setattr(core.audio.cliente_http, "post", post)
+
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"))
+    caminho = gerador.generate_audio(ROTEIRO, str(tmp_path / "roteiro.mp3"), optimize=False,
+                                     chunked=True, max_chunk_length=50)
+
+    assert caminho is None
+    assert not (tmp_path / "roteiro.mp3").exists()
+
+
+def test_junta_partes_com_ffmpeg(tmp_path, monkeypatch):
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+    ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    monkeypatch.setattr(core.audio, "FFMPEG_BINARY", ffmpeg)
+
+    # MP3 real de meio segundo para cada parte
+    mp3 = tmp_path / "tom.mp3"
+    subprocess.run([ffmpeg, "-y", "-f", "lavfi", "-i", "sine=d=0.5", "-c:a", "libmp3lame", str(mp3)],
+                   check=True, capture_output=True)
+    chamadas, estado = [], {"ativas": 0, "maximo": 0}
+    monkeypatch.setattr(core.audio.cliente_http, "post",
+                        _post_concorrente(chamadas, estado, lambda texto: mp3.read_bytes()))
+
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"))
+    caminho = gerador.generate_audio(ROTEIRO, str(tmp_path / "roteiro.mp3"), optimize=False,
+                                     chunked=True, max_chunk_length=50)
+
+    resultado = subprocess.run([ffmpeg, "-i", caminho, "-f", "null", "-"], capture_output=True, text=True)
+    assert resultado.returncode == 0
+    # Quatro partes de 0,5 s (mais o preenchimento do codificador) resultam em cerca de 2 s de áudio
+    duracao = float(re.findall(r"time=00:00:(\d+\.\d+)", resultado.stderr)[-1])
+    assert 1.9 <= duracao <= 2.4
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Testes da geração de áudio em modo streaming.
+Usa um servidor HTTP local que transmite um MP3 de teste em partes.
+"""
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+import core.audio
+from core.audio import AudioGenerator
+
+# MP3 de teste: cabeçalho ID3 seguido de bytes arbitrários
+MP3_TESTE = b"ID3\x03\x00\x00\x00\x00\x00\x00" + bytes(range(256)) * 400
+
+
+class _HandlerStreaming(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requisicoes = []
+    falhar_no_meio = False
+
+    def do_POST(self):
+        corpo = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        _HandlerStreaming.requisicoes.append((self.path, corpo))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        # Transmitir o arquivo em partes, como a API de streaming
+        limite = len(MP3_TESTE) // 2 if _HandlerStreaming.falhar_no_meio else len(MP3_TESTE)
+        for inicio in range(0, limite, 8192):
+            parte = MP3_TESTE[inicio:min(inicio + 8192, limite)]
+            self.wfile.write(f"{len(parte):x}\r\n".encode() + parte + b"\r\n")
+            self.wfile.flush()
+
+        if _HandlerStreaming.falhar_no_meio:
+            # Encerrar a conexão sem o chunk final
+            self.close_connection = True
+            return
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    _HandlerStreaming.requisicoes = []
+    _HandlerStreaming.falhar_no_meio = False
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _HandlerStreaming)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/v1"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_streaming_grava_partes_em_disco(servidor, tmp_path):
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"), api_base_url=servidor)
+    partes = []
+    saida = tmp_path / "stream.mp3"
+
+    def ao_receber(parte):
+        # Cada parte já está no disco quando o callback é chamado
+        partes.append(parte)
+        assert saida.stat().st_size >= sum(len(p) for p in partes)
+
+    caminho = gerador.generate_audio("Bitcoin sobe 5% hoje.", str(saida), stream=True,
+                                     chunk_callback=ao_receber)
+
+    assert caminho == str(saida)
+    assert saida.read_bytes() == MP3_TESTE
+    assert len(partes) > 1 and b"".join(partes) == MP3_TESTE
+
+    caminho_requisicao, corpo = _HandlerStreaming.requisicoes[0]
+    assert caminho_requisicao.startswith("/v1/text-to-speech/")
+    assert caminho_requisicao.endswith("/stream")
+    assert corpo["model_id"] == gerador.voice_settings["model_id"]
+
+
+def test_streaming_usa_cache(servidor, tmp_path):
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"), api_base_url=servidor)
+    gerador.generate_audio("Ethereum em alta.", str(tmp_path / "um.mp3"), stream=True)
+
+    partes = []
+    gerador.generate_audio("Ethereum em alta.", str(tmp_path / "dois.mp3"), stream=True,
+                           chunk_callback=partes.append)
+
+    assert len(_HandlerStreaming.requisicoes) == 1
+    assert (tmp_path / "dois.mp3").read_bytes() == MP3_TESTE
+    # O áudio em cache também é entregue ao callback
+    assert b"".join(partes) == MP3_TESTE
+
+
+def test_streaming_interrompido_nao_deixa_arquivo(servidor, tmp_path):
+    _HandlerStreaming.falhar_no_meio = True
+    gerador = AudioGenerator(api_key="teste", cache_dir=str(tmp_path / "cache"), api_base_url=servidor)
+
+    caminho = gerador.generate_audio("Solana cai.", str(tmp_path / "falha.mp3"), stream=True)
+
+    assert caminho is None
+    assert not (tmp_path / "falha.mp3").exists()
+    assert gerador.cache.size() == 0
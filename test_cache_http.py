@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Testes do cache de respostas HTTP com requisições condicionais.
+Usa um servidor HTTP local que responde 304 quando o ETag não mudou.
+"""
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from core.cache_http import CacheHTTP
+from buscador_noticias_cripto import NoticiasCriptoScraper
+from buscador_videos_cripto import YouTubeCriptoScraper
+
+ETAG = '"versao-1"'
+
+HTML_PORTAL = """
+<html><body>
+  <article class="noticia">
+    <h2><a href="/bitcoin">Bitcoin sobe</a></h2>
+    <p class="resumo">Resumo da notícia sobre Bitcoin.</p>
+  </article>
+</body></html>
+"""
+
+
+class _HandlerCondicional(BaseHTTPRequestHandler):
+    requisicoes = []
+
+    def do_GET(self):
+        _HandlerCondicional.requisicoes.append(dict(self.headers))
+
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        corpo = HTML_PORTAL.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    _HandlerCondicional.requisicoes = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _HandlerCondicional)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_requisicao_condicional(servidor, tmp_path):
+    cache = CacheHTTP(str(tmp_path))
+
+    primeira = cache.buscar(f"{servidor}/portal/")
+    assert primeira["status"] == 200
+    assert not primeira["nao_modificado"]
+    cache.salvar_extracao(primeira["chave"], [{"titulo": "Bitcoin sobe"}])
+
+    segunda = cache.buscar(f"{servidor}/portal/")
+    assert segunda["status"] == 304
+    assert segunda["nao_modificado"]
+    assert segunda["texto"] == primeira["texto"]
+    assert segunda["extracao"] == [{"titulo": "Bitcoin sobe"}]
+
+    cabecalhos = _HandlerCondicional.requisicoes[1]
+    assert cabecalhos.get("If-None-Match") == ETAG
+    assert cabecalhos.get("If-Modified-Since") == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def test_scraper_nao_reprocessa_pagina_inalterada(servidor, tmp_path, monkeypatch):
+    portal = {
+        "nome": "Portal Local",
+        "url": f"{servidor}/portal/",
+        "seletor_noticias": "article.noticia",
+        "seletor_titulo": "h2 a",
+        "seletor_link": "h2 a",
+        "seletor_data": "time.data",
+        "seletor_resumo": "p.resumo",
+        "formato_data": "%d/%m/%Y",
+        "idioma": "pt",
+        "confiabilidade": 8
+    }
+    scraper = NoticiasCriptoScraper(cache_dir=str(tmp_path), traduzir_automaticamente=False)
+
+    extracoes = []
+    extrair_original = scraper._extrair_noticias
+
+    def extrair_contando(portal, html):
+        extracoes.append(portal["nome"])
+        return extrair_original(portal, html)
+
+    monkeypatch.setattr(scraper, "_extrair_noticias", extrair_contando)
+
+    primeira = scraper.buscar_noticias(portal)
+    segunda = scraper.buscar_noticias(portal)
+
+    assert len(extracoes) == 1
+    assert [n["titulo"] for n in segunda] == [n["titulo"] for n in primeira] == ["Bitcoin sobe"]
+
+
+class _CacheHTTPMemoria:
+    """Cache HTTP em memória: a primeira busca responde 200 e as seguintes 304."""
+
+    def __init__(self, corpo):
+        self.corpo = corpo
+        self.extracao = None
+
+    def buscar(self, url, **kwargs):
+        nao_modificado = self.extracao is not None
+        return {"chave": "busca", "status": 304 if nao_modificado else 200, "texto": self.corpo,
+                "nao_modificado": nao_modificado, "extracao": self.extracao}
+
+    def salvar_extracao(self, chave, extracao):
+        self.extracao = json.loads(json.dumps(extracao))
+
+
+def test_busca_de_videos_guarda_extracao_completa(tmp_path):
+    itens = [{"id": {"videoId": f"v{i}"},
+              "snippet": {"title": f"Vídeo {i}", "description": "", "channelId": "canal", "channelTitle": "Canal",
+                          "publishedAt": "2025-01-01T00:00:00Z", "thumbnails": {"high": {"url": ""}}}}
+             for i in range(6)]
+    scraper = YouTubeCriptoScraper(api_key="chave", cache_dir=str(tmp_path), traduzir_automaticamente=False)
+    scraper.cache_http = _CacheHTTPMemoria(json.dumps({"items": itens}))
+
+    primeira = scraper.buscar_videos_por_termo("bitcoin", max_videos=2)
+    scraper.cache_http.extracao = [dict(v, timestamp="2000-01-01T00:00:00") for v in scraper.cache_http.extracao]
+    segunda = scraper.buscar_videos_por_termo("bitcoin", max_videos=5)
+
+    assert [v["id"] for v in primeira] == ["v0", "v1"]
+    # O 304 reaproveita a extração completa, não a lista cortada da primeira busca
+    assert [v["id"] for v in segunda] == ["v0", "v1", "v2", "v3", "v4"]
+    assert all(v["timestamp"] > "2000-01-01T00:00:00" for v in segunda)
+
+
+def test_renovar_timestamps_nao_altera_extracao():
+    extracao = [{"titulo": "Bitcoin sobe", "timestamp": "2000-01-01T00:00:00"}, {"titulo": "Sem horário"}]
+
+    renovados = CacheHTTP.renovar_timestamps(extracao)
+
+    assert renovados[0]["timestamp"] > "2000-01-01T00:00:00"
+    assert "timestamp" not in renovados[1]
+    assert extracao[0]["timestamp"] == "2000-01-01T00:00:00"
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the cache of rendered title cards and static text.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from core.card_cache import CardCache
+
+video = pytest.importorskip("core.video")
+
+
+class _FakeTextClip:
+    """Stands in for MoviePy's TextClip (which needs ImageMagick)."""
+    rendered = 0
+
+    def __init__(self, text, **kwargs):
+        _FakeTextClip.rendered += 1
+        self.img = np.full((10, 20, 3), 200, dtype=np.uint8)
+        self.mask = type("Mask", (), {"img": np.linspace(0, 1, 200).reshape(10, 20)})()
+
+
+def test_renders_once_and_persists(tmp_path):
+    renders = []
+
+    def render():
+        renders.append(1)
+        return np.arange(24, dtype=np.uint8).reshape(2, 4, 3)
+
+    cache = CardCache(str(tmp_path))
+    key = CardCache.make_key("title", title="Bitcoin", width=4, height=2)
+    first = cache.get_or_render(key, render)
+    assert cache.get_or_render(key, render) is first
+
+    # A new process reads the PNG from disk
+    reloaded = CardCache(str(tmp_path)).get_or_render(key, render)
+
+    assert len(renders) == 1
+    assert np.array_equal(reloaded, first)
+    assert not reloaded.flags.writeable
+
+
+def test_memory_lru_eviction():
+    cache = CardCache(max_items=2)
+    for name in ("a", "b", "c"):
+        cache.put(name, np.zeros((1, 1, 3), dtype=np.uint8))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None and cache.get("c") is not None
+
+
+def test_key_depends_on_style():
+    base = CardCache.make_key("text", text="Olá", fontsize=60, color="white")
+
+    assert base == CardCache.make_key("text", color="white", fontsize=60, text="Olá")
+    assert base != CardCache.make_key("text", text="Olá", fontsize=50, color="white")
+
+
+@pytest.fixture
+def gerador(tmp_path):
+    return video.VideoGenerator(use_frame_cache=False, card_cache_dir=str(tmp_path / "cards"))
+
+
+def test_title_image_matches_uncached(gerador):
+    uncached = video.VideoGenerator(use_frame_cache=False, use_card_cache=False)
+    title = "1. Bitcoin dispara para nova máxima histórica"
+
+    assert np.array_equal(gerador.create_title_image(title), uncached.create_title_image(title))
+    assert gerador.create_title_image(title) is gerador.create_title_image(title)
+    # Titles are cheap to draw and are only kept in memory
+    assert os.listdir(gerador.card_cache.cache_dir) == []
+
+
+def test_text_clip_rendered_once(gerador, monkeypatch):
+    monkeypatch.setattr(video, "TextClip", _FakeTextClip)
+    _FakeTextClip.rendered = 0
+
+    clips = [gerador.create_text_clip("Gerado por Clone IA", 3.0) for _ in range(3)]
+
+    assert _FakeTextClip.rendered == 1
+    expected = _FakeTextClip("x")
+    for clip in clips:
+        assert np.array_equal(clip.get_frame(0), expected.img)
+        assert np.allclose(clip.mask.get_frame(0), expected.mask.img, atol=1 / 255)
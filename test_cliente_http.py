@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Testes do cliente HTTP compartilhado pelas integrações.
+Usa um servidor HTTP local que falha nas primeiras requisições.
+"""
+import io
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from core.cliente_http import ClienteHTTP
+
+
+class _HandlerInstavel(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    falhas = []
+    requisicoes = []
+    conexoes = set()
+
+    def _responder(self, corpo=b""):
+        _HandlerInstavel.requisicoes.append((self.command, corpo))
+        _HandlerInstavel.conexoes.add(self.client_address)
+
+        status = _HandlerInstavel.falhas.pop(0) if _HandlerInstavel.falhas else 200
+        resposta = corpo or b"ok"
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", str(len(resposta)))
+        self.end_headers()
+        self.wfile.write(resposta)
+
+    def do_GET(self):
+        self._responder()
+
+    def do_POST(self):
+        self._responder(self.rfile.read(int(self.headers["Content-Length"])))
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    _HandlerInstavel.falhas = []
+    _HandlerInstavel.requisicoes = []
+    _HandlerInstavel.conexoes = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _HandlerInstavel)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _cliente(**kwargs):
+    return ClienteHTTP(espera_inicial=0.01, intervalos_host={}, **kwargs)
+
+
+def test_repete_5xx_em_get_e_reaproveita_conexao(servidor):
+    _HandlerInstavel.falhas = [503, 502]
+    cliente = _cliente()
+
+    resposta = cliente.get(f"{servidor}/dados")
+    assert resposta.status_code == 200
+    assert cliente.get(f"{servidor}/dados").status_code == 200
+
+    assert len(_HandlerInstavel.requisicoes) == 4
+    # Todas as requisições usaram a mesma conexão (keep-alive)
+    assert len(_HandlerInstavel.conexoes) == 1
+
+
+def test_post_repete_429_mas_nao_5xx(servidor):
+    cliente = _cliente()
+
+    _HandlerInstavel.falhas = [429]
+    assert cliente.post(f"{servidor}/gerar", data=b"payload").status_code == 200
+    assert len(_HandlerInstavel.requisicoes) == 2
+
+    _HandlerInstavel.falhas = [500]
+    assert cliente.post(f"{servidor}/gerar", data=b"payload").status_code == 500
+    assert len(_HandlerInstavel.requisicoes) == 3
+
+
+def test_reenvia_arquivo_desde_o_inicio(servidor):
+    _HandlerInstavel.falhas = [429, 429]
+    arquivo = io.BytesIO(b"conteudo do audio")
+
+    resposta = _cliente().post(f"{servidor}/upload", data=arquivo)
+
+    assert resposta.status_code == 200
+    assert [corpo for _, corpo in _HandlerInstavel.requisicoes] == [b"conteudo do audio"] * 3
+
+
+def test_reenvia_files_em_lista(servidor):
+    # Mesmo formato usado na clonagem de voz: lista de pares (nome, arquivo)
+    _HandlerInstavel.falhas = [429]
+    arquivo = io.BytesIO(b"amostra de voz")
+    files = [("files", ("amostra.mp3", arquivo, "audio/mpeg")), ("files", ("outra.mp3", b"bytes", "audio/mpeg"))]
+
+    resposta = _cliente().post(f"{servidor}/voices/add", data={"name": "voz"}, files=files)
+
+    assert resposta.status_code == 200
+    corpos = [corpo for _, corpo in _HandlerInstavel.requisicoes]
+    assert len(corpos) == 2
+    assert all(b"amostra de voz" in corpo and b"bytes" in corpo for corpo in corpos)
+
+
+def test_desiste_apos_ultima_tentativa(servidor):
+    _HandlerInstavel.falhas = [503] * 5
+
+    resposta = _cliente(tentativas=2).get(f"{servidor}/dados")
+
+    assert resposta.status_code == 503
+    assert len(_HandlerInstavel.requisicoes) == 2
+
+
+def test_intervalo_minimo_por_host(servidor):
+    cliente = _cliente()
+    cliente.configurar_host(servidor.split("://")[1], 0.05)
+
+    inicio = time.monotonic()
+    for _ in range(3):
+        cliente.get(f"{servidor}/dados")
+
+    assert time.monotonic() - inicio >= 0.1
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Testes da coleta concorrente de portais de notícias.
+Usa um servidor HTTP local que serve HTML de exemplo com atraso.
+"""
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from core.coleta_concorrente import ColetorConcorrente
+from buscador_noticias_cripto import NoticiasCriptoScraper
+
+# Atraso artificial de cada resposta do servidor local
+ATRASO_RESPOSTA = 0.5
+
+HTML_PORTAL = """
+<html><body>
+  <article class="noticia">
+    <h2><a href="/{portal}/bitcoin">Bitcoin sobe no portal {portal}</a></h2>
+    <p class="resumo">Resumo da notícia sobre Bitcoin no portal {portal}.</p>
+  </article>
+  <article class="noticia">
+    <h2><a href="/{portal}/ethereum">Ethereum cai no portal {portal}</a></h2>
+    <p class="resumo">Resumo da notícia sobre Ethereum no portal {portal}.</p>
+  </article>
+</body></html>
+"""
+
+
+class _HandlerPortal(BaseHTTPRequestHandler):
+    def do_GET(self):
+        portal = self.path.strip("/").split("/")[0]
+        atraso = 5.0 if portal == "lento" else ATRASO_RESPOSTA
+        time.sleep(atraso)
+
+        corpo = HTML_PORTAL.format(portal=portal).encode("utf-8")
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _HandlerPortal)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _portal(base_url, nome):
+    return {
+        "nome": nome,
+        "url": f"{base_url}/{nome}/",
+        "seletor_noticias": "article.noticia",
+        "seletor_titulo": "h2 a",
+        "seletor_link": "h2 a",
+        "seletor_data": "time.data",
+        "seletor_resumo": "p.resumo",
+        "formato_data": "%d/%m/%Y",
+        "idioma": "pt",
+        "confiabilidade": 8
+    }
+
+
+def test_coleta_em_paralelo_preserva_ordem(servidor):
+    urls = [f"{servidor}/portal{i}/" for i in range(4)]
+    coletor = ColetorConcorrente(max_concorrencia=4, max_por_host=4,
+                                 intervalo_por_host=(0.0, 0.0), prazo_total=10.0)
+
+    inicio = time.monotonic()
+    resultados = coletor.coletar(urls)
+    duracao = time.monotonic() - inicio
+
+    # Sequencialmente levaria 4 * ATRASO_RESPOSTA
+    assert duracao < 3 * ATRASO_RESPOSTA
+    assert [r["url"] for r in resultados] == urls
+    for i, resultado in enumerate(resultados):
+        assert resultado["erro"] is None
+        assert resultado["status"] == 200
+        assert f"portal{i}" in resultado["texto"]
+
+
+def test_limite_por_host(servidor):
+    urls = [f"{servidor}/portal{i}/" for i in range(4)]
+    coletor = ColetorConcorrente(max_concorrencia=4, max_por_host=1,
+                                 intervalo_por_host=(0.0, 0.0), prazo_total=10.0)
+
+    inicio = time.monotonic()
+    resultados = coletor.coletar(urls)
+    duracao = time.monotonic() - inicio
+
+    # Com uma requisição por host, as quatro são feitas em sequência
+    assert duracao >= 4 * ATRASO_RESPOSTA
+    assert all(r["erro"] is None for r in resultados)
+
+
+def test_prazo_total(servidor):
+    urls = [f"{servidor}/portal0/", f"{servidor}/lento/"]
+    coletor = ColetorConcorrente(max_concorrencia=2, max_por_host=2,
+                                 intervalo_por_host=(0.0, 0.0), prazo_total=1.5)
+
+    inicio = time.monotonic()
+    resultados = coletor.coletar(urls)
+    duracao = time.monotonic() - inicio
+
+    assert duracao < 3.0
+    assert resultados[0]["erro"] is None
+    # O portal lento não termina dentro do prazo
+    assert resultados[1] is None or resultados[1]["erro"] is not None
+
+
+def test_buscar_todas_noticias_concorrente(servidor, tmp_path):
+    portais = [_portal(servidor, f"portal{i}") for i in range(3)]
+    scraper = NoticiasCriptoScraper(
+        cache_dir=str(tmp_path),
+        traduzir_automaticamente=False,
+        max_concorrencia=3,
+        max_por_host=3,
+        prazo_coleta=10.0,
+        intervalo_por_host=(0.0, 0.0)
+    )
+
+    inicio = time.monotonic()
+    noticias = scraper.buscar_todas_noticias(
+        max_por_portal=2,
+        max_total=10,
+        usar_verificacao_cruzada=False,
+        coleta_concorrente=True,
+        portais=portais
+    )
+    duracao = time.monotonic() - inicio
+
+    assert len(noticias) == 6
+    assert {n["portal"] for n in noticias} == {"portal0", "portal1", "portal2"}
+    assert duracao < 3 * ATRASO_RESPOSTA + 1.0
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Testes do download retomável dos vídeos do HeyGen.
+Usa um servidor HTTP local com suporte a Range e If-Range que pode derrubar
+a conexão no meio da primeira resposta, mandar uma faixa menor que a pedida
+ou uma faixa que não começa no byte pedido.
+"""
+import os
+import json
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from core.heygen_api import baixar_arquivo, vincular_copia, hash_registrado, verificar_arquivo
+
+VIDEO = bytes(range(256)) * 4096 * 4  # 4 MiB
+
+
+class _HandlerRange(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requisicoes = []
+    validadores = []
+    interromper = False
+    encurtar = False
+    deslocar = 0
+    etag = '"v1"'
+
+    def do_GET(self):
+        faixa = self.headers.get("Range")
+        validador = self.headers.get("If-Range")
+        _HandlerRange.requisicoes.append(faixa)
+        _HandlerRange.validadores.append(validador)
+        if validador and validador != _HandlerRange.etag:
+            # O arquivo mudou desde o download parcial: mandar o conteúdo inteiro
+            faixa = None
+
+        inicio = int(faixa.split("=")[1].rstrip("-")) if faixa else 0
+        if inicio >= len(VIDEO):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(VIDEO)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        inicio += _HandlerRange.deslocar if faixa else 0
+        fim = len(VIDEO)
+        if faixa and _HandlerRange.encurtar:
+            # Resposta válida, mas com menos bytes que o pedido
+            _HandlerRange.encurtar = False
+            fim = inicio + (fim - inicio) // 2
+        corpo = VIDEO[inicio:fim]
+        self.send_response(206 if faixa else 200)
+        if faixa:
+            self.send_header("Content-Range", f"bytes {inicio}-{fim - 1}/{len(VIDEO)}")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.send_header("ETag", _HandlerRange.etag)
+        self.end_headers()
+
+        if _HandlerRange.interromper:
+            _HandlerRange.interromper = False
+            self.wfile.write(corpo[:len(corpo) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(corpo)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    _HandlerRange.requisicoes = []
+    _HandlerRange.validadores = []
+    _HandlerRange.interromper = False
+    _HandlerRange.encurtar = False
+    _HandlerRange.deslocar = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _HandlerRange)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/video.mp4"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_download_retoma_com_range(servidor, tmp_path):
+    _HandlerRange.interromper = True
+    destino = str(tmp_path / "video.mp4")
+
+    baixar_arquivo(servidor, destino, sha256=hashlib.sha256(VIDEO).hexdigest())
+
+    with open(destino, "rb") as f:
+        assert f.read() == VIDEO
+    assert _HandlerRange.requisicoes[0] is None
+    # A segunda requisição pede apenas o que faltava
+    assert _HandlerRange.requisicoes[1].startswith("bytes=")
+    assert _HandlerRange.requisicoes[1] != "bytes=0-"
+    assert _HandlerRange.validadores[1] == '"v1"'
+    assert not os.path.exists(destino + ".part")
+    assert not os.path.exists(destino + ".part.json")
+
+
+def _parcial(destino, conteudo, url, etag):
+    with open(destino + ".part", "wb") as f:
+        f.write(conteudo)
+    with open(destino + ".part.json", "w") as f:
+        json.dump({"url": url, "etag": etag, "last_modified": None}, f)
+
+
+def test_download_retoma_parcial_de_outra_chamada(servidor, tmp_path):
+    destino = str(tmp_path / "video.mp4")
+    _parcial(destino, VIDEO[:1000], servidor, '"v1"')
+
+    baixar_arquivo(servidor, destino, sha256=hashlib.sha256(VIDEO).hexdigest())
+
+    assert _HandlerRange.requisicoes == ["bytes=1000-"]
+    assert _HandlerRange.validadores == ['"v1"']
+
+
+def test_parcial_de_outra_url_descartado(servidor, tmp_path):
+    destino = str(tmp_path / "video.mp4")
+    _parcial(destino, b"x" * 1000, servidor + "?assinatura=antiga", '"v1"')
+
+    baixar_arquivo(servidor, destino, sha256=hashlib.sha256(VIDEO).hexdigest())
+
+    assert _HandlerRange.requisicoes == [None]
+
+
+def test_arquivo_alterado_recomeca_download(servidor, tmp_path):
+    destino = str(tmp_path / "video.mp4")
+    _parcial(destino, b"x" * 1000, servidor, '"v0"')
+
+    baixar_arquivo(servidor, destino, sha256=hashlib.sha256(VIDEO).hexdigest())
+
+    # O servidor respondeu 200 ao If-Range desatualizado: o parcial foi descartado
+    assert _HandlerRange.validadores == ['"v0"']
+    with open(destino, "rb") as f:
+        assert f.read() == VIDEO
+    assert not os.path.exists(destino + ".part.json")
+
+
+def test_resposta_curta_retoma_na_mesma_chamada(servidor, tmp_path):
+    destino = str(tmp_path / "video.mp4")
+    _parcial(destino, VIDEO[:1000], servidor, '"v1"')
+    _HandlerRange.encurtar = True
+
+    baixar_arquivo(servidor, destino)
+
+    meio = 1000 + (len(VIDEO) - 1000) // 2
+    assert _HandlerRange.requisicoes == ["bytes=1000-", f"bytes={meio}-"]
+    with open(destino, "rb") as f:
+        assert f.read() == VIDEO
+
+
+def test_faixa_fora_do_lugar_recomeca(servidor, tmp_path):
+    destino = str(tmp_path / "video.mp4")
+    _parcial(destino, VIDEO[:1000], servidor, '"v1"')
+    _HandlerRange.deslocar = 10
+
+    baixar_arquivo(servidor, destino)
+
+    assert _HandlerRange.requisicoes == ["bytes=1000-", None]
+    with open(destino, "rb") as f:
+        assert f.read() == VIDEO
+
+
+@pytest.mark.parametrize("excesso,requisicoes", [(b"", ["bytes={}-"]), (b"x" * 10, ["bytes={}-", None])])
+def test_416_so_conclui_com_o_tamanho_certo(servidor, tmp_path, excesso, requisicoes):
+    destino = str(tmp_path / "video.mp4")
+    _parcial(destino, VIDEO + excesso, servidor, '"v1"')
+
+    baixar_arquivo(servidor, destino)
+
+    tamanho = len(VIDEO + excesso)
+    assert _HandlerRange.requisicoes == [r.format(tamanho) if r else r for r in requisicoes]
+    with open(destino, "rb") as f:
+        assert f.read() == VIDEO
+
+
+def test_hash_registrado_confere_arquivo_e_copia(servidor, tmp_path):
+    destino = str(tmp_path / "video.mp4")
+    baixar_arquivo(servidor, destino)
+
+    assert hash_registrado(destino) == hashlib.sha256(VIDEO).hexdigest()
+    copia = vincular_copia(destino, str(tmp_path / "heygen_123.mp4"))
+    assert hash_registrado(copia) == hash_registrado(destino)
+    assert verificar_arquivo(copia)
+
+    with open(destino, "r+b") as f:
+        f.write(b"corrompido")
+    assert not verificar_arquivo(destino)
+    assert not verificar_arquivo(str(tmp_path / "inexistente.mp4"))
+
+
+def test_hash_divergente_descarta_download(servidor, tmp_path):
+    destino = str(tmp_path / "video.mp4")
+
+    with pytest.raises(RuntimeError):
+        baixar_arquivo(servidor, destino, sha256="0" * 64)
+
+    assert not os.path.exists(destino)
+    assert not os.path.exists(destino + ".part")
+    assert not os.path.exists(destino + ".part.json")
+
+
+def test_copia_por_hardlink(tmp_path):
+    origem = tmp_path / "video.mp4"
+    origem.write_bytes(b"conteudo")
+
+    copia = vincular_copia(str(origem), str(tmp_path / "heygen_123.mp4"))
+
+    assert os.path.samefile(origem, copia)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the cache of frames extracted from the reference videos.
+Uses a fake video whose frames encode their timestamp, so no decoder is needed.
+"""
+import os
+
+import numpy as np
+
+from core.frame_cache import FrameCache
+
+
+class _FakeVideo:
+    """Video of 10 s whose frame at t is filled with int(t * 10)."""
+    opened = 0
+    decoded = 0
+
+    def __init__(self, video_path):
+        _FakeVideo.opened += 1
+        self.duration = 10.0
+
+    def get_frame(self, t):
+        _FakeVideo.decoded += 1
+        return np.full((4, 6, 3), int(t * 10), dtype=np.uint8)
+
+    def close(self):
+        pass
+
+
+def _cache(tmp_path, **kwargs):
+    _FakeVideo.opened = 0
+    _FakeVideo.decoded = 0
+    return FrameCache(str(tmp_path / "frames"), opener=_FakeVideo, **kwargs)
+
+
+def _video(tmp_path, name="ref.mp4", content=b"video"):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_pre_extracts_once_and_serves_from_memory(tmp_path):
+    cache = _cache(tmp_path, frames_per_video=5)
+    video = _video(tmp_path)
+
+    samples = cache.prepare(video)
+    assert samples.shape == (5, 4, 6, 3)
+    assert [int(frame[0, 0, 0]) for frame in samples] == [int(t * 10) for t in cache.sample_times(10.0)]
+
+    for _ in range(20):
+        frame = cache.get_frame(video)
+        assert frame.shape == (4, 6, 3) and frame.flags.writeable
+    assert (_FakeVideo.opened, _FakeVideo.decoded) == (1, 5)
+
+
+def test_samples_persist_across_instances(tmp_path):
+    video = _video(tmp_path)
+    _cache(tmp_path, frames_per_video=3).prepare(video)
+
+    cache = _cache(tmp_path, frames_per_video=3)
+    cache.get_frame(video)
+
+    assert _FakeVideo.decoded == 0
+
+
+def test_changed_video_is_extracted_again(tmp_path):
+    cache = _cache(tmp_path, frames_per_video=3)
+    video = _video(tmp_path)
+    cache.prepare(video)
+
+    _video(tmp_path, content=b"new video contents")
+    cache.prepare(video)
+
+    assert _FakeVideo.opened == 2
+
+
+def test_frame_at_timestamp(tmp_path):
+    cache = _cache(tmp_path)
+    video = _video(tmp_path)
+
+    assert int(cache.get_frame(video, 2.5)[0, 0, 0]) == 25
+    assert int(cache.get_frame(video, 2.5)[0, 0, 0]) == 25
+    assert _FakeVideo.decoded == 1
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = _cache(tmp_path, frames_per_video=2, max_bytes=400)
+    first = _video(tmp_path, "a.mp4")
+    second = _video(tmp_path, "b.mp4")
+
+    cache.prepare(first)
+    cache.prepare(second)
+
+    files = os.listdir(tmp_path / "frames")
+    assert len(files) == 1
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Testes do gerenciador de jobs do HeyGen.
+Usa o cliente simulado: nenhuma chamada de rede é feita.
+"""
+import time
+import sqlite3
+
+from core.heygen_api import ClienteHeyGenSimulado
+from core.jobs_heygen import GerenciadorJobsHeyGen, CONCLUIDO, FALHOU, PROCESSANDO
+
+
+def _audios(tmp_path, n):
+    audios = []
+    for i in range(n):
+        caminho = tmp_path / f"secao_{i + 1}.mp3"
+        caminho.write_bytes(f"audio {i + 1}".encode("utf-8"))
+        audios.append({"audio": str(caminho), "saida": str(tmp_path / "videos" / f"secao_{i + 1}.mp4")})
+    return audios
+
+
+def _gerenciador(cliente, tmp_path, **kwargs):
+    kwargs.setdefault("intervalo_inicial", 0.01)
+    kwargs.setdefault("intervalo_maximo", 0.04)
+    return GerenciadorJobsHeyGen(cliente, arquivo=str(tmp_path / "jobs.db"), **kwargs)
+
+
+def test_varios_jobs_em_um_laco(tmp_path):
+    cliente = ClienteHeyGenSimulado(consultas_ate_concluir=4)
+    gerenciador = _gerenciador(cliente, tmp_path)
+    itens = _audios(tmp_path, 5)
+
+    gerenciador.submeter_lote(itens)
+    jobs = gerenciador.aguardar()
+
+    assert [job["status"] for job in jobs] == [CONCLUIDO] * 5
+    for i, item in enumerate(itens):
+        with open(item["saida"], "rb") as f:
+            assert f.read() == f"VIDEO:audio {i + 1}".encode("utf-8")
+
+    # O intervalo entre consultas cresce até o máximo configurado
+    assert all(job["consultas"] == 4 for job in jobs)
+    assert all(job["intervalo"] == 0.04 for job in jobs)
+    assert cliente.chamadas.count("status_video") == 20
+
+
+def test_falha_nao_interrompe_os_demais(tmp_path):
+    cliente = ClienteHeyGenSimulado(falhar_com=b"audio 2")
+    gerenciador = _gerenciador(cliente, tmp_path)
+
+    gerenciador.submeter_lote(_audios(tmp_path, 3))
+    jobs = gerenciador.aguardar()
+
+    assert [job["status"] for job in jobs] == [CONCLUIDO, FALHOU, CONCLUIDO]
+    assert jobs[1]["erro"] == "falha simulada"
+
+
+def test_retoma_jobs_apos_interrupcao(tmp_path):
+    cliente = ClienteHeyGenSimulado(consultas_ate_concluir=1000)
+    gerenciador = _gerenciador(cliente, tmp_path)
+    itens = _audios(tmp_path, 2)
+
+    gerenciador.submeter_lote(itens)
+    jobs = gerenciador.aguardar(tempo_maximo=0.05)
+    assert [job["status"] for job in jobs] == [PROCESSANDO] * 2
+    gerenciador.fechar()
+
+    # Um novo gerenciador (novo processo) lê a tabela e continua de onde parou
+    cliente.consultas_ate_concluir = 1
+    retomado = _gerenciador(cliente, tmp_path)
+    assert [job["status"] for job in retomado.submeter_lote(itens)] == [PROCESSANDO] * 2
+    jobs = retomado.aguardar()
+
+    assert [job["status"] for job in jobs] == [CONCLUIDO] * 2
+    assert cliente.chamadas.count("criar_video") == 2
+
+
+def test_reaproveita_job_apenas_com_o_mesmo_audio(tmp_path):
+    cliente = ClienteHeyGenSimulado()
+    gerenciador = _gerenciador(cliente, tmp_path)
+    item = _audios(tmp_path, 1)[0]
+
+    primeiro = gerenciador.submeter(item["audio"], item["saida"])
+    gerenciador.aguardar()
+    assert gerenciador.submeter(item["audio"], item["saida"])["status"] == CONCLUIDO
+
+    # O áudio foi regenerado com outro conteúdo: o vídeo antigo não serve mais
+    with open(item["audio"], "wb") as f:
+        f.write(b"audio novo")
+    segundo = gerenciador.submeter(item["audio"], item["saida"])
+    assert segundo["status"] == PROCESSANDO
+    assert segundo["video_id"] != primeiro["video_id"]
+
+    gerenciador.aguardar()
+    with open(item["saida"], "rb") as f:
+        assert f.read() == b"VIDEO:audio novo"
+    assert cliente.chamadas.count("criar_video") == 2
+
+
+def test_acompanha_video_criado_fora_do_gerenciador(tmp_path):
+    cliente = ClienteHeyGenSimulado(consultas_ate_concluir=2)
+    gerenciador = _gerenciador(cliente, tmp_path)
+    item = _audios(tmp_path, 1)[0]
+    video_id = cliente.criar_video(cliente.enviar_audio(item["audio"]))
+
+    gerenciador.acompanhar(video_id, item["saida"])
+    gerenciador.aguardar()
+
+    assert gerenciador.job(item["saida"])["status"] == CONCLUIDO
+    with open(item["saida"], "rb") as f:
+        assert f.read() == b"VIDEO:audio 1"
+
+
+def test_banco_sem_hash_do_audio(tmp_path):
+    conexao = sqlite3.connect(str(tmp_path / "jobs.db"))
+    conexao.execute("CREATE TABLE jobs (saida TEXT PRIMARY KEY, audio TEXT NOT NULL, video_id TEXT,"
+                    " status TEXT NOT NULL, intervalo REAL NOT NULL, proxima_consulta REAL NOT NULL,"
+                    " consultas INTEGER NOT NULL DEFAULT 0, erro TEXT, criado_em REAL NOT NULL,"
+                    " atualizado_em REAL NOT NULL)")
+    item = _audios(tmp_path, 1)[0]
+    conexao.execute("INSERT INTO jobs VALUES (?, ?, 'video_antigo', ?, 1, 0, 3, NULL, 0, 0)",
+                    (str(item["saida"]), item["audio"], CONCLUIDO))
+    conexao.commit()
+    conexao.close()
+
+    gerenciador = _gerenciador(ClienteHeyGenSimulado(), tmp_path)
+
+    # Sem o hash, não há como saber se o vídeo é do mesmo áudio: o job é refeito
+    assert gerenciador.submeter(item["audio"], item["saida"])["video_id"] != "video_antigo"
+
+
+class _ClienteDownloadLento(ClienteHeyGenSimulado):
+    """Cliente simulado cujo download demora mais que o tempo máximo de espera."""
+
+    def baixar_video(self, video_url, caminho_saida):
+        time.sleep(0.5)
+        return super().baixar_video(video_url, caminho_saida)
+
+
+def test_tempo_maximo_nao_espera_downloads(tmp_path):
+    gerenciador = _gerenciador(_ClienteDownloadLento(), tmp_path)
+    item = _audios(tmp_path, 1)[0]
+    gerenciador.submeter(item["audio"], item["saida"])
+
+    inicio = time.monotonic()
+    jobs = gerenciador.aguardar(tempo_maximo=0.1)
+
+    assert time.monotonic() - inicio < 0.4
+    assert jobs[0]["status"] == PROCESSANDO
+    # O download termina em segundo plano mesmo com o banco já fechado
+    gerenciador.fechar()
+    time.sleep(0.6)
+    assert (tmp_path / "videos" / "secao_1.mp4").exists()
+
+
+def test_aguardar_apenas_as_saidas_informadas(tmp_path):
+    cliente = ClienteHeyGenSimulado(consultas_ate_concluir=2)
+    gerenciador = _gerenciador(cliente, tmp_path)
+    itens = _audios(tmp_path, 2)
+    gerenciador.submeter_lote(itens)
+
+    jobs = gerenciador.aguardar(saidas=[itens[0]["saida"]])
+
+    assert [job["status"] for job in jobs] == [CONCLUIDO]
+    assert gerenciador.job(itens[1]["saida"])["status"] == PROCESSANDO
+
+
+def test_video_corrompido_nao_e_reaproveitado(tmp_path):
+    cliente = ClienteHeyGenSimulado()
+    gerenciador = _gerenciador(cliente, tmp_path)
+    item = _audios(tmp_path, 1)[0]
+    gerenciador.submeter(item["audio"], item["saida"])
+    gerenciador.aguardar()
+
+    # Hash registrado no download diferente do conteúdo atual do vídeo
+    with open(item["saida"] + ".sha256", "w") as f:
+        f.write("0" * 64 + "  secao_1.mp4\n")
+
+    assert gerenciador.submeter(item["audio"], item["saida"])["status"] == PROCESSANDO
+    assert cliente.chamadas.count("criar_video") == 2
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Testes do pipeline de geração de vídeo por seções.
+Usa os serviços simulados: nenhuma chamada de rede é feita.
+"""
+import time
+import threading
+
+from core.content_splitter import MARCADOR_CORTE
+from core.heygen_api import ClienteHeyGenSimulado
+from core.pipeline_secoes import (
+    PipelineSecoes, GeradorAudioSimulado, LimiteConta, dividir_secoes, juntar_arquivos, criar_pipeline
+)
+
+SCRIPT = f"\n\n{MARCADOR_CORTE}\n\n".join([
+    "E aí, pessoal! Bem-vindos à Rapidinha.",
+    "Bitcoin sobe cinco por cento.",
+    "Ethereum acompanha o mercado.",
+    "Solana bate recorde.",
+    "E para finalizar: fiquem ligados!"
+])
+
+
+class _ClienteContando(ClienteHeyGenSimulado):
+    """Cliente simulado que mede quantos vídeos renderizam ao mesmo tempo."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.ativos = 0
+        self.maximo = 0
+        self._trava = threading.Lock()
+
+    def criar_video(self, audio_asset_id, dimensao=None, cor_fundo="#000000"):
+        with self._trava:
+            self.ativos += 1
+            self.maximo = max(self.maximo, self.ativos)
+        return super().criar_video(audio_asset_id, dimensao, cor_fundo)
+
+    def baixar_video(self, video_url, caminho_saida):
+        caminho = super().baixar_video(video_url, caminho_saida)
+        with self._trava:
+            self.ativos -= 1
+        return caminho
+
+
+def _pipeline(clientes, limites, **kwargs):
+    return PipelineSecoes(GeradorAudioSimulado(latencia=0.01), clientes, limites,
+                          intervalo_status=0.01, montador=juntar_arquivos, **kwargs)
+
+
+def test_dividir_secoes():
+    assert len(dividir_secoes(SCRIPT)) == 5
+    assert dividir_secoes(f"Introdução {MARCADOR_CORTE}  {MARCADOR_CORTE} Notícia") == ["Introdução", "Notícia"]
+
+    sem_marcadores = "Olá, pessoal!\n\nNotícia 1: Bitcoin sobe.\n\nNotícia 2: Ethereum cai."
+    assert len(dividir_secoes(sem_marcadores)) == 3
+
+
+def test_secoes_em_paralelo_montadas_em_ordem(tmp_path):
+    clientes = {
+        "conta1": _ClienteContando(consultas_ate_concluir=3, latencia=0.02),
+        "conta2": _ClienteContando(consultas_ate_concluir=3, latencia=0.02)
+    }
+    limites = {conta: LimiteConta(max_renderizacoes=1, intervalo_minimo=0.0) for conta in clientes}
+    pipeline = _pipeline(clientes, limites, max_workers=5)
+
+    resultado = pipeline.processar_script(SCRIPT, str(tmp_path), prefixo="teste")
+
+    assert [secao["status"] for secao in resultado["secoes"]] == ["concluido"] * 5
+    # Cada conta renderiza no máximo um vídeo por vez, mas as duas trabalham em paralelo
+    assert all(cliente.maximo == 1 for cliente in clientes.values())
+    assert {secao["conta"] for secao in resultado["secoes"]} == {"conta1", "conta2"}
+
+    with open(resultado["video_final"], "rb") as f:
+        final = f.read()
+    esperado = b"".join(b"VIDEO:AUDIO:" + texto.encode("utf-8") for texto in dividir_secoes(SCRIPT))
+    assert final == esperado
+
+
+def test_falha_em_uma_secao_nao_monta_video(tmp_path):
+    cliente = ClienteHeyGenSimulado(falhar_com="Solana".encode("utf-8"))
+    pipeline = _pipeline({"conta1": cliente}, {"conta1": LimiteConta(4, 0.0)})
+
+    resultado = pipeline.processar_script(SCRIPT, str(tmp_path))
+
+    status = [secao["status"] for secao in resultado["secoes"]]
+    assert status == ["concluido", "concluido", "concluido", "falhou", "concluido"]
+    assert "falha simulada" in resultado["secoes"][3]["erro"]
+    assert resultado["video_final"] is None
+
+
+def test_intervalo_minimo_entre_requisicoes():
+    limite = LimiteConta(intervalo_minimo=0.05)
+
+    inicio = time.monotonic()
+    for _ in range(4):
+        limite.aguardar_requisicao()
+
+    assert time.monotonic() - inicio >= 0.15
+
+
+def test_processar_audios_existentes(tmp_path):
+    audios = []
+    for i in range(3):
+        caminho = tmp_path / f"rapidinha_secao_{i + 1}.mp3"
+        caminho.write_bytes(f"audio {i + 1}".encode("utf-8"))
+        audios.append(str(caminho))
+
+    pipeline = criar_pipeline(simulado=True, max_workers=3)
+    resultado = pipeline.processar_audios(audios, str(tmp_path / "videos"), prefixo="rapidinha_video")
+
+    assert [secao["video"].endswith(f"rapidinha_video_secao_{i + 1}.mp4")
+            for i, secao in enumerate(resultado["secoes"])] == [True] * 3
+    with open(resultado["video_final"], "rb") as f:
+        assert f.read() == b"VIDEO:audio 1VIDEO:audio 2VIDEO:audio 3"
+
+
+def test_retoma_secoes_de_execucao_anterior(tmp_path):
+    cliente = ClienteHeyGenSimulado(consultas_ate_concluir=2)
+    diretorio_jobs = str(tmp_path / "jobs")
+
+    primeiro = _pipeline({"conta1": cliente}, {"conta1": LimiteConta(4, 0.0)}, diretorio_jobs=diretorio_jobs)
+    assert primeiro.processar_script(SCRIPT, str(tmp_path / "videos"))["video_final"]
+    primeiro.fechar()
+    assert cliente.chamadas.count("criar_video") == 5
+
+    # Os vídeos já baixados para os mesmos áudios não são renderizados de novo
+    segundo = _pipeline({"conta1": cliente}, {"conta1": LimiteConta(4, 0.0)}, diretorio_jobs=diretorio_jobs)
+    resultado = segundo.processar_script(SCRIPT, str(tmp_path / "videos"))
+    segundo.fechar()
+
+    assert [secao["status"] for secao in resultado["secoes"]] == ["concluido"] * 5
+    assert cliente.chamadas.count("criar_video") == 5
+    assert cliente.chamadas.count("status_video") == 10
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the cache of encoded video segments.
+The end-to-end render uses the FFmpeg binary bundled with imageio-ffmpeg.
+"""
+import os
+import subprocess
+
+import numpy as np
+import pytest
+
+import core.video_ffmpeg
+from core.segment_cache import SegmentCache
+from core.video_ffmpeg import FilterGraphRenderer
+
+video = pytest.importorskip("core.video")
+
+
+class _FakeTextClip:
+    """Stands in for MoviePy's TextClip (which needs ImageMagick)."""
+
+    def __init__(self, text, **kwargs):
+        self.img = np.full((10, 20, 3), 255, dtype=np.uint8)
+        self.mask = type("Mask", (), {"img": np.ones((10, 20))})()
+
+
+def _store(cache, tmp_path, key, size):
+    source = tmp_path / f"{key}.tmp"
+    source.write_bytes(b"\0" * size)
+    return cache.put(key, str(source))
+
+
+def test_get_put_and_lru_eviction(tmp_path):
+    cache = SegmentCache(str(tmp_path / "segments"), max_bytes=250)
+    assert cache.get("a") is None
+
+    for key in ("a", "b", "c"):
+        _store(cache, tmp_path, key, 100)
+        os.utime(cache._path(key), (0, {"a": 1, "b": 2, "c": 3}[key]))
+    # Using "a" makes "b" the least recently used segment
+    assert cache.get("a") == cache._path("a")
+
+    assert cache.evict() == 1
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c")
+
+
+def test_key_depends_on_contents():
+    base = SegmentCache.make_key("segment", section={"text": "Olá"}, frames=30)
+
+    assert base == SegmentCache.make_key("segment", frames=30, section={"text": "Olá"})
+    assert base != SegmentCache.make_key("segment", section={"text": "Olá"}, frames=31)
+    assert base != SegmentCache.make_key("segment", section={"text": "Oi"}, frames=30)
+
+
+@pytest.fixture
+def gerador(tmp_path, monkeypatch):
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+    monkeypatch.setattr(core.video_ffmpeg, "FFMPEG_BINARY", imageio_ffmpeg.get_ffmpeg_exe())
+    monkeypatch.setattr(video, "TextClip", _FakeTextClip)
+
+    gerador = video.VideoGenerator(use_frame_cache=False, card_cache_dir=str(tmp_path / "cards"),
+                                   render_backend="segmented", render_workers=1,
+                                   segment_cache_dir=str(tmp_path / "segments"))
+    gerador.video_width, gerador.video_height, gerador.fps = 64, 48, 10
+    return gerador
+
+
+def _sections(texts):
+    sections = []
+    for i, text in enumerate(texts):
+        frame = np.full((48, 64, 3), 60 * (i + 1), dtype=np.uint8)
+        sections.append({"kind": "content", "duration": 0.5, "frame": frame, "darken": 0.7,
+                         "box": 0.4, "text": text, "fontsize": 60})
+    return sections
+
+
+def test_only_changed_segments_are_encoded(gerador, tmp_path, monkeypatch):
+    encoded = []
+    encode_segments = FilterGraphRenderer.encode_segments
+
+    def counting_encode(self, sections, frame_counts, directory, workers=None):
+        encoded.append(len(sections))
+        return encode_segments(self, sections, frame_counts, directory, workers)
+
+    monkeypatch.setattr(FilterGraphRenderer, "encode_segments", counting_encode)
+
+    first = str(tmp_path / "primeiro.mp4")
+    assert gerador._render_sections(_sections(["a", "b", "c"]), first) == first
+    second = str(tmp_path / "segundo.mp4")
+    assert gerador._render_sections(_sections(["a", "B", "c"]), second) == second
+    third = str(tmp_path / "terceiro.mp4")
+    assert gerador._render_sections(_sections(["a", "B", "c"]), third) == third
+
+    assert encoded == [3, 1]
+    assert len(os.listdir(gerador.segment_cache.cache_dir)) == 4
+
+    ffmpeg = core.video_ffmpeg.FFMPEG_BINARY
+    raw = subprocess.run([ffmpeg, "-i", third, "-f", "rawvideo", "-pix_fmt", "rgb24", "-"],
+                         capture_output=True, check=True).stdout
+    frames = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 48, 64, 3)
+    assert len(frames) == 15
+
+
+def test_segment_key_covers_frame_and_style(gerador):
+    renderer = FilterGraphRenderer(64, 48, 10)
+    section = _sections(["a"])[0]
+    key = gerador._segment_key(section, 5, renderer)
+
+    changed_frame = dict(section, frame=section["frame"] + 1)
+    assert gerador._segment_key(changed_frame, 5, renderer) != key
+    assert gerador._segment_key(section, 6, renderer) != key
+    assert gerador._segment_key(section, 5, FilterGraphRenderer(64, 48, 10, preset="fast")) != key
+
+    gerador.text_color = (255, 255, 0)
+    assert gerador._segment_key(section, 5, renderer) != key
+
+
+def test_section_frames_are_stable_with_the_cache(gerador):
+    first = gerador._section_rng("Bitcoin sobe").random()
+
+    assert gerador._section_rng("Bitcoin sobe").random() == first
+    assert gerador._section_rng("Bitcoin cai").random() != first
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Testes da análise de sentimento em lote com o léxico local em português.
+Não usa a rede: a tradução usa o backend offline.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from core.lexico_sentimento import PontuadorLexico
+from core.tradutor import Tradutor, BackendDicionario
+
+
+def _buscador_tweets():
+    # O buscador de tweets (e o gerador de scripts, que o importa) precisa do nltk e do TextBlob
+    pytest.importorskip("nltk")
+    pytest.importorskip("textblob")
+    import buscador_tweets_cripto
+    return buscador_tweets_cripto
+
+
+def _analisador(tmp_path, traducoes=None):
+    tradutor = Tradutor(backend=BackendDicionario(traducoes), arquivo_memoria=str(tmp_path / "traducoes.db"))
+    return _buscador_tweets().AnalisadorSentimento(tradutor)
+
+
+def test_lexico_classifica_textos_em_portugues():
+    pontuador = PontuadorLexico()
+
+    resultados = pontuador.analisar_lote([
+        "Ótimas notícias sobre Bitcoin! O mercado está em alta! 🚀",
+        "Preocupante situação para Bitcoin, os preços estão caindo rapidamente. 📉",
+        "Informações neutras sobre Bitcoin. O mercado segue estável.",
+        "O Bitcoin não caiu hoje"
+    ])
+
+    assert [classificacao for _, classificacao in resultados] == ["positivo", "negativo", "neutro", "positivo"]
+    assert all(-1.0 < polaridade < 1.0 for polaridade, _ in resultados)
+
+
+def test_memoriza_por_texto_normalizado():
+    pontuador = PontuadorLexico()
+    chamadas = []
+    original = pontuador._pontuar_normalizado
+
+    def contando(texto):
+        chamadas.append(texto)
+        return original(texto)
+
+    pontuador._pontuar_normalizado = contando
+
+    polaridades = pontuador.pontuar_lote([
+        "Bitcoin em ALTA  https://t.co/abc",
+        "bitcoin em alta @fulano",
+        "Bitcoin em alta"
+    ])
+
+    assert len(chamadas) == 1
+    assert len(set(polaridades)) == 1
+
+
+def test_analisar_lote_com_varios_idiomas(tmp_path):
+    analisador = _analisador(tmp_path, {"bitcoin es excelente": "bitcoin is excellent"})
+
+    resultados = analisador.analisar_lote(
+        ["Lucro excelente hoje!", "Terrible crash today", "Bitcoin es excelente"],
+        ["pt", "en", "es"]
+    )
+
+    assert [classificacao for _, classificacao in resultados] == ["positivo", "negativo", "positivo"]
+    # Português não passa pelo tradutor; só o texto em espanhol é traduzido
+    assert analisador.tradutor.chamadas_backend == 1
+    assert analisador.analisar("Terrible crash today", "en") == resultados[1]
+
+
+def test_selecionar_melhores_tweets_analisa_em_lote(tmp_path):
+    analisador = _analisador(tmp_path)
+    from core.gerador_script import GeradorScript
+
+    gerador = GeradorScript.__new__(GeradorScript)
+    gerador.buscador_tweets = SimpleNamespace(analisador_sentimento=analisador)
+
+    tweets = [
+        {"text": "Excelente momento para investir!", "idioma": "pt", "likes": 10},
+        {"text": "Golpe e fraude na corretora", "idioma": "pt", "likes": 100},
+        {"text": "Mercado em alta", "idioma": "pt", "likes": 50, "sentimento": "positivo"}
+    ]
+
+    melhores = gerador._selecionar_melhores_tweets(tweets, 2)
+
+    assert [t["text"] for t in melhores] == ["Mercado em alta", "Excelente momento para investir!"]
+    assert tweets[1]["sentimento"] == "negativo"
+
+
+def test_tweets_simulados_analisados_em_lote(tmp_path, monkeypatch):
+    modulo = _buscador_tweets()
+    scraper = modulo.TwitterCriptoScraper.__new__(modulo.TwitterCriptoScraper)
+    scraper.analisador_sentimento = _analisador(tmp_path)
+    scraper.usar_fontes_confiaveis = False
+    scraper.filtro_sentimento = None
+
+    lotes = []
+    analisar_lote = scraper.analisador_sentimento.analisar_lote
+    monkeypatch.setattr(scraper.analisador_sentimento, "analisar_lote",
+                        lambda textos, idiomas: lotes.append(len(textos)) or analisar_lote(textos, idiomas))
+    monkeypatch.setattr(scraper.analisador_sentimento, "analisar",
+                        lambda texto, idioma: pytest.fail("tweet analisado individualmente"))
+    monkeypatch.setattr(modulo.cliente_http, "get", lambda *args, **kwargs: SimpleNamespace(raise_for_status=lambda: None))
+
+    tweets = scraper._buscar_tweets_alternativo("Bitcoin", max_results=5)
+
+    assert lotes == [5]
+    assert [t["sentimento"] for t in tweets][:2] == ["positivo", "negativo"]
@@ -4,10 +4,13 @@ Script para testar a geração de vídeo com um avatar específico usando a nova
 """
 import os
 import json
-import requests
 import time
 from dotenv import load_dotenv
 
+from core import cliente_http
+from core.heygen_api import ClienteHeyGen, vincular_copia
+from core.jobs_heygen import GerenciadorJobsHeyGen, CONCLUIDO
+
 # Carregar variáveis de ambiente
 load_dotenv()
 
@@ -29,8 +32,7 @@ def generate_video():
     Returns:
         str: Caminho para o vídeo gerado, ou None se falhar.
     """
-    # URLs base da API
-    api_base_url = "https://api.heygen.com/v1"
+    # URL da API
     video_url = "https://api.heygen.com/v2/video/generate"
 
     # Configurar cabeçalhos
@@ -73,7 +75,7 @@ def generate_video():
         print(f"Dados da requisição: {json.dumps(video_data, indent=2)}")
 
         # Criar o vídeo
-        video_response = requests.post(video_url, headers=headers, json=video_data)
+        video_response = cliente_http.post(video_url, headers=headers, json=video_data)
         print(f"Status code: {video_response.status_code}")
 
         if video_response.status_code == 200:
@@ -92,60 +94,30 @@ def generate_video():
             print(f"Resposta: {video_response.text}")
             return None
 
-        # Verificar o status do vídeo e baixá-lo quando estiver pronto
+        # Acompanhar a renderização e baixar o vídeo com o gerenciador de jobs
         print(f"Vídeo em processamento (ID: {video_id}). Aguardando conclusão...")
 
-        status_url = f"{api_base_url}/video_status.get?video_id={video_id}"
-        max_attempts = 60  # 5 minutos (5 segundos por tentativa)
-
-        for attempt in range(max_attempts):
-            status_response = requests.get(status_url, headers=headers)
-            status_response.raise_for_status()
-
-            status_result = status_response.json()
-            status = status_result.get("data", {}).get("status")
-
-            if status == "completed":
-                # Vídeo pronto, baixar
-                video_url = status_result.get("data", {}).get("video_url")
-
-                if video_url:
-                    try:
-                        print(f"Vídeo pronto! Baixando de {video_url}...")
-                        video_content_response = requests.get(video_url)
-                        video_content_response.raise_for_status()
-
-                        with open(output_path, 'wb') as f:
-                            f.write(video_content_response.content)
+        manager = GerenciadorJobsHeyGen(ClienteHeyGen(API_KEY, AVATAR_ID), arquivo=":memory:")
+        try:
+            manager.acompanhar(video_id, output_path)
+            manager.aguardar(tempo_maximo=300)  # 5 minutos
+            job = manager.job(output_path)
+        finally:
+            manager.fechar()
 
-                        print(f"Vídeo salvo em {output_path}")
-
-                        # Salvar uma cópia do vídeo com o ID para referência
-                        video_id_path = os.path.join(os.path.dirname(output_path), f"heygen_{video_id}.mp4")
-                        with open(video_id_path, 'wb') as f:
-                            f.write(video_content_response.content)
+        if job["status"] != CONCLUIDO:
+            print(f"Falha ao processar o vídeo: {job['erro'] or 'tempo limite excedido'}")
+            return None
 
-                        print(f"Cópia do vídeo salva em {video_id_path}")
+        print(f"Vídeo salvo em {output_path}")
 
-                        return output_path
-                    except Exception as e:
-                        print(f"Erro ao baixar o vídeo: {e}")
-                        return None
-                else:
-                    print("URL do vídeo não encontrada na resposta.")
-                    return None
+        # Salvar uma cópia do vídeo com o ID para referência
+        video_id_path = os.path.join(os.path.dirname(output_path), f"heygen_{video_id}.mp4")
+        vincular_copia(output_path, video_id_path)
 
-            elif status == "failed":
-                error = status_result.get("data", {}).get("error")
-                print(f"Falha ao processar o vídeo: {error}")
-                return None
+        print(f"Cópia do vídeo salva em {video_id_path}")
 
-            # Aguardar 5 segundos antes de verificar novamente
-            print(f"Status do vídeo: {status}. Verificando novamente em 5 segundos...")
-            time.sleep(5)
-
-        print("Tempo limite excedido ao aguardar o processamento do vídeo.")
-        return None
+        return output_path
 
     except Exception as e:
         print(f"Erro ao gerar vídeo: {e}")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the text optimization engine and its profiles.
+The golden outputs were produced by the implementations each profile replaced.
+"""
+import os
+import glob
+
+import pytest
+
+from core.text import TextProcessor
+from core.text_optimizer import get_optimizer, optimize
+from core.utils import optimize_text
+from gerar_audio_rapido import optimize_text_for_speed
+
+SCRIPTS = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts", "*.txt")))
+
+
+@pytest.fixture(scope="module")
+def processor():
+    return TextProcessor()
+
+
+@pytest.mark.parametrize("text", [
+    "E aí galera, tudo bem? Fala cambada!",
+    "O Bitcoin subiu; Bitcoins e bitcoin não mudam. NFT e DeFi também.",
+    "Está muito forte, MUITO forte e Muito superior... super!",
+    "Alta de 1,5% mas e então porém caiu",
+    "a e e e b mas mas c E MAS d",
+    "Nova máxima: MÁXIMA incrível e INCRÍVEL",
+    "",
+])
+def test_same_output_as_sequential(processor, text):
+    assert processor.optimize_for_speech(text) == processor._optimize_for_speech_sequential(text)
+
+
+def test_known_output(processor):
+    text = "Fala galera! O Bitcoin está muito forte, mas caiu 1,5%."
+
+    assert processor.optimize_for_speech(text) == "FALAGALERA O Bitcoim está MUITO FORTE mas- caiu 15%."
+
+
+@pytest.mark.skipif(not SCRIPTS, reason="no scripts in scripts/")
+def test_scripts_corpus(processor):
+    for path in SCRIPTS:
+        with open(path, "r", encoding="utf-8") as f:
+            script = f.read()
+        assert processor.optimize_for_speech(script) == processor._optimize_for_speech_sequential(script), path
+
+
+def test_sequential_mode(processor):
+    sequential = TextProcessor(use_compiled=False)
+    text = "E aí cambada, o Ethereum está bombando"
+
+    assert sequential.optimize_for_speech(text) == processor.optimize_for_speech(text)
+
+
+GOLDEN = [
+    ("speech", "E aí galera, hoje o Bitcoin está bombando!!! Muito forte; a altcoin subiu...",
+     "EAÍGALERA hoje o Bitcoim está BOMBANDO MUITO FORTE  a ôltcoin subiu"),
+    ("speech", "Fala cambada! NFT e DeFi em alta, mas e então o staking: 1,5% de ganho.",
+     "FALACAMBADA ÊnÊfeTê e- DêFai em ALTA mas- e- então- o stêiking  15% de ganho."),
+    ("speech", "O Ethereum bateu MÁXIMA histórica. Bitcoins e bitcoin não mudam",
+     "O Etherium bateu MÁXIMA histórica Bitcoins e- bitcoin não mudam"),
+    ("natural", "E aí cambada, hoje o Bitcoin está bombando!!! Muito forte; a altcoin subiu...",
+     "EAÍCAMBADA hoje o Bitcoim está BOMBANDO MUITO FORTE a ôltcoin subiu"),
+    ("natural", "Fala cambada! NFT e DeFi em alta, staking e mining - miner e wallet.",
+     "FALACAMBADA ÊnÊfeTê e DêFai em ALTA stêiking e máining - máiner e wólet"),
+    ("natural", "O Ethereum bateu Máxima histórica? Super incrível, MEGA alta",
+     "O Etherium bateu MÁXIMA histórica SUPER INCRÍVEL MEGA ALTA"),
+    ("natural", "  Preço   de 1,5 mil -- o token   caiu... e  então?? ",
+     "  Preço   de 15 mil -- o tôken   caiu e  então "),
+    ("fast", "E aí cambada, hoje o Bitcoin está bombando!!! Muito forte; a altcoin subiu...",
+     "<prosody rate='1.25'>EAÍCAMBADA hoje o Bitcoim está bombando!! Muito forte a altcoin subiu.</prosody>"),
+    ("fast", "Fala cambada! NFT e DeFi em alta, staking e mining - miner e wallet.",
+     "<prosody rate='1.25'>FALACAMBADA! ÊnÊfeTê e DêFai em alta staking e mining miner e wallet.</prosody>"),
+    ("fast", "  Preço   de 1,5 mil -- o token   caiu... e  então?? ",
+     "<prosody rate='1.25'>Preço de 15 mil o token caiu. e então?</prosody>"),
+]
+
+
+@pytest.mark.parametrize("profile, text, expected", GOLDEN)
+def test_golden_output(profile, text, expected):
+    assert optimize(text, profile) == expected
+
+
+def test_callers_use_the_profiles(processor):
+    for profile, text, expected in GOLDEN:
+        if profile == "speech":
+            assert processor.optimize_for_speech(text) == expected
+        elif profile == "natural":
+            assert optimize_text(text) == expected
+        else:
+            assert optimize_text_for_speed(text) == expected
+
+
+def test_empty_text():
+    assert optimize("", "speech") == ""
+    assert optimize("", "natural") == ""
+    assert optimize("", "fast") == "<prosody rate='1.25'></prosody>"
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        get_optimizer("robotico")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Testes da camada de tradução com memória de tradução persistente.
+Usa o backend offline, sem acesso à rede.
+"""
+from core.tradutor import Tradutor, BackendDicionario, BackendGoogletrans, GOOGLETRANS_DISPONIVEL
+from buscador_noticias_cripto import NoticiasCriptoScraper
+
+TRADUCOES = {
+    "Bitcoin hits new high": "Bitcoin atinge nova máxima",
+    "Prices rose sharply today.": "Os preços subiram fortemente hoje.",
+    "Ethereum upgrade delayed": "Atualização do Ethereum adiada"
+}
+
+HTML_PORTAL = """
+<html><body>
+  <article class="noticia">
+    <h2><a href="/bitcoin">Bitcoin hits new high</a></h2>
+    <p class="resumo">Prices rose sharply today.</p>
+  </article>
+  <article class="noticia">
+    <h2><a href="/ethereum">Ethereum upgrade delayed</a></h2>
+    <p class="resumo"></p>
+  </article>
+</body></html>
+"""
+
+
+class BackendContando(BackendDicionario):
+    def __init__(self, traducoes):
+        super().__init__(traducoes)
+        self.lotes = []
+
+    def traduzir_lote(self, textos, origem, destino):
+        self.lotes.append(list(textos))
+        return super().traduzir_lote(textos, origem, destino)
+
+
+def test_memoria_persistente(tmp_path):
+    arquivo = str(tmp_path / "traducoes.db")
+    backend = BackendContando(TRADUCOES)
+    tradutor = Tradutor(backend=backend, arquivo_memoria=arquivo)
+
+    textos = ["Bitcoin hits new high", "", "Prices rose sharply today.", "Bitcoin hits new high"]
+    traduzidos = tradutor.traduzir_lote(textos, "en", "pt")
+
+    assert traduzidos == ["Bitcoin atinge nova máxima", "", "Os preços subiram fortemente hoje.",
+                          "Bitcoin atinge nova máxima"]
+    # Uma única chamada ao backend, sem textos repetidos nem vazios
+    assert backend.lotes == [["Bitcoin hits new high", "Prices rose sharply today."]]
+
+    # Uma nova instância reaproveita a memória gravada em disco
+    outro_backend = BackendContando(TRADUCOES)
+    outro = Tradutor(backend=outro_backend, arquivo_memoria=arquivo)
+    assert outro.traduzir_lote(textos, "en", "pt") == traduzidos
+    assert outro_backend.lotes == []
+    assert outro.chamadas_backend == 0
+
+
+def test_scraper_sem_chamadas_na_segunda_execucao(tmp_path):
+    portal = {
+        "nome": "Portal Internacional",
+        "url": "https://example.com/",
+        "seletor_noticias": "article.noticia",
+        "seletor_titulo": "h2 a",
+        "seletor_link": "h2 a",
+        "seletor_data": "time.data",
+        "seletor_resumo": "p.resumo",
+        "formato_data": "%d/%m/%Y",
+        "idioma": "en",
+        "confiabilidade": 8
+    }
+
+    def executar():
+        tradutor = Tradutor(backend=BackendContando(TRADUCOES),
+                            arquivo_memoria=str(tmp_path / "traducoes.db"))
+        scraper = NoticiasCriptoScraper(cache_dir=str(tmp_path / "cache"), usar_cache_http=False,
+                                        tradutor=tradutor)
+        return scraper._extrair_noticias(portal, HTML_PORTAL), tradutor
+
+    primeira, tradutor = executar()
+    assert [n["titulo"] for n in primeira] == ["Bitcoin atinge nova máxima", "Atualização do Ethereum adiada"]
+    assert primeira[0]["titulo_original"] == "Bitcoin hits new high"
+    assert primeira[0]["resumo"] == "Os preços subiram fortemente hoje."
+    assert "resumo_original" not in primeira[1]
+    assert all(n["traduzido"] and n["idioma"] == "pt" for n in primeira)
+    assert len(tradutor.backend.lotes) == 1
+
+    segunda, tradutor = executar()
+    assert tradutor.chamadas_backend == 0
+    assert [n["titulo"] for n in segunda] == [n["titulo"] for n in primeira]
+
+
+def test_lotes_googletrans():
+    if not GOOGLETRANS_DISPONIVEL:
+        return
+
+    backend = BackendGoogletrans(max_caracteres=20)
+    lotes = backend._lotes(["aaaa", "bbbb", "linha\nquebrada", "c" * 30, "dddddddddd", "eeee"])
+
+    assert lotes == [[2], [3], [0, 1], [4, 5]]
+
+
+def test_falha_na_traducao_nao_altera_itens(tmp_path):
+    class BackendComFalha:
+        def traduzir_lote(self, textos, origem, destino):
+            raise RuntimeError("serviço indisponível")
+
+    tradutor = Tradutor(backend=BackendComFalha(), arquivo_memoria=str(tmp_path / "traducoes.db"))
+    itens = [{"titulo": "Bitcoin hits new high", "idioma": "en"}, {"titulo": "Bitcoin sobe", "idioma": "pt"}]
+
+    resultado = tradutor.traduzir_itens(itens, ["titulo"])
+
+    assert itens == [{"titulo": "Bitcoin hits new high", "idioma": "en"}, {"titulo": "Bitcoin sobe", "idioma": "pt"}]
+    assert resultado[0] == {"titulo": "Bitcoin hits new high", "idioma": "en", "traduzido": False}
+    assert resultado[1] is itens[1]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Testes do verificador incremental de notícias.
+"""
+from datetime import datetime, timedelta
+
+from core.verificador_noticias import VerificadorNoticias
+from core.verificador_incremental import VerificadorIncremental
+from test_verificador_noticias import NOTICIAS_SIMULADAS
+
+
+def _noticia(link, titulo, resumo, portal, dias_atras=0, credibilidade=7):
+    return {
+        "titulo": titulo,
+        "resumo": resumo,
+        "link": link,
+        "data_iso": (datetime.now() - timedelta(days=dias_atras)).isoformat(),
+        "portal": portal,
+        "credibilidade": credibilidade,
+        "razoes_credibilidade": []
+    }
+
+
+BITCOIN_1 = _noticia("a", "Bitcoin atinge novo recorde histórico de preço",
+                     "O Bitcoin atingiu um novo recorde histórico de preço nesta segunda-feira.", "Portal 1")
+BITCOIN_2 = _noticia("b", "Bitcoin atinge novo recorde histórico de preço hoje",
+                     "O Bitcoin atingiu novo recorde histórico de preço nesta segunda-feira.", "Portal 2")
+ETHEREUM = _noticia("c", "Ethereum lança atualização da rede principal",
+                    "A rede Ethereum recebeu a atualização prevista para este mês.", "Portal 3")
+
+
+def test_mesmo_resultado_da_verificacao_completa(tmp_path):
+    arquivo = str(tmp_path / "estado.json")
+    limiar = 0.4
+    incremental = VerificadorIncremental(arquivo_estado=arquivo, dias_max=100000, limiar_similaridade=limiar)
+
+    assert incremental.verificar_noticias(NOTICIAS_SIMULADAS) == \
+        VerificadorNoticias(limiar_similaridade=limiar).verificar_noticias(NOTICIAS_SIMULADAS)
+
+
+def test_grupos_persistem_entre_execucoes(tmp_path, monkeypatch):
+    arquivo = str(tmp_path / "estado.json")
+    VerificadorIncremental(arquivo_estado=arquivo).verificar_noticias([BITCOIN_1, ETHEREUM])
+
+    # Na segunda execução, só a notícia nova é comparada
+    verificador = VerificadorIncremental(arquivo_estado=arquivo)
+    comparacoes = []
+    pontuar_original = verificador._pontuar_par
+
+    def pontuar_contando(dados_i, dados_j):
+        comparacoes.append((dados_i['titulo'], dados_j['titulo']))
+        return pontuar_original(dados_i, dados_j)
+
+    monkeypatch.setattr(verificador, "_pontuar_par", pontuar_contando)
+
+    resultado = verificador.verificar_noticias([BITCOIN_1, BITCOIN_2, ETHEREUM])
+
+    assert len(comparacoes) == 1
+    por_link = {noticia["link"]: noticia for noticia in resultado}
+    assert por_link["a"]["cruzamento"]["fontes"] == ["Portal 1", "Portal 2"]
+    assert por_link["b"]["cruzamento"]["confirmado"]
+    assert por_link["a"]["credibilidade"] == 8
+    assert por_link["c"]["cruzamento"]["num_fontes"] == 1
+
+
+def test_remove_noticias_antigas(tmp_path):
+    arquivo = str(tmp_path / "estado.json")
+    antiga = _noticia("antiga", BITCOIN_2["titulo"], BITCOIN_2["resumo"], "Portal 2", dias_atras=10)
+
+    VerificadorIncremental(arquivo_estado=arquivo, dias_max=30).verificar_noticias([BITCOIN_1, antiga])
+
+    verificador = VerificadorIncremental(arquivo_estado=arquivo, dias_max=7)
+    resultado = verificador.verificar_noticias([BITCOIN_1])
+
+    assert "antiga" not in verificador.noticias
+    assert resultado[0]["cruzamento"]["num_fontes"] == 1
+    assert resultado[0]["cruzamento"]["fontes"] == ["Portal 1"]
+    assert not resultado[0]["cruzamento"]["confirmado"]
+
+
+def test_par_com_uma_palavra_em_comum(tmp_path):
+    # Títulos e resumos quase iguais, mas só "bitcoin" em comum entre as palavras-chave
+    arquivo = str(tmp_path / "estado.json")
+    VerificadorIncremental(arquivo_estado=arquivo).verificar_noticias(
+        [_noticia("a", "BTC em alta de 5%", "Vai a 10 mil", "Portal 1")]
+    )
+
+    resultado = VerificadorIncremental(arquivo_estado=arquivo).verificar_noticias(
+        [_noticia("b", "BTC em alto de 5%", "Vai a 10 mil", "Portal 2")]
+    )
+
+    assert resultado[0]["cruzamento"]["fontes"] == ["Portal 1", "Portal 2"]
+    assert VerificadorNoticias(usar_indice=False).verificar_noticias(
+        [_noticia("a", "BTC em alta de 5%", "Vai a 10 mil", "Portal 1"),
+         _noticia("b", "BTC em alto de 5%", "Vai a 10 mil", "Portal 2")]
+    )[1]["cruzamento"]["fontes"] == ["Portal 1", "Portal 2"]
+
+
+def test_datas_com_fuso_convertidas_para_utc(tmp_path):
+    verificador = VerificadorIncremental(arquivo_estado=str(tmp_path / "estado.json"))
+
+    sao_paulo = verificador._data_referencia({"data_iso": "2025-01-01T22:00:00-03:00"}, "")
+    londres = verificador._data_referencia({"data_iso": "2025-01-02T00:30:00+00:00"}, "")
+
+    assert sao_paulo == "2025-01-02T01:00:00"
+    assert londres < sao_paulo
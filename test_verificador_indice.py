@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Testes do agrupamento indexado do verificador de notícias.
+O resultado deve ser igual ao do algoritmo exaustivo de referência.
+"""
+import pytest
+
+from core.verificador_noticias import VerificadorNoticias
+from test_verificador_noticias import NOTICIAS_SIMULADAS
+from tools.benchmark_verificador import generate_news
+
+
+def _links(grupos):
+    return [[noticia["link"] for noticia in grupo] for grupo in grupos]
+
+
+@pytest.mark.parametrize("limiar", [0.7, 0.8])
+def test_indice_igual_ao_exaustivo(limiar):
+    noticias = generate_news(100, seed=7)
+
+    indexado = VerificadorNoticias(limiar_similaridade=limiar, usar_indice=True)
+    exaustivo = VerificadorNoticias(limiar_similaridade=limiar, usar_indice=False)
+
+    grupos_indexados = indexado._agrupar_noticias_similares(noticias)
+    grupos_exaustivos = exaustivo._agrupar_noticias_similares(noticias)
+
+    assert _links(grupos_indexados) == _links(grupos_exaustivos)
+    assert any(len(grupo) > 1 for grupo in grupos_indexados)
+
+
+def test_verificacao_igual_ao_exaustivo():
+    indexado = VerificadorNoticias(usar_indice=True).verificar_noticias(NOTICIAS_SIMULADAS)
+    exaustivo = VerificadorNoticias(usar_indice=False).verificar_noticias(NOTICIAS_SIMULADAS)
+
+    assert indexado == exaustivo
+
+
+def test_titulos_identicos_sem_palavras_chave():
+    # Palavras curtas não viram palavras-chave: o par só é encontrado pelo título
+    noticias = [
+        {"titulo": "Alta de 5%", "resumo": "Vai a 10", "link": "a", "portal": "P1"},
+        {"titulo": "Alta de 5%", "resumo": "Vai a 10", "link": "b", "portal": "P2"},
+        {"titulo": "Nada mudou", "resumo": "", "link": "c", "portal": "P3"}
+    ]
+
+    grupos = VerificadorNoticias(usar_indice=True)._agrupar_noticias_similares(noticias)
+
+    assert _links(grupos) == [["a", "b"], ["c"]]
+
+
+def test_backend_tfidf():
+    pytest.importorskip("sklearn")
+
+    noticias = [
+        {"titulo": "Bitcoin atinge novo recorde histórico de preço",
+         "resumo": "O Bitcoin atingiu um novo recorde histórico de preço nesta segunda-feira.",
+         "link": "a", "portal": "P1"},
+        {"titulo": "Bitcoin atinge novo recorde histórico de preço!",
+         "resumo": "O Bitcoin atingiu novo recorde histórico de preço nesta segunda-feira.",
+         "link": "b", "portal": "P2"},
+        {"titulo": "Ethereum lança atualização da rede principal",
+         "resumo": "A rede Ethereum recebeu a atualização prevista para este mês.",
+         "link": "c", "portal": "P3"}
+    ]
+
+    verificador = VerificadorNoticias(backend_similaridade="tfidf")
+    assert verificador.backend_similaridade == "tfidf"
+    assert _links(verificador._agrupar_noticias_similares(noticias)) == [["a", "b"], ["c"]]
+
+
+def test_backend_invalido():
+    with pytest.raises(ValueError):
+        VerificadorNoticias(backend_similaridade="levenshtein")
+
+
+def test_consistencia_reaproveita_similaridades():
+    noticias = generate_news(100, seed=7)
+    verificador = VerificadorNoticias()
+    grupos, similaridades_resumo = verificador._agrupar_indices(noticias)
+
+    assert similaridades_resumo
+    for indices in grupos:
+        grupo = [noticias[idx] for idx in indices]
+        assert (verificador._analisar_consistencia_grupo(grupo, indices, similaridades_resumo)
+                == verificador._analisar_consistencia_grupo(grupo))
+
+
+def test_palavras_frequentes_nao_escondem_pares():
+    # Todas as palavras-chave das notícias aparecem em mais de 100 notícias
+    noticias = [{"titulo": f"Bitcoin preço mercado sobe {i}", "resumo": f"Relatório {i}",
+                 "link": f"f{i}", "portal": "P1"} for i in range(120)]
+    noticias += [
+        {"titulo": "Mercado: bitcoin sobe de preço", "resumo": "", "link": "a", "portal": "P2"},
+        {"titulo": "Mercado - bitcoin sobe de preço", "resumo": "", "link": "b", "portal": "P3"}
+    ]
+
+    indexado = VerificadorNoticias(usar_indice=True)._agrupar_noticias_similares(noticias)
+    exaustivo = VerificadorNoticias(usar_indice=False)._agrupar_noticias_similares(noticias)
+
+    assert _links(indexado) == _links(exaustivo)
+    assert ["a", "b"] in _links(indexado)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the FFmpeg filtergraph render backend.
+The end-to-end render uses the FFmpeg binary bundled with imageio-ffmpeg.
+"""
+import subprocess
+
+import numpy as np
+import pytest
+
+import core.video_ffmpeg
+from core.video_ffmpeg import FilterGraphRenderer, blit, center_position
+
+video = pytest.importorskip("core.video")
+
+
+class _FakeTextClip:
+    """Stands in for MoviePy's TextClip (which needs ImageMagick): white text, half transparent."""
+
+    def __init__(self, text, **kwargs):
+        self.img = np.full((20, 40, 3), 255, dtype=np.uint8)
+        self.mask = type("Mask", (), {"img": np.full((20, 40), 0.5)})()
+
+
+def _section(color, duration, **kwargs):
+    image = np.empty((48, 64, 3), dtype=np.uint8)
+    image[...] = color
+    return dict(image=image, duration=duration, **kwargs)
+
+
+def test_frame_counts_follow_the_timeline():
+    renderer = FilterGraphRenderer(64, 48, 30)
+    durations = [3.0, 1.01, 2.345, 0.7, 3.0]
+
+    counts = renderer.frame_counts(durations)
+
+    # Same frames MoviePy writes for the concatenated clips: one every 1/fps while t < duration
+    assert sum(counts) == len(np.arange(0, sum(durations), 1 / 30))
+    assert counts[0] == 90
+
+
+def test_blit_blends_and_crops():
+    canvas = np.full((4, 4, 3), 100, dtype=np.float32)
+    text = np.zeros((2, 3, 4), dtype=np.uint8)
+    text[..., :3] = 200
+    text[..., 3] = 127.5
+
+    blit(canvas, text, (2, -1))
+
+    assert np.allclose(canvas[0, 2:], 150, atol=0.5)
+    assert np.all(canvas[1:, :] == 100) and np.all(canvas[0, :2] == 100)
+    assert center_position((1080, 1920), (101, 50)) == (489, 935)
+
+
+def test_command_concatenates_sections_and_maps_audio():
+    renderer = FilterGraphRenderer(64, 48, 10)
+    sections = [
+        _section((0, 0, 0), 1.0, fade_in=0.5, overlay=np.zeros((48, 64, 4), dtype=np.uint8),
+                 overlay_start=0.5, overlay_fade=0.5),
+        _section((255, 0, 0), 2.0),
+    ]
+
+    cmd = renderer.build_command(sections, [("a.png", "a_over.png"), ("b.png", None)], "out.mp4", "audio.mp3")
+
+    assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == '-i'] == ["a.png", "a_over.png", "b.png", "audio.mp3"]
+    graph = cmd[cmd.index('-filter_complex') + 1]
+    assert "loop=loop=9:" in graph and "loop=loop=19:" in graph
+    assert "fade=t=in:st=0.500000:d=0.500000:alpha=1" in graph
+    assert graph.endswith("[s0][s1]concat=n=2:v=1:a=0[v]")
+    assert cmd[cmd.index('-map') + 3] == "3:a"
+    assert cmd[-1] == "out.mp4"
+
+
+def test_render_with_ffmpeg(tmp_path, monkeypatch):
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+    ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    monkeypatch.setattr(core.video_ffmpeg, "FFMPEG_BINARY", ffmpeg)
+
+    renderer = FilterGraphRenderer(64, 48, 10)
+    output = str(tmp_path / "saida.mp4")
+    assert renderer.render([_section((200, 0, 0), 0.5), _section((0, 0, 200), 1.0)], output) == output
+
+    raw = subprocess.run([ffmpeg, "-i", output, "-f", "rawvideo", "-pix_fmt", "rgb24", "-"],
+                         capture_output=True, check=True).stdout
+    frames = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 48, 64, 3).astype(int)
+
+    assert len(frames) == 15
+    assert np.allclose(frames[2].mean(axis=(0, 1)), (200, 0, 0), atol=12)
+    assert np.allclose(frames[10].mean(axis=(0, 1)), (0, 0, 200), atol=12)
+
+
+def test_segments_are_encoded_alike_and_joined_without_reencoding():
+    renderer = FilterGraphRenderer(64, 48, 10)
+
+    segment = renderer.build_segment_command(_section((0, 0, 0), 1.0), 10, "a.png", None, "a.mp4")
+    joined = renderer.build_command([_section((0, 0, 0), 1.0)], [("a.png", None)], "out.mp4")
+
+    assert '-an' in segment and '-c:a' not in segment
+    assert segment[-len(renderer.video_codec_args()) - 1:-1] == renderer.video_codec_args()
+    assert set(renderer.video_codec_args()) <= set(joined)
+
+
+def test_render_segments_with_ffmpeg(tmp_path, monkeypatch):
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+    ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    monkeypatch.setattr(core.video_ffmpeg, "FFMPEG_BINARY", ffmpeg)
+
+    renderer = FilterGraphRenderer(64, 48, 10)
+    output = str(tmp_path / "saida.mp4")
+    sections = [_section((200, 0, 0), 0.55), _section((0, 200, 0), 0.3), _section((0, 0, 200), 0.65)]
+    assert renderer.render_segments(sections, output, workers=2) == output
+
+    raw = subprocess.run([ffmpeg, "-i", output, "-f", "rawvideo", "-pix_fmt", "rgb24", "-"],
+                         capture_output=True, check=True).stdout
+    frames = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 48, 64, 3).astype(int)
+
+    # The segments keep the frames of the full timeline (6 + 3 + 6 frames at 10 fps)
+    assert len(frames) == 15
+    colors = [int(np.argmax(frame.mean(axis=(0, 1)))) for frame in frames]
+    assert colors == [0] * 6 + [1] * 3 + [2] * 6
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        video.VideoGenerator(use_frame_cache=False, use_card_cache=False, render_backend="blender")
+
+
+def test_content_section_matches_moviepy_composition(tmp_path, monkeypatch):
+    monkeypatch.setattr(video, "TextClip", _FakeTextClip)
+    gerador = video.VideoGenerator(use_frame_cache=False, card_cache_dir=str(tmp_path / "cards"),
+                                   render_backend="ffmpeg")
+    frame = np.full((gerador.video_height, gerador.video_width, 3), 200, dtype=np.uint8)
+    section = {"kind": "content", "duration": 2.0, "frame": frame, "darken": 0.7, "box": 0.4,
+               "text": "Bitcoin sobe", "fontsize": 60}
+
+    image = gerador._section_layers(section)["image"]
+    expected = gerador._section_clip(section).get_frame(0).astype(np.uint8)
+
+    assert np.array_equal(image, expected)
+    center_y, center_x = gerador.video_height // 2, gerador.video_width // 2
+    assert image[0, 0, 0] == 140                      # darkened frame
+    assert image[center_y - 200, center_x, 0] == 70   # box with 50% opacity
+    assert image[center_y, center_x, 0] == 162        # half transparent text over the box
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the news cross-checking (VerificadorNoticias) grouping step.
+
+Generates synthetic news with clusters of near-duplicate stories, compares the
+indexed candidate generation with the exhaustive reference algorithm on the
+smaller sizes, and measures how the indexed engine scales up to 10k items.
+The TF-IDF backend is timed as well, with its agreement with the difflib groups.
+With --verify-size, a micro-benchmark of the consistency analysis (with and
+without reusing the similarities computed during grouping) is run as well.
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+from typing import Dict, List, Any
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.verificador_noticias import VerificadorNoticias
+
+logger = logging.getLogger('cloneia.tools.benchmark_verificador')
+
+SYLLABLES = ["ba", "be", "bi", "bo", "ca", "ce", "ci", "co", "da", "de", "di", "fa", "fe", "fi",
+             "ga", "ge", "la", "le", "li", "lo", "ma", "me", "mi", "mo", "na", "ne", "ni", "no",
+             "pa", "pe", "pi", "po", "ra", "re", "ri", "ro", "ta", "te", "ti", "to", "va", "ve"]
+
+COINS = ["Bitcoin", "Ethereum", "Cardano", "Solana", "Ripple", "Dogecoin"]
+
+
+def generate_vocabulary(rng: random.Random, size: int) -> List[str]:
+    """
+    Generate a vocabulary of pseudo-words.
+
+    Args:
+        rng: Random number generator
+        size: Number of words
+
+    Returns:
+        List[str]: Unique pseudo-words
+    """
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def mutate(rng: random.Random, words: List[str], vocabulary: List[str], rate: float) -> List[str]:
+    """
+    Replace a fraction of the words of a text with random words.
+
+    Args:
+        rng: Random number generator
+        words: Words of the original text
+        vocabulary: Vocabulary to draw replacements from
+        rate: Fraction of words to replace
+
+    Returns:
+        List[str]: Mutated words
+    """
+    return [rng.choice(vocabulary) if rng.random() < rate else word for word in words]
+
+
+def generate_news(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Generate synthetic news items with clusters of near-duplicates.
+
+    Args:
+        count: Number of news items
+        seed: Random seed
+
+    Returns:
+        List[Dict[str, Any]]: News items in the format produced by the scrapers
+    """
+    rng = random.Random(seed)
+    vocabulary = generate_vocabulary(rng, 8000)
+    news = []
+
+    while len(news) < count:
+        coin = rng.choice(COINS)
+        title = [coin] + rng.sample(vocabulary, 7)
+        summary = [coin] + rng.sample(vocabulary, 19)
+
+        # Each story is covered by 1-4 portals with slightly different wording
+        for _ in range(rng.randint(1, 4)):
+            portal = rng.randint(1, 30)
+            news.append({
+                "titulo": " ".join(mutate(rng, title, vocabulary, 0.1)),
+                "resumo": " ".join(mutate(rng, summary, vocabulary, 0.1)),
+                "link": f"https://portal{portal}.com/{len(news)}",
+                "data_iso": f"2025-05-{rng.randint(1, 28):02d}T10:00:00",
+                "portal": f"Portal {portal}",
+                "credibilidade": rng.randint(5, 9)
+            })
+
+    news = news[:count]
+    rng.shuffle(news)
+    return news
+
+
+def run_grouping(verificador: VerificadorNoticias, news: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run the grouping step and measure it.
+
+    Args:
+        verificador: Configured news verifier
+        news: News items
+
+    Returns:
+        Dict[str, Any]: Elapsed time and groups (as lists of links)
+    """
+    start = time.perf_counter()
+    groups = verificador._agrupar_noticias_similares(news)
+    elapsed = time.perf_counter() - start
+    return {
+        "time": elapsed,
+        "groups": [[item["link"] for item in group] for group in groups]
+    }
+
+
+def group_agreement(reference: List[List[str]], other: List[List[str]]) -> float:
+    """
+    Fraction of items placed in exactly the same group as in the reference.
+
+    Args:
+        reference: Reference groups (lists of links)
+        other: Groups to compare (lists of links)
+
+    Returns:
+        float: Agreement between 0.0 and 1.0
+    """
+    reference_group = {link: frozenset(group) for group in reference for link in group}
+    other_group = {link: frozenset(group) for group in other for link in group}
+    if not reference_group:
+        return 1.0
+    same = sum(1 for link, group in reference_group.items() if other_group.get(link) == group)
+    return same / len(reference_group)
+
+
+def benchmark_verification(size: int) -> None:
+    """
+    Micro-benchmark of the steps after grouping in verificar_noticias.
+
+    Compares the consistency analysis reusing the summary similarities stored
+    during grouping with recomputing them, and the index-based groups with the
+    old noticias.index() lookups. Also checks that the output is unchanged.
+
+    Args:
+        size: Number of news items
+    """
+    news = generate_news(size, seed=3)
+    verificador = VerificadorNoticias()
+    groups, summary_similarities = verificador._agrupar_indices(news)
+    multi_groups = [indices for indices in groups if len(indices) > 1]
+
+    calls = {"count": 0}
+    original_similarity = verificador._calcular_similaridade
+
+    def counting_similarity(text1, text2):
+        calls["count"] += 1
+        return original_similarity(text1, text2)
+
+    verificador._calcular_similaridade = counting_similarity
+
+    start = time.perf_counter()
+    for indices in groups:
+        verificador._analisar_consistencia_grupo([news[idx] for idx in indices])
+    recompute_time = time.perf_counter() - start
+    recompute_calls = calls["count"]
+
+    calls["count"] = 0
+    start = time.perf_counter()
+    for indices in groups:
+        verificador._analisar_consistencia_grupo([news[idx] for idx in indices], indices, summary_similarities)
+    reuse_time = time.perf_counter() - start
+    reuse_calls = calls["count"]
+
+    # Old logging path: recover each member's index with a linear scan
+    start = time.perf_counter()
+    for indices in multi_groups:
+        [news.index(item) for item in [news[idx] for idx in indices]]
+    index_lookup_time = time.perf_counter() - start
+
+    verificador._calcular_similaridade = original_similarity
+    stored = VerificadorNoticias().verificar_noticias(news)
+
+    # Reference: the same verification with an empty similarity store
+    reference = VerificadorNoticias()
+    reference._agrupar_indices = lambda items: (VerificadorNoticias._agrupar_indices(reference, items)[0], {})
+    same = stored == reference.verificar_noticias(news)
+
+    print(f"\nVerification micro-benchmark: {size} items, {len(multi_groups)} multi-item groups")
+    print(f"  consistency, recomputing similarities: {recompute_time * 1000:8.1f} ms ({recompute_calls} difflib calls)")
+    print(f"  consistency, reusing stored scores:    {reuse_time * 1000:8.1f} ms ({reuse_calls} difflib calls)")
+    print(f"  noticias.index() lookups (old logging): {index_lookup_time * 1000:7.1f} ms")
+    print(f"  verificar_noticias output unchanged:   {'yes' if same else 'NO'}")
+
+
+def main():
+    """
+    Main function.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the news grouping step")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 1000, 2000, 5000, 10000],
+                        help="Numbers of news items to benchmark")
+    parser.add_argument("--max-exhaustive", type=int, default=300,
+                        help="Largest size also run with the exhaustive reference algorithm")
+    parser.add_argument("--threshold", type=float, default=0.7, help="Similarity threshold")
+    parser.add_argument("--verify-size", type=int, default=2000,
+                        help="Number of news items in the verification micro-benchmark (0 to skip)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('verificador_noticias').setLevel(logging.WARNING)
+
+    print(f"{'items':>7} {'indexed (s)':>12} {'exhaustive (s)':>15} {'groups':>7} {'same':>5} "
+          f"{'tfidf (s)':>10} {'tfidf agreement':>16}")
+    for size in args.sizes:
+        news = generate_news(size)
+
+        indexed = run_grouping(VerificadorNoticias(limiar_similaridade=args.threshold, usar_indice=True), news)
+
+        exhaustive_time = "-"
+        same = "-"
+        if size <= args.max_exhaustive:
+            exhaustive = run_grouping(VerificadorNoticias(limiar_similaridade=args.threshold, usar_indice=False), news)
+            exhaustive_time = f"{exhaustive['time']:.2f}"
+            same = "yes" if exhaustive["groups"] == indexed["groups"] else "NO"
+
+        tfidf = run_grouping(VerificadorNoticias(limiar_similaridade=args.threshold, backend_similaridade="tfidf"), news)
+        agreement = group_agreement(indexed["groups"], tfidf["groups"])
+
+        print(f"{size:>7} {indexed['time']:>12.2f} {exhaustive_time:>15} {len(indexed['groups']):>7} {same:>5} "
+              f"{tfidf['time']:>10.2f} {agreement:>16.1%}")
+
+    if args.verify_size:
+        benchmark_verification(args.verify_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the render backends of VideoGenerator.
+
+Builds a synthetic project (reference video, narration and a script with N
+news items) in a temporary directory, renders it with the MoviePy, the FFmpeg
+filtergraph and the segmented (parallel) backends from the same planned
+timeline, and reports the wall time of each render and how much their frames
+differ from the MoviePy output. The segmented backend is then timed again
+after the first news item changes, when only its segments are encoded.
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+import subprocess
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import core.video_ffmpeg
+from core.video import VideoGenerator, RENDER_BACKENDS
+from core.utils import VIDEO_WIDTH, VIDEO_HEIGHT
+
+logger = logging.getLogger('cloneia.tools.benchmark_video_render')
+
+
+def build_project(directory: str, ffmpeg: str, duration: float, news: int) -> Dict[str, str]:
+    """
+    Create the inputs of the benchmark.
+
+    Args:
+        directory: Directory where the files are created
+        ffmpeg: FFmpeg binary
+        duration: Duration of the narration in seconds
+        news: Number of news items in the script
+
+    Returns:
+        Dict[str, str]: Paths of the "reference_dir", "audio" and "script"
+    """
+    reference_dir = os.path.join(directory, "reference")
+    os.makedirs(reference_dir)
+    paths = {
+        "reference_dir": reference_dir,
+        "audio": os.path.join(directory, "narracao.mp3"),
+        "script": os.path.join(directory, "roteiro.txt"),
+    }
+
+    subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-f', 'lavfi',
+                    '-i', f"testsrc=size={VIDEO_WIDTH}x{VIDEO_HEIGHT}:rate=30:duration=10",
+                    '-pix_fmt', 'yuv420p', '-c:v', 'libx264', '-preset', 'ultrafast',
+                    os.path.join(reference_dir, "referencia.mp4")], check=True)
+    subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-f', 'lavfi',
+                    '-i', f"sine=frequency=440:duration={duration}",
+                    '-c:a', 'libmp3lame', paths["audio"]], check=True)
+
+    lines = ["E aí cambada, bem-vindos à Rapidinha no Cripto!", ""]
+    for i in range(news):
+        lines += [f"{i + 1}. Bitcoin renova a máxima número {i + 1}",
+                  "O mercado reagiu com força e os investidores ficaram atentos.", ""]
+    lines.append("Valeu, até amanhã!")
+    with open(paths["script"], 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines))
+
+    return paths
+
+
+def render(backend: str, paths: Dict[str, str], output_path: str, cache_dir: str,
+           workers: Optional[int] = None) -> float:
+    """
+    Render the project with a backend.
+
+    Args:
+        backend: Render backend
+        paths: Inputs created by build_project
+        output_path: Path to save the video
+        cache_dir: Directory of the frame, card and segment caches
+        workers: Number of sections encoded at the same time by the "segmented" backend
+
+    Returns:
+        float: Wall time of the render in seconds
+    """
+    generator = VideoGenerator(cache_dir=os.path.join(cache_dir, "frames"),
+                               card_cache_dir=os.path.join(cache_dir, "cards"),
+                               segment_cache_dir=os.path.join(cache_dir, "segments"),
+                               render_backend=backend, render_workers=workers)
+    generator.reference_dir = paths["reference_dir"]
+
+    # Both backends pick the same frames for the sections
+    random.seed(0)
+    start = time.perf_counter()
+    if not generator.generate_video_from_script(paths["script"], paths["audio"], output_path):
+        raise RuntimeError(f"Render with the {backend} backend failed")
+    return time.perf_counter() - start
+
+
+def frame_difference(first: str, second: str, samples: int = 12) -> List[float]:
+    """
+    Compare the frames of two videos.
+
+    Args:
+        first: Path to the first video
+        second: Path to the second video
+        samples: Number of frames compared, evenly spaced
+
+    Returns:
+        List[float]: Mean absolute difference (0-255) of each sampled frame
+    """
+    import moviepy.editor as mp
+
+    a, b = mp.VideoFileClip(first), mp.VideoFileClip(second)
+    try:
+        duration = min(a.duration, b.duration)
+        times = [(i + 0.5) * duration / samples for i in range(samples)]
+        return [float(np.abs(a.get_frame(t).astype(int) - b.get_frame(t).astype(int)).mean()) for t in times]
+    finally:
+        a.close()
+        b.close()
+
+
+def main():
+    """
+    Main function.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the video render backends")
+    parser.add_argument("--ffmpeg", default=core.video_ffmpeg.FFMPEG_BINARY, help="FFmpeg binary")
+    parser.add_argument("--duration", type=float, default=30.0, help="Duration of the narration in seconds")
+    parser.add_argument("--news", type=int, default=4, help="Number of news items in the script")
+    parser.add_argument("--backends", nargs="+", default=list(RENDER_BACKENDS), choices=RENDER_BACKENDS,
+                        help="Backends to benchmark")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Sections encoded at the same time by the segmented backend (default: number of CPUs)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('cloneia').setLevel(logging.WARNING)
+    core.video_ffmpeg.FFMPEG_BINARY = args.ffmpeg
+
+    with tempfile.TemporaryDirectory(prefix="cloneia_bench_") as directory:
+        paths = build_project(directory, args.ffmpeg, args.duration, args.news)
+        cache_dir = os.path.join(directory, "cache")
+
+        # Decode the reference frames up front so both backends start from the same state
+        generator = VideoGenerator(cache_dir=os.path.join(cache_dir, "frames"), use_card_cache=False,
+                                   use_segment_cache=False)
+        generator.prepare_reference_frames([os.path.join(paths["reference_dir"], "referencia.mp4")])
+
+        outputs = {}
+        print(f"Timeline: {args.duration:.0f} s of narration, {args.news} news items, "
+              f"{VIDEO_WIDTH}x{VIDEO_HEIGHT}, {os.cpu_count()} CPUs")
+        for backend in args.backends:
+            outputs[backend] = os.path.join(directory, f"{backend}.mp4")
+            elapsed = render(backend, paths, outputs[backend], cache_dir, args.workers)
+            print(f"  {backend:8s} {elapsed:8.2f} s")
+
+        if "segmented" in outputs:
+            # Change the first news item: the other segments come from the cache
+            with open(paths["script"], encoding='utf-8') as f:
+                script = f.read()
+            with open(paths["script"], 'w', encoding='utf-8') as f:
+                f.write(script.replace("máxima número 1\n", "máxima número 1 (atualizada)\n"))
+            elapsed = render("segmented", paths, os.path.join(directory, "segmented_edit.mp4"),
+                             cache_dir, args.workers)
+            print(f"  segmented, one news item changed {elapsed:8.2f} s")
+
+        if "moviepy" in outputs:
+            for backend in outputs:
+                if backend != "moviepy":
+                    differences = frame_difference(outputs["moviepy"], outputs[backend])
+                    print(f"  {backend} vs moviepy, mean frame difference: {np.mean(differences):.2f} "
+                          f"(max {max(differences):.2f}) out of 255")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())